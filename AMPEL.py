@@ -17,16 +17,27 @@ Demo repository : https://github.com/AmedeoPelliccia/AMPEL360-AI-studio
 Live demo app   : https://ais-pre-qgodcoewjywuhs2glepnfo-324605324739.europe-west2.run.app/
 
 Coding conventions: stdlib only; dataclasses, Enum, type hints.
+NumPy is optional and only required by ``ProfileSelector.validate_batch()``.
 Parent document: ESSA-DOC-AMPEL-001 (ESSA/ampel.yaml).
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict, field
+import operator
+import os
+import re
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, fields, is_dataclass, replace
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None  # type: ignore[assignment]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -59,7 +70,12 @@ class GateType(Enum):
 # 2. CORE DATA STRUCTURES
 # ──────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+def _freeze_scope(obj: object) -> None:
+    """Coerce a ``dal_scope`` list into a tuple on a frozen dataclass."""
+    object.__setattr__(obj, "dal_scope", tuple(obj.dal_scope))  # type: ignore[attr-defined]
+
+
+@dataclass(frozen=True, slots=True)
 class ArtefactTemplate:
     """A documentation artefact required at a specific lifecycle gate."""
     template_id: str
@@ -67,11 +83,14 @@ class ArtefactTemplate:
     standard_ref: str          # e.g. "DO-178C Table A-1", "CS 25.1309"
     gate: GateType
     token: str                 # H-pipeline token: H_EVIDENCE / H_SIGNOFF / etc.
-    dal_scope: List[str] = field(default_factory=list)   # e.g. ["A","B","C"]
+    dal_scope: Sequence[str] = ()                        # e.g. ("A","B","C")
     notes: str = ""
 
+    def __post_init__(self) -> None:
+        _freeze_scope(self)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationRule:
     """A check that must pass before a gate transition is allowed."""
     rule_id: str
@@ -79,13 +98,16 @@ class ValidationRule:
     check: str                 # Human-readable check specification
     severity: Severity
     gate: GateType
-    dal_scope: List[str] = field(default_factory=list)
+    dal_scope: Sequence[str] = ()
     fail_threshold: str = ""
     warn_threshold: str = ""
     reference: str = ""
 
+    def __post_init__(self) -> None:
+        _freeze_scope(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Constraint:
     """An invariant or hard limit enforced by the engine."""
     constraint_id: str
@@ -97,19 +119,36 @@ class Constraint:
     waiver_token: str = "H_EXCEPTION"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProfileConfig:
-    """Complete runtime configuration for one regulatory profile."""
+    """
+    Complete runtime configuration for one regulatory profile.
+
+    Instances are read-only: the collections are stored as tuples so one
+    built profile can be shared by every activation (see
+    :class:`ProfileCache`).  Each activation is a shallow copy that only
+    differs in ``activated_at``.
+    """
     profile: RegulatoryProfile
     document_id: str
     title: str
     regulatory_authority: str
-    standards: List[str]
-    templates: List[ArtefactTemplate]
-    validation_rules: List[ValidationRule]
-    constraints: List[Constraint]
+    standards: Sequence[str]
+    templates: Sequence[ArtefactTemplate]
+    validation_rules: Sequence[ValidationRule]
+    constraints: Sequence[Constraint]
     activated_at: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        for name in ("standards", "templates", "validation_rules", "constraints"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+
+    def activate(self, activated_at: Optional[str] = None) -> "ProfileConfig":
+        """Return a view of this profile stamped with its activation time."""
+        if activated_at is None:
+            activated_at = datetime.now(timezone.utc).isoformat()
+        return replace(self, activated_at=activated_at)
+
     def summary(self) -> str:
         return (
             f"Profile  : {self.profile.value}\n"
@@ -555,18 +594,738 @@ def _build_do178c() -> ProfileConfig:
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# 4. PROFILE REGISTRY
+# 4. SERIALISATION
+# ──────────────────────────────────────────────────────────────────────────────
+
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _to_plain(value: Any) -> Any:
+    """
+    Convert profile objects into JSON-ready values in a single walk.
+
+    Dataclasses become dicts in field order, enums their ``.value`` and
+    tuples lists.  Unlike :func:`dataclasses.asdict` nothing is deep-copied
+    first: leaf values are shared with the (immutable) profile.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (tuple, list)):
+        return [_to_plain(item) for item in value]
+    if is_dataclass(value):
+        names = _FIELD_NAMES.get(type(value))
+        if names is None:
+            names = _FIELD_NAMES.setdefault(type(value), tuple(f.name for f in fields(value)))
+        return {name: _to_plain(getattr(value, name)) for name in names}
+    return value
+
+
+def _profile_encoder(indent: Optional[int], canonical: bool) -> json.JSONEncoder:
+    if canonical:
+        return json.JSONEncoder(
+            sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False,
+        )
+    separators = (",", ":") if indent is None else (",", ": ")
+    return json.JSONEncoder(indent=indent, separators=separators)
+
+
+def _profile_document(config: ProfileConfig, include_activation: bool) -> Dict[str, Any]:
+    data = _to_plain(config)
+    if not include_activation:
+        del data["activated_at"]
+    return data
+
+
+def write_profile_json(
+    config: ProfileConfig,
+    fh: IO[str],
+    *,
+    indent: Optional[int] = 2,
+    canonical: bool = False,
+    include_activation: bool = True,
+) -> None:
+    """
+    Stream *config* as JSON to the text file object *fh*.
+
+    ``indent=None`` gives compact output.  ``canonical=True`` overrides the
+    layout with sorted keys, no whitespace and literal UTF-8, so that equal
+    profiles always serialise to the same text.  Set *include_activation*
+    to *False* to leave out the per-activation ``activated_at`` stamp.
+    """
+    encoder = _profile_encoder(indent, canonical)
+    for chunk in encoder.iterencode(_profile_document(config, include_activation)):
+        fh.write(chunk)
+
+
+def profile_to_json(
+    config: ProfileConfig,
+    *,
+    indent: Optional[int] = 2,
+    canonical: bool = False,
+    include_activation: bool = True,
+) -> str:
+    """Return *config* as a JSON string (see :func:`write_profile_json`)."""
+    encoder = _profile_encoder(indent, canonical)
+    return encoder.encode(_profile_document(config, include_activation))
+
+
+def canonical_profile_bytes(config: ProfileConfig, include_activation: bool = False) -> bytes:
+    """
+    Byte-stable UTF-8 encoding of *config* for hashing and comparison.
+
+    ``activated_at`` is left out by default so that every activation of
+    the same profile definition yields identical bytes.
+    """
+    return profile_to_json(
+        config, canonical=True, include_activation=include_activation,
+    ).encode("utf-8")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 5. PROFILE INDEXES
+# ──────────────────────────────────────────────────────────────────────────────
+
+# Design Assurance Levels, most to least stringent.
+_DAL_LEVELS: Tuple[str, ...] = ("A", "B", "C", "D", "E")
+
+# DAL key under which only unscoped (DAL-independent) entries are indexed.
+# Lookups for a DAL letter that no entry mentions resolve to this key.
+_UNSCOPED = ""
+
+
+def _in_scope(dal_scope: Sequence[str], dal: Optional[str]) -> bool:
+    """True when an entry with *dal_scope* applies at *dal* (*None* = any)."""
+    return dal is None or not dal_scope or dal in dal_scope
+
+
+class ProfileIndex:
+    """
+    Inverted indexes over one :class:`ProfileConfig`.
+
+    Every filter combination accepted by the ``ProfileSelector.list_*``
+    queries (gate, severity, DAL letter, waivability and their products) is
+    resolved once at build time into a tuple, so a query is a single dict
+    lookup.  Built alongside the cached profile and shared with it.
+    """
+
+    __slots__ = ("_templates", "_rules", "_constraints")
+
+    def __init__(self, config: ProfileConfig) -> None:
+        dals = set(_DAL_LEVELS)
+        for item in (*config.templates, *config.validation_rules):
+            dals.update(item.dal_scope)
+        dal_keys = (None, _UNSCOPED, *sorted(dals))
+        gate_keys = (None, *GateType)
+        severity_keys = (None, *Severity)
+
+        self._templates: Dict[Tuple[Optional[GateType], Optional[str]], Tuple[ArtefactTemplate, ...]] = {
+            (gate, dal): tuple(
+                t for t in config.templates
+                if (gate is None or t.gate is gate) and _in_scope(t.dal_scope, dal)
+            )
+            for gate in gate_keys
+            for dal in dal_keys
+        }
+        self._rules: Dict[
+            Tuple[Optional[Severity], Optional[GateType], Optional[str]],
+            Tuple[ValidationRule, ...],
+        ] = {
+            (severity, gate, dal): tuple(
+                r for r in config.validation_rules
+                if (severity is None or r.severity is severity)
+                and (gate is None or r.gate is gate)
+                and _in_scope(r.dal_scope, dal)
+            )
+            for severity in severity_keys
+            for gate in gate_keys
+            for dal in dal_keys
+        }
+        self._constraints: Dict[Optional[bool], Tuple[Constraint, ...]] = {
+            None: tuple(config.constraints),
+            True: tuple(c for c in config.constraints if c.is_waivable),
+            False: tuple(c for c in config.constraints if not c.is_waivable),
+        }
+
+    def templates(
+        self,
+        gate: Optional[GateType] = None,
+        dal: Optional[str] = None,
+    ) -> Tuple[ArtefactTemplate, ...]:
+        """Templates at *gate* applicable to *dal* (*None* = no filter)."""
+        found = self._templates.get((gate, dal))
+        return found if found is not None else self._templates[gate, _UNSCOPED]
+
+    def rules(
+        self,
+        severity: Optional[Severity] = None,
+        gate: Optional[GateType] = None,
+        dal: Optional[str] = None,
+    ) -> Tuple[ValidationRule, ...]:
+        """Rules of *severity* at *gate* applicable to *dal* (*None* = no filter)."""
+        found = self._rules.get((severity, gate, dal))
+        return found if found is not None else self._rules[severity, gate, _UNSCOPED]
+
+    def constraints(self, waivable: Optional[bool] = None) -> Tuple[Constraint, ...]:
+        """Constraints with the given waivability (*None* = all)."""
+        return self._constraints[waivable]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 6. VALIDATION PLANS
+# ──────────────────────────────────────────────────────────────────────────────
+
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+
+# "> 10", "> 60 lines", "Ec >= 1e-4", "residual_orbital_lifetime > 25 years"
+_COMPARISON_RE = re.compile(
+    rf"^(?:[A-Za-z_][\w.]*\s*)?(?P<op><=|>=|<|>|==)\s*(?P<value>{_NUMBER})(?:\s*[A-Za-z%]+)?$"
+)
+# "8–10", "50–60 lines" (en dash, em dash or hyphen)
+_RANGE_RE = re.compile(
+    rf"^(?P<low>{_NUMBER})\s*[–—-]\s*(?P<high>{_NUMBER})(?:\s*[A-Za-z%]+)?$"
+)
+# "> 10 (DAL A/B)" — one clause of a DAL-qualified threshold list
+_DAL_CLAUSE_RE = re.compile(r"^(?P<expr>.+?)\s*\(DAL\s+(?P<dals>[A-Z](?:\s*/\s*[A-Z])*)\)$")
+
+_COMPARATORS: Dict[str, Callable[[float, float], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+}
+
+_MISSING = object()
+_SKIP_REASON = "check key not present in state"
+
+
+def _as_number(raw: object) -> Optional[float]:
+    """Interpret a state value as a measurement, or *None* if it is not one."""
+    if isinstance(raw, bool):
+        return None
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    if isinstance(raw, str):
+        try:
+            return float(raw)
+        except ValueError:
+            return None
+    return None
+
+
+class _Threshold:
+    """
+    Sentinel threshold: fires when the state value renders as *token*.
+
+    *token* is always the full threshold text, so a state that reports the
+    threshold verbatim (e.g. ``"PSAC_absent"`` or ``"> 10"``) fires for
+    every threshold kind.
+    """
+
+    __slots__ = ("token",)
+
+    def __init__(self, token: str) -> None:
+        self.token = token
+
+    def matches(self, raw: object) -> bool:
+        return (raw if type(raw) is str else str(raw)) == self.token
+
+    def mask(self, column: "_Column") -> Any:
+        """Vectorised :meth:`matches` over a batch column."""
+        return column.equals(self.token)
+
+
+class _Comparison(_Threshold):
+    """Numeric threshold such as ``> 10``."""
+
+    __slots__ = ("op", "value")
+
+    def __init__(self, token: str, op: str, value: float) -> None:
+        super().__init__(token)
+        self.op = _COMPARATORS[op]
+        self.value = value
+
+    def matches(self, raw: object) -> bool:
+        number = _as_number(raw)
+        if number is None:
+            return _Threshold.matches(self, raw)
+        return self.op(number, self.value)
+
+    def mask(self, column: "_Column") -> Any:
+        numeric = column.numeric
+        with np.errstate(invalid="ignore"):
+            hit = self.op(numeric, self.value)
+        return np.where(column.is_numeric, hit, column.equals(self.token))
+
+
+class _Range(_Threshold):
+    """Inclusive numeric band such as ``8–10``."""
+
+    __slots__ = ("low", "high")
+
+    def __init__(self, token: str, low: float, high: float) -> None:
+        super().__init__(token)
+        self.low = low
+        self.high = high
+
+    def matches(self, raw: object) -> bool:
+        number = _as_number(raw)
+        if number is None:
+            return _Threshold.matches(self, raw)
+        return self.low <= number <= self.high
+
+    def mask(self, column: "_Column") -> Any:
+        numeric = column.numeric
+        with np.errstate(invalid="ignore"):
+            hit = (numeric >= self.low) & (numeric <= self.high)
+        return np.where(column.is_numeric, hit, column.equals(self.token))
+
+
+def _select_clause(text: str, dal: Optional[str]) -> Optional[str]:
+    """
+    Pick the expression of a DAL-qualified threshold that applies at *dal*.
+
+    ``"> 10 (DAL A/B), > 15 (DAL C)"`` yields ``"> 10"`` for DAL A or B and
+    ``"> 15"`` for DAL C.  Without a DAL the first (strictest) clause is
+    used; a DAL the threshold does not mention yields *None*.  Thresholds
+    without DAL qualifiers are returned unchanged.
+    """
+    clauses = [_DAL_CLAUSE_RE.match(part.strip()) for part in text.split(",")]
+    if not all(clauses):
+        return text
+    if dal is None:
+        return clauses[0].group("expr")  # type: ignore[union-attr]
+    for clause in clauses:
+        dals = {d.strip() for d in clause.group("dals").split("/")}  # type: ignore[union-attr]
+        if dal in dals:
+            return clause.group("expr")  # type: ignore[union-attr]
+    return None
+
+
+def _compile_threshold(text: str, dal: Optional[str]) -> _Threshold:
+    """Parse a rule threshold into a typed predicate."""
+    expr = _select_clause(text, dal)
+    if expr is None:
+        return _Threshold(text)
+    match = _COMPARISON_RE.match(expr)
+    if match:
+        return _Comparison(text, match.group("op"), float(match.group("value")))
+    match = _RANGE_RE.match(expr)
+    if match:
+        low, high = float(match.group("low")), float(match.group("high"))
+        return _Range(text, min(low, high), max(low, high))
+    return _Threshold(text)
+
+
+class _CompiledRule:
+    """One :class:`ValidationRule` with its lookup keys and predicates resolved."""
+
+    __slots__ = (
+        "rule_id", "key", "fail", "warn", "fired_result", "blocking",
+        "description", "threshold", "reference",
+    )
+
+    def __init__(self, rule: ValidationRule, dal: Optional[str]) -> None:
+        self.rule_id = rule.rule_id
+        self.key = rule.check.replace(" ", "_").lower()
+        self.fail = _compile_threshold(rule.fail_threshold, dal)
+        self.warn = _compile_threshold(rule.warn_threshold, dal) if rule.warn_threshold else None
+        self.fired_result = rule.severity.value
+        self.blocking = rule.severity is Severity.FAIL
+        self.description = rule.description
+        self.threshold = rule.fail_threshold
+        self.reference = rule.reference
+
+
+class ValidationPlan:
+    """
+    The validation rules of one profile compiled for repeated evaluation.
+
+    Only rules whose ``dal_scope`` covers *dal* are compiled (all rules
+    when *dal* is None).  Lookup keys and thresholds are resolved once;
+    :meth:`run` is then a single pass over the rules.  Thresholds are
+    typed: numeric comparisons (``> 10``) and bands (``8–10``) are
+    evaluated against numeric state values, DAL-qualified thresholds are
+    resolved for the plan's *dal*, and any other threshold is a sentinel
+    token compared as a string.  A state value equal to the threshold text
+    always fires, as before.
+    """
+
+    __slots__ = ("dal", "rules")
+
+    def __init__(self, config: ProfileConfig, dal: Optional[str] = None) -> None:
+        self.dal = dal
+        self.rules = tuple(
+            _CompiledRule(rule, dal)
+            for rule in config.validation_rules
+            if _in_scope(rule.dal_scope, dal)
+        )
+
+    def run(self, state: Dict[str, object]) -> Tuple[bool, List[Dict]]:
+        """Evaluate *state*; returns ``(all_passed, report)``."""
+        get = state.get
+        report: List[Dict] = []
+        append = report.append
+        all_passed = True
+
+        for rule in self.rules:
+            # Try the rule's check key directly; fall back to rule_id key
+            raw = get(rule.key, _MISSING)
+            if raw is _MISSING:
+                raw = get(rule.rule_id)
+            if raw is None:
+                append({"rule_id": rule.rule_id, "result": "SKIP", "reason": _SKIP_REASON})
+                continue
+
+            if rule.fail.matches(raw):
+                result = rule.fired_result
+                if rule.blocking:
+                    all_passed = False
+            elif rule.warn is not None and rule.warn.matches(raw):
+                result = Severity.WARN.value
+            else:
+                result = "PASS"
+            append({
+                "rule_id": rule.rule_id,
+                "description": rule.description,
+                "result": result,
+                "check_value": raw,
+                "threshold": rule.threshold,
+                "reference": rule.reference,
+            })
+
+        return all_passed, report
+
+    def run_batch(
+        self,
+        states: Union[Mapping[str, Sequence[object]], Sequence[Mapping[str, object]]],
+    ) -> "BatchValidationResult":
+        """
+        Evaluate every rule over many states at once.
+
+        *states* is either columnar — a mapping of check key (or rule_id) to
+        a sequence or NumPy array with one value per unit — or a sequence of
+        per-unit state dicts, which is converted into columns once.  As in
+        :meth:`run`, a check-key value of ``None`` skips the rule; the
+        rule_id value is used only where the check key is absent from a
+        unit's state or, in a numeric column, ``NaN``.
+        """
+        if np is None:
+            raise RuntimeError("validate_batch() requires NumPy (pip install numpy).")
+
+        keys = {rule.key for rule in self.rules} | {rule.rule_id for rule in self.rules}
+        columns, n_units = _to_columns(states, keys)
+
+        codes = np.zeros((n_units, len(self.rules)), dtype=np.int8)
+        blocked = np.zeros(n_units, dtype=bool)
+        values: List[Any] = []
+
+        for r, rule in enumerate(self.rules):
+            column = _Column.merge(columns.get(rule.key), columns.get(rule.rule_id), n_units)
+            values.append(column.values)
+            if not column.present.any():
+                codes[:, r] = BATCH_RESULT_CODES["SKIP"]
+                continue
+            fired = rule.fail.mask(column) & column.present
+            if rule.warn is not None:
+                warned = rule.warn.mask(column) & column.present & ~fired
+                codes[warned, r] = BATCH_RESULT_CODES[Severity.WARN.value]
+            codes[fired, r] = BATCH_RESULT_CODES[rule.fired_result]
+            codes[~column.present, r] = BATCH_RESULT_CODES["SKIP"]
+            if rule.blocking:
+                blocked |= fired
+
+        return BatchValidationResult(self, codes, ~blocked, values)
+
+
+# Result codes stored in BatchValidationResult.codes; the index is the code.
+BATCH_RESULTS: Tuple[str, ...] = ("PASS", "SKIP", "INFO", "WARN", "FAIL")
+BATCH_RESULT_CODES: Dict[str, int] = {name: code for code, name in enumerate(BATCH_RESULTS)}
+
+
+def _to_columns(
+    states: Union[Mapping[str, Sequence[object]], Sequence[Mapping[str, object]]],
+    keys: set,
+) -> Tuple[Dict[str, Any], int]:
+    """Normalise batch input into ``{key: ndarray}`` restricted to *keys*."""
+    if isinstance(states, Mapping):
+        columns = {k: _as_column(v) for k, v in states.items() if k in keys}
+        lengths = {len(c) for c in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns must all have the same length, got {sorted(lengths)}.")
+        return columns, lengths.pop() if lengths else 0
+
+    n_units = len(states)
+    present_keys = set()
+    for unit in states:
+        present_keys.update(k for k in unit if k in keys)
+    columns = {}
+    for key in present_keys:
+        column = np.empty(n_units, dtype=object)
+        column[:] = [unit.get(key, _MISSING) for unit in states]
+        columns[key] = column
+    return columns, n_units
+
+
+def _as_column(values: Sequence[object]) -> Any:
+    """Numeric arrays are kept as-is; anything else becomes an object array."""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+        return values
+    column = np.empty(len(values), dtype=object)
+    column[:] = list(values)
+    return column
+
+
+class _Column:
+    """One rule's resolved values across a batch, with lazily typed views."""
+
+    __slots__ = ("values", "present", "_numeric", "_is_numeric", "_text")
+
+    def __init__(self, values: Any, present: Any) -> None:
+        self.values = values
+        self.present = present
+        self._numeric = None
+        self._is_numeric = None
+        self._text = None
+
+    @staticmethod
+    def _given(values: Any) -> Any:
+        """Cells that hold a value for the key, ``None`` included."""
+        if values.dtype.kind == "f":
+            return ~np.isnan(values)
+        if values.dtype.kind in "iu":
+            return np.ones(len(values), dtype=bool)
+        return np.fromiter((v is not _MISSING for v in values), dtype=bool, count=len(values))
+
+    @classmethod
+    def _of(cls, values: Any) -> "_Column":
+        if values.dtype.kind != "O":
+            return cls(values, cls._given(values))
+        unset = ~cls._given(values)
+        if unset.any():
+            values = values.copy()
+            values[unset] = None
+        return cls(values, np.fromiter((v is not None for v in values), dtype=bool, count=len(values)))
+
+    @classmethod
+    def merge(cls, primary: Any, fallback: Any, n_units: int) -> "_Column":
+        """Prefer *primary* (check key) values, falling back to *fallback* (rule_id).
+
+        A primary cell falls back only when the key is absent (or the value
+        is ``NaN``); a ``None`` value is kept and marks the rule skipped.
+        """
+        if primary is None and fallback is None:
+            return cls(np.full(n_units, None, dtype=object), np.zeros(n_units, dtype=bool))
+        if primary is None or fallback is None:
+            return cls._of(primary if primary is not None else fallback)
+        has_primary = cls._given(primary)
+        if has_primary.all():
+            return cls._of(primary)
+        if primary.dtype != fallback.dtype:
+            primary, fallback = primary.astype(object), fallback.astype(object)
+        return cls._of(np.where(has_primary, primary, fallback))
+
+    @property
+    def numeric(self) -> Any:
+        """Values as float64, NaN where a value is not a measurement."""
+        if self._numeric is None:
+            if self.values.dtype.kind in "iuf":
+                self._numeric = self.values.astype(np.float64)
+            else:
+                self._numeric = np.fromiter(
+                    (n if (n := _as_number(v)) is not None else np.nan for v in self.values),
+                    dtype=np.float64, count=len(self.values),
+                )
+            self._is_numeric = ~np.isnan(self._numeric)
+        return self._numeric
+
+    @property
+    def is_numeric(self) -> Any:
+        if self._is_numeric is None:
+            self.numeric  # noqa: B018 - populates both views
+        return self._is_numeric
+
+    def equals(self, token: str) -> Any:
+        """Element-wise ``str(value) == token``."""
+        if self.values.dtype.kind in "iuf":
+            # Numeric columns cannot render as a sentinel token.
+            number = _as_number(token)
+            if number is None:
+                return np.zeros(len(self.values), dtype=bool)
+            return self.numeric == number
+        if self._text is None:
+            self._text = np.array(
+                [v if type(v) is str else str(v) for v in self.values], dtype=object,
+            )
+        return self._text == token
+
+
+class BatchValidationResult:
+    """
+    Outcome of :meth:`ValidationPlan.run_batch`.
+
+    ``codes`` is a ``units × rules`` ``int8`` matrix indexing
+    :data:`BATCH_RESULTS`; ``passed`` is the per-unit aggregate (no
+    FAIL-severity rule fired).  Per-unit report dicts in the format of
+    :meth:`ProfileSelector.validate` are only built by :meth:`report`.
+    """
+
+    __slots__ = ("rule_ids", "codes", "passed", "_plan", "_values")
+
+    def __init__(self, plan: ValidationPlan, codes: Any, passed: Any, values: List[Any]) -> None:
+        self.rule_ids: Tuple[str, ...] = tuple(rule.rule_id for rule in plan.rules)
+        self.codes = codes
+        self.passed = passed
+        self._plan = plan
+        self._values = values
+
+    def __len__(self) -> int:
+        return len(self.passed)
+
+    def results(self, unit: int) -> Dict[str, str]:
+        """Rule ID → result name for one unit."""
+        return {rid: BATCH_RESULTS[code] for rid, code in zip(self.rule_ids, self.codes[unit])}
+
+    def report(self, unit: int) -> List[Dict]:
+        """Materialise the ``validate()``-style report for one unit."""
+        report: List[Dict] = []
+        for r, rule in enumerate(self._plan.rules):
+            result = BATCH_RESULTS[self.codes[unit, r]]
+            if result == "SKIP":
+                report.append({"rule_id": rule.rule_id, "result": "SKIP", "reason": _SKIP_REASON})
+                continue
+            raw = self._values[r][unit]
+            report.append({
+                "rule_id": rule.rule_id,
+                "description": rule.description,
+                "result": result,
+                "check_value": raw.item() if isinstance(raw, np.generic) else raw,
+                "threshold": rule.threshold,
+                "reference": rule.reference,
+            })
+        return report
+
+
+class CompiledProfile:
+    """A cached profile together with the lookup structures derived from it."""
+
+    __slots__ = ("config", "index", "_plans")
+
+    def __init__(self, config: ProfileConfig) -> None:
+        self.config = config
+        self.index = ProfileIndex(config)
+        self._plans: Dict[Optional[str], ValidationPlan] = {}
+
+    def plan(self, dal: Optional[str] = None) -> ValidationPlan:
+        """Return the validation plan for *dal*, compiling it on first use."""
+        plan = self._plans.get(dal)
+        if plan is None:
+            plan = self._plans.setdefault(dal, ValidationPlan(self.config, dal))
+        return plan
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 7. PROFILE REGISTRY
 # ──────────────────────────────────────────────────────────────────────────────
 
-_PROFILE_BUILDERS: Dict[RegulatoryProfile, object] = {
+_PROFILE_BUILDERS: Dict[RegulatoryProfile, Callable[[], ProfileConfig]] = {
     RegulatoryProfile.EASA_Q100: _build_easa_q100,
     RegulatoryProfile.SPACE_Q10: _build_space_q10,
     RegulatoryProfile.DO_178C:   _build_do178c,
 }
 
 
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters of a :class:`ProfileCache`."""
+    hits: int
+    misses: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ProfileCache:
+    """
+    Process-wide memo of built regulatory profiles.
+
+    Each :class:`ProfileConfig` is built once by its registered builder and
+    then shared read-only together with its :class:`ProfileIndex`;
+    :meth:`get` and :meth:`compiled` are safe to call from many threads.
+    Call :meth:`invalidate` (or :meth:`register_builder`) when a profile
+    definition changes so that the next lookup rebuilds it.
+    """
+
+    def __init__(
+        self,
+        builders: Optional[Dict[RegulatoryProfile, Callable[[], ProfileConfig]]] = None,
+    ) -> None:
+        # Own copy: register_builder() must not leak into other caches.
+        self._builders = dict(builders if builders is not None else _PROFILE_BUILDERS)
+        self._entries: Dict[RegulatoryProfile, CompiledProfile] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, profile: RegulatoryProfile) -> ProfileConfig:
+        """Return the shared, un-activated configuration for *profile*."""
+        return self.compiled(profile).config
+
+    def compiled(self, profile: RegulatoryProfile) -> CompiledProfile:
+        """Return the shared configuration and indexes for *profile*."""
+        # Lock-free fast path; counters are best-effort under contention.
+        entry = self._entries.get(profile)
+        if entry is not None:
+            self._hits += 1
+            return entry
+        with self._lock:
+            entry = self._entries.get(profile)
+            if entry is None:
+                self._misses += 1
+                entry = CompiledProfile(self._builders[profile]())
+                self._entries[profile] = entry
+            else:
+                self._hits += 1
+        return entry
+
+    def register_builder(
+        self,
+        profile: RegulatoryProfile,
+        builder: Callable[[], ProfileConfig],
+    ) -> None:
+        """Replace the builder for *profile* and drop its cached entry."""
+        with self._lock:
+            self._builders[profile] = builder
+            self._entries.pop(profile, None)
+
+    def invalidate(self, profile: Optional[RegulatoryProfile] = None) -> None:
+        """Drop the cached entry for *profile*, or every entry if *None*."""
+        with self._lock:
+            if profile is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(profile, None)
+
+    def stats(self) -> CacheStats:
+        """Return the hit/miss counters and the number of cached profiles."""
+        return CacheStats(self._hits, self._misses, len(self._entries))
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss counters without touching cached entries."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+
+#: Cache shared by every :class:`ProfileSelector` that is not given its own.
+PROFILE_CACHE = ProfileCache()
+
+
 # ──────────────────────────────────────────────────────────────────────────────
-# 5. PROFILE SELECTOR
+# 8. PROFILE SELECTOR
 # ──────────────────────────────────────────────────────────────────────────────
 
 class ProfileSelector:
@@ -581,8 +1340,10 @@ class ProfileSelector:
         passed, report = selector.validate({"PSAC_absent": False, ...})
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache: Optional[ProfileCache] = None) -> None:
+        self._cache = cache if cache is not None else PROFILE_CACHE
         self._active: Optional[ProfileConfig] = None
+        self._compiled: Optional[CompiledProfile] = None
 
     # ── selection ─────────────────────────────────────────────────────────────
 
@@ -591,11 +1352,13 @@ class ProfileSelector:
         Activate *profile* and return its configuration.
 
         The returned :class:`ProfileConfig` exposes ``.templates``,
-        ``.validation_rules``, and ``.constraints`` ready for use.
+        ``.validation_rules``, and ``.constraints`` ready for use.  It is a
+        read-only view over the cached profile carrying its own
+        ``activated_at`` timestamp.
         """
-        builder = _PROFILE_BUILDERS[profile]
-        config = builder()                   # type: ignore[operator]
-        config.activated_at = datetime.now(timezone.utc).isoformat()
+        compiled = self._cache.compiled(profile)
+        config = compiled.config.activate()
+        self._compiled = compiled
         self._active = config
         return config
 
@@ -604,103 +1367,97 @@ class ProfileSelector:
         """The currently active :class:`ProfileConfig`, or *None*."""
         return self._active
 
+    def _require_compiled(self) -> CompiledProfile:
+        if self._compiled is None:
+            raise RuntimeError("No profile selected. Call select() first.")
+        return self._compiled
+
     # ── introspection ─────────────────────────────────────────────────────────
 
-    def list_templates(self, gate: Optional[GateType] = None) -> List[ArtefactTemplate]:
-        """Return templates for the active profile, optionally filtered by gate."""
-        if self._active is None:
-            raise RuntimeError("No profile selected. Call select() first.")
-        templates = self._active.templates
-        if gate is not None:
-            templates = [t for t in templates if t.gate == gate]
-        return templates
+    def list_templates(
+        self,
+        gate: Optional[GateType] = None,
+        dal: Optional[str] = None,
+    ) -> Tuple[ArtefactTemplate, ...]:
+        """Return templates for the active profile, optionally filtered by gate and DAL level."""
+        return self._require_compiled().index.templates(gate, dal)
 
     def list_rules(
         self,
         severity: Optional[Severity] = None,
         dal: Optional[str] = None,
-    ) -> List[ValidationRule]:
-        """Return validation rules, optionally filtered by severity or DAL level."""
-        if self._active is None:
-            raise RuntimeError("No profile selected. Call select() first.")
-        rules = self._active.validation_rules
-        if severity is not None:
-            rules = [r for r in rules if r.severity == severity]
-        if dal is not None:
-            rules = [r for r in rules if not r.dal_scope or dal in r.dal_scope]
-        return rules
-
-    def list_constraints(self, waivable: Optional[bool] = None) -> List[Constraint]:
+        gate: Optional[GateType] = None,
+    ) -> Tuple[ValidationRule, ...]:
+        """Return validation rules, optionally filtered by severity, DAL level or gate."""
+        return self._require_compiled().index.rules(severity, gate, dal)
+
+    def list_constraints(self, waivable: Optional[bool] = None) -> Tuple[Constraint, ...]:
         """Return constraints, optionally filtered by waivability."""
-        if self._active is None:
-            raise RuntimeError("No profile selected. Call select() first.")
-        constraints = self._active.constraints
-        if waivable is not None:
-            constraints = [c for c in constraints if c.is_waivable == waivable]
-        return constraints
+        return self._require_compiled().index.constraints(waivable)
 
     # ── validation ────────────────────────────────────────────────────────────
 
-    def validate(self, state: Dict[str, object]) -> Tuple[bool, List[Dict]]:
+    def validate(
+        self,
+        state: Dict[str, object],
+        dal: Optional[str] = None,
+    ) -> Tuple[bool, List[Dict]]:
         """
         Run all validation rules against *state*.
 
         *state* is a dict of check-name → value.  A rule fires when its
-        ``check`` key is present in *state* and equals the ``fail_threshold``
-        value (exact string match).  Rules whose check key is absent in
-        *state* are skipped (treated as PASS).
+        ``check`` key (or its ``rule_id``) is present in *state* and the
+        value meets the ``fail_threshold``: numeric thresholds (``> 10``,
+        ``8–10``) are compared numerically, sentinel thresholds
+        (``PSAC_absent``) by exact string match.  A value that meets only
+        the ``warn_threshold`` reports ``WARN``.  *dal* selects the clause
+        of DAL-qualified thresholds such as ``"> 10 (DAL A/B), > 15 (DAL C)"``;
+        without it the first clause applies.  With *dal*, rules whose
+        ``dal_scope`` excludes it are neither evaluated nor reported.  Rules
+        whose check key is absent in *state* are skipped (treated as PASS).
 
         Returns ``(all_passed: bool, report: list[dict])``.
         """
-        if self._active is None:
-            raise RuntimeError("No profile selected. Call select() first.")
-
-        report: List[Dict] = []
-        all_passed = True
+        return self._require_compiled().plan(dal).run(state)
 
-        for rule in self._active.validation_rules:
-            check_key = rule.check.replace(" ", "_").lower()
-            # Try the rule's check key directly; fall back to rule_id key
-            raw = state.get(check_key, state.get(rule.rule_id))
-            if raw is None:
-                report.append({
-                    "rule_id": rule.rule_id,
-                    "result": "SKIP",
-                    "reason": "check key not present in state",
-                })
-                continue
-
-            fired = str(raw) == rule.fail_threshold
-            if fired and rule.severity == Severity.FAIL:
-                all_passed = False
-            report.append({
-                "rule_id": rule.rule_id,
-                "description": rule.description,
-                "result": rule.severity.value if fired else "PASS",
-                "check_value": raw,
-                "threshold": rule.fail_threshold,
-                "reference": rule.reference,
-            })
+    def validate_batch(
+        self,
+        states: Union[Mapping[str, Sequence[object]], Sequence[Mapping[str, object]]],
+        dal: Optional[str] = None,
+    ) -> BatchValidationResult:
+        """
+        Run all validation rules against many states in vectorised form.
 
-        return all_passed, report
+        *states* is columnar (check key or rule_id → NumPy array / sequence,
+        one value per unit) or a list of state dicts.  Returns a
+        :class:`BatchValidationResult` holding the ``units × rules`` result
+        code matrix and the per-unit pass vector; per-unit reports are
+        built on demand.  Requires NumPy.
+        """
+        return self._require_compiled().plan(dal).run_batch(states)
 
     # ── export ────────────────────────────────────────────────────────────────
 
-    def export_config(self, filepath: str = "profile_config.json") -> None:
-        """Serialise the active profile configuration to *filepath* as JSON."""
+    def export_config(
+        self,
+        filepath: str = "profile_config.json",
+        *,
+        compact: bool = False,
+        canonical: bool = False,
+    ) -> None:
+        """
+        Serialise the active profile configuration to *filepath* as JSON.
+
+        *compact* drops indentation; *canonical* writes the byte-stable form
+        of :func:`canonical_profile_bytes` (activation stamp included).
+        """
         if self._active is None:
             raise RuntimeError("No profile selected. Call select() first.")
-        data = asdict(self._active)
-        # Enum values need to be serialised as strings
-        data["profile"] = self._active.profile.value
-        for tmpl in data["templates"]:
-            tmpl["gate"] = tmpl["gate"].value if hasattr(tmpl["gate"], "value") else tmpl["gate"]
-        for rule in data["validation_rules"]:
-            rule["severity"] = rule["severity"].value if hasattr(rule["severity"], "value") else rule["severity"]
-            rule["gate"] = rule["gate"].value if hasattr(rule["gate"], "value") else rule["gate"]
         try:
             with open(filepath, "w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2)
+                write_profile_json(
+                    self._active, fh, indent=None if compact else 2, canonical=canonical,
+                )
             print(f"[Export] Profile config saved to {filepath}")
         except OSError as exc:
             print(f"[Export] Failed to save profile config: {exc}")
@@ -712,7 +1469,173 @@ class ProfileSelector:
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# 6. QUICK-START DEMO  (python AMPEL.py)
+# 9. VALIDATION SERVICE
+# ──────────────────────────────────────────────────────────────────────────────
+
+def validate_state(
+    profile: RegulatoryProfile,
+    state: Dict[str, object],
+    dal: Optional[str] = None,
+    cache: Optional[ProfileCache] = None,
+) -> Tuple[bool, List[Dict]]:
+    """
+    Validate *state* against *profile* without any selector state.
+
+    Equivalent to ``select(profile)`` followed by ``validate(state, dal)``
+    but safe to call concurrently for different profiles, since the shared
+    compiled profile is never mutated.
+    """
+    return (cache or PROFILE_CACHE).compiled(profile).plan(dal).run(state)
+
+
+@dataclass(frozen=True)
+class ValidationJob:
+    """One (profile, state) pair submitted to a :class:`ValidationService`."""
+    profile: RegulatoryProfile
+    state: Dict[str, object]
+    dal: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ValidationOutcome:
+    """
+    Result of one :class:`ValidationJob`; *index* is its submission order.
+    *report* is *None* when the service runs with ``include_reports=False``.
+    """
+    index: int
+    profile: RegulatoryProfile
+    passed: bool
+    report: Optional[List[Dict]]
+
+
+# Wire format between the service and its workers: plain tuples pickle far
+# faster than dataclasses, which matters for process pools.
+_ChunkItem = Tuple[int, RegulatoryProfile, Dict[str, object], Optional[str]]
+_ChunkResult = Tuple[int, bool, Optional[List[Dict]]]
+
+
+def _run_chunk(chunk: List[_ChunkItem], include_reports: bool) -> List[_ChunkResult]:
+    """Worker entry point; module-level so process pools can pickle it."""
+    results = []
+    for index, profile, state, dal in chunk:
+        passed, report = validate_state(profile, state, dal)
+        results.append((index, passed, report if include_reports else None))
+    return results
+
+
+class ValidationService:
+    """
+    Stateless, concurrent validation of (profile, state) jobs.
+
+    Jobs are grouped into chunks of *chunk_size* and fanned out over a
+    thread or process pool (*executor* ``"thread"`` or ``"process"``).
+    :meth:`run` streams outcomes back as chunks complete, keeping at most
+    ``2 × max_workers`` chunks in flight so arbitrarily long job streams
+    run in bounded memory.  Processes are needed to scale CPU-bound
+    validation across cores; threads suit small batches and callers that
+    already hold large states in memory.  With ``include_reports=False``
+    only the pass/fail verdicts travel back from the workers, which keeps
+    inter-process traffic small for large batches.
+
+    Usage::
+
+        with ValidationService(executor="process") as service:
+            for outcome in service.run(jobs):
+                ...
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        executor: str = "thread",
+        chunk_size: int = 256,
+        include_reports: bool = True,
+    ) -> None:
+        if executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', not {executor!r}.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor_kind = executor
+        self.chunk_size = chunk_size
+        self.include_reports = include_reports
+        self._executor: Optional[Executor] = None
+
+    def __enter__(self) -> "ValidationService":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            pool_cls = ProcessPoolExecutor if self.executor_kind == "process" else ThreadPoolExecutor
+            self._executor = pool_cls(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def run(
+        self,
+        jobs: Iterable[Union[ValidationJob, Tuple[RegulatoryProfile, Dict[str, object]]]],
+    ) -> Iterator[ValidationOutcome]:
+        """Validate *jobs*, yielding outcomes in completion order."""
+        pool = self._pool()
+        max_in_flight = 2 * self.max_workers
+        profiles: Dict[int, RegulatoryProfile] = {}
+        pending: Set[Future] = set()
+        chunk: List[_ChunkItem] = []
+
+        def drain(done: Set[Future]) -> Iterator[ValidationOutcome]:
+            for future in done:
+                for index, passed, report in future.result():
+                    yield ValidationOutcome(index, profiles.pop(index), passed, report)
+
+        for index, job in enumerate(jobs):
+            if not isinstance(job, ValidationJob):
+                job = ValidationJob(*job)
+            profiles[index] = job.profile
+            chunk.append((index, job.profile, job.state, job.dal))
+            if len(chunk) < self.chunk_size:
+                continue
+            pending.add(pool.submit(_run_chunk, chunk, self.include_reports))
+            chunk = []
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from drain(done)
+        if chunk:
+            pending.add(pool.submit(_run_chunk, chunk, self.include_reports))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from drain(done)
+
+    def run_ordered(
+        self,
+        jobs: Iterable[Union[ValidationJob, Tuple[RegulatoryProfile, Dict[str, object]]]],
+    ) -> List[ValidationOutcome]:
+        """Validate *jobs* and return outcomes in submission order."""
+        return sorted(self.run(jobs), key=lambda outcome: outcome.index)
+
+    def validate_all(
+        self,
+        state: Dict[str, object],
+        profiles: Optional[Sequence[RegulatoryProfile]] = None,
+        dal: Optional[str] = None,
+    ) -> Dict[RegulatoryProfile, Tuple[bool, List[Dict]]]:
+        """Validate one evidence *state* against several profiles at once."""
+        profiles = list(profiles or RegulatoryProfile)
+        return {
+            outcome.profile: (outcome.passed, outcome.report)
+            for outcome in self.run(ValidationJob(p, state, dal) for p in profiles)
+        }
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 10. QUICK-START DEMO  (python AMPEL.py)
 # ──────────────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
@@ -745,12 +1668,13 @@ if __name__ == "__main__":
         print(f"  [{c.constraint_id}] {c.hard_limit}")
 
     # Validation run — state may use rule_id as key (direct fallback in validate()).
-    # Supplying the fail_threshold value as the state value triggers a FAIL;
-    # any other value gives a PASS.
+    # Numeric values are compared against numeric thresholds; sentinel
+    # thresholds (and the threshold text itself) fire on exact match.
     print("\n── Validation run (EASA-Q100, simulated state) ──")
     simulated_state = {
-        "Q100-RULE-01": "> 10",       # FAIL: function exceeds complexity threshold
+        "Q100-RULE-01": 12,            # FAIL: complexity 12 exceeds "> 10"
         "Q100-RULE-02": "false",       # PASS: no recursion detected
+        "Q100-RULE-03": 55,            # WARN: within the "50–60 lines" band
         "Q100-RULE-06": "PSAC_absent", # FAIL: PSAC not yet present
     }
     passed, rpt = selector.validate(simulated_state)
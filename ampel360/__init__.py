@@ -17,7 +17,19 @@ from ampel360.resolver import (
     HumanPresence,
     OperationalContext,
     AMPEL360Profile,
+    FrozenAMPEL360Profile,
+    ResolutionCache,
     resolve_profile,
+    resolve_profile_cached,
+)
+from ampel360.packs import (
+    PackRegistry,
+    default_registry,
+)
+from ampel360.snapshot import (
+    SnapshotReader,
+    load_snapshot,
+    save_snapshot,
 )
 
 __all__ = [
@@ -27,5 +39,13 @@ __all__ = [
     "HumanPresence",
     "OperationalContext",
     "AMPEL360Profile",
+    "FrozenAMPEL360Profile",
+    "ResolutionCache",
     "resolve_profile",
+    "resolve_profile_cached",
+    "PackRegistry",
+    "default_registry",
+    "SnapshotReader",
+    "load_snapshot",
+    "save_snapshot",
 ]
@@ -0,0 +1,370 @@
+"""
+ampel360.lattice — Precomputed Profile Lattice
+==============================================
+
+Enumerates every combination of the four enum axes with each known
+regulatory overlay, resolves them through :func:`resolve_profile`, and
+writes the result as a dense JSON lookup table.  Edge services answer
+profile questions from that table with a single dictionary lookup.
+
+Table layout (``format = "ampel360.profile_lattice"``)::
+
+    {
+      "format": "ampel360.profile_lattice",
+      "version": 1,
+      "digest": "<sha256 of the canonical profiles section>",
+      "overlays": ["DO-178C", "EASA-Q100", ...],
+      "names": ["AUTHORITY_SIGNOFF_PRESENT", ...],   # interned template/ruleset names
+      "profiles": {
+        "AIR.PAX_TRANSPORT.CIVIL_PUBLIC.EASA-Q100@CIVIL": {
+          "env": "AIR", "func": "PAX_TRANSPORT", "payload": "CIVIL_PUBLIC",
+          "context": "CIVIL", "overlay": "EASA-Q100", "human": "HUMAN_ON_BOARD",
+          "disclosure": "FULL", "templates": [3, 17, ...], "rulesets": [...],
+          "constraints": {"dal_level": "A", ...}
+        }, ...
+      }
+    }
+
+``profile_id`` does not encode the operational context, so table keys are
+``"<profile_id>@<context>"`` (see :func:`lattice_key`).
+
+The module needs nothing beyond the standard library at import time; the
+resolver is imported only when a table is built, so :class:`LatticeTable`
+can be used on its own to read a generated table.
+
+Command line::
+
+    python -m ampel360.lattice build -o lattice.json [--overlay NAME ...]
+    python -m ampel360.lattice diff old.json new.json [--json]
+
+Coding conventions: stdlib only; dataclasses, type hints.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+LATTICE_FORMAT = "ampel360.profile_lattice"
+LATTICE_VERSION = 1
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 1. BUILD
+# ──────────────────────────────────────────────────────────────────────────────
+
+def lattice_key(profile_id: str, context: str) -> str:
+    """Return the table key of a resolved profile."""
+    return f"{profile_id}@{context}"
+
+
+def _digest(profiles: Mapping[str, Any], names: List[str]) -> str:
+    payload = json.dumps(
+        [names, profiles], sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def build_lattice(
+    overlays: Optional[Iterable[str]] = None,
+    registry: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Resolve the full axis product for each overlay and return the table.
+
+    Parameters
+    ----------
+    overlays : iterable of str, optional
+        Overlay names to enumerate (default: the ``overlay_id`` of every
+        overlay pack in the registry).
+    registry : PackRegistry, optional
+        Pack registry to resolve against (default: the process-wide one).
+    """
+    from ampel360.packs import OVERLAY_AXIS, default_registry
+    from ampel360.resolver import (
+        FunctionalMission,
+        OperationalContext,
+        OperationalEnvironment,
+        PayloadClassification,
+        resolve_profile,
+    )
+
+    registry = registry if registry is not None else default_registry()
+    if overlays is None:
+        overlays = [p.value for p in registry.packs.packs if p.axis == OVERLAY_AXIS]
+    overlays = sorted(set(overlays))
+
+    resolved = [
+        resolve_profile(env, func, payload, overlay, context, registry=registry)
+        for overlay, env, func, payload, context in itertools.product(
+            overlays,
+            OperationalEnvironment,
+            FunctionalMission,
+            PayloadClassification,
+            OperationalContext,
+        )
+    ]
+
+    names = sorted({n for p in resolved for n in (*p.templates, *p.rulesets)})
+    name_ids = {name: i for i, name in enumerate(names)}
+
+    profiles: Dict[str, Any] = {}
+    for p in resolved:
+        profiles[lattice_key(p.profile_id, p.operational_context.value)] = {
+            "env": p.environment.value,
+            "func": p.function.value,
+            "payload": p.payload_class.value,
+            "context": p.operational_context.value,
+            "overlay": p.regulatory_overlay,
+            "human": p.human_presence.value,
+            "disclosure": p.disclosure_mode,
+            "templates": sorted(name_ids[n] for n in p.templates),
+            "rulesets": sorted(name_ids[n] for n in p.rulesets),
+            "constraints": dict(sorted(p.constraints.items())),
+        }
+
+    return {
+        "format": LATTICE_FORMAT,
+        "version": LATTICE_VERSION,
+        "digest": _digest(profiles, names),
+        "overlays": overlays,
+        "names": names,
+        "profiles": profiles,
+    }
+
+
+def write_lattice(table: Mapping[str, Any], path: str) -> None:
+    """Write *table* as compact, key-sorted JSON."""
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(table, fh, sort_keys=True, separators=(",", ":"))
+        fh.write("\n")
+
+
+def read_lattice(path: str) -> Dict[str, Any]:
+    """Read and check a table written by :func:`write_lattice`."""
+    with open(path, "r", encoding="utf-8") as fh:
+        table = json.load(fh)
+    if table.get("format") != LATTICE_FORMAT:
+        raise ValueError(f"{path}: not a profile lattice table")
+    if table.get("version") != LATTICE_VERSION:
+        raise ValueError(
+            f"{path}: unsupported lattice version {table.get('version')!r}"
+        )
+    return table
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 2. LOOKUP
+# ──────────────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class LatticeProfile:
+    """One decoded table entry."""
+    key: str
+    environment: str
+    function: str
+    payload_class: str
+    operational_context: str
+    regulatory_overlay: str
+    human_presence: str
+    disclosure_mode: str
+    templates: frozenset
+    rulesets: frozenset
+    constraints: Mapping[str, Any]
+
+
+class LatticeTable:
+    """
+    Read-only lookup over a generated table.
+
+    Usage::
+
+        table = LatticeTable.load("lattice.json")
+        rec = table.get("AIR", "PAX_TRANSPORT", "CIVIL_PUBLIC", "EASA-Q100")
+        rec.constraints["dal_level"]
+    """
+
+    def __init__(self, table: Mapping[str, Any]) -> None:
+        self.table = table
+        self.digest: str = table["digest"]
+        self._names: List[str] = table["names"]
+        self._records: Mapping[str, Any] = table["profiles"]
+        self._decoded: Dict[str, LatticeProfile] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "LatticeTable":
+        return cls(read_lattice(path))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    def keys(self) -> Iterable[str]:
+        return self._records.keys()
+
+    def record(self, key: str) -> LatticeProfile:
+        """Return the decoded entry stored under *key*."""
+        hit = self._decoded.get(key)
+        if hit is None:
+            raw = self._records[key]
+            names = self._names
+            hit = LatticeProfile(
+                key=key,
+                environment=raw["env"],
+                function=raw["func"],
+                payload_class=raw["payload"],
+                operational_context=raw["context"],
+                regulatory_overlay=raw["overlay"],
+                human_presence=raw["human"],
+                disclosure_mode=raw["disclosure"],
+                templates=frozenset(names[i] for i in raw["templates"]),
+                rulesets=frozenset(names[i] for i in raw["rulesets"]),
+                constraints=raw["constraints"],
+            )
+            self._decoded[key] = hit
+        return hit
+
+    def get(
+        self,
+        env: str,
+        func: str,
+        payload: str,
+        overlay: str,
+        context: str = "CIVIL",
+    ) -> LatticeProfile:
+        """Look up a profile by its axis values; raises KeyError if absent."""
+        return self.record(lattice_key(f"{env}.{func}.{payload}.{overlay}", context))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 3. DIFF
+# ──────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class LatticeDiff:
+    """Differences between two tables, keyed by table key."""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"added": self.added, "removed": self.removed, "changed": self.changed}
+
+
+def _entry_changes(old: LatticeProfile, new: LatticeProfile) -> Dict[str, Any]:
+    changes: Dict[str, Any] = {}
+    for name in ("templates", "rulesets"):
+        a, b = getattr(old, name), getattr(new, name)
+        if a != b:
+            changes[name] = {"added": sorted(b - a), "removed": sorted(a - b)}
+    keys = sorted(set(old.constraints) | set(new.constraints))
+    constraint_changes = {
+        k: [old.constraints.get(k), new.constraints.get(k)]
+        for k in keys
+        if old.constraints.get(k) != new.constraints.get(k)
+    }
+    if constraint_changes:
+        changes["constraints"] = constraint_changes
+    for name in ("disclosure_mode", "human_presence"):
+        a, b = getattr(old, name), getattr(new, name)
+        if a != b:
+            changes[name] = [a, b]
+    return changes
+
+
+def diff_lattices(old: Mapping[str, Any], new: Mapping[str, Any]) -> LatticeDiff:
+    """Compare two tables entry by entry."""
+    diff = LatticeDiff()
+    if old.get("digest") == new.get("digest"):
+        return diff
+    a, b = LatticeTable(old), LatticeTable(new)
+    diff.added = sorted(set(b.keys()) - set(a.keys()))
+    diff.removed = sorted(set(a.keys()) - set(b.keys()))
+    for key in sorted(set(a.keys()) & set(b.keys())):
+        changes = _entry_changes(a.record(key), b.record(key))
+        if changes:
+            diff.changed[key] = changes
+    return diff
+
+
+def format_diff(diff: LatticeDiff) -> str:
+    """Render *diff* as a human-readable report."""
+    if not diff:
+        return "No differences."
+    lines = [
+        f"{len(diff.added)} added, {len(diff.removed)} removed, "
+        f"{len(diff.changed)} changed"
+    ]
+    lines += [f"+ {key}" for key in diff.added]
+    lines += [f"- {key}" for key in diff.removed]
+    for key, changes in diff.changed.items():
+        lines.append(f"~ {key}")
+        for name, change in changes.items():
+            if name in ("templates", "rulesets"):
+                for item in change["added"]:
+                    lines.append(f"    {name}: + {item}")
+                for item in change["removed"]:
+                    lines.append(f"    {name}: - {item}")
+            elif name == "constraints":
+                for k, (a, b) in change.items():
+                    lines.append(f"    constraints.{k}: {a!r} -> {b!r}")
+            else:
+                lines.append(f"    {name}: {change[0]!r} -> {change[1]!r}")
+    return "\n".join(lines)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 4. COMMAND LINE
+# ──────────────────────────────────────────────────────────────────────────────
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m ampel360.lattice",
+        description="Build and compare precomputed AMPEL360 profile lattices.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="resolve every profile and write the table")
+    build.add_argument("-o", "--output", required=True)
+    build.add_argument(
+        "--overlay", action="append", dest="overlays",
+        help="overlay name to enumerate (repeatable; default: all overlay packs)",
+    )
+
+    diff = sub.add_parser("diff", help="compare two tables (exit 1 if they differ)")
+    diff.add_argument("old")
+    diff.add_argument("new")
+    diff.add_argument("--json", action="store_true", help="print the diff as JSON")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        table = build_lattice(args.overlays)
+        write_lattice(table, args.output)
+        print(
+            f"[Lattice] {len(table['profiles'])} profiles, "
+            f"{len(table['overlays'])} overlays -> {args.output} "
+            f"(sha256 {table['digest'][:12]})"
+        )
+        return 0
+
+    result = diff_lattices(read_lattice(args.old), read_lattice(args.new))
+    if args.json:
+        print(json.dumps(result.as_dict(), indent=2, sort_keys=True))
+    else:
+        print(format_diff(result))
+    return 1 if result else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+ampel360.nameset — Interned Name Bitsets
+========================================
+
+Template and ruleset names are interned once in a :class:`NameTable`; a set
+of names is then a single Python ``int`` with one bit per interned id.
+:class:`NameSet` wraps such an ``int`` behind the read-only
+``collections.abc.Set`` interface, so compiled packs and shared (frozen)
+resolved profiles keep answering ``name in profile.templates`` while union,
+intersection, difference and equality between them become integer
+operations.
+
+Only explicit construction (:meth:`NameTable.set`) interns names.  Set
+operators merely look names up; a result that would contain names outside
+the table is returned as a plain ``frozenset``, so caller input cannot grow
+the process-wide tables.
+
+Ids are process-local: pickling a :class:`NameSet` stores its names and
+re-interns them on load.
+
+Coding conventions: stdlib only; type hints.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Set as AbstractSet
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class NameTable:
+    """Append-only registry assigning each name a stable bit position."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"NameTable({self.name!r}, {len(self)} names)"
+
+    def intern(self, name: str) -> int:
+        """Return the id of *name*, assigning the next free id if new."""
+        i = self._ids.get(name)
+        if i is None:
+            with self._lock:
+                i = self._ids.get(name)
+                if i is None:
+                    i = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = i
+        return i
+
+    def bits(self, names: Iterable[str]) -> int:
+        """Return the bitset of *names*, interning any new ones."""
+        if isinstance(names, NameSet) and names.table is self:
+            return names.bits
+        out = 0
+        for name in names:
+            out |= 1 << self.intern(name)
+        return out
+
+    def set(self, names: Iterable[str] = ()) -> "NameSet":
+        """Return a :class:`NameSet` of *names* over this table."""
+        return NameSet(self, self.bits(names))
+
+    def iter_names(self, bits: int) -> Iterator[str]:
+        names = self._names
+        while bits:
+            low = bits & -bits
+            yield names[low.bit_length() - 1]
+            bits ^= low
+
+
+#: Name tables shared by every pack and resolved profile in the process.
+TEMPLATE_NAMES = NameTable("templates")
+RULESET_NAMES = NameTable("rulesets")
+
+_TABLES = {t.name: t for t in (TEMPLATE_NAMES, RULESET_NAMES)}
+
+
+def _restore(table_name: str, names: tuple) -> "NameSet":
+    return _TABLES[table_name].set(names)
+
+
+class NameSet(AbstractSet):
+    """
+    Immutable set of names stored as a bitset over a :class:`NameTable`.
+
+    Set operators between two NameSets of the same table are single integer
+    operations; any other iterable of names is accepted as an operand too.
+    """
+
+    __slots__ = ("table", "bits")
+
+    def __init__(self, table: NameTable, bits: int = 0) -> None:
+        self.table = table
+        self.bits = bits
+
+    # ── Set protocol ──────────────────────────────────────────────────────────
+
+    def __contains__(self, name: object) -> bool:
+        i = self.table._ids.get(name)  # type: ignore[arg-type]
+        return i is not None and (self.bits >> i) & 1 == 1
+
+    def __iter__(self) -> Iterator[str]:
+        return self.table.iter_names(self.bits)
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def _other_bits(self, other: Any) -> Optional[Tuple[int, Tuple[str, ...]]]:
+        """Return (bits of the interned names in *other*, names outside the table).
+
+        Names are only looked up, never interned, so arbitrary operands
+        cannot grow the shared table.
+        """
+        # NameSet of the same table: no ABC check, no lookups.
+        if other.__class__ is NameSet and other.table is self.table:
+            return other.bits, ()
+        if not isinstance(other, Iterable):
+            return None
+        ids = self.table._ids
+        bits = 0
+        unknown = []
+        for name in other:
+            i = ids.get(name)
+            if i is None:
+                unknown.append(name)
+            else:
+                bits |= 1 << i
+        return bits, tuple(unknown)
+
+    # Results that would contain names outside the table are plain frozensets.
+
+    def __or__(self, other: Any) -> AbstractSet:
+        split = self._other_bits(other)
+        if split is None:
+            return NotImplemented
+        bits, unknown = split
+        result = NameSet(self.table, self.bits | bits)
+        return frozenset(result).union(unknown) if unknown else result
+
+    def __and__(self, other: Any) -> "NameSet":
+        split = self._other_bits(other)
+        if split is None:
+            return NotImplemented
+        return NameSet(self.table, self.bits & split[0])
+
+    def __sub__(self, other: Any) -> "NameSet":
+        split = self._other_bits(other)
+        if split is None:
+            return NotImplemented
+        return NameSet(self.table, self.bits & ~split[0])
+
+    def __xor__(self, other: Any) -> AbstractSet:
+        split = self._other_bits(other)
+        if split is None:
+            return NotImplemented
+        bits, unknown = split
+        result = NameSet(self.table, self.bits ^ bits)
+        return frozenset(result).union(unknown) if unknown else result
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __rsub__(self, other: Any) -> AbstractSet:
+        split = self._other_bits(other)
+        if split is None:
+            return NotImplemented
+        bits, unknown = split
+        result = NameSet(self.table, bits & ~self.bits)
+        return frozenset(result).union(unknown) if unknown else result
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is NameSet and other.table is self.table:
+            return self.bits == other.bits
+        return AbstractSet.__eq__(self, other)
+
+    def __le__(self, other: Any) -> bool:
+        if other.__class__ is NameSet and other.table is self.table:
+            return self.bits & ~other.bits == 0
+        return AbstractSet.__le__(self, other)
+
+    def __ge__(self, other: Any) -> bool:
+        if other.__class__ is NameSet and other.table is self.table:
+            return other.bits & ~self.bits == 0
+        return AbstractSet.__ge__(self, other)
+
+    def isdisjoint(self, other: Iterable[str]) -> bool:
+        if other.__class__ is NameSet and other.table is self.table:
+            return self.bits & other.bits == 0
+        return AbstractSet.isdisjoint(self, other)
+
+    # Equal NameSets and frozensets must hash alike.
+    def __hash__(self) -> int:
+        return hash(frozenset(self))
+
+    def __repr__(self) -> str:
+        return f"NameSet({sorted(self)!r})"
+
+    def __reduce__(self):
+        return (_restore, (self.table.name, tuple(self)))
@@ -0,0 +1,557 @@
+"""
+ampel360.packs — Axis Pack Registry
+===================================
+
+Loads the axis packs (``profiles/axis_packs/*.yaml``) and regulatory
+overlays (``profiles/overlays/*.yaml``) described in AMPEL360-ARCH-SPEC-v2.0
+§9.6–§9.7 once, and compiles them into immutable :class:`AxisPack` objects
+that :func:`ampel360.resolver.resolve_profile` applies without any string
+parsing at resolve time.
+
+Pack document schema (YAML)::
+
+    axis: environment | function | payload_classification | operational_context
+    value: AIR                      # enum value on that axis
+    overlay_id: EASA-Q100           # overlays only (instead of axis/value)
+    match: [EASA, Q100]             # overlay tokens, substring-matched
+    templates / additional_templates: [...]
+    rulesets / additional_rulesets:   [...]
+    constraints: {key: value, ...}
+
+Any pack carrying ``match`` tokens is also applied as a regulatory overlay
+whenever one of its tokens occurs in the (upper-cased) overlay name.  An
+overlay without ``match`` is matched on its own ``overlay_id``.
+
+Reloading builds a complete new :class:`PackSet` and swaps it in with a
+single attribute assignment, so concurrent resolvers always see either the
+old or the new generation, never a mixture.  :meth:`PackRegistry.watch`
+polls the pack files and reloads on change, so a new overlay file takes
+effect without a code deploy.
+
+PyYAML is optional: without it, or when the ``profiles/`` directory is not
+shipped, the registry falls back to the builtin pack documents below, which
+mirror the :data:`PACK_KEYS` of the YAML files one-to-one (enforced by
+``tests/test_pack_registry.py``).
+
+Coding conventions: stdlib only (PyYAML optional); dataclasses, type hints.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AbstractSet, Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ampel360.nameset import RULESET_NAMES, TEMPLATE_NAMES
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 1. PACK OBJECTS
+# ──────────────────────────────────────────────────────────────────────────────
+
+AXES = (
+    "environment",
+    "function",
+    "payload_classification",
+    "operational_context",
+)
+OVERLAY_AXIS = "overlay"
+
+DEFAULT_PROFILES_DIR = Path(__file__).resolve().parent.parent / "profiles"
+PACK_SUBDIRS = ("axis_packs", "overlays")
+
+# Keys of a pack document read by compile_pack(); others are commentary.
+PACK_KEYS = (
+    "axis",
+    "value",
+    "overlay_id",
+    "match",
+    "templates",
+    "additional_templates",
+    "rulesets",
+    "additional_rulesets",
+    "constraints",
+)
+
+# Distinct overlay strings whose matched packs each PackSet remembers.
+OVERLAY_MEMO_SIZE = 256
+
+
+class PackError(ValueError):
+    """Raised when a pack document is malformed or the pack set is incomplete."""
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("true", "yes", "on", "1"):
+            return True
+        if lowered in ("false", "no", "off", "0"):
+            return False
+        raise PackError(f"Not a boolean: {value!r}")
+    return bool(value)
+
+
+def _to_upper_str(value: Any) -> str:
+    return str(value).strip().upper()
+
+
+# Constraint keys with a known type are coerced once at load time (§11.4).
+_CONSTRAINT_TYPES = {
+    "risk_threshold": float,
+    "dal_level": _to_upper_str,
+    "require_authority": _to_bool,
+    "human_override": _to_bool,
+    "query_relaxation": _to_bool,
+    "disclosure_mode": _to_upper_str,
+}
+
+
+@dataclass(frozen=True)
+class AxisPack:
+    """
+    One compiled axis pack or regulatory overlay.
+
+    ``templates`` and ``rulesets`` are interned :class:`NameSet` bitsets
+    (any iterable of names is accepted and converted).
+    """
+
+    pack_id: str
+    axis: str
+    value: str
+    templates: AbstractSet[str] = frozenset()
+    rulesets: AbstractSet[str] = frozenset()
+    constraints: Tuple[Tuple[str, Any], ...] = ()
+    match: Tuple[str, ...] = ()
+    source: str = "<builtin>"
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "templates", TEMPLATE_NAMES.set(self.templates))
+        object.__setattr__(self, "rulesets", RULESET_NAMES.set(self.rulesets))
+
+    def matches(self, overlay_upper: str) -> bool:
+        """Return True if any match token occurs in *overlay_upper*."""
+        return any(token in overlay_upper for token in self.match)
+
+
+def compile_pack(doc: Mapping[str, Any], source: str = "<builtin>") -> AxisPack:
+    """Compile one parsed pack document into an :class:`AxisPack`."""
+    if not isinstance(doc, Mapping):
+        raise PackError(f"{source}: pack document must be a mapping")
+
+    if "overlay_id" in doc:
+        axis = OVERLAY_AXIS
+        value = str(doc["overlay_id"])
+        pack_id = value
+    else:
+        axis = doc.get("axis")
+        value = doc.get("value")
+        if axis not in AXES or value is None:
+            raise PackError(
+                f"{source}: expected 'overlay_id' or 'axis' in {AXES} with a 'value'"
+            )
+        value = str(value)
+        pack_id = f"{axis}:{value}"
+
+    def names(*keys: str) -> AbstractSet[str]:
+        out: set = set()
+        for key in keys:
+            items = doc.get(key) or ()
+            if isinstance(items, str):
+                raise PackError(f"{source}: '{key}' must be a list")
+            out.update(str(item) for item in items)
+        return frozenset(out)
+
+    constraints = []
+    for key, raw in (doc.get("constraints") or {}).items():
+        coerce = _CONSTRAINT_TYPES.get(key)
+        try:
+            constraints.append((key, coerce(raw) if coerce else raw))
+        except (TypeError, ValueError) as exc:
+            raise PackError(f"{source}: constraint {key}={raw!r}: {exc}") from exc
+
+    match = doc.get("match")
+    if match is None:
+        match = (value,) if axis == OVERLAY_AXIS else ()
+    elif isinstance(match, str):
+        match = (match,)
+
+    return AxisPack(
+        pack_id=pack_id,
+        axis=axis,
+        value=value,
+        templates=names("templates", "additional_templates"),
+        rulesets=names("rulesets", "additional_rulesets"),
+        constraints=tuple(constraints),
+        match=tuple(_to_upper_str(token) for token in match),
+        source=source,
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 2. PACK SET
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _required_axes() -> Dict[str, Tuple[str, ...]]:
+    # Imported lazily: the resolver itself imports this module.
+    from ampel360.resolver import (
+        FunctionalMission,
+        OperationalEnvironment,
+        PayloadClassification,
+    )
+    return {
+        "environment": tuple(e.value for e in OperationalEnvironment),
+        "function": tuple(f.value for f in FunctionalMission),
+        "payload_classification": tuple(p.value for p in PayloadClassification),
+    }
+
+
+class PackSet:
+    """
+    Immutable generation of compiled packs.
+
+    Axis packs are looked up by ``(axis, value)``; the overlay packs that
+    apply to a given overlay name are memoised for the
+    :data:`OVERLAY_MEMO_SIZE` most recently used names.
+    """
+
+    __slots__ = ("generation", "packs", "_by_axis", "_overlay_packs", "_overlay_memo")
+
+    def __init__(self, packs: Iterable[AxisPack], generation: int = 0) -> None:
+        packs = tuple(sorted(packs, key=lambda p: (p.source, p.pack_id)))
+        by_axis: Dict[str, Dict[str, AxisPack]] = {axis: {} for axis in AXES}
+        seen: Dict[str, AxisPack] = {}
+        for pack in packs:
+            if pack.pack_id in seen:
+                raise PackError(
+                    f"Duplicate pack {pack.pack_id!r} in {pack.source} "
+                    f"and {seen[pack.pack_id].source}"
+                )
+            seen[pack.pack_id] = pack
+            if pack.axis in by_axis:
+                by_axis[pack.axis][pack.value] = pack
+
+        for axis, values in _required_axes().items():
+            missing = [v for v in values if v not in by_axis[axis]]
+            if missing:
+                raise PackError(f"No {axis} pack for {', '.join(missing)}")
+
+        self.generation = generation
+        self.packs = packs
+        self._by_axis = by_axis
+        self._overlay_packs = tuple(p for p in packs if p.match)
+        self._overlay_memo: "OrderedDict[str, Tuple[AxisPack, ...]]" = OrderedDict()
+
+    def axis_pack(self, axis: str, value: str) -> Optional[AxisPack]:
+        """Return the pack for *value* on *axis*, or None."""
+        return self._by_axis[axis].get(value)
+
+    def overlay(self, overlay: str) -> Tuple[AxisPack, ...]:
+        """Return the packs applied for the named regulatory overlay."""
+        memo = self._overlay_memo
+        hit = memo.get(overlay)
+        if hit is not None:
+            try:
+                memo.move_to_end(overlay)
+            except KeyError:  # evicted concurrently
+                pass
+            return hit
+        upper = overlay.upper()
+        hit = tuple(p for p in self._overlay_packs if p.matches(upper))
+        memo[overlay] = hit
+        while len(memo) > OVERLAY_MEMO_SIZE:
+            try:
+                memo.popitem(last=False)
+            except KeyError:  # emptied concurrently
+                break
+        return hit
+
+    def __len__(self) -> int:
+        return len(self.packs)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 3. BUILTIN PACK DOCUMENTS  (mirror profiles/*.yaml)
+# ──────────────────────────────────────────────────────────────────────────────
+
+BUILTIN_PACK_DOCUMENTS: Dict[str, Dict[str, Any]] = {
+    "axis_packs/context_defense.yaml": {
+        "axis": "operational_context",
+        "value": "DEFENSE",
+        "match": ["DEF"],
+        "templates": [
+            "ROE_ENGAGEMENT_CONSTRAINTS",
+            "CIVILIAN_PROTECTION_INVARIANTS",
+            "POST_EVENT_AUDITABILITY",
+            "CLASSIFICATION_OVERLAY",
+        ],
+        "rulesets": [
+            "ENGAGEMENT_AUTHORIZED_ENVELOPE_RULE",
+            "CIVILIAN_PROTECTION_CONSTRAINT_RULE",
+            "IMMUTABLE_DECISION_LOG_RULE",
+        ],
+    },
+    "axis_packs/env_air.yaml": {
+        "axis": "environment",
+        "value": "AIR",
+        "templates": [
+            "ICA_PRESENCE_GATE",
+            "EFFECTIVITY_COMPLETENESS_CHECK",
+            "OPERATOR_TRANSFER_TEMPORAL_MODEL",
+        ],
+        "rulesets": [
+            "ICA_PRESENCE_RULE",
+            "MSN_TAIL_APPLICABILITY_RULE",
+            "LEASING_STATE_MACHINE_RULE",
+        ],
+        "constraints": {"risk_threshold": 1.0e-9},
+    },
+    "axis_packs/env_space.yaml": {
+        "axis": "environment",
+        "value": "SPACE",
+        "templates": [
+            "CONJUNCTION_EVIDENCE_LOOP",
+            "ORBIT_REGIME_APPLICABILITY",
+            "REENTRY_SAFETY_CONSTRAINT",
+        ],
+        "rulesets": [
+            "CONJUNCTION_EVIDENCE_RULE",
+            "ORBIT_REGIME_RULE",
+            "REENTRY_SAFETY_RULE",
+        ],
+        "constraints": {"risk_threshold": 1.0e-4},
+    },
+    "axis_packs/func_cargo.yaml": {
+        "axis": "function",
+        "value": "CARGO_ONLY",
+        "templates": [
+            "THIRD_PARTY_HARM_ENVELOPE",
+            "CARGO_HAZARD_CLASSIFICATION",
+            "DANGEROUS_GOODS_TEMPLATE",
+        ],
+        "rulesets": [
+            "GROUND_RISK_CONTAINMENT_RULE",
+            "CARGO_FIRE_SUPPRESSION_RULE",
+            "PAYLOAD_RESTRAINT_RULE",
+        ],
+        "constraints": {"human_override": False},
+    },
+    "axis_packs/func_pax.yaml": {
+        "axis": "function",
+        "value": "PAX_TRANSPORT",
+        "templates": [
+            "SURVIVABILITY_REQUIREMENT",
+            "HUMAN_OVERRIDE_REQUIREMENT",
+            "CABIN_SAFETY_TEMPLATE",
+        ],
+        "rulesets": [
+            "PUBLISH_GATE_SAFETY_REPORT_REQUIRED",
+            "EVACUATION_COMPLIANCE_RULE",
+            "HUMAN_FACTORS_RULE",
+        ],
+        "constraints": {"human_override": True, "dal_level": "A"},
+    },
+    "axis_packs/payload_civil_public.yaml": {
+        "axis": "payload_classification",
+        "value": "CIVIL_PUBLIC",
+        "constraints": {"disclosure_mode": "FULL", "query_relaxation": True},
+    },
+    "axis_packs/payload_commercial_sensitive.yaml": {
+        "axis": "payload_classification",
+        "value": "COMMERCIAL_SENSITIVE",
+        "constraints": {"disclosure_mode": "REDACTED", "query_relaxation": True},
+    },
+    "axis_packs/payload_defense_classified.yaml": {
+        "axis": "payload_classification",
+        "value": "DEFENSE_CLASSIFIED",
+        "additional_rulesets": [
+            "FEDERATED_SEARCH_PUSHDOWN_RULE",
+            "PROVENANCE_WATERMARKING_RULE",
+        ],
+        "constraints": {
+            "disclosure_mode": "ATTESTATION_ONLY",
+            "query_relaxation": False,
+        },
+    },
+    "axis_packs/payload_export_controlled.yaml": {
+        "axis": "payload_classification",
+        "value": "EXPORT_CONTROLLED",
+        "constraints": {"disclosure_mode": "REDACTED", "query_relaxation": False},
+    },
+    "overlays/do_178c.yaml": {
+        "overlay_id": "DO-178C",
+        "match": ["DO-178C", "DO_178C"],
+        "additional_rulesets": ["DO_178C_ARTEFACT_RULESET"],
+    },
+    "overlays/easa_q100.yaml": {
+        "overlay_id": "EASA-Q100",
+        "match": ["EASA", "Q100"],
+        "additional_templates": ["EASA_CS25_COMPLIANCE_TEMPLATE"],
+        "additional_rulesets": ["DO_178C_DAL_A_RULESET"],
+        "constraints": {
+            "risk_threshold": 1.0e-9,
+            "dal_level": "A",
+            "require_authority": True,
+        },
+    },
+    "overlays/space_q10.yaml": {
+        "overlay_id": "SPACE-Q10",
+        "match": ["SPACE", "Q10"],
+        "additional_templates": ["ECSS_COMPLIANCE_TEMPLATE"],
+        "additional_rulesets": ["ECSS_Q_ST_40C_RULESET"],
+        "constraints": {"risk_threshold": 1.0e-4},
+    },
+}
+
+
+def builtin_packs() -> List[AxisPack]:
+    """Compile :data:`BUILTIN_PACK_DOCUMENTS`."""
+    return [compile_pack(doc, source) for source, doc in BUILTIN_PACK_DOCUMENTS.items()]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 4. REGISTRY
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _pack_files(root: Path) -> List[Path]:
+    files: List[Path] = []
+    for sub in PACK_SUBDIRS:
+        files.extend(sorted((root / sub).glob("*.yaml")))
+    return files
+
+
+def load_pack_files(root: Path) -> List[AxisPack]:
+    """Parse and compile every pack file below *root*."""
+    if yaml is None:
+        raise PackError("PyYAML is required to load pack files")
+    packs = []
+    for path in _pack_files(root):
+        with open(path, "r", encoding="utf-8") as fh:
+            doc = yaml.safe_load(fh)
+        packs.append(compile_pack(doc, f"{path.parent.name}/{path.name}"))
+    return packs
+
+
+class PackRegistry:
+    """
+    Holder of the current :class:`PackSet`.
+
+    Parameters
+    ----------
+    root : path, optional
+        Directory containing ``axis_packs/`` and ``overlays/``.  When None,
+        the builtin pack documents are used.
+    """
+
+    def __init__(self, root: Optional[Any] = None) -> None:
+        self.root: Optional[Path] = Path(root) if root is not None else None
+        self.last_error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._signature: Tuple[Tuple[str, int, int], ...] = ()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.packs: PackSet = self._build(0)
+
+    def _file_signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        if self.root is None:
+            return ()
+        sig = []
+        for path in _pack_files(self.root):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            sig.append((str(path), st.st_mtime_ns, st.st_size))
+        return tuple(sig)
+
+    def _build(self, generation: int) -> PackSet:
+        signature = self._file_signature()
+        packs = builtin_packs() if self.root is None else load_pack_files(self.root)
+        pack_set = PackSet(packs, generation)
+        self._signature = signature
+        return pack_set
+
+    @property
+    def generation(self) -> int:
+        """Generation number of the current pack set."""
+        return self.packs.generation
+
+    def reload(self) -> PackSet:
+        """
+        Re-read all pack files and atomically swap in the new pack set.
+
+        On error the current pack set stays in place and the exception is
+        re-raised (and kept in :attr:`last_error`).
+        """
+        with self._lock:
+            try:
+                pack_set = self._build(self.packs.generation + 1)
+            except Exception as exc:
+                self.last_error = exc
+                raise
+            self.last_error = None
+            self.packs = pack_set
+            return pack_set
+
+    def reload_if_changed(self) -> bool:
+        """Reload if any pack file was added, removed or modified."""
+        if self.root is None or self._file_signature() == self._signature:
+            return False
+        try:
+            self.reload()
+        except Exception:
+            # Remember the broken signature so a bad file is reported once.
+            self._signature = self._file_signature()
+            return False
+        return True
+
+    def watch(self, interval: float = 1.0) -> None:
+        """Start a daemon thread that polls the pack files every *interval* s."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+
+        def _poll() -> None:
+            while not self._stop.wait(interval):
+                self.reload_if_changed()
+
+        self._watcher = threading.Thread(
+            target=_poll, name="ampel360-pack-watch", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the polling thread started by :meth:`watch`."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+
+_DEFAULT_REGISTRY: Optional[PackRegistry] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_registry() -> PackRegistry:
+    """
+    Return the process-wide registry.
+
+    Loads ``profiles/`` next to the package when it exists and PyYAML is
+    installed; otherwise uses the builtin pack documents.
+    """
+    global _DEFAULT_REGISTRY
+    registry = _DEFAULT_REGISTRY
+    if registry is None:
+        with _DEFAULT_LOCK:
+            if _DEFAULT_REGISTRY is None:
+                use_files = yaml is not None and (DEFAULT_PROFILES_DIR / "axis_packs").is_dir()
+                _DEFAULT_REGISTRY = PackRegistry(DEFAULT_PROFILES_DIR if use_files else None)
+            registry = _DEFAULT_REGISTRY
+    return registry
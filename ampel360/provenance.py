@@ -0,0 +1,469 @@
+"""
+ampel360.provenance — Explainable, Incremental Re-resolution
+============================================================
+
+:func:`trace_profile` resolves a profile exactly like
+:func:`ampel360.resolver.resolve_profile`, but keeps the packs contributed
+by each axis slot and the merge history of every constraint, so that
+
+  • :meth:`ResolutionTrace.explain` tells an auditor which pack set each
+    merged constraint value (and which packs were overridden), and
+  • :meth:`ResolutionTrace.sources_of` tells which packs added a template
+    or ruleset.
+
+:meth:`ResolutionTrace.with_axes` re-resolves after an axis change by
+re-selecting only the slots that depend on the changed axes and re-folding
+the precompiled packs, and returns a structured :class:`ProfileDiff`.
+
+:class:`FleetResolver` applies the same idea to a fleet: tails sharing an
+axis tuple share one trace, so an overlay change re-resolves each distinct
+axis tuple once (at most 32 per overlay) however many tails there are.
+
+Slot dependencies::
+
+    environment   ← env
+    function      ← func
+    payload       ← payload
+    context       ← context
+    overlay       ← overlay, context   (defence extension is applied once)
+
+Coding conventions: stdlib only; dataclasses, type hints.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ampel360.nameset import RULESET_NAMES, TEMPLATE_NAMES, NameSet
+from ampel360.packs import AxisPack, PackRegistry, PackSet, default_registry
+from ampel360.resolver import (
+    AMPEL360Profile,
+    FrozenAMPEL360Profile,
+    FunctionalMission,
+    HumanPresence,
+    OperationalContext,
+    OperationalEnvironment,
+    PayloadClassification,
+    _CONSTRAINT_MERGE,
+    _KERNEL_CONSTRAINTS,
+    _KERNEL_RULESETS,
+    _KERNEL_TEMPLATES,
+    _defense_extension,
+    _last_writer_wins,
+    _normalise,
+    _regulatory_overlay,
+)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 1. SLOTS
+# ──────────────────────────────────────────────────────────────────────────────
+
+AXIS_NAMES = ("env", "func", "payload", "overlay", "context")
+SLOTS = ("kernel", "environment", "function", "payload", "context", "overlay")
+
+# Axes each slot is selected from.
+_SLOT_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "kernel": (),
+    "environment": ("env",),
+    "function": ("func",),
+    "payload": ("payload",),
+    "context": ("context",),
+    "overlay": ("overlay", "context"),
+}
+
+_KERNEL_PACK = AxisPack(
+    pack_id="kernel",
+    axis="kernel",
+    value="BASE",
+    templates=_KERNEL_TEMPLATES,
+    rulesets=_KERNEL_RULESETS,
+    constraints=tuple(_KERNEL_CONSTRAINTS.items()),
+)
+
+AxisKey = Tuple[
+    OperationalEnvironment,
+    FunctionalMission,
+    PayloadClassification,
+    str,
+    OperationalContext,
+]
+
+
+def _axis_key(axes: Mapping[str, Any]) -> AxisKey:
+    return (
+        _normalise(OperationalEnvironment, axes["env"]),
+        _normalise(FunctionalMission, axes["func"]),
+        _normalise(PayloadClassification, axes["payload"]),
+        str(axes["overlay"]),
+        _normalise(OperationalContext, axes.get("context", OperationalContext.CIVIL)),
+    )
+
+
+def _select_slot(slot: str, packs: PackSet, key: AxisKey) -> Tuple[AxisPack, ...]:
+    env, func, payload, overlay, context = key
+    if slot == "kernel":
+        return (_KERNEL_PACK,)
+    if slot == "environment":
+        return (packs.axis_pack("environment", env.value),)
+    if slot == "function":
+        return (packs.axis_pack("function", func.value),)
+    if slot == "payload":
+        return (packs.axis_pack("payload_classification", payload.value),)
+    defense = context == OperationalContext.DEFENSE
+    if slot == "context":
+        pack = _defense_extension(packs) if defense else None
+        return (pack,) if pack is not None else ()
+    return tuple(_regulatory_overlay(packs, overlay, _defense_applied=defense))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 2. DIFF
+# ──────────────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class ConstraintProvenance:
+    """How one merged constraint got its value."""
+    key: str
+    value: Any
+    source: str
+    history: Tuple[Tuple[str, Any], ...]
+
+
+@dataclass(frozen=True)
+class ConstraintChange:
+    """A constraint whose merged value differs between two profiles."""
+    key: str
+    before: Any
+    after: Any
+    before_source: Optional[str]
+    after_source: Optional[str]
+
+
+@dataclass(frozen=True)
+class ProfileDiff:
+    """Structured difference between two resolved profiles."""
+    before_id: str
+    after_id: str
+    axes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+    templates_added: NameSet = field(default_factory=TEMPLATE_NAMES.set)
+    templates_removed: NameSet = field(default_factory=TEMPLATE_NAMES.set)
+    rulesets_added: NameSet = field(default_factory=RULESET_NAMES.set)
+    rulesets_removed: NameSet = field(default_factory=RULESET_NAMES.set)
+    constraints: Dict[str, ConstraintChange] = field(default_factory=dict)
+    fields: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        """True if the resolved content (not just the axes) changed."""
+        return bool(
+            self.templates_added or self.templates_removed
+            or self.rulesets_added or self.rulesets_removed
+            or self.constraints or self.fields
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain, JSON-serialisable form."""
+        def plain(v: Any) -> Any:
+            return v.value if hasattr(v, "value") and not isinstance(v, str) else v
+
+        return {
+            "before": self.before_id,
+            "after": self.after_id,
+            "axes": {k: [plain(a), plain(b)] for k, (a, b) in self.axes.items()},
+            "templates": {
+                "added": sorted(self.templates_added),
+                "removed": sorted(self.templates_removed),
+            },
+            "rulesets": {
+                "added": sorted(self.rulesets_added),
+                "removed": sorted(self.rulesets_removed),
+            },
+            "constraints": {
+                k: {
+                    "before": c.before,
+                    "after": c.after,
+                    "before_source": c.before_source,
+                    "after_source": c.after_source,
+                }
+                for k, c in sorted(self.constraints.items())
+            },
+            "fields": {k: [plain(a), plain(b)] for k, (a, b) in self.fields.items()},
+        }
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 3. TRACE
+# ──────────────────────────────────────────────────────────────────────────────
+
+class ResolutionTrace:
+    """
+    A resolved profile together with the per-slot packs that produced it.
+
+    Build with :func:`trace_profile`; derive changed traces with
+    :meth:`with_axes`.
+    """
+
+    __slots__ = ("key", "packs", "slots", "profile", "_sources", "_history")
+
+    def __init__(
+        self,
+        key: AxisKey,
+        packs: PackSet,
+        slots: Dict[str, Tuple[AxisPack, ...]],
+    ) -> None:
+        self.key = key
+        self.packs = packs
+        self.slots = slots
+        self._fold()
+
+    def _fold(self) -> None:
+        templates = rulesets = 0
+        constraints: Dict[str, Any] = {}
+        sources: Dict[str, str] = {}
+        history: Dict[str, List[Tuple[str, Any]]] = {}
+        merge = _CONSTRAINT_MERGE
+        for slot in SLOTS:
+            for pack in self.slots[slot]:
+                templates |= pack.templates.bits
+                rulesets |= pack.rulesets.bits
+                for k, value in pack.constraints:
+                    history.setdefault(k, []).append((pack.pack_id, value))
+                    if k in constraints:
+                        merged = merge.get(k, _last_writer_wins)(constraints[k], value)
+                        if merged != constraints[k]:
+                            sources[k] = pack.pack_id
+                        constraints[k] = merged
+                    else:
+                        constraints[k] = value
+                        sources[k] = pack.pack_id
+
+        env, func, payload, overlay, context = self.key
+        self.profile = FrozenAMPEL360Profile(AMPEL360Profile(
+            profile_id=f"{env.value}.{func.value}.{payload.value}.{overlay}",
+            environment=env,
+            function=func,
+            payload_class=payload,
+            human_presence=(
+                HumanPresence.HOB
+                if func == FunctionalMission.PAX_TRANSPORT
+                else HumanPresence.NHOB
+            ),
+            operational_context=context,
+            regulatory_overlay=overlay,
+            templates=NameSet(TEMPLATE_NAMES, templates),
+            rulesets=NameSet(RULESET_NAMES, rulesets),
+            constraints=constraints,
+            disclosure_mode=constraints.get("disclosure_mode", "FULL"),
+        ))
+        self._sources = sources
+        self._history = {k: tuple(v) for k, v in history.items()}
+
+    # ── provenance ────────────────────────────────────────────────────────────
+
+    @property
+    def axes(self) -> Dict[str, Any]:
+        return dict(zip(AXIS_NAMES, self.key))
+
+    def contributions(self) -> List[Tuple[str, AxisPack]]:
+        """Return ``(slot, pack)`` pairs in application order."""
+        return [(slot, pack) for slot in SLOTS for pack in self.slots[slot]]
+
+    def sources_of(self, name: str) -> List[str]:
+        """Return the ids of the packs that added template or ruleset *name*."""
+        out = []
+        for _, pack in self.contributions():
+            if name in pack.templates or name in pack.rulesets:
+                out.append(pack.pack_id)
+        return out
+
+    def explain(self, key: str) -> ConstraintProvenance:
+        """Return the merged value of constraint *key* and where it came from."""
+        return ConstraintProvenance(
+            key=key,
+            value=self.profile.constraints[key],
+            source=self._sources[key],
+            history=self._history[key],
+        )
+
+    # ── incremental re-resolution ─────────────────────────────────────────────
+
+    def with_axes(
+        self,
+        registry: Optional[PackRegistry] = None,
+        **changes: Any,
+    ) -> Tuple["ResolutionTrace", ProfileDiff]:
+        """
+        Re-resolve with some axes changed (``env``, ``func``, ``payload``,
+        ``overlay``, ``context``).
+
+        Only slots whose inputs changed are re-selected; all slots are
+        re-selected if the pack registry was reloaded since this trace was
+        built.  Returns the new trace and its diff against this one.
+        """
+        unknown = set(changes) - set(AXIS_NAMES)
+        if unknown:
+            raise TypeError(f"Unknown axis: {', '.join(sorted(unknown))}")
+        axes = self.axes
+        axes.update(changes)
+        key = _axis_key(axes)
+        packs = (registry or default_registry()).packs
+        changed_axes = {
+            name for name, old, new in zip(AXIS_NAMES, self.key, key) if old != new
+        }
+        slots = {}
+        for slot in SLOTS:
+            if packs is self.packs and not changed_axes.intersection(_SLOT_INPUTS[slot]):
+                slots[slot] = self.slots[slot]
+            else:
+                slots[slot] = _select_slot(slot, packs, key)
+        new = ResolutionTrace(key, packs, slots)
+        return new, self.diff(new)
+
+    def diff(self, other: "ResolutionTrace") -> ProfileDiff:
+        """Return the structured difference from this trace to *other*."""
+        a, b = self.profile, other.profile
+        constraints = {}
+        for k in sorted(set(a.constraints) | set(b.constraints)):
+            before, after = a.constraints.get(k), b.constraints.get(k)
+            if before != after:
+                constraints[k] = ConstraintChange(
+                    k, before, after, self._sources.get(k), other._sources.get(k)
+                )
+        fields = {
+            name: (getattr(a, name), getattr(b, name))
+            for name in ("human_presence", "disclosure_mode")
+            if getattr(a, name) != getattr(b, name)
+        }
+        return ProfileDiff(
+            before_id=a.profile_id,
+            after_id=b.profile_id,
+            axes={
+                name: (old, new)
+                for name, old, new in zip(AXIS_NAMES, self.key, other.key)
+                if old != new
+            },
+            templates_added=b.templates - a.templates,
+            templates_removed=a.templates - b.templates,
+            rulesets_added=b.rulesets - a.rulesets,
+            rulesets_removed=a.rulesets - b.rulesets,
+            constraints=constraints,
+            fields=fields,
+        )
+
+
+def trace_profile(
+    env: OperationalEnvironment,
+    func: FunctionalMission,
+    payload: PayloadClassification,
+    overlay: str,
+    context: OperationalContext = OperationalContext.CIVIL,
+    *,
+    registry: Optional[PackRegistry] = None,
+) -> ResolutionTrace:
+    """
+    Resolve a profile and keep its provenance.
+
+    ``trace_profile(...).profile`` equals ``resolve_profile(...)`` for the
+    same arguments.  Axis arguments may be enum members or their values.
+    """
+    key = _axis_key(
+        {"env": env, "func": func, "payload": payload, "overlay": overlay,
+         "context": context}
+    )
+    packs = (registry or default_registry()).packs
+    return ResolutionTrace(
+        key, packs, {slot: _select_slot(slot, packs, key) for slot in SLOTS}
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 4. FLEET
+# ──────────────────────────────────────────────────────────────────────────────
+
+class FleetResolver:
+    """
+    Profiles for a fleet of tails, re-resolved incrementally.
+
+    Usage::
+
+        fleet = FleetResolver()
+        fleet.assign("EC-ABC", "AIR", "PAX_TRANSPORT", "CIVIL_PUBLIC", "EASA-Q100")
+        diffs = fleet.change(overlay="EASA-Q100(+DO-178C)")
+        diffs["EC-ABC"].rulesets_added
+    """
+
+    def __init__(self, registry: Optional[PackRegistry] = None) -> None:
+        self._registry = registry
+        self._tails: Dict[str, AxisKey] = {}
+        self._traces: Dict[AxisKey, ResolutionTrace] = {}
+
+    @property
+    def registry(self) -> PackRegistry:
+        return self._registry if self._registry is not None else default_registry()
+
+    def __len__(self) -> int:
+        return len(self._tails)
+
+    def __contains__(self, tail: str) -> bool:
+        return tail in self._tails
+
+    def _trace(self, key: AxisKey) -> ResolutionTrace:
+        trace = self._traces.get(key)
+        if trace is None or trace.packs is not self.registry.packs:
+            trace = trace_profile(*key, registry=self.registry)
+            self._traces[key] = trace
+        return trace
+
+    def assign(
+        self,
+        tail: str,
+        env: OperationalEnvironment,
+        func: FunctionalMission,
+        payload: PayloadClassification,
+        overlay: str,
+        context: OperationalContext = OperationalContext.CIVIL,
+    ) -> FrozenAMPEL360Profile:
+        """Register (or re-register) *tail* and return its profile."""
+        key = _axis_key(
+            {"env": env, "func": func, "payload": payload, "overlay": overlay,
+             "context": context}
+        )
+        self._tails[tail] = key
+        return self._trace(key).profile
+
+    def remove(self, tail: str) -> None:
+        del self._tails[tail]
+
+    def profile(self, tail: str) -> FrozenAMPEL360Profile:
+        return self._trace(self._tails[tail]).profile
+
+    def trace(self, tail: str) -> ResolutionTrace:
+        return self._trace(self._tails[tail])
+
+    def change(
+        self,
+        tails: Optional[Iterable[str]] = None,
+        **changes: Any,
+    ) -> Dict[str, ProfileDiff]:
+        """
+        Apply an axis change to *tails* (default: the whole fleet).
+
+        Each distinct axis tuple among the tails is re-resolved once.
+        Returns the diff of every tail whose resolved profile changed.
+        """
+        selected = list(self._tails) if tails is None else list(tails)
+        groups: Dict[AxisKey, List[str]] = {}
+        for tail in selected:
+            groups.setdefault(self._tails[tail], []).append(tail)
+
+        diffs: Dict[str, ProfileDiff] = {}
+        for old_key, members in groups.items():
+            old = self._trace(old_key)
+            new, diff = old.with_axes(registry=self.registry, **changes)
+            self._traces.setdefault(new.key, new)
+            for tail in members:
+                self._tails[tail] = new.key
+                if diff:
+                    diffs[tail] = diff
+        return diffs
@@ -13,14 +13,30 @@ Axis resolution order (structural):
 
 Merge strategy: most-restrictive-wins on all safety and security gates.
 
+Pack contents are data, not code: they are loaded from ``profiles/`` and
+precompiled by :mod:`ampel360.packs`.
+
 Coding conventions: stdlib only; dataclasses, Enum, type hints.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError, dataclass, field, fields
 from enum import Enum
-from typing import Any, Dict, Optional, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from ampel360.nameset import RULESET_NAMES, TEMPLATE_NAMES
+
+from ampel360.packs import (
+    OVERLAY_AXIS,
+    AxisPack,
+    PackRegistry,
+    PackSet,
+    default_registry,
+)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -65,6 +81,10 @@ _DISCLOSURE_ORDER = ["FULL", "REDACTED", "ATTESTATION_ONLY"]
 # DAL levels ordered from least to most restrictive (E < D < C < B < A).
 _DAL_ORDER = ["E", "D", "C", "B", "A"]
 
+# Integer ranks of the orders above; unknown values rank lowest.
+_DISCLOSURE_RANK = {mode: i for i, mode in enumerate(_DISCLOSURE_ORDER)}
+_DAL_RANK = {level: i for i, level in enumerate(_DAL_ORDER)}
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 2. PROFILE OBJECT  (§11.2)
@@ -72,7 +92,14 @@ _DAL_ORDER = ["E", "D", "C", "B", "A"]
 
 @dataclass
 class AMPEL360Profile:
-    """Complete resolved profile produced by :func:`resolve_profile`."""
+    """
+    Complete resolved profile produced by :func:`resolve_profile`.
+
+    ``templates`` and ``rulesets`` are plain mutable sets.  Packs are merged
+    as interned bitsets internally, and shared profiles
+    (:class:`FrozenAMPEL360Profile`) keep them as read-only
+    :class:`~ampel360.nameset.NameSet` bitsets.
+    """
 
     profile_id: str = ""
     environment: Optional[OperationalEnvironment] = None
@@ -93,16 +120,30 @@ class AMPEL360Profile:
 
 def _most_restrictive_disclosure(a: str, b: str) -> str:
     """Return the more restrictive of two disclosure modes."""
-    idx_a = _DISCLOSURE_ORDER.index(a) if a in _DISCLOSURE_ORDER else 0
-    idx_b = _DISCLOSURE_ORDER.index(b) if b in _DISCLOSURE_ORDER else 0
-    return _DISCLOSURE_ORDER[max(idx_a, idx_b)]
+    rank = _DISCLOSURE_RANK
+    return _DISCLOSURE_ORDER[max(rank.get(a, 0), rank.get(b, 0))]
 
 
 def _max_dal(a: str, b: str) -> str:
     """Return the higher (stricter) of two DAL levels."""
-    idx_a = _DAL_ORDER.index(a) if a in _DAL_ORDER else 0
-    idx_b = _DAL_ORDER.index(b) if b in _DAL_ORDER else 0
-    return _DAL_ORDER[max(idx_a, idx_b)]
+    rank = _DAL_RANK
+    return _DAL_ORDER[max(rank.get(a, 0), rank.get(b, 0))]
+
+
+def _last_writer_wins(existing: Any, incoming: Any) -> Any:
+    return incoming
+
+
+# Merge operator per constraint key (most-restrictive-wins, §11.4).
+# Keys not listed here are last-writer-wins.
+_CONSTRAINT_MERGE: Dict[str, Callable[[Any, Any], Any]] = {
+    "risk_threshold": min,
+    "dal_level": lambda a, b: _max_dal(str(a), str(b)),
+    "require_authority": lambda a, b: a or b,
+    "human_override": lambda a, b: a or b,
+    "disclosure_mode": lambda a, b: _most_restrictive_disclosure(str(a), str(b)),
+    "query_relaxation": lambda a, b: a and b,
+}
 
 
 def _merge_constraint(key: str, existing: Any, incoming: Any) -> Any:
@@ -110,200 +151,100 @@ def _merge_constraint(key: str, existing: Any, incoming: Any) -> Any:
     Merge a single constraint value according to the most-restrictive-wins
     strategy (§11.4).
     """
-    if key == "risk_threshold":
-        return min(existing, incoming)
-    if key == "dal_level":
-        return _max_dal(str(existing), str(incoming))
-    if key in ("require_authority", "human_override"):
-        return existing or incoming
-    if key == "disclosure_mode":
-        return _most_restrictive_disclosure(str(existing), str(incoming))
-    if key == "query_relaxation":
-        return existing and incoming
-    # Default: prefer incoming (last-writer-wins for unknown keys)
-    return incoming
-
-
-def _merge_constraints(
-    target: Dict[str, Any],
-    source: Dict[str, Any],
-) -> None:
-    """Merge *source* constraints into *target* in place."""
-    for key, value in source.items():
-        if key in target:
-            target[key] = _merge_constraint(key, target[key], value)
-        else:
-            target[key] = value
+    return _CONSTRAINT_MERGE.get(key, _last_writer_wins)(existing, incoming)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 4. AXIS PACK LOADERS  (§9.6)
+#    Pack contents live in profiles/axis_packs and profiles/overlays and are
+#    compiled once by ampel360.packs; the functions below select and apply them.
 # ──────────────────────────────────────────────────────────────────────────────
 
+_KERNEL_TEMPLATES = TEMPLATE_NAMES.set((
+    "H_PIPELINE_GATE_CHECK",
+    "SECURITY_INTEGRITY_CHECK",
+    "INTERPRET_CONFIRM_ACTIVATE_PUBLISH_SM",
+))
+_KERNEL_RULESETS = RULESET_NAMES.set((
+    "SAFETY_ENVELOPE_VALID",
+    "TOKEN_GRAPH_COMPLETE",
+    "AUTHORITY_SIGNOFF_PRESENT",
+))
+_KERNEL_CONSTRAINTS = {
+    "risk_threshold": 1e-7,
+    "require_authority": True,
+    "human_override": False,
+    "query_relaxation": True,
+    "disclosure_mode": "FULL",
+}
+
+
 def _load_base_kernel() -> AMPEL360Profile:
     """Step 1 — Load the base kernel (common to all profiles)."""
     return AMPEL360Profile(
-        templates={
-            "H_PIPELINE_GATE_CHECK",
-            "SECURITY_INTEGRITY_CHECK",
-            "INTERPRET_CONFIRM_ACTIVATE_PUBLISH_SM",
-        },
-        rulesets={
-            "SAFETY_ENVELOPE_VALID",
-            "TOKEN_GRAPH_COMPLETE",
-            "AUTHORITY_SIGNOFF_PRESENT",
-        },
-        constraints={
-            "risk_threshold": 1e-7,
-            "require_authority": True,
-            "human_override": False,
-            "query_relaxation": True,
-            "disclosure_mode": "FULL",
-        },
+        templates=_KERNEL_TEMPLATES,
+        rulesets=_KERNEL_RULESETS,
+        constraints=dict(_KERNEL_CONSTRAINTS),
     )
 
 
-def _apply_env_pack(profile: AMPEL360Profile, env: OperationalEnvironment) -> None:
-    """Apply environment axis pack (§9.6 ENV effects)."""
-    if env == OperationalEnvironment.AIR:
-        profile.templates |= {
-            "ICA_PRESENCE_GATE",
-            "EFFECTIVITY_COMPLETENESS_CHECK",
-            "OPERATOR_TRANSFER_TEMPORAL_MODEL",
-        }
-        profile.rulesets |= {
-            "ICA_PRESENCE_RULE",
-            "MSN_TAIL_APPLICABILITY_RULE",
-            "LEASING_STATE_MACHINE_RULE",
-        }
-        _merge_constraints(profile.constraints, {
-            "risk_threshold": 1e-9,
-        })
-    else:  # SPACE
-        profile.templates |= {
-            "CONJUNCTION_EVIDENCE_LOOP",
-            "ORBIT_REGIME_APPLICABILITY",
-            "REENTRY_SAFETY_CONSTRAINT",
-        }
-        profile.rulesets |= {
-            "CONJUNCTION_EVIDENCE_RULE",
-            "ORBIT_REGIME_RULE",
-            "REENTRY_SAFETY_RULE",
-        }
-        _merge_constraints(profile.constraints, {
-            "risk_threshold": 1e-4,
-        })
-
-
-def _apply_func_pack(profile: AMPEL360Profile, func: FunctionalMission) -> None:
-    """Apply function axis pack (§9.6 FUNC effects)."""
-    if func == FunctionalMission.PAX_TRANSPORT:
-        profile.templates |= {
-            "SURVIVABILITY_REQUIREMENT",
-            "HUMAN_OVERRIDE_REQUIREMENT",
-            "CABIN_SAFETY_TEMPLATE",
-        }
-        profile.rulesets |= {
-            "PUBLISH_GATE_SAFETY_REPORT_REQUIRED",
-            "EVACUATION_COMPLIANCE_RULE",
-            "HUMAN_FACTORS_RULE",
-        }
-        _merge_constraints(profile.constraints, {
-            "human_override": True,
-            "dal_level": "A",
-        })
-    else:  # CARGO_ONLY
-        profile.templates |= {
-            "THIRD_PARTY_HARM_ENVELOPE",
-            "CARGO_HAZARD_CLASSIFICATION",
-            "DANGEROUS_GOODS_TEMPLATE",
-        }
-        profile.rulesets |= {
-            "GROUND_RISK_CONTAINMENT_RULE",
-            "CARGO_FIRE_SUPPRESSION_RULE",
-            "PAYLOAD_RESTRAINT_RULE",
-        }
-        _merge_constraints(profile.constraints, {
-            "human_override": False,
-        })
-
-
-def _apply_payload_pack(
-    profile: AMPEL360Profile,
+def _apply_packs(profile: AMPEL360Profile, packs: Iterable[AxisPack]) -> None:
+    """
+    Apply precompiled packs in order.
+
+    Template and ruleset bitsets are OR-ed as plain ints and expanded into
+    the profile's mutable sets once at the end; constraint deltas are merged
+    through :data:`_CONSTRAINT_MERGE`.
+    """
+    templates = TEMPLATE_NAMES.bits(profile.templates)
+    rulesets = RULESET_NAMES.bits(profile.rulesets)
+    constraints = profile.constraints
+    merge = _CONSTRAINT_MERGE
+    for pack in packs:
+        templates |= pack.templates.bits
+        rulesets |= pack.rulesets.bits
+        for key, value in pack.constraints:
+            if key in constraints:
+                constraints[key] = merge.get(key, _last_writer_wins)(constraints[key], value)
+            else:
+                constraints[key] = value
+    profile.templates = set(TEMPLATE_NAMES.iter_names(templates))
+    profile.rulesets = set(RULESET_NAMES.iter_names(rulesets))
+
+
+def _axis_packs(
+    packs: PackSet,
+    env: OperationalEnvironment,
+    func: FunctionalMission,
     payload: PayloadClassification,
-) -> None:
-    """Apply payload classification axis pack (§9.6 PAYLOAD effects)."""
-    if payload == PayloadClassification.CIVIL_PUBLIC:
-        _merge_constraints(profile.constraints, {
-            "disclosure_mode": "FULL",
-            "query_relaxation": True,
-        })
-    elif payload == PayloadClassification.COMMERCIAL_SENSITIVE:
-        _merge_constraints(profile.constraints, {
-            "disclosure_mode": "REDACTED",
-            "query_relaxation": True,
-        })
-    elif payload == PayloadClassification.EXPORT_CONTROLLED:
-        _merge_constraints(profile.constraints, {
-            "disclosure_mode": "REDACTED",
-            "query_relaxation": False,
-        })
-    elif payload == PayloadClassification.DEFENSE_CLASSIFIED:
-        profile.rulesets |= {
-            "FEDERATED_SEARCH_PUSHDOWN_RULE",
-            "PROVENANCE_WATERMARKING_RULE",
-        }
-        _merge_constraints(profile.constraints, {
-            "disclosure_mode": "ATTESTATION_ONLY",
-            "query_relaxation": False,
-        })
-
-
-def _apply_defense_extension(profile: AMPEL360Profile) -> None:
-    """Apply defence profile extension (§8)."""
-    profile.templates |= {
-        "ROE_ENGAGEMENT_CONSTRAINTS",
-        "CIVILIAN_PROTECTION_INVARIANTS",
-        "POST_EVENT_AUDITABILITY",
-        "CLASSIFICATION_OVERLAY",
-    }
-    profile.rulesets |= {
-        "ENGAGEMENT_AUTHORIZED_ENVELOPE_RULE",
-        "CIVILIAN_PROTECTION_CONSTRAINT_RULE",
-        "IMMUTABLE_DECISION_LOG_RULE",
-    }
-
-
-def _apply_regulatory_overlay(
-    profile: AMPEL360Profile,
-    overlay: str,
-    *,
-    _defense_applied: bool = False,
-) -> None:
-    """Apply a named regulatory overlay (§9.5 step 3)."""
-    overlay_upper = overlay.upper()
+) -> List[AxisPack]:
+    """Select the ENV, FUNC and PAYLOAD packs (§9.6)."""
+    return [
+        packs.axis_pack("environment", env.value),
+        packs.axis_pack("function", func.value),
+        packs.axis_pack("payload_classification", payload.value),
+    ]
+
 
-    if "EASA" in overlay_upper or "Q100" in overlay_upper:
-        profile.templates.add("EASA_CS25_COMPLIANCE_TEMPLATE")
-        profile.rulesets.add("DO_178C_DAL_A_RULESET")
-        _merge_constraints(profile.constraints, {
-            "risk_threshold": 1e-9,
-            "dal_level": "A",
-            "require_authority": True,
-        })
+def _defense_extension(packs: PackSet) -> Optional[AxisPack]:
+    """Select the defence profile extension (§8)."""
+    return packs.axis_pack("operational_context", OperationalContext.DEFENSE.value)
 
-    if "SPACE" in overlay_upper or "Q10" in overlay_upper:
-        profile.templates.add("ECSS_COMPLIANCE_TEMPLATE")
-        profile.rulesets.add("ECSS_Q_ST_40C_RULESET")
-        _merge_constraints(profile.constraints, {
-            "risk_threshold": 1e-4,
-        })
 
-    if "DO-178C" in overlay_upper or "DO_178C" in overlay_upper:
-        profile.rulesets.add("DO_178C_ARTEFACT_RULESET")
+def _regulatory_overlay(
+    packs: PackSet,
+    overlay: str,
+    *,
+    _defense_applied: bool = False,
+) -> List[AxisPack]:
+    """
+    Select the packs of a named regulatory overlay (§9.5 step 3).
 
-    if "DEF" in overlay_upper and not _defense_applied:
-        _apply_defense_extension(profile)
+    Every pack whose match tokens occur in the overlay name applies; the
+    defence extension is skipped if the operational context already added it.
+    """
+    skip = _defense_extension(packs) if _defense_applied else None
+    return [pack for pack in packs.overlay(overlay) if pack is not skip]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -316,6 +257,8 @@ def resolve_profile(
     payload: PayloadClassification,
     overlay: str,
     context: OperationalContext = OperationalContext.CIVIL,
+    *,
+    registry: Optional[PackRegistry] = None,
 ) -> AMPEL360Profile:
     """
     Deterministic profile resolution.
@@ -335,6 +278,9 @@ def resolve_profile(
         Named regulatory overlay (e.g. "EASA-Q100", "SPACE-Q10").
     context : OperationalContext
         Civil or Defence operational context (default: CIVIL).
+    registry : PackRegistry, optional
+        Source of the compiled axis packs (default: the process-wide
+        registry loaded from ``profiles/``).
 
     Returns
     -------
@@ -342,17 +288,15 @@ def resolve_profile(
         Fully resolved profile with merged templates, rulesets, and
         constraints.
     """
+    # One pack-set generation for the whole resolution, even across a reload.
+    packs = (registry or default_registry()).packs
     profile = _load_base_kernel()
 
-    # Step 2 — Apply axis packs in structural order
+    # Step 2 — Axis packs in structural order: ENV → FUNC → PAYLOAD
     profile.environment = env
-    _apply_env_pack(profile, env)
-
     profile.function = func
-    _apply_func_pack(profile, func)
-
     profile.payload_class = payload
-    _apply_payload_pack(profile, payload)
+    applied = _axis_packs(packs, env, func, payload)
 
     # Derive human presence from function axis (§7)
     profile.human_presence = (
@@ -361,16 +305,20 @@ def resolve_profile(
         else HumanPresence.NHOB
     )
 
-    # Apply operational context (§8)
+    # Operational context (§8)
     profile.operational_context = context
     _defense_applied = False
     if context == OperationalContext.DEFENSE:
-        _apply_defense_extension(profile)
+        defense = _defense_extension(packs)
+        if defense is not None:
+            applied.append(defense)
         _defense_applied = True
 
-    # Step 3 — Apply named regulatory overlay (most restrictive wins)
+    # Step 3 — Named regulatory overlay (most restrictive wins)
     profile.regulatory_overlay = overlay
-    _apply_regulatory_overlay(profile, overlay, _defense_applied=_defense_applied)
+    applied += _regulatory_overlay(packs, overlay, _defense_applied=_defense_applied)
+
+    _apply_packs(profile, applied)
 
     # Compute composite profile_id (§9.4)
     profile.profile_id = f"{env.value}.{func.value}.{payload.value}.{overlay}"
@@ -381,3 +329,265 @@ def resolve_profile(
     )
 
     return profile
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 6. RESOLUTION CACHE
+# ──────────────────────────────────────────────────────────────────────────────
+
+class FrozenAMPEL360Profile(AMPEL360Profile):
+    """
+    Read-only :class:`AMPEL360Profile` shared by :class:`ResolutionCache`.
+
+    ``templates`` and ``rulesets`` are name bitsets and ``constraints`` is a
+    read-only mapping; attribute assignment raises.  Use :meth:`thaw` to
+    obtain a private mutable copy.
+    """
+
+    def __init__(self, profile: AMPEL360Profile) -> None:
+        for f in fields(AMPEL360Profile):
+            object.__setattr__(self, f.name, getattr(profile, f.name))
+        object.__setattr__(self, "templates", TEMPLATE_NAMES.set(profile.templates))
+        object.__setattr__(self, "rulesets", RULESET_NAMES.set(profile.rulesets))
+        object.__setattr__(
+            self, "constraints", MappingProxyType(dict(profile.constraints))
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AMPEL360Profile):
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name)
+            for f in fields(AMPEL360Profile)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self):
+        return (FrozenAMPEL360Profile, (self.thaw(),))
+
+    def thaw(self) -> AMPEL360Profile:
+        """Return a mutable copy of this profile."""
+        return AMPEL360Profile(
+            **{f.name: getattr(self, f.name) for f in fields(AMPEL360Profile)}
+            | {
+                "templates": set(self.templates),
+                "rulesets": set(self.rulesets),
+                "constraints": dict(self.constraints),
+            }
+        )
+
+
+@dataclass(frozen=True)
+class ResolutionCacheStats:
+    """Point-in-time counters of a :class:`ResolutionCache`."""
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    overlays: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+# Enum member or value string -> enum member, per axis enum.
+_AXIS_MEMBERS: Dict[type, Dict[Any, Enum]] = {
+    enum_cls: {**{m: m for m in enum_cls}, **{m.value: m for m in enum_cls}}
+    for enum_cls in (
+        OperationalEnvironment,
+        FunctionalMission,
+        PayloadClassification,
+        OperationalContext,
+    )
+}
+
+
+def _normalise(enum_cls: type, value: Any) -> Any:
+    member = _AXIS_MEMBERS[enum_cls].get(value)
+    return member if member is not None else enum_cls(value)
+
+
+class ResolutionCache:
+    """
+    Memo of :func:`resolve_profile` results.
+
+    The enum axes give 2×2×4×2 combinations per overlay, so entries are kept
+    in one bucket per overlay string and only buckets are evicted, least
+    recently used first, once more than *max_overlays* are held.  Lookups
+    return shared :class:`FrozenAMPEL360Profile` instances; the cache is
+    cleared automatically when the pack registry reloads.
+
+    Parameters
+    ----------
+    max_overlays : int
+        Number of distinct overlay strings kept (default: 128).
+    registry : PackRegistry, optional
+        Pack registry to resolve against (default: the process-wide one).
+    """
+
+    def __init__(
+        self,
+        max_overlays: int = 128,
+        registry: Optional[PackRegistry] = None,
+    ) -> None:
+        if max_overlays < 1:
+            raise ValueError("max_overlays must be at least 1")
+        self.max_overlays = max_overlays
+        self._registry = registry
+        self._packs: Optional[PackSet] = None
+        self._buckets: "OrderedDict[str, Dict[tuple, FrozenAMPEL360Profile]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def registry(self) -> PackRegistry:
+        return self._registry if self._registry is not None else default_registry()
+
+    def _lookup(
+        self,
+        packs: PackSet,
+        overlay: str,
+        key: tuple,
+    ) -> Optional[FrozenAMPEL360Profile]:
+        # Lock-free fast path; counters are best-effort under contention.
+        if packs is not self._packs:
+            return None
+        bucket = self._buckets.get(overlay)
+        if bucket is None:
+            return None
+        profile = bucket.get(key)
+        if profile is not None:
+            self._hits += 1
+            try:
+                self._buckets.move_to_end(overlay)
+            except KeyError:  # evicted concurrently
+                pass
+        return profile
+
+    def resolve(
+        self,
+        env: OperationalEnvironment,
+        func: FunctionalMission,
+        payload: PayloadClassification,
+        overlay: str,
+        context: OperationalContext = OperationalContext.CIVIL,
+    ) -> FrozenAMPEL360Profile:
+        """
+        Cached :func:`resolve_profile`.
+
+        Axis arguments may be enum members or their string values.
+        """
+        packs = self.registry.packs
+        profile = self._lookup(packs, overlay, (env, func, payload, context))
+        if profile is not None:
+            return profile
+        key = (
+            _normalise(OperationalEnvironment, env),
+            _normalise(FunctionalMission, func),
+            _normalise(PayloadClassification, payload),
+            _normalise(OperationalContext, context),
+        )
+        profile = self._lookup(packs, overlay, key)
+        if profile is not None:
+            return profile
+
+        with self._lock:
+            if packs is not self._packs:
+                self._buckets.clear()
+                self._packs = packs
+            bucket = self._buckets.get(overlay)
+            if bucket is None:
+                bucket = self._buckets[overlay] = {}
+                while len(self._buckets) > self.max_overlays:
+                    self._buckets.popitem(last=False)
+                    self._evictions += 1
+            else:
+                self._buckets.move_to_end(overlay)
+            profile = bucket.get(key)
+            if profile is None:
+                self._misses += 1
+                profile = FrozenAMPEL360Profile(
+                    resolve_profile(*key[:3], overlay, key[3], registry=self.registry)
+                )
+                bucket[key] = profile
+            else:
+                self._hits += 1
+        return profile
+
+    def precompute(self, overlays: Optional[Iterable[str]] = None) -> int:
+        """
+        Eagerly resolve the full axis product for each overlay.
+
+        *overlays* defaults to the ``overlay_id`` of every overlay pack in
+        the registry.  Returns the number of profiles resolved.
+        """
+        if overlays is None:
+            overlays = [
+                p.value for p in self.registry.packs.packs if p.axis == OVERLAY_AXIS
+            ]
+        count = 0
+        for overlay in overlays:
+            for env in OperationalEnvironment:
+                for func in FunctionalMission:
+                    for payload in PayloadClassification:
+                        for context in OperationalContext:
+                            self.resolve(env, func, payload, overlay, context)
+                            count += 1
+        return count
+
+    def invalidate(self, overlay: Optional[str] = None) -> None:
+        """Drop the entries for *overlay*, or every entry if *None*."""
+        with self._lock:
+            if overlay is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(overlay, None)
+
+    def stats(self) -> ResolutionCacheStats:
+        """Return the counters and the number of cached profiles."""
+        buckets = list(self._buckets.values())
+        return ResolutionCacheStats(
+            self._hits,
+            self._misses,
+            self._evictions,
+            sum(len(b) for b in buckets),
+            len(buckets),
+        )
+
+    def reset_stats(self) -> None:
+        """Zero the counters without touching cached entries."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+#: Cache used by :func:`resolve_profile_cached`.
+RESOLUTION_CACHE = ResolutionCache()
+
+
+def resolve_profile_cached(
+    env: OperationalEnvironment,
+    func: FunctionalMission,
+    payload: PayloadClassification,
+    overlay: str,
+    context: OperationalContext = OperationalContext.CIVIL,
+) -> FrozenAMPEL360Profile:
+    """
+    Like :func:`resolve_profile`, but memoised in :data:`RESOLUTION_CACHE`.
+
+    The returned profile is shared and read-only; call ``.thaw()`` for a
+    mutable copy.
+    """
+    return RESOLUTION_CACHE.resolve(env, func, payload, overlay, context)
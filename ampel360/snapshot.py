@@ -0,0 +1,516 @@
+"""
+ampel360.snapshot — Binary Profile Snapshots
+=============================================
+
+Compact, versioned binary format for resolved profiles, so that worker
+processes can load them instead of re-running builders or the resolver.
+
+Supported record kinds:
+  • :class:`ampel360.resolver.AMPEL360Profile`  (resolved axis profiles)
+  • ``AMPEL.ProfileConfig``                     (regulatory selector profiles)
+
+Layout (all integers little-endian)::
+
+    header   magic "AMPS" | version u16 | flags u16 | n_strings u32
+             | n_records u32 | strings_offset u32 | records_offset u32
+    strings  (n_strings + 1) u32 offsets, then the UTF-8 blob
+    enums    n_tables u32, then per enum type: name id u32 | n_values u32
+             | value string ids u32
+    records  n_records × (kind u8, offset u32), then the record bodies
+
+Every text field — IDs, template and ruleset names, descriptions — is
+interned once in the string table and referenced by a u32 id.  Enum members
+are packed as u8 codes whose meaning is stored in the file itself, and
+constraint values carry a type tag (None/bool/int/float/str).
+
+:class:`SnapshotReader` memory-maps the file read-only and decodes records
+on demand, so one snapshot file is shared through the page cache by every
+worker process that opens it.
+
+Coding conventions: stdlib only; dataclasses, Enum, type hints.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from ampel360.resolver import (
+    AMPEL360Profile,
+    FunctionalMission,
+    HumanPresence,
+    OperationalContext,
+    OperationalEnvironment,
+    PayloadClassification,
+)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 1. FORMAT CONSTANTS
+# ──────────────────────────────────────────────────────────────────────────────
+
+SNAPSHOT_MAGIC = b"AMPS"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIIII")
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_RECORD_ENTRY = struct.Struct("<BI")
+_CONSTRAINT = struct.Struct("<IB8s")
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+
+_NONE_ID = 0xFFFFFFFF   # string id standing for None
+_NONE_CODE = 0xFF       # enum code standing for None
+
+KIND_AMPEL360_PROFILE = 1
+KIND_PROFILE_CONFIG = 2
+
+_TAG_NONE, _TAG_BOOL, _TAG_INT, _TAG_FLOAT, _TAG_STR = range(5)
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot is malformed or of an unsupported version."""
+
+
+_RESOLVER_ENUMS: Tuple[Type[Enum], ...] = (
+    OperationalEnvironment,
+    FunctionalMission,
+    PayloadClassification,
+    HumanPresence,
+    OperationalContext,
+)
+
+
+def _selector_enums() -> Tuple[Type[Enum], ...]:
+    """Enum types of ``AMPEL.py``; imported lazily, only ProfileConfig needs them."""
+    from AMPEL import GateType, RegulatoryProfile, Severity
+
+    return (RegulatoryProfile, Severity, GateType)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 2. WRITER
+# ──────────────────────────────────────────────────────────────────────────────
+
+class _Writer:
+    """Accumulates the string table and record bodies of one snapshot."""
+
+    def __init__(self) -> None:
+        self.strings: Dict[str, int] = {}
+        self.body = bytearray()
+
+    def sid(self, text: Optional[str]) -> int:
+        if text is None:
+            return _NONE_ID
+        sid = self.strings.get(text)
+        if sid is None:
+            sid = self.strings[text] = len(self.strings)
+        return sid
+
+    def u8(self, value: int) -> None:
+        self.body += _U8.pack(value)
+
+    def u32(self, value: int) -> None:
+        self.body += _U32.pack(value)
+
+    def string(self, text: Optional[str]) -> None:
+        self.u32(self.sid(text))
+
+    def strings_list(self, items: Iterable[str]) -> None:
+        items = list(items)
+        self.u32(len(items))
+        for item in items:
+            self.string(item)
+
+    def enum(self, member: Optional[Enum], codes: Dict[Enum, int]) -> None:
+        self.u8(_NONE_CODE if member is None else codes[member])
+
+    def value(self, key: str, value: Any) -> None:
+        if value is None:
+            tag, payload = _TAG_NONE, bytes(8)
+        elif isinstance(value, bool):
+            tag, payload = _TAG_BOOL, _INT64.pack(int(value))
+        elif isinstance(value, int):
+            tag, payload = _TAG_INT, _INT64.pack(value)
+        elif isinstance(value, float):
+            tag, payload = _TAG_FLOAT, _FLOAT64.pack(value)
+        elif isinstance(value, str):
+            tag, payload = _TAG_STR, _INT64.pack(self.sid(value))
+        else:
+            raise TypeError(
+                f"Constraint {key!r} has unsupported type {type(value).__name__}."
+            )
+        self.body += _CONSTRAINT.pack(self.sid(key), tag, payload)
+
+
+def _write_resolved(w: _Writer, profile: AMPEL360Profile, codes: Dict[Enum, int]) -> None:
+    w.string(profile.profile_id)
+    w.enum(profile.environment, codes)
+    w.enum(profile.function, codes)
+    w.enum(profile.payload_class, codes)
+    w.enum(profile.human_presence, codes)
+    w.enum(profile.operational_context, codes)
+    w.string(profile.regulatory_overlay)
+    w.strings_list(sorted(profile.templates))
+    w.strings_list(sorted(profile.rulesets))
+    w.u32(len(profile.constraints))
+    for key, value in profile.constraints.items():
+        w.value(key, value)
+    w.string(profile.disclosure_mode)
+
+
+def _write_config(w: _Writer, config: Any, codes: Dict[Enum, int]) -> None:
+    w.enum(config.profile, codes)
+    w.string(config.document_id)
+    w.string(config.title)
+    w.string(config.regulatory_authority)
+    w.string(config.activated_at)
+    w.strings_list(config.standards)
+    w.u32(len(config.templates))
+    for t in config.templates:
+        w.string(t.template_id)
+        w.string(t.name)
+        w.string(t.standard_ref)
+        w.enum(t.gate, codes)
+        w.string(t.token)
+        w.strings_list(t.dal_scope)
+        w.string(t.notes)
+    w.u32(len(config.validation_rules))
+    for r in config.validation_rules:
+        w.string(r.rule_id)
+        w.string(r.description)
+        w.string(r.check)
+        w.enum(r.severity, codes)
+        w.enum(r.gate, codes)
+        w.strings_list(r.dal_scope)
+        w.string(r.fail_threshold)
+        w.string(r.warn_threshold)
+        w.string(r.reference)
+    w.u32(len(config.constraints))
+    for c in config.constraints:
+        w.string(c.constraint_id)
+        w.string(c.description)
+        w.string(c.value_type)
+        w.string(c.hard_limit)
+        w.string(c.source_standard)
+        w.u8(int(c.is_waivable))
+        w.string(c.waiver_token)
+
+
+def dump_snapshot(profiles: Iterable[Any]) -> bytes:
+    """Encode *profiles* (resolved profiles and/or ProfileConfigs) as bytes."""
+    profiles = list(profiles)
+    enum_types = _RESOLVER_ENUMS
+    config_type: Optional[type] = None
+    if not all(isinstance(p, AMPEL360Profile) for p in profiles):
+        from AMPEL import ProfileConfig
+
+        config_type = ProfileConfig
+        enum_types = _RESOLVER_ENUMS + _selector_enums()
+    codes: Dict[Enum, int] = {
+        member: code for enum_type in enum_types for code, member in enumerate(enum_type)
+    }
+
+    w = _Writer()
+    entries: List[Tuple[int, int]] = []
+    for profile in profiles:
+        offset = len(w.body)
+        if isinstance(profile, AMPEL360Profile):
+            _write_resolved(w, profile, codes)
+            entries.append((KIND_AMPEL360_PROFILE, offset))
+        elif config_type is not None and isinstance(profile, config_type):
+            _write_config(w, profile, codes)
+            entries.append((KIND_PROFILE_CONFIG, offset))
+        else:
+            raise TypeError(f"Cannot snapshot object of type {type(profile).__name__}.")
+
+    enum_table = bytearray(_U32.pack(len(enum_types)))
+    for enum_type in enum_types:
+        members = list(enum_type)
+        enum_table += _U32.pack(w.sid(enum_type.__name__)) + _U32.pack(len(members))
+        for member in members:
+            enum_table += _U32.pack(w.sid(member.value))
+
+    blobs = [text.encode("utf-8") for text in w.strings]
+    string_offsets = bytearray()
+    position = 0
+    for blob in blobs:
+        string_offsets += _U32.pack(position)
+        position += len(blob)
+    string_offsets += _U32.pack(position)
+    string_section = bytes(string_offsets) + b"".join(blobs)
+
+    strings_offset = _HEADER.size
+    enums_offset = strings_offset + len(string_section)
+    records_offset = enums_offset + len(enum_table)
+    bodies_offset = records_offset + len(entries) * _RECORD_ENTRY.size
+    directory = b"".join(
+        _RECORD_ENTRY.pack(kind, bodies_offset + offset) for kind, offset in entries
+    )
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(blobs), len(entries),
+        strings_offset, records_offset,
+    )
+    return header + string_section + bytes(enum_table) + directory + bytes(w.body)
+
+
+def save_snapshot(profiles: Union[Any, Iterable[Any]], path: str) -> None:
+    """Write one profile or an iterable of profiles to the snapshot *path*."""
+    if isinstance(profiles, AMPEL360Profile) or not isinstance(profiles, Iterable):
+        profiles = [profiles]
+    data = dump_snapshot(profiles)
+    with open(path, "wb") as fh:
+        fh.write(data)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 3. READER
+# ──────────────────────────────────────────────────────────────────────────────
+
+class _Cursor:
+    """Sequential decoder over a record body."""
+
+    __slots__ = ("buf", "pos", "reader")
+
+    def __init__(self, reader: "SnapshotReader", pos: int) -> None:
+        self.reader = reader
+        self.buf = reader._buf
+        self.pos = pos
+
+    def u8(self) -> int:
+        value = self.buf[self.pos]
+        self.pos += 1
+        return value
+
+    def u32(self) -> int:
+        (value,) = _U32.unpack_from(self.buf, self.pos)
+        self.pos += 4
+        return value
+
+    def string(self) -> Optional[str]:
+        return self.reader.string(self.u32())
+
+    def strings_list(self) -> List[str]:
+        return [self.string() for _ in range(self.u32())]  # type: ignore[misc]
+
+    def enum(self, enum_type: Type[Enum]) -> Any:
+        code = self.u8()
+        return None if code == _NONE_CODE else self.reader._enum_members[enum_type][code]
+
+    def value(self) -> Tuple[str, Any]:
+        key_id, tag, payload = _CONSTRAINT.unpack_from(self.buf, self.pos)
+        self.pos += _CONSTRAINT.size
+        if tag == _TAG_NONE:
+            value: Any = None
+        elif tag == _TAG_BOOL:
+            value = bool(_INT64.unpack(payload)[0])
+        elif tag == _TAG_INT:
+            value = _INT64.unpack(payload)[0]
+        elif tag == _TAG_FLOAT:
+            value = _FLOAT64.unpack(payload)[0]
+        elif tag == _TAG_STR:
+            value = self.reader.string(_INT64.unpack(payload)[0])
+        else:
+            raise SnapshotError(f"Unknown constraint value tag {tag}.")
+        return self.reader.string(key_id), value  # type: ignore[return-value]
+
+
+class SnapshotReader:
+    """
+    Read-only view over a snapshot file or buffer.
+
+    Files are memory-mapped, so opening is O(header) and records are only
+    decoded when accessed (``reader[i]`` or iteration).  Decoded strings are
+    interned and cached per reader.
+    """
+
+    def __init__(self, source: Union[str, bytes, bytearray, memoryview]) -> None:
+        self._mmap: Optional[mmap.mmap] = None
+        if isinstance(source, str):
+            with open(source, "rb") as fh:
+                # mmap cannot map an empty file; check before mapping.
+                if os.fstat(fh.fileno()).st_size < _HEADER.size:
+                    raise SnapshotError("Snapshot is truncated.")
+                self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buf: Any = memoryview(self._mmap)
+        else:
+            self._buf = memoryview(source)
+
+        try:
+            self._parse()
+        except BaseException:
+            self.close()
+            raise
+
+    def _need(self, end: int) -> None:
+        if end > len(self._buf):
+            raise SnapshotError("Snapshot is truncated.")
+
+    def _parse(self) -> None:
+        self._need(_HEADER.size)
+        magic, version, _flags, n_strings, n_records, strings_offset, records_offset = (
+            _HEADER.unpack_from(self._buf, 0)
+        )
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError("Not an AMPEL profile snapshot.")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(
+                f"Unsupported snapshot version {version} (expected {SNAPSHOT_VERSION})."
+            )
+        self._n_strings = n_strings
+        self._string_offsets = strings_offset
+        self._string_blob = strings_offset + (n_strings + 1) * _U32.size
+        self._need(self._string_blob)
+        self._strings: List[Optional[str]] = [None] * n_strings
+        self._need(records_offset + n_records * _RECORD_ENTRY.size)
+        self._records = [
+            _RECORD_ENTRY.unpack_from(self._buf, records_offset + i * _RECORD_ENTRY.size)
+            for i in range(n_records)
+        ]
+        if any(offset >= len(self._buf) for _, offset in self._records):
+            raise SnapshotError("Snapshot is truncated.")
+        (blob_size,) = _U32.unpack_from(self._buf, self._string_blob - _U32.size)
+        self._need(self._string_blob + blob_size)
+        self._enum_members = self._read_enum_tables(self._string_blob + blob_size)
+
+    def _read_enum_tables(self, pos: int) -> Dict[Type[Enum], List[Enum]]:
+        known = {enum_type.__name__: enum_type for enum_type in _RESOLVER_ENUMS}
+        tables: Dict[Type[Enum], List[Enum]] = {}
+        self._need(pos + _U32.size)
+        (n_tables,) = _U32.unpack_from(self._buf, pos)
+        pos += _U32.size
+        for _ in range(n_tables):
+            self._need(pos + 2 * _U32.size)
+            name_id, count = struct.unpack_from("<II", self._buf, pos)
+            pos += 2 * _U32.size
+            name = self.string(name_id)
+            if name not in known:
+                known.update((e.__name__, e) for e in _selector_enums())
+            enum_type = known.get(name)  # type: ignore[arg-type]
+            if enum_type is None:
+                raise SnapshotError(f"Snapshot references unknown enum {name!r}.")
+            self._need(pos + count * _U32.size)
+            value_ids = struct.unpack_from(f"<{count}I", self._buf, pos)
+            pos += count * _U32.size
+            tables[enum_type] = [enum_type(self.string(sid)) for sid in value_ids]
+        return tables
+
+    def string(self, sid: int) -> Optional[str]:
+        """Decode string *sid* (``None`` for the null id)."""
+        if sid == _NONE_ID:
+            return None
+        text = self._strings[sid]
+        if text is None:
+            start, end = struct.unpack_from("<II", self._buf, self._string_offsets + sid * _U32.size)
+            blob = self._string_blob
+            text = self._strings[sid] = sys.intern(
+                bytes(self._buf[blob + start:blob + end]).decode("utf-8")
+            )
+        return text
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def kind(self, index: int) -> int:
+        """Record kind of entry *index* (``KIND_*`` constant)."""
+        return self._records[index][0]
+
+    def __getitem__(self, index: int) -> Any:
+        kind, offset = self._records[index]
+        cursor = _Cursor(self, offset)
+        try:
+            if kind == KIND_AMPEL360_PROFILE:
+                return _read_resolved(cursor)
+            if kind == KIND_PROFILE_CONFIG:
+                return _read_config(cursor)
+        except (struct.error, IndexError) as exc:
+            raise SnapshotError(f"Record {index} is truncated or corrupt: {exc}") from exc
+        raise SnapshotError(f"Unknown record kind {kind}.")
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[i] for i in range(len(self)))
+
+    def close(self) -> None:
+        """Release the memory map (records already decoded stay valid)."""
+        self._buf.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _read_resolved(c: _Cursor) -> AMPEL360Profile:
+    profile = AMPEL360Profile(
+        profile_id=c.string(),  # type: ignore[arg-type]
+        environment=c.enum(OperationalEnvironment),
+        function=c.enum(FunctionalMission),
+        payload_class=c.enum(PayloadClassification),
+        human_presence=c.enum(HumanPresence),
+        operational_context=c.enum(OperationalContext),
+        regulatory_overlay=c.string(),  # type: ignore[arg-type]
+        templates=set(c.strings_list()),
+        rulesets=set(c.strings_list()),
+    )
+    profile.constraints = dict(c.value() for _ in range(c.u32()))
+    profile.disclosure_mode = c.string()  # type: ignore[assignment]
+    return profile
+
+
+def _read_config(c: _Cursor) -> Any:
+    from AMPEL import (
+        ArtefactTemplate, Constraint, GateType, ProfileConfig, RegulatoryProfile,
+        Severity, ValidationRule,
+    )
+
+    profile = c.enum(RegulatoryProfile)
+    document_id, title, authority, activated_at = c.string(), c.string(), c.string(), c.string()
+    standards = c.strings_list()
+    templates = [
+        ArtefactTemplate(
+            c.string(), c.string(), c.string(), c.enum(GateType), c.string(),
+            dal_scope=c.strings_list(), notes=c.string(),
+        )
+        for _ in range(c.u32())
+    ]
+    rules = [
+        ValidationRule(
+            c.string(), c.string(), c.string(), c.enum(Severity), c.enum(GateType),
+            c.strings_list(), fail_threshold=c.string(), warn_threshold=c.string(),
+            reference=c.string(),
+        )
+        for _ in range(c.u32())
+    ]
+    constraints = [
+        Constraint(
+            c.string(), c.string(), c.string(), c.string(), c.string(),
+            is_waivable=bool(c.u8()), waiver_token=c.string(),
+        )
+        for _ in range(c.u32())
+    ]
+    return ProfileConfig(
+        profile=profile,
+        document_id=document_id,
+        title=title,
+        regulatory_authority=authority,
+        standards=standards,
+        templates=templates,
+        validation_rules=rules,
+        constraints=constraints,
+        activated_at=activated_at,
+    )
+
+
+def load_snapshot(source: Union[str, bytes, bytearray, memoryview]) -> List[Any]:
+    """Load every profile stored in the snapshot file (or buffer) *source*."""
+    with SnapshotReader(source) as reader:
+        return list(reader)
@@ -0,0 +1,453 @@
+"""
+audit_ledger.py
+===============
+Append-only, hash-chained audit ledger with Merkle checkpoints.
+
+Record file (JSON Lines, one record per line)::
+
+    {"h":"<sha256 hex>","e":<entry as canonical JSON>}
+
+  h_i = SHA-256(h_{i-1} ‖ e_i), h_{-1} = 32 zero bytes, where e_i is the
+  canonical payload bytes exactly as written.  The fixed line layout lets
+  the verifier slice hash and payload without parsing JSON.
+
+Checkpoint file (``<path>.ckpt``): after every ``checkpoint_every`` records
+a checkpoint stores the record count, the byte offset of the next record,
+the chain head and the Merkle root of the block's record
+hashes.  Checkpoints are chained the same way.  Merkle leaves are the
+record hashes themselves (fixed 32-byte digests); interior nodes are
+SHA-256(0x01 ‖ left ‖ right), with an odd last node promoted unchanged.  The Merkle root over all
+block roots (:func:`ledger_root`) commits to the whole checkpointed ledger;
+a block is proved against it with O(log n) sibling hashes.
+
+  • HashChainLedger  — AuditSink writer (resumes an existing ledger)
+  • verify_ledger    — single streaming pass over records and checkpoints
+  • verify_range     — seek via checkpoints, verify only the blocks covering
+                       [start, stop), proving each block root against the
+                       ledger root in O(log n)
+
+The chain detects any modification, insertion or deletion before the last
+record; truncation of records after the last checkpoint is only detected
+against an externally anchored :meth:`HashChainLedger.head`.
+
+Dependencies: none beyond the Python 3.10+ standard library.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import threading
+import time
+import warnings
+from dataclasses import dataclass
+from binascii import hexlify
+from hashlib import sha256
+from typing import Iterable, Iterator
+
+from audit_sink import AuditSink, _json_default
+
+
+GENESIS = bytes(32)
+_PREFIX = b'{"h":"'
+_INFIX = b'","e":'
+_PAYLOAD = len(_PREFIX) + 64 + len(_INFIX)   # payload starts at byte 76
+_SUFFIX = b"}\n"
+# Canonical payload encoding; built once (json.dumps with options builds one per call).
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=_json_default)
+
+
+class LedgerError(ValueError):
+    """Malformed or tampered ledger."""
+
+
+# ──────────────────────────────────────────────
+# 1. Merkle trees
+# ──────────────────────────────────────────────
+
+def _levels(leaves: list[bytes]) -> list[list[bytes]]:
+    level = list(leaves)
+    levels = [level]
+    while len(level) > 1:
+        nxt = [sha256(b"\x01" + level[i] + level[i + 1]).digest()
+               for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            nxt.append(level[-1])     # odd node is promoted unchanged
+        level = nxt
+        levels.append(level)
+    return levels
+
+
+def merkle_root(leaves: list[bytes]) -> bytes:
+    if not leaves:
+        return sha256(b"").digest()
+    return _levels(leaves)[-1][0]
+
+
+def merkle_proof(leaves: list[bytes], index: int) -> list[bytes]:
+    """Sibling hashes from leaf *index* up to the root."""
+    if not 0 <= index < len(leaves):
+        raise IndexError(f"leaf {index} out of range for {len(leaves)} leaves")
+    return _proof(_levels(leaves), index)
+
+
+def _proof(levels: list[list[bytes]], index: int) -> list[bytes]:
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append(level[sibling])
+        index //= 2
+    return proof
+
+
+def verify_merkle_proof(leaf: bytes, index: int, size: int, proof: list[bytes], root: bytes) -> bool:
+    node = leaf
+    it = iter(proof)
+    while size > 1:
+        if index ^ 1 < size:
+            sibling = next(it, None)
+            if sibling is None:
+                return False
+            node = sha256(b"\x01" + (sibling + node if index & 1 else node + sibling)).digest()
+        index //= 2
+        size = (size + 1) // 2
+    return next(it, None) is None and node == root
+
+
+# ──────────────────────────────────────────────
+# 2. Checkpoints
+# ──────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class Checkpoint:
+    index: int        # records covered (exclusive end)
+    offset: int       # byte offset of record `index`
+    head: str         # chain hash of record index-1
+    block_root: str   # Merkle root of the block's record hashes
+    prev: str         # hash of the previous checkpoint
+    hash: str
+
+    @staticmethod
+    def digest(prev: str, index: int, offset: int, head: str, block_root: str) -> str:
+        body = f"{index}:{offset}:{head}:{block_root}".encode()
+        return sha256(bytes.fromhex(prev) + body).hexdigest()
+
+
+def read_checkpoints(path: str) -> list[Checkpoint]:
+    """Load and chain-verify ``<path>.ckpt`` (empty list if absent)."""
+    ckpt_path = path + ".ckpt"
+    if not os.path.exists(ckpt_path):
+        return []
+    out: list[Checkpoint] = []
+    prev = GENESIS.hex()
+    with open(ckpt_path) as fh:
+        for n, line in enumerate(fh):
+            try:
+                cp = Checkpoint(**json.loads(line))
+            except (ValueError, TypeError) as exc:
+                raise LedgerError(f"checkpoint {n}: malformed ({exc})") from exc
+            if cp.prev != prev or cp.hash != Checkpoint.digest(
+                    cp.prev, cp.index, cp.offset, cp.head, cp.block_root):
+                raise LedgerError(f"checkpoint {n}: chain hash mismatch")
+            if out and (cp.index <= out[-1].index or cp.offset <= out[-1].offset) or cp.index < 1:
+                raise LedgerError(f"checkpoint {n}: index/offset not increasing")
+            out.append(cp)
+            prev = cp.hash
+    return out
+
+
+def ledger_root(checkpoints: list[Checkpoint]) -> str:
+    """Merkle root over all block roots: commits to the checkpointed ledger."""
+    return merkle_root([bytes.fromhex(cp.block_root) for cp in checkpoints]).hex()
+
+
+def checkpoint_proof(checkpoints: list[Checkpoint], j: int) -> list[bytes]:
+    """Inclusion proof of block *j*'s root under :func:`ledger_root`."""
+    return merkle_proof([bytes.fromhex(cp.block_root) for cp in checkpoints], j)
+
+
+# ──────────────────────────────────────────────
+# 3. Writer
+# ──────────────────────────────────────────────
+
+class HashChainLedger(AuditSink):
+    """Append-only ledger writer; also usable as an :class:`AuditSink`.
+
+    Opening an existing ledger verifies its checkpoints and the records
+    after the last one, then continues the chain.  It recovers from a crash
+    mid-write: an unterminated last line (record or checkpoint) is dropped
+    with a :class:`RuntimeWarning`, and checkpoints missing for verified
+    records are recomputed and appended.  ``checkpoint_every`` may differ
+    from the value the ledger was written with; blocks need not be equal.
+    """
+
+    def __init__(self, path: str, checkpoint_every: int = 1024) -> None:
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be positive.")
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        _drop_torn_line(path + ".ckpt")
+        self._checkpoints = read_checkpoints(path)
+        self._head = GENESIS
+        self._count = 0
+        self._offset = 0
+        self._block: list[bytes] = []
+        missing: list[tuple[int, int, bytes, list[bytes]]] = []
+        if self._checkpoints:
+            last = self._checkpoints[-1]
+            self._head, self._count, self._offset = bytes.fromhex(last.head), last.index, last.offset
+        if os.path.exists(path):
+            missing = self._resume()
+        elif self._checkpoints:
+            raise LedgerError(f"{path}: records missing for {len(self._checkpoints)} checkpoints")
+        self._lock = threading.Lock()
+        self._fh = open(path, "ab")
+        self._ckpt_fh = open(path + ".ckpt", "a")
+        for index, offset, head, block in missing:
+            self._write_checkpoint(index, offset, head, block)
+
+    def _resume(self) -> list[tuple[int, int, bytes, list[bytes]]]:
+        """Verify records after the last checkpoint; return the full blocks
+        among them that still lack a checkpoint."""
+        if os.path.getsize(self.path) < self._offset:
+            raise LedgerError(f"{self.path}: truncated before the last checkpoint")
+        missing = []
+        with open(self.path, "rb") as fh:
+            fh.seek(self._offset)
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break  # torn final write, dropped below
+                digest = _check_line(line, self._head, self._count)
+                self._block.append(digest)
+                self._head = digest
+                self._count += 1
+                self._offset += len(line)
+                if len(self._block) == self.checkpoint_every:
+                    missing.append((self._count, self._offset, self._head, self._block))
+                    self._block = []
+        _drop_torn_line(self.path, self._offset)
+        return missing
+
+    def __len__(self) -> int:
+        return self._count
+
+    def head(self) -> tuple[int, str]:
+        """(record count, chain hash) — anchor this externally to detect truncation."""
+        return self._count, self._head.hex()
+
+    def root(self) -> str:
+        return ledger_root(self._checkpoints)
+
+    def write_many(self, entries: Iterable[dict]) -> None:
+        encode = _ENCODER.encode
+        with self._lock:
+            lines: list[bytes] = []
+            every = self.checkpoint_every
+            try:
+                for entry in entries:
+                    payload = encode(entry).encode("ascii")
+                    head = sha256(self._head + payload).digest()
+                    line = b"".join((_PREFIX, hexlify(head), _INFIX, payload, _SUFFIX))
+                    lines.append(line)
+                    self._block.append(head)
+                    self._head = head
+                    self._offset += len(line)
+                    self._count += 1
+                    if len(self._block) == every:
+                        self._fh.write(b"".join(lines))
+                        lines = []
+                        self._checkpoint()
+            finally:
+                # Records accounted for in the chain state are always written.
+                self._fh.write(b"".join(lines))
+                self._fh.flush()
+
+    def _checkpoint(self) -> None:
+        self._fh.flush()
+        self._write_checkpoint(self._count, self._offset, self._head, self._block)
+        self._block = []
+
+    def _write_checkpoint(self, index: int, offset: int, head: bytes, block: list[bytes]) -> None:
+        prev = self._checkpoints[-1].hash if self._checkpoints else GENESIS.hex()
+        fields = dict(index=index, offset=offset, head=head.hex(),
+                      block_root=merkle_root(block).hex())
+        cp = Checkpoint(prev=prev, hash=Checkpoint.digest(prev, **fields), **fields)
+        self._ckpt_fh.write(json.dumps(cp.__dict__) + "\n")
+        self._ckpt_fh.flush()
+        self._checkpoints.append(cp)
+
+    def flush(self, sync: bool = False) -> None:
+        with self._lock:
+            self._flush(sync)
+
+    def _flush(self, sync: bool) -> None:
+        self._fh.flush()
+        self._ckpt_fh.flush()
+        if sync:
+            os.fsync(self._fh.fileno())
+            os.fsync(self._ckpt_fh.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._fh.closed:
+                self._flush(sync=True)
+                self._fh.close()
+                self._ckpt_fh.close()
+
+
+def _drop_torn_line(path: str, end: int | None = None) -> None:
+    """Truncate an unterminated last line left by a crash mid-write.
+
+    *end* is the offset where verified content stops (default: after the
+    last newline).  Complete lines are never removed.
+    """
+    if not os.path.exists(path):
+        return
+    size = os.path.getsize(path)
+    if end is None:
+        end = _after_last_newline(path, size)
+    if end < size:
+        warnings.warn(f"{path}: dropping {size - end} bytes of an incomplete last line",
+                      RuntimeWarning, stacklevel=3)
+        os.truncate(path, end)
+
+
+def _after_last_newline(path: str, size: int, block: int = 1 << 16) -> int:
+    """Offset just past the last ``\n`` in *path* (0 if none), read backwards."""
+    with open(path, "rb") as fh:
+        pos = size
+        while pos > 0:
+            start = max(0, pos - block)
+            fh.seek(start)
+            i = fh.read(pos - start).rfind(b"\n")
+            if i >= 0:
+                return start + i + 1
+            pos = start
+    return 0
+
+
+# ──────────────────────────────────────────────
+# 4. Verification
+# ──────────────────────────────────────────────
+
+def _check_line(line: bytes, prev: bytes, n: int) -> bytes:
+    if line[:6] != _PREFIX or line[70:76] != _INFIX or line[-2:] != _SUFFIX:
+        raise LedgerError(f"record {n}: malformed line")
+    digest = sha256(prev + line[_PAYLOAD:-2]).digest()
+    if hexlify(digest) != line[6:70]:
+        raise LedgerError(f"record {n}: hash mismatch (modified, inserted or removed record)")
+    return digest
+
+
+@dataclass
+class VerifyReport:
+    records: int
+    bytes: int
+    seconds: float
+    head: str
+    root: str
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes / 1e6 / self.seconds if self.seconds else float("inf")
+
+
+def verify_ledger(path: str, blocks: bool = True) -> VerifyReport:
+    """Verify every record and checkpoint in one streaming pass.
+
+    With ``blocks=False`` checkpoint heads and offsets are still checked but
+    block Merkle roots are not recomputed (about twice as fast).  Raises
+    :class:`LedgerError` at the first inconsistency.
+    """
+    start = time.perf_counter()
+    checkpoints = read_checkpoints(path)
+    prev, base = GENESIS, 0
+    P = _PAYLOAD
+    with open(path, "rb", buffering=1 << 20) as fh:
+        # This loop is the throughput bottleneck; _check_line only runs to
+        # produce the error message.
+        for cp in checkpoints:
+            block: list[bytes] = []
+            append = block.append
+            want = cp.index - base
+            for line in fh:
+                digest = sha256(prev + line[P:-2]).digest()
+                if hexlify(digest) != line[6:70]:
+                    _check_line(line, prev, base + len(block))
+                prev = digest
+                append(digest)
+                if len(block) == want:
+                    break
+            base += len(block)
+            if len(block) < want:
+                raise LedgerError(f"ledger truncated: checkpoint expects {cp.index} records, found {base}")
+            if cp.offset != fh.tell() or cp.head != digest.hex() or (
+                    blocks and cp.block_root != merkle_root(block).hex()):
+                raise LedgerError(f"checkpoint at record {base} does not match the records")
+        n = base
+        for line in fh:
+            digest = sha256(prev + line[P:-2]).digest()
+            if hexlify(digest) != line[6:70]:
+                _check_line(line, prev, n)
+            prev = digest
+            n += 1
+        size = fh.tell()
+    return VerifyReport(n, size, time.perf_counter() - start, prev.hex(), ledger_root(checkpoints))
+
+
+def verify_range(path: str, start: int, stop: int, root: str | None = None) -> VerifyReport:
+    """Verify records [start, stop) by seeking to the covering checkpoint blocks.
+
+    The first block is found by bisection over the checkpoints; each covered
+    block is re-hashed, chained to its checkpoint head, and its root proved
+    against *root* with an O(log n) Merkle proof.  *root* defaults to the
+    root of the (chain-verified) checkpoint file; pass an externally
+    anchored root to also detect a rewritten checkpoint file.  Records after
+    the last checkpoint are verified from its head.
+    """
+    t0 = time.perf_counter()
+    checkpoints = read_checkpoints(path)
+    root = ledger_root(checkpoints) if root is None else root
+    ends = [cp.index for cp in checkpoints]
+    if not 0 <= start < stop:
+        raise ValueError("need 0 <= start < stop")
+    j = bisect.bisect_right(ends, start)             # block containing `start`
+    prev_cp = checkpoints[j - 1] if j else None
+    prev = bytes.fromhex(prev_cp.head) if prev_cp else GENESIS
+    n = prev_cp.index if prev_cp else 0
+    offset = prev_cp.offset if prev_cp else 0
+    levels = _levels([bytes.fromhex(cp.block_root) for cp in checkpoints]) if checkpoints else []
+    anchor = bytes.fromhex(root)
+    size = 0
+    with open(path, "rb") as fh:
+        fh.seek(offset)
+        block: list[bytes] = []
+        for line in fh:
+            prev = _check_line(line, prev, n)
+            block.append(prev)
+            n += 1
+            size += len(line)
+            if j < len(checkpoints) and n == checkpoints[j].index:
+                cp = checkpoints[j]
+                if cp.head != prev.hex() or not verify_merkle_proof(
+                        merkle_root(block), j, len(checkpoints), _proof(levels, j), anchor):
+                    raise LedgerError(f"block {j} (records up to {n}) fails its checkpoint")
+                block = []
+                j += 1
+                if n >= stop:
+                    break
+            elif j == len(checkpoints) and n >= stop:
+                break
+    if n < stop:
+        raise LedgerError(f"ledger has {n} records, range ends at {stop}")
+    return VerifyReport(n - (prev_cp.index if prev_cp else 0), size,
+                        time.perf_counter() - t0, prev.hex(), root)
+
+
+def iter_entries(path: str) -> Iterator[dict]:
+    """Yield the entries of a ledger (no verification)."""
+    with open(path, "rb") as fh:
+        for line in fh:
+            yield json.loads(line[_PAYLOAD:-2])
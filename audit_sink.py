@@ -0,0 +1,314 @@
+"""
+audit_sink.py
+=============
+Pluggable audit sinks shared by the audit producers
+(``CertifiedAdmissibleSpace`` in certified_dynamics.py and
+``HilbertBellManifold`` in hilbert_bell_manifold.py).
+
+  • AuditSink   — interface: write / write_many / flush / close
+  • MemorySink  — keeps entries in a list (tests, in-process consumers)
+  • JsonlSink   — streams JSON Lines through a background writer thread with
+                  size/age-based rotation, batched fsync and backpressure
+
+Entries are serialised by the writer thread, so a producer must not mutate
+an entry after handing it to a sink.  Several producers (and threads) may
+share one sink.
+
+Dependencies: none beyond the Python 3.10+ standard library.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+
+# ──────────────────────────────────────────────
+# 1. Interface
+# ──────────────────────────────────────────────
+
+class SinkError(RuntimeError):
+    """The sink's writer failed, or the sink is closed."""
+
+
+class SinkFullError(SinkError):
+    """Backpressure: the pending queue stayed full (overflow="raise" or timeout)."""
+
+
+class AuditSink:
+    """Destination for audit entries (JSON-serialisable dicts)."""
+
+    def write(self, entry: dict) -> None:
+        self.write_many((entry,))
+
+    def write_many(self, entries: Iterable[dict]) -> None:
+        raise NotImplementedError
+
+    def flush(self, sync: bool = False) -> None:
+        """Block until every accepted entry is written (and fsynced if *sync*)."""
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "AuditSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class MemorySink(AuditSink):
+    """Collects entries in ``self.entries``."""
+
+    def __init__(self) -> None:
+        self.entries: list[dict] = []
+        self._lock = threading.Lock()
+
+    def write_many(self, entries: Iterable[dict]) -> None:
+        with self._lock:
+            self.entries.extend(entries)
+
+
+# ──────────────────────────────────────────────
+# 2. JSON Lines writer
+# ──────────────────────────────────────────────
+
+def _json_default(obj: Any) -> Any:
+    # NumPy scalars/arrays and enums without importing either.
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "value"):
+        return obj.value
+    return str(obj)
+
+
+@dataclass
+class SinkStats:
+    written: int = 0
+    dropped: int = 0
+    batches: int = 0
+    rotations: int = 0
+    fsyncs: int = 0
+
+
+class JsonlSink(AuditSink):
+    """Append-only JSON Lines file fed by a background writer thread.
+
+    Args:
+        path: Active log file (opened in append mode).
+        max_bytes: Rotate before a line would grow the file past this size.
+        max_age: Rotate when the active file is older than this (seconds).
+        backup_count: Rotated files kept as ``path.1`` (newest) .. ``path.N``;
+            ``None`` keeps all of them.
+        fsync_every: fsync after this many written entries.
+        fsync_interval: fsync at most this many seconds after a write.
+        max_pending: Entries accepted but not yet written; beyond this the
+            ``overflow`` policy applies.
+        overflow: ``"block"`` (wait, up to ``timeout`` seconds, then raise
+            :class:`SinkFullError`), ``"drop"`` (count in ``stats.dropped``)
+            or ``"raise"``.
+
+    With neither fsync option set, data reaches the OS after every batch but
+    is only fsynced on ``flush(sync=True)``, rotation and close.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_bytes: int | None = None,
+        max_age: float | None = None,
+        backup_count: int | None = 5,
+        fsync_every: int | None = None,
+        fsync_interval: float | None = None,
+        max_pending: int = 65536,
+        overflow: str = "block",
+        timeout: float | None = None,
+    ) -> None:
+        if overflow not in ("block", "drop", "raise"):
+            raise ValueError(f"overflow must be 'block', 'drop' or 'raise', got {overflow!r}.")
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive.")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backup_count = backup_count
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self.timeout = timeout
+        self.stats = SinkStats()
+
+        self._cond = threading.Condition()
+        self._queue: list[list[dict]] = []
+        self._outstanding = 0          # accepted, not yet written
+        self._sync_requested = False
+        self._closed = False
+        self._error: BaseException | None = None
+
+        self._fh = None
+        self._open()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="JsonlSink-writer", daemon=True)
+        self._thread.start()
+
+    # -- producer side -------------------------------------------------------
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise SinkError(f"Audit sink writer failed: {self._error}") from self._error
+        if self._closed:
+            raise SinkError("Audit sink is closed.")
+
+    def write_many(self, entries: Iterable[dict]) -> None:
+        batch = list(entries)
+        if not batch:
+            return
+        with self._cond:
+            self._check()
+            deadline = None if self.timeout is None else time.monotonic() + self.timeout
+            # An oversized batch is admitted once the queue is empty.
+            while self._outstanding and self._outstanding + len(batch) > self.max_pending:
+                if self.overflow == "drop":
+                    self.stats.dropped += len(batch)
+                    return
+                if self.overflow == "raise":
+                    raise SinkFullError(f"{self._outstanding} audit entries pending.")
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise SinkFullError(f"Timed out after {self.timeout}s waiting for the audit writer.")
+                self._cond.wait(remaining)
+                self._check()
+            self._queue.append(batch)
+            self._outstanding += len(batch)
+            self._cond.notify_all()
+
+    def flush(self, sync: bool = False) -> None:
+        with self._cond:
+            if self._closed and not self._thread.is_alive():
+                return
+            self._check()
+            self._sync_requested |= sync
+            self._cond.notify_all()
+            while (self._outstanding or self._sync_requested) and self._error is None:
+                self._cond.wait()
+            self._check()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        if self._error is not None:
+            raise SinkError(f"Audit sink writer failed: {self._error}") from self._error
+
+    # -- writer thread -------------------------------------------------------
+
+    def _open(self) -> None:
+        self._fh = open(self.path, "a", encoding="ascii")
+        self._size = self._fh.tell()
+        self._opened = time.monotonic()
+
+    def _sync(self) -> None:
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self.stats.fsyncs += 1
+
+    def _rotate(self) -> None:
+        self._sync()
+        self._fh.close()
+        if self.backup_count is None:
+            n = 1
+            while os.path.exists(f"{self.path}.{n}"):
+                n += 1
+        else:
+            n = self.backup_count
+            if os.path.exists(f"{self.path}.{n}"):
+                os.remove(f"{self.path}.{n}")
+        for i in range(n - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if n > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+        self.stats.rotations += 1
+
+    def _write_lines(self, lines: list[str]) -> None:
+        if self.max_age is not None and self._size and time.monotonic() - self._opened >= self.max_age:
+            self._rotate()
+        if self.max_bytes is None:
+            self._fh.write("".join(lines))
+            self._size += sum(map(len, lines))
+            return
+        start = 0
+        pending = 0
+        for i, line in enumerate(lines):
+            # json.dumps output is ASCII, so len() is the byte count.
+            if self._size + pending and self._size + pending + len(line) > self.max_bytes:
+                self._fh.write("".join(lines[start:i]))
+                self._size += pending
+                self._rotate()
+                start, pending = i, 0
+            pending += len(line)
+        self._fh.write("".join(lines[start:]))
+        self._size += pending
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    while not (self._queue or self._sync_requested or self._closed):
+                        if self.fsync_interval is not None and self._unsynced:
+                            wait = self.fsync_interval - (time.monotonic() - self._last_sync)
+                            if wait <= 0:
+                                break
+                            self._cond.wait(wait)
+                        else:
+                            self._cond.wait()
+                    batches, self._queue = self._queue, []
+                    sync, closing = self._sync_requested, self._closed
+
+                n = sum(map(len, batches))
+                if n:
+                    dumps = json.dumps
+                    self._write_lines([
+                        dumps(entry, default=_json_default) + "\n"
+                        for batch in batches for entry in batch
+                    ])
+                    self._fh.flush()
+                    self._unsynced += n
+                if self._unsynced and (
+                    sync or closing
+                    or (self.fsync_every is not None and self._unsynced >= self.fsync_every)
+                    or (self.fsync_interval is not None
+                        and time.monotonic() - self._last_sync >= self.fsync_interval)
+                ):
+                    self._sync()
+
+                with self._cond:
+                    self._outstanding -= n
+                    self.stats.written += n
+                    self.stats.batches += len(batches)
+                    if sync:
+                        self._sync_requested = False
+                    self._cond.notify_all()
+                    if closing and not self._queue:
+                        break
+        except BaseException as exc:  # surfaced to producers via _check()
+            with self._cond:
+                self._error = exc
+                self._cond.notify_all()
+        finally:
+            self._fh.close()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_audit_ledger.py — Audit ledger write/verify throughput
+========================================================================
+
+Writes a hash-chained ledger of synthetic CertifiedAdmissibleSpace audit
+entries, then measures streaming verification throughput (MB/s) with and
+without block Merkle roots, and the cost of verifying a short range via
+checkpoints.
+
+Run with:  python benchmarks/bench_audit_ledger.py --records 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from audit_ledger import HashChainLedger, verify_ledger, verify_range  # noqa: E402
+
+_STATUSES = ("FULLY_ADMISSIBLE", "MIXED_BOUNDARY", "INADMISSIBLE", "CONDITIONAL_PENDING")
+
+
+def _entries(n: int, dim: int, seed: int = 0):
+    rng = random.Random(seed)
+    for i in range(n):
+        status = _STATUSES[rng.randrange(4)]
+        yield {
+            "timestamp": "2026-01-01T00:00:00.000000",
+            "simulation_time": i * 0.01,
+            "system_id": "AERO-EVTOL-1",
+            "state_vector": [rng.random() for _ in range(dim)],
+            "status": status,
+            "reason": "All constraints satisfied." if status == "FULLY_ADMISSIBLE"
+                      else "Partial violations in ['Noise_Limit_CS23'], no evidence gates available.",
+            "violations": [] if status == "FULLY_ADMISSIBLE" else ["Noise_Limit_CS23"],
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=4, help="state vector length")
+    parser.add_argument("--checkpoint-every", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "audit.ledger")
+        entries = list(_entries(args.records, args.dim))
+        start = time.perf_counter()
+        with HashChainLedger(path, checkpoint_every=args.checkpoint_every) as ledger:
+            ledger.write_many(entries)
+        write_s = time.perf_counter() - start
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"{'operation':<22} {'seconds':>9} {'MB/s':>9} {'records/s':>12}")
+        print(f"{'write':<22} {write_s:>9.3f} {size_mb / write_s:>9.1f} {args.records / write_s:>12,.0f}")
+
+        for label, blocks in (("verify", True), ("verify (chain only)", False)):
+            best = min((verify_ledger(path, blocks=blocks) for _ in range(args.repeat)),
+                       key=lambda r: r.seconds)
+            print(f"{label:<22} {best.seconds:>9.3f} {best.mb_per_s:>9.1f} "
+                  f"{best.records / best.seconds:>12,.0f}")
+
+        mid = args.records // 2
+        report = min((verify_range(path, mid, mid + 10) for _ in range(args.repeat)),
+                     key=lambda r: r.seconds)
+        print(f"{'verify_range (10 rec)':<22} {report.seconds:>9.4f} {'':>9} "
+              f"{report.records:>9} rec read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_hilbert_bell.py — Hamiltonian evolution step throughput
+=========================================================================
+
+Evolves a random state under HamiltonianEvolver with the pure-stdlib
+backend and the NumPy backend (dense and sparse step operators) for a few
+basis sizes and couplings per state, reporting steps per second.
+
+Run with:  python benchmarks/bench_hilbert_bell.py --dims 12,256,2048 --couplings 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import cmath
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from hilbert_bell_manifold import (  # noqa: E402
+    BasisState,
+    CouplingPair,
+    EntanglementMatrix,
+    HamiltonianEvolver,
+    QuantumState,
+)
+
+
+def _rate(dim: int, couplings: int, backend: str, sparse: bool | None, seconds: float) -> float:
+    rng = random.Random(0)
+    entanglement = EntanglementMatrix(dim)
+    for _ in range(couplings * dim // 2):
+        entanglement.set_coupling(CouplingPair(rng.randrange(dim), rng.randrange(dim), rng.uniform(-1, 1)))
+    basis = [BasisState(k, f"S{k + 1}") for k in range(dim)]
+    state = QuantumState([cmath.rect(1, rng.uniform(0, 6.28)) for _ in range(dim)], basis, backend)
+    evolver = HamiltonianEvolver(entanglement, [rng.uniform(-1, 1) for _ in range(dim)], sparse=sparse)
+    evolver.evolve(state)  # assemble the step operator outside the timed loop
+    steps, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for _ in range(10):
+            evolver.evolve(state)
+        steps += 10
+    return steps / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dims", default="12,256,2048")
+    parser.add_argument("--couplings", type=int, default=4, help="average couplings per basis state")
+    parser.add_argument("--seconds", type=float, default=1.0, help="time per measurement")
+    args = parser.parse_args()
+
+    variants = (("python", "python", None), ("numpy dense", "numpy", False), ("numpy sparse", "numpy", True))
+    print(f"{'dim':>6} " + " ".join(f"{label + ' steps/s':>20}" for label, _, _ in variants))
+    for dim in map(int, args.dims.split(",")):
+        rates = [_rate(dim, args.couplings, backend, sparse, args.seconds) for _, backend, sparse in variants]
+        print(f"{dim:>6} " + " ".join(f"{rate:>20,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
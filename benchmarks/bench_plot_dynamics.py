@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_plot_dynamics.py — Trajectory plotting on large audit logs
+============================================================================
+
+Writes a synthetic CertifiedAdmissibleSpace audit log (columnar .npz and/or
+JSON Lines), then measures streaming load + downsampling, the full
+plot_state_trajectory() render and the one-pass compliance summary,
+reporting the process's peak RSS.  With --charts, also renders a fleet of
+charts (two state components per log) through render_batch() and reports
+charts/s and the mean per-job load and render times.
+
+Run with:  python benchmarks/bench_plot_dynamics.py --entries 10000000 --formats npz
+           python benchmarks/bench_plot_dynamics.py --entries 20000 --formats npz --charts 200 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from certified_dynamics import (  # noqa: E402
+    CertifiedAdmissibleSpace,
+    InvariantCore,
+    LinearConstraint,
+)
+from plot_dynamics import DynamicsPlotter, PlotJob, load_trace, render_batch  # noqa: E402
+
+
+def _write_log(path: str, n: int, seed: int = 0) -> None:
+    core = InvariantCore("AERO-EVTOL-1", "EASA", "Plot benchmark")
+    core.add_constraint(LinearConstraint("Noise_Limit_CS23", [1.0, 0.0], 80.0))
+    core.add_constraint(LinearConstraint("Mass", [0.0, 1.0], 5.0))
+    space = CertifiedAdmissibleSpace(fail_closed=False)
+    rng = np.random.default_rng(seed)
+    for start in range(0, n, 1_000_000):
+        m = min(1_000_000, n - start)
+        t = np.arange(start, start + m) * 1e-3
+        X = np.column_stack([78 + 3 * np.sin(t) + rng.normal(0, 0.2, m), rng.uniform(3, 4.9, m)])
+        space.evaluate_states(X, core, times=t)
+    space.audit_log.export(path)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux; it is a high-water mark for the process.
+    return result, seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--formats", default="npz,jsonl", help="comma-separated: npz, jsonl, json")
+    parser.add_argument("--max-points", type=int, default=5000)
+    parser.add_argument("--charts", type=int, default=0, help="batch-render this many charts")
+    parser.add_argument("--workers", type=int, default=None, help="render_batch workers (default: CPUs)")
+    args = parser.parse_args()
+
+    print(f"{'format':<7} {'operation':<16} {'seconds':>9} {'entries/s':>12} {'peak RSS MB':>12} {'kept':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in args.formats.split(","):
+            path = os.path.join(tmp, f"audit.{fmt}")
+            _write_log(path, args.entries)
+            trace, seconds, peak = _timed(lambda: load_trace(path, 0, args.max_points))
+            print(f"{fmt:<7} {'load+downsample':<16} {seconds:>9.2f} {args.entries / seconds:>12,.0f} "
+                  f"{peak:>12.1f} {len(trace):>7}")
+            out = os.path.join(tmp, "plot.png")
+            _, seconds, peak = _timed(lambda: DynamicsPlotter(path).plot_state_trajectory(
+                threshold_fn=lambda t: 80.0, output_path=out, max_points=args.max_points))
+            print(f"{fmt:<7} {'plot':<16} {seconds:>9.2f} {args.entries / seconds:>12,.0f} {peak:>12.1f}")
+            report = os.path.join(tmp, "summary.json")
+            _, seconds, peak = _timed(lambda: DynamicsPlotter(path).generate_summary_report(report))
+            print(f"{fmt:<7} {'summary':<16} {seconds:>9.2f} {args.entries / seconds:>12,.0f} {peak:>12.1f}")
+            if args.charts:
+                _batch(path, args, tmp)
+            os.remove(path)
+
+
+def _batch(path: str, args, tmp: str) -> None:
+    """Render ``--charts`` charts over copies of ``path``, two per log."""
+    logs = [path]
+    for k in range(1, (args.charts + 1) // 2):
+        logs.append(os.path.join(tmp, f"tail{k}{Path(path).suffix}"))
+        os.link(path, logs[-1])
+    jobs = [PlotJob(log, i, None, os.path.join(tmp, f"chart{k}_{i}.png"), max_points=args.max_points)
+            for k, log in enumerate(logs) for i in (0, 1)][:args.charts]
+    results, seconds, _ = _timed(lambda: render_batch(jobs, args.workers))
+    load = sum(r.load_seconds for r in results) / len(results)
+    render = sum(r.render_seconds for r in results) / len(results)
+    print(f"batch   {len(jobs)} charts: {seconds:.2f} s, {len(jobs) / seconds:.1f} charts/s, "
+          f"{len({r.worker for r in results})} worker(s), mean load {load:.3f} s, "
+          f"mean render {render:.3f} s, {sum(not r.ok for r in results)} failed")
+    for log in logs[1:]:
+        os.remove(log)
+
+
+if __name__ == "__main__":
+    main()
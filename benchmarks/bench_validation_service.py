@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_validation_service.py — ValidationService throughput
+======================================================================
+
+Measures (profile, state) validation throughput of ``AMPEL.ValidationService``
+for a large batch of synthetic evidence states validated against all three
+regulatory profiles, serially and across 1…N worker threads/processes.
+
+Run with:  python benchmarks/bench_validation_service.py --states 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from AMPEL import (  # noqa: E402
+    RegulatoryProfile,
+    ValidationJob,
+    ValidationService,
+    validate_state,
+)
+
+
+def _make_jobs(n_states: int, seed: int = 0) -> List[ValidationJob]:
+    rng = random.Random(seed)
+    profiles = list(RegulatoryProfile)
+    jobs = []
+    for i in range(n_states):
+        state = {
+            "Q100-RULE-01": rng.randint(1, 14),
+            "Q100-RULE-03": rng.randint(20, 70),
+            "PR-VAL-CC-01": rng.randint(1, 18),
+            "PR-VAL-CC-04": rng.randint(1, 10),
+            "PR-VAL-ART-00": "PSAC_absent" if rng.random() < 0.05 else "PSAC_approved",
+            "Q10-RULE-02": rng.random() * 2e-4,
+        }
+        jobs.append(ValidationJob(profiles[i % len(profiles)], state))
+    return jobs
+
+
+def _serial(jobs: List[ValidationJob]) -> float:
+    start = time.perf_counter()
+    for job in jobs:
+        validate_state(job.profile, job.state, job.dal)
+    return time.perf_counter() - start
+
+
+def _pooled(
+    jobs: List[ValidationJob],
+    executor: str,
+    workers: int,
+    chunk_size: int,
+    include_reports: bool,
+) -> float:
+    with ValidationService(
+        max_workers=workers,
+        executor=executor,
+        chunk_size=chunk_size,
+        include_reports=include_reports,
+    ) as service:
+        # Warm the pool (process start-up and per-process profile cache).
+        for _ in service.run(jobs[: workers * chunk_size]):
+            pass
+        start = time.perf_counter()
+        count = sum(1 for _ in service.run(jobs))
+        elapsed = time.perf_counter() - start
+    assert count == len(jobs)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--states", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--executor", choices=("thread", "process", "both"), default="both")
+    parser.add_argument("--verdicts-only", action="store_true",
+                        help="run the service with include_reports=False")
+    args = parser.parse_args()
+
+    jobs = _make_jobs(args.states)
+    workers = sorted({1, 2, 4, 8, 16, args.max_workers} & set(range(1, args.max_workers + 1)))
+    kinds = ("thread", "process") if args.executor == "both" else (args.executor,)
+
+    baseline = _serial(jobs)
+    print(f"{'mode':<10} {'workers':>7} {'seconds':>9} {'states/s':>12} {'speed-up':>9}")
+    print(f"{'serial':<10} {1:>7} {baseline:>9.3f} {len(jobs) / baseline:>12,.0f} {1.0:>9.2f}")
+    for kind in kinds:
+        for n in workers:
+            elapsed = _pooled(jobs, kind, n, args.chunk_size, not args.verdicts_only)
+            print(f"{kind:<10} {n:>7} {elapsed:>9.3f} {len(jobs) / elapsed:>12,.0f} "
+                  f"{baseline / elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
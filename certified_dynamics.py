@@ -1,9 +1,18 @@
 import numpy as np
 import json
+import itertools
+import os
+import shutil
+import tempfile
+import warnings
+import weakref
+from collections import OrderedDict
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Callable, List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional, Union
+
+from audit_sink import AuditSink
 
 # ==========================================
 # 1. DATA STRUCTURES AND STATES
@@ -25,27 +34,253 @@ class EvidenceGate:
     is_fulfilled: bool = False
     evidence_uri: Optional[str] = None
     timestamp: Optional[str] = None
+    # Registries holding this gate, notified on fulfil (set by register())
+    _registries: List["EvidenceGateRegistry"] = field(
+        default_factory=list, init=False, repr=False, compare=False)
     
     def fulfill(self, uri: str):
         self.is_fulfilled = True
         self.evidence_uri = uri
         self.timestamp = datetime.now().isoformat()
+        for registry in self._registries:
+            registry._fulfilled(self)
+
+    def to_dict(self) -> dict:
+        """The gate's own fields (asdict() would also copy its registries)."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
 
 # ==========================================
 # 2. DYNAMIC CONSTRAINTS AND CORE
 # ==========================================
 
+class SlowConstraintWarning(RuntimeWarning):
+    """A constraint without an array form was evaluated row by row."""
+
 class TimeVaryingConstraint:
-    """Constraint that evolves over time: g(x, t) <= 0."""
+    """Constraint that evolves over time: g(x, t) <= 0.
+
+    Array-capable protocol: a constraint with ``vectorized = True`` accepts an
+    (N, d) state matrix and a scalar or (N,) time vector in
+    :meth:`evaluate_batch` and returns (N,) values.  For this class that means
+    ``base_fn`` maps (N, d) -> (N,) and ``evolution_fn`` maps times to a
+    broadcastable factor.  Otherwise :meth:`evaluate_batch` falls back to one
+    call per row, counts the rows in ``fallback_rows`` and warns once with
+    :class:`SlowConstraintWarning` (see :func:`fallback_report`).
+
+    ``time_invariant`` declares that g does not depend on t (implied when no
+    ``evolution_fn`` is given); :class:`AdmissibilityCache` relies on it.
+    """
     def __init__(self, name: str, base_fn: Callable[[np.ndarray], float], 
-                 evolution_fn: Callable[[float], float] = lambda t: 1.0):
+                 evolution_fn: Optional[Callable[[float], float]] = None,
+                 vectorized: bool = False, time_invariant: bool = False):
         self.name = name
         self.base_fn = base_fn
-        self.evolution_fn = evolution_fn  # By default does not change over time
+        self.evolution_fn = evolution_fn or _unit  # By default does not change over time
+        self.vectorized = vectorized
+        self.time_invariant = time_invariant or self.evolution_fn is _unit
+        self.fallback_rows = 0
 
     def evaluate(self, x: np.ndarray, t: float) -> float:
         return self.base_fn(x) * self.evolution_fn(t)
 
+    def evaluate_batch(self, X: np.ndarray, t) -> np.ndarray:
+        """Evaluate g for every row of X (N, d); t is a scalar or an (N,) vector."""
+        n = X.shape[0]
+        if self.vectorized:
+            return np.broadcast_to(
+                np.asarray(self.base_fn(X), dtype=float) * self.evolution_fn(t), (n,)
+            )
+        if not self.fallback_rows:
+            warnings.warn(
+                f"Constraint '{self.name}' is not array-capable; evaluating row by row. "
+                "Use a compiled form or declare vectorized=True.",
+                SlowConstraintWarning, stacklevel=2,
+            )
+        self.fallback_rows += n
+        base = np.fromiter((self.base_fn(x) for x in X), dtype=float, count=n)
+        if np.ndim(t) == 0:
+            return base * self.evolution_fn(float(t))
+        # Monte-Carlo sweeps typically share a few time stamps.
+        uniq, inverse = np.unique(t, return_inverse=True)
+        factors = np.fromiter((self.evolution_fn(float(u)) for u in uniq), dtype=float, count=len(uniq))
+        return base * factors[inverse]
+
+def fallback_report(core: "InvariantCore") -> Dict[str, int]:
+    """Rows evaluated through the per-row fallback, per constraint, slowest first."""
+    counts = {c.name: getattr(c, "fallback_rows", 0) for c in core.constraints}
+    return dict(sorted(((k, v) for k, v in counts.items() if v), key=lambda kv: -kv[1]))
+
+# ------------------------------------------
+# Compiled constraint forms
+# ------------------------------------------
+# g(x, t) = base(x) * schedule(t).  ``schedule`` must accept a scalar or an
+# (N,) array (PiecewiseLinearSchedule does; so does e.g. ``lambda t: 1 - t/80``).
+
+def _frozen(a, ndim: int, what: str) -> np.ndarray:
+    arr = np.array(a, dtype=float, ndmin=ndim)
+    if arr.ndim != ndim:
+        raise ValueError(f"{what} must be {ndim}-dimensional, got shape {arr.shape}.")
+    arr.setflags(write=False)
+    return arr
+
+class PiecewiseLinearSchedule:
+    """Time factor interpolated between (time, factor) knots, held constant outside."""
+    def __init__(self, times, factors):
+        self.times = _frozen(times, 1, "times")
+        self.factors = _frozen(factors, 1, "factors")
+        if self.times.shape != self.factors.shape or len(self.times) == 0:
+            raise ValueError("times and factors must be non-empty and of equal length.")
+        if np.any(np.diff(self.times) <= 0):
+            raise ValueError("times must be strictly increasing.")
+
+    def __call__(self, t):
+        return np.interp(t, self.times, self.factors)
+
+    def __repr__(self) -> str:
+        return f"PiecewiseLinearSchedule({self.times.tolist()}, {self.factors.tolist()})"
+
+def _unit(t):
+    return 1.0
+
+class MaxAffineConstraint(TimeVaryingConstraint):
+    """g(x, t) = max_k (A[k]·x - b[k]) * schedule(t).
+
+    The engine stacks the rows of every max-affine constraint in a core into
+    one matrix and evaluates them with a single ``X @ A.T``.
+    """
+    def __init__(self, name: str, A, b, schedule: Optional[Callable] = None):
+        self.A = _frozen(A, 2, "A")
+        self.b = _frozen(b, 1, "b")
+        if self.b.shape != (self.A.shape[0],) or self.A.shape[0] == 0:
+            raise ValueError(f"b must have shape ({self.A.shape[0]},), got {self.b.shape}.")
+        self.schedule = schedule
+        super().__init__(name, self._base, schedule or _unit, vectorized=True)
+
+    @property
+    def dim(self) -> int:
+        return self.A.shape[1]
+
+    def _base(self, x: np.ndarray):
+        return (x @ self.A.T - self.b).max(axis=-1)
+
+class LinearConstraint(MaxAffineConstraint):
+    """g(x, t) = (a·x - b) * schedule(t)."""
+    def __init__(self, name: str, a, b: float = 0.0, schedule: Optional[Callable] = None):
+        super().__init__(name, _frozen(a, 1, "a")[np.newaxis, :], [b], schedule)
+
+class BoxConstraint(MaxAffineConstraint):
+    """lower <= x <= upper; g is the largest bound excess (negative inside the box).
+
+    Infinite (or None) bounds are dropped.
+    """
+    def __init__(self, name: str, lower, upper, schedule: Optional[Callable] = None):
+        lo = np.array([-np.inf if v is None else v for v in np.ravel(lower)], dtype=float)
+        hi = np.array([np.inf if v is None else v for v in np.ravel(upper)], dtype=float)
+        if lo.shape != hi.shape:
+            raise ValueError("lower and upper must have the same length.")
+        if np.any(lo > hi):
+            raise ValueError("lower must not exceed upper.")
+        eye = np.eye(len(lo))
+        up, down = np.isfinite(hi), np.isfinite(lo)
+        A = np.vstack([eye[up], -eye[down]])
+        b = np.concatenate([hi[up], -lo[down]])
+        if len(b) == 0:
+            raise ValueError("BoxConstraint needs at least one finite bound.")
+        super().__init__(name, A, b, schedule)
+        self.lower, self.upper = _frozen(lo, 1, "lower"), _frozen(hi, 1, "upper")
+
+class QuadraticConstraint(TimeVaryingConstraint):
+    """g(x, t) = (xᵀQx + a·x + c) * schedule(t)."""
+    def __init__(self, name: str, Q, a=None, c: float = 0.0, schedule: Optional[Callable] = None):
+        self.Q = _frozen(Q, 2, "Q")
+        d = self.Q.shape[0]
+        if self.Q.shape != (d, d):
+            raise ValueError(f"Q must be square, got shape {self.Q.shape}.")
+        self.a = _frozen(np.zeros(d) if a is None else a, 1, "a")
+        if self.a.shape != (d,):
+            raise ValueError(f"a must have shape ({d},), got {self.a.shape}.")
+        self.c = float(c)
+        self.schedule = schedule
+        super().__init__(name, self._base, schedule or _unit, vectorized=True)
+
+    @property
+    def dim(self) -> int:
+        return self.Q.shape[0]
+
+    def _base(self, x: np.ndarray):
+        return np.einsum("...d,de,...e->...", x, self.Q, x) + x @ self.a + self.c
+
+class _FusedConstraints:
+    """Evaluation plan for a constraint list: compiled forms are fused, the rest delegate."""
+    def __init__(self, constraints: List[TimeVaryingConstraint]):
+        boxes = [(j, c) for j, c in enumerate(constraints) if isinstance(c, BoxConstraint)]
+        affine = [(j, c) for j, c in enumerate(constraints)
+                  if isinstance(c, MaxAffineConstraint) and not isinstance(c, BoxConstraint)]
+        quad = [(j, c) for j, c in enumerate(constraints) if isinstance(c, QuadraticConstraint)]
+        fused = {j for j, _ in boxes + affine + quad}
+        self.m = len(constraints)
+        self.dims = {c.dim for _, c in boxes + affine + quad}
+        self.others = [(j, c) for j, c in enumerate(constraints) if j not in fused]
+
+        self.affine_cols = np.array([j for j, _ in affine], dtype=np.intp)
+        if affine:
+            self.A = np.vstack([c.A for _, c in affine])
+            self.b = np.concatenate([c.b for _, c in affine])[:, np.newaxis]
+            # Row spans of constraints with several rows, reduced by max.
+            bounds = np.cumsum([0] + [c.A.shape[0] for _, c in affine])
+            self.first_rows = bounds[:-1]
+            self.segments = [(s, e) for s, e in zip(bounds[:-1], bounds[1:]) if e - s > 1]
+
+        # Boxes are bounds on single coordinates: elementwise, not a matmul
+        # against +/- identity rows.
+        self.boxes = []
+        for j, c in boxes:
+            dims = np.flatnonzero(np.isfinite(c.lower) | np.isfinite(c.upper))
+            self.boxes.append((j, dims, c.lower[dims, np.newaxis], c.upper[dims, np.newaxis]))
+
+        self.quad_cols = np.array([j for j, _ in quad], dtype=np.intp)
+        if quad:
+            self.Q = np.stack([c.Q for _, c in quad])
+            self.qa = np.stack([c.a for _, c in quad])
+            self.qc = np.array([c.c for _, c in quad])[:, np.newaxis]
+
+        # Columns sharing one schedule object get a single schedule(t) call.
+        groups: Dict[int, Tuple[Callable, List[int]]] = {}
+        for j, c in boxes + affine + quad:
+            if c.schedule is not None:
+                groups.setdefault(id(c.schedule), (c.schedule, []))[1].append(j)
+        self.schedules = [(s, np.array(cols, dtype=np.intp)) for s, cols in groups.values()]
+
+    def evaluate(self, X: np.ndarray, t) -> np.ndarray:
+        """Return the (N, m) value matrix (a transposed view of an (m, N) buffer)."""
+        n, d = X.shape
+        if self.dims and self.dims != {d}:
+            raise ValueError(f"Compiled constraints expect dimension {sorted(self.dims)}, got {d}.")
+        # Row-major per constraint: every write below is a contiguous row.
+        W = np.empty((self.m, n), dtype=float)
+        if len(self.affine_cols):
+            Y = self.A @ X.T
+            Y -= self.b
+            if self.segments:
+                for s, e in self.segments:
+                    np.maximum.reduce(Y[s:e], axis=0, out=Y[s])
+                Y = Y[self.first_rows]
+            W[self.affine_cols] = Y
+        if self.boxes:
+            Xt = X.T
+            for j, dims, lower, upper in self.boxes:
+                rows = Xt[dims]
+                np.maximum(rows - upper, lower - rows).max(axis=0, out=W[j])
+        if len(self.quad_cols):
+            W[self.quad_cols] = (
+                np.einsum("nd,qde,ne->qn", X, self.Q, X, optimize=True) + self.qa @ X.T + self.qc
+            )
+        for schedule, cols in self.schedules:
+            W[cols] *= np.asarray(schedule(t), dtype=float)
+        for j, constraint in self.others:
+            W[j] = constraint.evaluate_batch(X, t)
+        return W.T
+
 class InvariantCore:
     """The minimum common denominator (C) with temporal constraints."""
     def __init__(self, sys_id: str, authority: str, purpose: str):
@@ -53,10 +288,19 @@ class InvariantCore:
         self.authority = authority
         self.purpose = purpose
         self.constraints: List[TimeVaryingConstraint] = []
+        self._plan: Optional[_FusedConstraints] = None
+        self._plan_key: Tuple[int, ...] = ()
 
     def add_constraint(self, constraint: TimeVaryingConstraint):
         self.constraints.append(constraint)
 
+    def compiled(self) -> _FusedConstraints:
+        """Fused evaluation plan, rebuilt when the constraint list changes."""
+        key = tuple(map(id, self.constraints))
+        if self._plan is None or key != self._plan_key:
+            self._plan, self._plan_key = _FusedConstraints(self.constraints), key
+        return self._plan
+
 class System:
     """M_i = C ⊕ E_i"""
     def __init__(self, core: InvariantCore):
@@ -74,50 +318,723 @@ class System:
 # 3. ADMISSIBLE SPACE AND TRACEABILITY
 # ==========================================
 
+# Status codes used by batch evaluation (index into this tuple).
+STATUS_ORDER: Tuple[AdmissibilityStatus, ...] = tuple(AdmissibilityStatus)
+_CODE = {status: i for i, status in enumerate(STATUS_ORDER)}
+
+@dataclass
+class BatchAdmissibility:
+    """Result of :meth:`CertifiedAdmissibleSpace.evaluate_states`.
+
+    ``values`` holds g(x, t) as an (N, m) matrix, ``violations`` its
+    ``> 0`` mask and ``codes`` the per-row status as indices into
+    :data:`STATUS_ORDER`.
+    """
+    constraint_names: List[str]
+    values: np.ndarray
+    violations: np.ndarray
+    codes: np.ndarray
+    _reasons: List[str]
+    _pattern_ids: np.ndarray
+    _pattern_violations: List[List[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def status(self, i: int) -> AdmissibilityStatus:
+        return STATUS_ORDER[self.codes[i]]
+
+    def reason(self, i: int) -> str:
+        return self._reasons[self._pattern_ids[i]]
+
+    @property
+    def statuses(self) -> List[AdmissibilityStatus]:
+        return [STATUS_ORDER[c] for c in self.codes.tolist()]
+
+    def mask(self, status: AdmissibilityStatus) -> np.ndarray:
+        """Boolean (N,) mask of rows with *status*."""
+        return self.codes == _CODE[status]
+
+    def counts(self) -> Dict[str, int]:
+        totals = np.bincount(self.codes, minlength=len(STATUS_ORDER))
+        return {s.value: int(n) for s, n in zip(STATUS_ORDER, totals)}
+
+# ------------------------------------------
+# Columnar audit store
+# ------------------------------------------
+
+AUDIT_FORMAT = "certified_dynamics.audit"
+AUDIT_FORMAT_VERSION = 1
+
+class _Interner:
+    """Append-only value table; rows store the integer id."""
+    def __init__(self, values=()):
+        self.values: List = []
+        self._ids: Dict = {}
+        for v in values:
+            self.intern(v)
+
+    def intern(self, value) -> int:
+        i = self._ids.get(value)
+        if i is None:
+            i = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return i
+
+class AuditStore:
+    """Append-only, columnar audit log.
+
+    Rows live in growing NumPy buffers (wall-clock timestamp, simulation time,
+    status code, system/reason/violation ids, ``applied`` flag, state
+    matrix); system ids, reasons and violation lists are interned once.
+    Every ``chunk_rows`` rows the buffer is sealed into a chunk: kept in
+    memory, or written as ``.npz`` to a private ``audit-*`` directory created
+    inside ``spill_dir`` (so stores may share one ``spill_dir``) so that
+    memory stays bounded by one chunk.  A change of state dimension also
+    seals a chunk.
+
+    The store reads as a sequence of the classic audit dicts
+    (``store[-1]["status"]``, ``list(store)``) and exports to JSON, JSON
+    Lines or a columnar ``.npz`` (:meth:`export`, :meth:`load`).
+    """
+    _COLUMNS = ("timestamp", "simulation_time", "status", "system", "reason", "violations", "applied")
+    _DTYPES = (np.float64, np.float64, np.int8, np.int32, np.int32, np.int32, np.int8)
+
+    def __init__(self, chunk_rows: int = 65536, spill_dir: Optional[str] = None):
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be positive.")
+        self.chunk_rows = chunk_rows
+        self.spill_dir = spill_dir
+        self._reset()
+
+    def _reset(self):
+        """Empty state: no rows, chunks, interned strings or spill directory."""
+        self._spill_path: Optional[str] = None  # this store's directory inside spill_dir
+        self.systems = _Interner()
+        self.reasons = _Interner()
+        self.violation_sets = _Interner()
+        self._chunks: List = []  # column dicts (in memory) or .npz paths (spilled)
+        self._chunk_sizes: List[int] = []
+        self._n = 0
+        self._dim: Optional[int] = None
+        self._buf: Dict[str, np.ndarray] = {}
+        self._loaded: Tuple[int, Optional[Dict[str, np.ndarray]]] = (-1, None)
+
+    # ---- writing ----
+    def _reserve(self, d: int) -> int:
+        """Make room for at least one row of dimension d; return free rows."""
+        if self._n and (d != self._dim or self._n == self.chunk_rows):
+            self._seal()
+        if not self._buf:
+            self._dim = d
+            cap = min(1024, self.chunk_rows)
+            self._buf = {name: np.empty(cap, dtype=dt) for name, dt in zip(self._COLUMNS, self._DTYPES)}
+            self._buf["state"] = np.empty((cap, d), dtype=np.float64)
+        return self.chunk_rows - self._n
+
+    def _grow(self, rows: int):
+        cap = len(self._buf["timestamp"])
+        if self._n + rows <= cap:
+            return
+        new_cap = min(self.chunk_rows, max(2 * cap, self._n + rows))
+        for name, arr in self._buf.items():
+            grown = np.empty((new_cap,) + arr.shape[1:], dtype=arr.dtype)
+            grown[:self._n] = arr[:self._n]
+            self._buf[name] = grown
+
+    def _seal(self):
+        cols = {name: arr[:self._n].copy() for name, arr in self._buf.items()}
+        if self.spill_dir is not None:
+            if self._spill_path is None:
+                os.makedirs(self.spill_dir, exist_ok=True)
+                self._spill_path = tempfile.mkdtemp(dir=self.spill_dir, prefix="audit-")
+            path = os.path.join(self._spill_path, f"audit-chunk-{len(self._chunks):06d}.npz")
+            np.savez(path, **cols)
+            self._chunks.append(path)
+        else:
+            self._chunks.append(cols)
+        self._chunk_sizes.append(self._n)
+        self._buf, self._n, self._dim = {}, 0, None
+
+    def append(self, sys_id: str, sim_time: float, state: np.ndarray, status: AdmissibilityStatus,
+               reason: str, violations: List[str], timestamp: Optional[float] = None,
+               applied: Optional[bool] = None):
+        """Append one evaluation (``timestamp`` in POSIX seconds, default now)."""
+        state = np.ravel(state)
+        self._reserve(len(state))
+        self._grow(1)
+        i, b = self._n, self._buf
+        b["timestamp"][i] = datetime.now().timestamp() if timestamp is None else timestamp
+        b["simulation_time"][i] = sim_time
+        b["status"][i] = _CODE[status]
+        b["system"][i] = self.systems.intern(sys_id)
+        b["reason"][i] = self.reasons.intern(reason)
+        b["violations"][i] = self.violation_sets.intern(tuple(violations))
+        b["applied"][i] = -1 if applied is None else applied
+        b["state"][i] = state
+        self._n += 1
+
+    def append_batch(self, sys_id: str, states: np.ndarray, sim_times, codes: np.ndarray,
+                     pattern_ids: np.ndarray, reasons: List[str], violations: List[List[str]],
+                     timestamp: Optional[float] = None, applied: Optional[np.ndarray] = None):
+        """Append N rows whose reason/violations are given per pattern (see evaluate_states)."""
+        n, d = states.shape
+        ts = datetime.now().timestamp() if timestamp is None else timestamp
+        sys_idx = self.systems.intern(sys_id)
+        reason_ids = np.array([self.reasons.intern(r) for r in reasons], dtype=np.int32)[pattern_ids]
+        viol_ids = np.array([self.violation_sets.intern(tuple(v)) for v in violations],
+                            dtype=np.int32)[pattern_ids]
+        sim_times = np.broadcast_to(np.asarray(sim_times, dtype=np.float64), (n,))
+        start = 0
+        while start < n:
+            take = min(n - start, self._reserve(d))
+            self._grow(take)
+            rows, b = slice(self._n, self._n + take), self._buf
+            src = slice(start, start + take)
+            b["timestamp"][rows] = ts
+            b["simulation_time"][rows] = sim_times[src]
+            b["status"][rows] = codes[src]
+            b["system"][rows] = sys_idx
+            b["reason"][rows] = reason_ids[src]
+            b["violations"][rows] = viol_ids[src]
+            b["applied"][rows] = -1 if applied is None else applied[src]
+            b["state"][rows] = states[src]
+            self._n += take
+            start += take
+
+    def set_applied(self, applied: bool):
+        """Record whether the state of the most recent row was applied."""
+        if self._n:
+            self._buf["applied"][self._n - 1] = applied
+        elif self._chunks and isinstance(self._chunks[-1], dict):
+            self._chunks[-1]["applied"][-1] = applied
+        else:
+            raise IndexError("No writable audit row to mark as applied.")
+
+    def clear(self):
+        """Drop all rows and remove this store's spilled chunks (only its own)."""
+        if self._spill_path is not None:
+            shutil.rmtree(self._spill_path, ignore_errors=True)
+        self._reset()
+
+    # ---- reading ----
+    def _chunk(self, k: int) -> Dict[str, np.ndarray]:
+        chunk = self._chunks[k]
+        if isinstance(chunk, dict):
+            return chunk
+        if self._loaded[0] != k:
+            with np.load(chunk) as f:
+                self._loaded = (k, {name: f[name] for name in f.files})
+        return self._loaded[1]
+
+    def iter_chunks(self):
+        """Yield each chunk (then the open buffer) as a dict of column arrays."""
+        for k in range(len(self._chunks)):
+            yield self._chunk(k)
+        if self._n:
+            yield {name: arr[:self._n] for name, arr in self._buf.items()}
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """All rows as concatenated columns; ``state`` is (N, d) when d is uniform."""
+        chunks = list(self.iter_chunks())
+        cols = {name: np.concatenate([c[name] for c in chunks]) if chunks else np.empty(0, dt)
+                for name, dt in zip(self._COLUMNS, self._DTYPES)}
+        dims = {c["state"].shape[1] for c in chunks}
+        if len(dims) <= 1:
+            cols["state"] = (np.concatenate([c["state"] for c in chunks]) if chunks
+                             else np.empty((0, 0)))
+        else:
+            cols["state_data"] = np.concatenate([c["state"].ravel() for c in chunks])
+            lengths = np.concatenate([np.full(len(c["state"]), c["state"].shape[1]) for c in chunks])
+            cols["state_offsets"] = np.concatenate([[0], np.cumsum(lengths)])
+        return cols
+
+    def _rows(self, cols: Dict[str, np.ndarray], start: int = 0, stop: Optional[int] = None):
+        status_values = [s.value for s in STATUS_ORDER]
+        systems, reasons, vsets = self.systems.values, self.reasons.values, self.violation_sets.values
+        iso: Dict[float, str] = {}
+        sl = slice(start, stop)
+        for ts, sim, code, s, r, v, a, state in zip(
+                *(cols[name][sl].tolist() for name in self._COLUMNS), cols["state"][sl].tolist()):
+            stamp = iso.get(ts)
+            if stamp is None:
+                stamp = iso[ts] = datetime.fromtimestamp(ts).isoformat()
+            entry = {
+                "timestamp": stamp,
+                "simulation_time": sim,
+                "system_id": systems[s],
+                "state_vector": state,
+                "status": status_values[code],
+                "reason": reasons[r],
+                "violations": list(vsets[v]),
+            }
+            if a >= 0:
+                entry["applied"] = bool(a)
+            yield entry
+
+    def __len__(self) -> int:
+        return sum(self._chunk_sizes) + self._n
+
+    def __iter__(self):
+        return self.rows()
+
+    def rows(self, start: int = 0):
+        """Iterate audit dicts from row ``start`` on, skipping whole chunks."""
+        for size, cols in zip(self._chunk_sizes + [self._n], self.iter_chunks()):
+            if start < size:
+                yield from self._rows(cols, start)
+            start = max(0, start - size)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("audit row index out of range")
+        for k, size in enumerate(self._chunk_sizes):
+            if index < size:
+                return next(self._rows(self._chunk(k), index, index + 1))
+            index -= size
+        return next(self._rows(self._buf, index, index + 1))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, AuditStore)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    # ---- export / import ----
+    def export(self, filepath: str):
+        """Write the log; format by extension: ``.jsonl``, ``.npz`` or JSON array."""
+        if filepath.endswith(".npz"):
+            cols = self.columns()
+            np.savez(
+                filepath,
+                format=np.array(AUDIT_FORMAT), version=np.array(AUDIT_FORMAT_VERSION),
+                status_values=np.array([s.value for s in STATUS_ORDER]),
+                system_ids=np.array(self.systems.values, dtype=str),
+                reasons=np.array(self.reasons.values, dtype=str),
+                violation_sets=np.array([json.dumps(list(v)) for v in self.violation_sets.values],
+                                        dtype=str),
+                **cols,
+            )
+            return
+        with open(filepath, "w") as f:
+            if filepath.endswith(".jsonl"):
+                for entry in self:
+                    f.write(json.dumps(entry) + "\n")
+            else:
+                f.write("[")
+                for i, entry in enumerate(self):
+                    f.write(",\n" if i else "\n")
+                    f.write(json.dumps(entry))
+                f.write("\n]\n")
+
+    @classmethod
+    def load(cls, filepath: str, **kwargs) -> "AuditStore":
+        """Read an ``.npz`` written by :meth:`export` into an in-memory store."""
+        with np.load(filepath) as f:
+            if "format" not in f.files or str(f["format"]) != AUDIT_FORMAT:
+                raise ValueError(f"{filepath} is not a {AUDIT_FORMAT} file.")
+            if int(f["version"]) != AUDIT_FORMAT_VERSION:
+                raise ValueError(f"Unsupported audit format version {int(f['version'])}.")
+            store = cls(**kwargs)
+            store.systems = _Interner(f["system_ids"].tolist())
+            store.reasons = _Interner(f["reasons"].tolist())
+            store.violation_sets = _Interner(tuple(json.loads(v)) for v in f["violation_sets"].tolist())
+            # Remap stored codes in case the status enumeration order changed.
+            remap = np.array([_CODE[AdmissibilityStatus(v)] for v in f["status_values"].tolist()],
+                             dtype=np.int8)
+            cols = {name: f[name] for name in cls._COLUMNS}
+            cols["status"] = remap[cols["status"]]
+            if "state" in f.files:
+                runs = [(0, len(cols["timestamp"]), f["state"])]
+            else:
+                data, offsets = f["state_data"], f["state_offsets"]
+                lengths = np.diff(offsets)
+                cuts = np.flatnonzero(np.diff(lengths)) + 1
+                bounds = np.concatenate([[0], cuts, [len(lengths)]]).tolist()
+                runs = [(s, e, data[offsets[s]:offsets[e]].reshape(e - s, lengths[s]))
+                        for s, e in zip(bounds[:-1], bounds[1:])]
+        for s, e, state in runs:
+            if e > s:
+                chunk = {name: arr[s:e].copy() for name, arr in cols.items()}
+                chunk["state"] = np.array(state, dtype=np.float64)
+                store._chunks.append(chunk)
+                store._chunk_sizes.append(e - s)
+        return store
+
+# ------------------------------------------
+# Evidence gate registry
+# ------------------------------------------
+
+ConstraintKey = Union[int, str]  # constraint position or name
+
+@dataclass(frozen=True)
+class GateEvent:
+    """Registry change: ``kind`` is ``"linked"`` or ``"fulfilled"``.
+
+    ``constraints`` are the keys (positions or names) the gate is linked
+    to, i.e. the constraints whose resolution may have changed.
+    """
+    kind: str
+    gate_id: str
+    constraints: Tuple[ConstraintKey, ...]
+    version: int
+
+@dataclass(frozen=True)
+class GateMasks:
+    """Gate state aligned with a core's constraint array (all shape (m,)).
+
+    ``gated``: at least one gate is linked; ``passed``: gated and every
+    linked gate is fulfilled; ``pending = gated & ~passed``.
+    """
+    gated: np.ndarray
+    passed: np.ndarray
+    gates: Tuple[Tuple[EvidenceGate, ...], ...]
+
+    @property
+    def pending(self) -> np.ndarray:
+        return self.gated & ~self.passed
+
+    def blocking(self, violations: np.ndarray) -> np.ndarray:
+        """Violations (bool (..., m)) not cleared by a passed gate."""
+        return violations & ~self.passed
+
+_registry_serials = itertools.count()
+
+class EvidenceGateRegistry:
+    """Evidence gates linked many-to-many to constraints by position or name.
+
+    Gates are identified by ``gate_id``.  A violated constraint is cleared
+    only when every gate linked to it is fulfilled.  :meth:`masks` resolves
+    links against a core into boolean arrays, cached until the registry
+    changes (``version``).  Subscribers receive a :class:`GateEvent` on
+    every link and fulfilment, including ``gate.fulfill()`` called directly.
+
+    A position and a name denote the same constraint only relative to a
+    core: :meth:`gates_for` resolves keys against the core it is given, or
+    else the core most recently passed to :meth:`masks`.
+    """
+    def __init__(self):
+        self._gates: Dict[str, EvidenceGate] = {}
+        self._links: Dict[str, List[ConstraintKey]] = {}
+        self._by_key: Dict[ConstraintKey, List[str]] = {}
+        self._listeners: List[Callable[[GateEvent], None]] = []
+        self._masks: Dict[int, Tuple[tuple, int, GateMasks]] = {}
+        self._core: Optional[weakref.ref] = None  # last core passed to masks()
+        self.version = 0
+        self.serial = next(_registry_serials)  # process-unique, unlike id()
+
+    def register(self, gate: EvidenceGate, *constraints: ConstraintKey) -> EvidenceGate:
+        """Add ``gate`` (or the gate already registered under its id) and link it."""
+        gate = self._gates.setdefault(gate.gate_id, gate)
+        self._links.setdefault(gate.gate_id, [])
+        if self not in gate._registries:
+            gate._registries.append(self)
+        self.link(gate.gate_id, *constraints)
+        return gate
+
+    def link(self, gate_id: str, *constraints: ConstraintKey):
+        """Link a registered gate to further constraints."""
+        links = self._links[self._gate(gate_id).gate_id]
+        added = tuple(key for key in dict.fromkeys(constraints) if key not in links)
+        for key in added:
+            links.append(key)
+            self._by_key.setdefault(key, []).append(gate_id)
+        if added:
+            self._emit("linked", gate_id, added)
+
+    def fulfill(self, gate_id: str, uri: str):
+        self._gate(gate_id).fulfill(uri)
+
+    def _fulfilled(self, gate: EvidenceGate):
+        if self._gates.get(gate.gate_id) is gate:
+            self._emit("fulfilled", gate.gate_id, tuple(self._links[gate.gate_id]))
+
+    def _gate(self, gate_id: str) -> EvidenceGate:
+        if gate_id not in self._gates:
+            raise KeyError(f"No evidence gate registered with id {gate_id!r}.")
+        return self._gates[gate_id]
+
+    def _emit(self, kind: str, gate_id: str, constraints: Tuple[ConstraintKey, ...]):
+        self.version += 1
+        event = GateEvent(kind, gate_id, constraints, self.version)
+        for callback in list(self._listeners):
+            callback(event)
+
+    def subscribe(self, callback: Callable[[GateEvent], None]) -> Callable[[], None]:
+        """Call ``callback(event)`` on every change; returns an unsubscribe function."""
+        self._listeners.append(callback)
+
+        def unsubscribe():
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+        return unsubscribe
+
+    def gates_for(self, key: ConstraintKey, core: Optional[InvariantCore] = None) -> List[EvidenceGate]:
+        """Gates linked to constraint ``key``, whether linked by position or name.
+
+        Without a core (none given and :meth:`masks` never called) keys are
+        matched literally.
+        """
+        gates = {gate_id: self._gates[gate_id] for gate_id in self._by_key.get(key, ())}
+        if core is None and self._core is not None:
+            core = self._core()
+        if core is not None:
+            per_constraint = self.masks(core).gates
+            for j in self.positions(core, [key]).tolist():
+                gates.update((gate.gate_id, gate) for gate in per_constraint[j])
+        return list(gates.values())
+
+    def constraints_for(self, gate_id: str) -> List[ConstraintKey]:
+        return list(self._links[self._gate(gate_id).gate_id])
+
+    def __getitem__(self, gate_id: str) -> EvidenceGate:
+        if isinstance(gate_id, (int, np.integer)):
+            # evidence_gates used to be a Dict[int, EvidenceGate]
+            warnings.warn("evidence_gates[index] is deprecated; gates are keyed by gate_id. "
+                          "Use evidence_gates.gates_for(index) instead.",
+                          DeprecationWarning, stacklevel=2)
+            return self.gates_for(int(gate_id))
+        return self._gate(gate_id)
+
+    def __contains__(self, gate_id: object) -> bool:
+        return gate_id in self._gates
+
+    def __iter__(self):
+        return iter(self._gates.values())
+
+    def __len__(self) -> int:
+        return len(self._gates)
+
+    @staticmethod
+    def positions(core: InvariantCore, keys) -> np.ndarray:
+        """Sorted constraint positions in ``core`` matched by ``keys``."""
+        m = len(core.constraints)
+        names = [c.name for c in core.constraints]
+        hits = set()
+        for key in keys:
+            if isinstance(key, str):
+                hits.update(j for j, name in enumerate(names) if name == key)
+            elif -m <= key < m:
+                hits.add(key % m)
+        return np.array(sorted(hits), dtype=np.intp)
+
+    def masks(self, core: InvariantCore) -> GateMasks:
+        """Gate masks for ``core``'s current constraint list (cached)."""
+        self._core = weakref.ref(core)
+        key = tuple(id(c) for c in core.constraints)
+        cached = self._masks.get(id(core))
+        if cached is not None and cached[0] == key and cached[1] == self.version:
+            return cached[2]
+        m = len(core.constraints)
+        per_constraint: List[List[EvidenceGate]] = [[] for _ in range(m)]
+        for gate_id, links in self._links.items():
+            for j in self.positions(core, links).tolist():
+                per_constraint[j].append(self._gates[gate_id])
+        gated = np.array([bool(g) for g in per_constraint], dtype=bool)
+        passed = np.array([bool(g) and all(x.is_fulfilled for x in g) for g in per_constraint],
+                          dtype=bool)
+        masks = GateMasks(gated, passed, tuple(tuple(g) for g in per_constraint))
+        self._masks[id(core)] = (key, self.version, masks)
+        return masks
+
+    def to_dict(self) -> Dict[str, dict]:
+        return {gate_id: {**gate.to_dict(), "constraints": list(self._links[gate_id])}
+                for gate_id, gate in self._gates.items()}
+
+# ------------------------------------------
+# Admissibility cache
+# ------------------------------------------
+
+class AdmissibilityCache:
+    """Opt-in LRU memo of scalar admissibility results.
+
+    Entries are keyed by (system id, constraint list, quantized state, time
+    key) and hold the violated constraint indices plus the classification
+    last derived from them, tagged with the (registry serial, registry
+    version, ``fail_closed``) it was computed under.  States are snapped to a
+    grid of ``tolerance`` (0: exact match).  The time key is ``None`` when
+    every constraint is time-invariant, the ``time_bucket`` index when
+    ``time_bucket > 0`` (results reused within a bucket), and the exact time
+    otherwise.  A hit whose tag differs from the asking space's (a gate
+    changed, or another space shares the cache) is reclassified without
+    re-evaluating constraints; ``step_time`` drops entries whose time key
+    has passed, in time proportional to the entries dropped.
+    """
+    def __init__(self, maxsize: int = 65536, tolerance: float = 0.0, time_bucket: float = 0.0):
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive.")
+        if tolerance < 0 or time_bucket < 0:
+            raise ValueError("tolerance and time_bucket must be non-negative.")
+        self.maxsize = maxsize
+        self.tolerance = tolerance
+        self.time_bucket = time_bucket
+        self._entries: "OrderedDict[tuple, list]" = OrderedDict()
+        self._invariant: Dict[Tuple[int, ...], bool] = {}
+        self._by_time: Dict[object, Dict[tuple, None]] = {}  # time key -> entry keys
+        self.hits = self.misses = self.reclassified = self.evictions = self.expired = 0
+
+    def _time_key(self, t: float):
+        return int(np.floor(t / self.time_bucket)) if self.time_bucket else float(t)
+
+    def key(self, core: InvariantCore, state: np.ndarray, t: float) -> tuple:
+        constraints = tuple(map(id, core.constraints))
+        invariant = self._invariant.get(constraints)
+        if invariant is None:
+            invariant = self._invariant[constraints] = all(
+                getattr(c, "time_invariant", False) for c in core.constraints)
+        x = np.asarray(state, dtype=float)
+        if self.tolerance:
+            x = np.rint(x / self.tolerance).astype(np.int64)
+        return (core.sys_id, constraints, x.shape, x.tobytes(),
+                None if invariant else self._time_key(t))
+
+    def get(self, key: tuple) -> Optional[list]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, violated: List[int]) -> list:
+        entry = self._entries[key] = [tuple(violated), None, None]
+        if key[-1] is not None:
+            self._by_time.setdefault(key[-1], {})[key] = None
+        if len(self._entries) > self.maxsize:
+            old, _ = self._entries.popitem(last=False)
+            if old[-1] is not None:
+                bucket = self._by_time[old[-1]]
+                del bucket[old]
+                if not bucket:
+                    del self._by_time[old[-1]]
+            self.evictions += 1
+        return entry
+
+    def advance(self, t: float):
+        """Drop time-dependent entries that can no longer be hit after the clock moved to ``t``."""
+        now = self._time_key(t)
+        for time_key in [k for k in self._by_time if k != now]:
+            bucket = self._by_time.pop(time_key)
+            for key in bucket:
+                del self._entries[key]
+            self.expired += len(bucket)
+
+    def clear(self):
+        self._entries.clear()
+        self._invariant.clear()
+        self._by_time.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def metrics(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "reclassified": self.reclassified,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
 class CertifiedAdmissibleSpace:
     """Evaluates admissibility at time t, manages gates and audit log."""
-    def __init__(self, fail_closed: bool = True):
+    def __init__(self, fail_closed: bool = True, audit_log: Optional[AuditStore] = None,
+                 sink: Optional[AuditSink] = None, cache: Optional[AdmissibilityCache] = None):
         self.fail_closed = fail_closed
-        self.evidence_gates: Dict[int, EvidenceGate] = {}
-        self.audit_log: List[Dict] = []
+        self.evidence_gates = EvidenceGateRegistry()
+        self.audit_log: AuditStore = audit_log if audit_log is not None else AuditStore()
+        self.sink = sink  # optional streaming copy of every audit row
+        self.cache = cache  # optional memo for evaluate_state()
         self.current_time: float = 0.0
 
-    def register_gate(self, constraint_idx: int, gate: EvidenceGate):
-        """Links the index of a constraint to an evidence requirement."""
-        self.evidence_gates[constraint_idx] = gate
+    def register_gate(self, constraint: Union[ConstraintKey, List[ConstraintKey]], gate: EvidenceGate):
+        """Links constraints (by index or name) to an evidence requirement."""
+        keys = constraint if isinstance(constraint, (list, tuple)) else [constraint]
+        return self.evidence_gates.register(gate, *keys)
 
-    def fulfill_gate(self, constraint_idx: int, uri: str):
-        """Fulfill an evidence gate for a given constraint index."""
-        if constraint_idx not in self.evidence_gates:
-            raise KeyError(f"No evidence gate registered for constraint index {constraint_idx}.")
-        self.evidence_gates[constraint_idx].fulfill(uri)
+    def fulfill_gate(self, constraint: ConstraintKey, uri: str, core: Optional[InvariantCore] = None):
+        """Fulfill every evidence gate linked to a constraint (index or name).
+
+        Indices and names are matched against ``core`` (default: the core
+        last evaluated), as in :meth:`EvidenceGateRegistry.gates_for`.
+        """
+        gates = self.evidence_gates.gates_for(constraint, core)
+        if not gates:
+            raise KeyError(f"No evidence gate registered for constraint {constraint!r}.")
+        for gate in gates:
+            gate.fulfill(uri)
 
     def step_time(self, delta_t: float):
         self.current_time += delta_t
+        if self.cache is not None:
+            self.cache.advance(self.current_time)
 
     def evaluate_state(self, state: np.ndarray, core: InvariantCore) -> Tuple[AdmissibilityStatus, str]:
         """Evaluates the current state and generates the audit log."""
-        violations = []
-        conditional_gates = []
-        ungated_violations = []
-        
+        status, reason, violations = self._assess(state, core)
+
+        # Register traceability
+        self._log_audit(core.sys_id, state, status, reason, violations)
+        return status, reason
+
+    def _assess(self, state: np.ndarray, core: InvariantCore) -> Tuple[AdmissibilityStatus, str, List[str]]:
+        """evaluate_state() without the audit entry."""
+        if self.cache is None:
+            return self._classify(self._violated(state, core), core)
+        entry = self._cached(state, core, self.current_time)
+        registry = self.evidence_gates
+        epoch = (registry.serial, registry.version, self.fail_closed)
+        if entry[1] != epoch:
+            if entry[1] is not None:
+                self.cache.reclassified += 1
+            entry[1], entry[2] = epoch, self._classify(list(entry[0]), core)
+        status, reason, violations = entry[2]
+        return status, reason, list(violations)
+
+    def _cached(self, state: np.ndarray, core: InvariantCore, t: float) -> list:
+        key = self.cache.key(core, state, t)
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = self.cache.put(key, self._evaluate_constraints(state, core, t))
+        return entry
+
+    def _violated(self, state: np.ndarray, core: InvariantCore, t: Optional[float] = None) -> List[int]:
+        """Indices of the constraints violated by ``state`` at time ``t`` (default: now)."""
+        t = self.current_time if t is None else t
+        if self.cache is not None:
+            return list(self._cached(state, core, t)[0])
+        return self._evaluate_constraints(state, core, t)
+
+    def _evaluate_constraints(self, state: np.ndarray, core: InvariantCore, t: float) -> List[int]:
+        violated = []
         for idx, constraint in enumerate(core.constraints):
-            # Evaluate the constraint at the current time
-            val = constraint.evaluate(state, self.current_time)
-            
+            val = constraint.evaluate(state, t)
             if val > 0: # Constraint violated
-                violations.append(constraint.name)
-                
-                # Check if there is a safe-conduct pass (Evidence Gate)
-                if idx in self.evidence_gates:
-                    gate = self.evidence_gates[idx]
-                    if gate.is_fulfilled:
-                        conditional_gates.append(f"GATE-{gate.gate_id}: PASSED")
-                    else:
-                        conditional_gates.append(f"GATE-{gate.gate_id}: PENDING")
-                else:
-                    ungated_violations.append(constraint.name)
-        
+                violated.append(idx)
+        return violated
+
+    def _classify(self, violated: List[int], core: InvariantCore) -> Tuple[AdmissibilityStatus, str, List[str]]:
+        """Resolve status and reason from the indices of violated constraints."""
+        masks = self.evidence_gates.masks(core)
+        idx = np.asarray(violated, dtype=np.intp)
+        violations = [core.constraints[j].name for j in violated]
+        conditional_gates = [
+            f"GATE-{gate.gate_id}: {'PASSED' if gate.is_fulfilled else 'PENDING'}"
+            for j in violated for gate in masks.gates[j]
+        ]
+        ungated_violations = [core.constraints[j].name for j in idx[~masks.gated[idx]].tolist()]
+
         # Resolution logic
         if not violations:
             status = AdmissibilityStatus.FULLY_ADMISSIBLE
@@ -128,7 +1045,7 @@ class CertifiedAdmissibleSpace:
         elif ungated_violations:
             status = AdmissibilityStatus.MIXED_BOUNDARY
             reason = f"Partial violations in {ungated_violations}, no evidence gates available."
-        elif conditional_gates and all("PASSED" in g for g in conditional_gates):
+        elif conditional_gates and masks.passed[idx].all():
             status = AdmissibilityStatus.FULLY_ADMISSIBLE
             reason = "Conditional approval granted via valid evidence gates."
         elif conditional_gates:
@@ -137,37 +1054,120 @@ class CertifiedAdmissibleSpace:
         else:
             status = AdmissibilityStatus.MIXED_BOUNDARY
             reason = f"Partial violations in {violations}, no evidence gates available."
+        return status, reason, violations
 
-        # Register traceability
-        self._log_audit(core.sys_id, state, status, reason, violations)
-        return status, reason
+    def evaluate_states(self, states: np.ndarray, core: InvariantCore,
+                        times: Optional[np.ndarray] = None, log: bool = True) -> BatchAdmissibility:
+        """Batch form of :meth:`evaluate_state` for an (N, d) state matrix.
 
-    def _log_audit(self, sys_id: str, state: np.ndarray, status: AdmissibilityStatus, reason: str, violations: List[str]):
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "simulation_time": self.current_time,
-            "system_id": sys_id,
-            "state_vector": state.tolist(), # Convert numpy array to list for JSON
-            "status": status.value,
-            "reason": reason,
-            "violations": violations
-        }
-        self.audit_log.append(log_entry)
+        Constraints are evaluated into an (N, m) matrix (compiled forms fused
+        via :meth:`InvariantCore.compiled`); rows are grouped by
+        violation pattern, each pattern is classified once, and statuses are
+        broadcast back with an index array.  ``times`` gives a per-row
+        simulation time (default: ``current_time`` for all rows).  With
+        ``log=True`` one audit entry per row is appended, identical to what
+        N calls of :meth:`evaluate_state` would write (the wall-clock
+        timestamp is taken once for the batch).
+        """
+        X = np.asarray(states, dtype=float)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        if X.ndim != 2:
+            raise ValueError(f"states must be an (N, d) matrix, got shape {X.shape}.")
+        n, m = X.shape[0], len(core.constraints)
+        if times is None:
+            t = self.current_time
+        else:
+            t = np.asarray(times, dtype=float)
+            if t.shape != (n,):
+                raise ValueError(f"times must have shape ({n},), got {t.shape}.")
+
+        values = core.compiled().evaluate(X, t)
+        V = values > 0
+
+        # Status and reason depend only on which constraints are violated, so
+        # they are resolved once per distinct violation pattern and broadcast
+        # to the rows with an index array.
+        if m <= 20:
+            # Pattern key = violation bitmask.  Grouping is O(N) via bincount
+            # while the 2^m table is small next to the batch, else a sort.
+            keys = np.zeros(n, dtype=np.int64)
+            for j in range(m):
+                keys |= V[:, j].astype(np.int64) << j
+            if (1 << m) <= 8 * n:
+                present = np.flatnonzero(np.bincount(keys, minlength=1 << m))
+                lookup = np.zeros(1 << m, dtype=np.int64)
+                lookup[present] = np.arange(len(present))
+                pattern_ids = lookup[keys]
+            else:
+                present, pattern_ids = np.unique(keys, return_inverse=True)
+            patterns = [[j for j in range(m) if (key >> j) & 1] for key in present.tolist()]
+        else:
+            _, first, pattern_ids = np.unique(
+                np.packbits(V, axis=1), axis=0, return_index=True, return_inverse=True)
+            pattern_ids = pattern_ids.reshape(-1)
+            patterns = [np.flatnonzero(V[i]).tolist() for i in first.tolist()]
+
+        pattern_codes = np.empty(len(patterns), dtype=np.int8)
+        reasons: List[str] = []
+        pattern_violations: List[List[str]] = []
+        for k, violated in enumerate(patterns):
+            status, reason, violations = self._classify(violated, core)
+            pattern_codes[k] = _CODE[status]
+            reasons.append(reason)
+            pattern_violations.append(violations)
+        codes = pattern_codes[pattern_ids]
+
+        result = BatchAdmissibility(
+            [c.name for c in core.constraints], values, V, codes, reasons, pattern_ids,
+            pattern_violations,
+        )
+        if log:
+            self._log_audit_batch(core.sys_id, X, t, result)
+        return result
+
+    def _log_audit(self, sys_id: str, state: np.ndarray, status: AdmissibilityStatus, reason: str,
+                   violations: List[str], applied: Optional[bool] = None):
+        self.audit_log.append(sys_id, self.current_time, state, status, reason, violations,
+                              applied=applied)
+        if self.sink is not None:
+            self.sink.write(self.audit_log[-1])
+
+    def _log_audit_batch(self, sys_id: str, X: np.ndarray, t, result: BatchAdmissibility,
+                         applied: Optional[np.ndarray] = None):
+        start = len(self.audit_log)
+        self.audit_log.append_batch(
+            sys_id, X, self.current_time if np.ndim(t) == 0 else t, result.codes,
+            result._pattern_ids, result._reasons, result._pattern_violations, applied=applied,
+        )
+        if self.sink is not None:
+            self.sink.write_many(self.audit_log.rows(start))
 
     # ==========================================
     # 4. JSON SERIALIZATION
     # ==========================================
     def export_audit_log(self, filepath: str = "audit_log.json"):
+        """Export the audit log as JSON, JSON Lines (``.jsonl``) or columnar ``.npz``."""
         try:
-            with open(filepath, 'w') as f:
-                json.dump(self.audit_log, f, indent=4)
+            self.audit_log.export(filepath)
             print(f"[Export] Audit log saved to {filepath}")
         except IOError as e:
             print(f"[Export] Failed to save audit log to {filepath}: {e}")
 
+    def export_cache_metrics(self, filepath: str = "cache_metrics.json"):
+        """Export the admissibility cache hit-rate metrics (no-op without a cache)."""
+        if self.cache is None:
+            return
+        try:
+            with open(filepath, 'w') as f:
+                json.dump(self.cache.metrics(), f, indent=4)
+            print(f"[Export] Cache metrics saved to {filepath}")
+        except IOError as e:
+            print(f"[Export] Failed to save cache metrics to {filepath}: {e}")
+
     def export_evidence_gates(self, filepath: str = "evidence_gates.json"):
-        # Serialize the dictionary of Dataclasses to JSON
-        gates_dict = {str(idx): asdict(gate) for idx, gate in self.evidence_gates.items()}
+        # Gates keyed by id, each with the constraints it is linked to
+        gates_dict = self.evidence_gates.to_dict()
         try:
             with open(filepath, 'w') as f:
                 json.dump(gates_dict, f, indent=4)
@@ -190,32 +1190,279 @@ class VoluntadDynamics:
         self.grad_J = objective_gradient
         self.space = space
         
-    def step(self, system: System, step_size: float = 0.1) -> Tuple[np.ndarray, AdmissibilityStatus]:
-        direction = self.grad_J(system.state)
+    def _direction(self, state: np.ndarray) -> np.ndarray:
+        direction = self.grad_J(state)
         # Ensure direction is a NumPy array and has the same shape as the state
         if not isinstance(direction, np.ndarray):
             direction = np.asarray(direction)
-        if direction.shape != system.state.shape:
+        if direction.shape != state.shape:
             raise ValueError(
-                f"objective_gradient must return an array with shape {system.state.shape}, "
+                f"objective_gradient must return an array with shape {state.shape}, "
                 f"but got {direction.shape}."
             )
-        proposed_state = system.state + (step_size * direction)
+        return direction
+
+    def step(self, system: System, step_size: float = 0.1) -> Tuple[np.ndarray, AdmissibilityStatus]:
+        proposed_state = system.state + (step_size * self._direction(system.state))
         
-        status, _ = self.space.evaluate_state(proposed_state, system.core)
+        status, reason, violations = self.space._assess(proposed_state, system.core)
         
         # Only apply the state if it is fully admissible
-        if status == AdmissibilityStatus.FULLY_ADMISSIBLE:
+        applied = status == AdmissibilityStatus.FULLY_ADMISSIBLE
+        if applied:
+            system.state = proposed_state
+
+        # One audit entry, marked with whether the proposed state was applied
+        self.space._log_audit(system.core.sys_id, proposed_state, status, reason, violations,
+                              applied=applied)
+        return system.state, status
+
+@dataclass
+class BoundaryEvent:
+    """A located crossing of the admissible-set boundary.
+
+    ``time`` and ``state`` are the last admissible point along the step
+    (within ``tol`` of the boundary); ``fraction`` is its position in the
+    attempted step of length ``step_size``, and ``constraints`` are the ones
+    that blocked it.
+    """
+    time: float
+    state: np.ndarray
+    constraints: List[str]
+    fraction: float
+    step_size: float
+
+    def as_dict(self) -> dict:
+        return {
+            "time": self.time,
+            "state_vector": self.state.tolist(),
+            "constraints": list(self.constraints),
+            "fraction": self.fraction,
+            "step_size": self.step_size,
+        }
+
+
+class AdaptiveVoluntadDynamics(VoluntadDynamics):
+    """VoluntadDynamics in simulated time, with boundary event detection.
+
+    A step of size ``h`` moves the state by ``h * grad_J(x)`` and advances
+    the space clock by ``h``, so constraints are checked at the end-of-step
+    time.  When the proposal is not admissible, the crossing of the blocking
+    constraints is root-found along the step (Illinois regula falsi on
+    ``max_j g_j(x + a*h*d, t + a*h)``), the state moves to the last
+    admissible point, the crossing is recorded in ``events`` and ``h``
+    shrinks.  A system already on the boundary (crossing within
+    ``min_step``) holds its state for the step, like a rejected
+    VoluntadDynamics proposal.  Admissible and held steps grow ``h`` up to
+    ``max_step``.
+
+    ``evaluations`` counts constraint-set evaluations.
+    """
+    def __init__(self, objective_gradient: Callable[[np.ndarray], np.ndarray],
+                 space: CertifiedAdmissibleSpace, step_size: float = 0.1,
+                 min_step: float = 1e-6, max_step: float = np.inf, grow: float = 2.0,
+                 shrink: float = 0.5, tol: float = 1e-9, max_iter: int = 100):
+        super().__init__(objective_gradient, space)
+        if not 0 < min_step <= step_size <= max_step:
+            raise ValueError("Expected 0 < min_step <= step_size <= max_step.")
+        if grow < 1 or not 0 < shrink <= 1:
+            raise ValueError("Expected grow >= 1 and 0 < shrink <= 1.")
+        self.step_size = step_size
+        self.min_step = min_step
+        self.max_step = max_step
+        self.grow = grow
+        self.shrink = shrink
+        self.tol = tol
+        self.max_iter = max_iter
+        self.events: List[BoundaryEvent] = []
+        self.evaluations = 0
+
+    def _blocking(self, state: np.ndarray, core: InvariantCore, t: float) -> Tuple[List[int], List[int]]:
+        self.evaluations += 1
+        violated = self.space._violated(state, core, t)
+        passed = self.space.evidence_gates.masks(core).passed
+        return violated, [idx for idx in violated if not passed[idx]]
+
+    def _crossing(self, x: np.ndarray, direction: np.ndarray, t0: float, h: float,
+                  core: InvariantCore, blocking: List[int]) -> float:
+        """Largest fraction ``a`` of the step (within ``tol``) that is admissible."""
+        constraints = [core.constraints[idx] for idx in blocking]
+
+        def phi(a: float) -> float:
+            self.evaluations += 1
+            return max(c.evaluate(x + a * h * direction, t0 + a * h) for c in constraints)
+
+        lo, hi = 0.0, 1.0
+        f_lo, f_hi = phi(lo), phi(hi)
+        if f_lo > 0:
+            return 0.0
+        side = 0
+        for _ in range(self.max_iter):
+            if (hi - lo) * h <= self.tol or f_lo == 0:
+                break
+            a = (lo * f_hi - hi * f_lo) / (f_hi - f_lo)
+            if not lo < a < hi:
+                a = 0.5 * (lo + hi)
+            f_a = phi(a)
+            if f_a > 0:
+                hi, f_hi = a, f_a
+                if side == 1:
+                    f_lo *= 0.5
+                side = 1
+            else:
+                lo, f_lo = a, f_a
+                if side == -1:
+                    f_hi *= 0.5
+                side = -1
+        # Other constraints may be violated part-way along the step: bisect
+        # on full admissibility until the located point is admissible.
+        for _ in range(self.max_iter):
+            if lo * h < self.min_step or not self._blocking(x + lo * h * direction, core, t0 + lo * h)[1]:
+                break
+            lo *= 0.5
+        return lo
+
+    def step(self, system: System, step_size: Optional[float] = None) -> Tuple[np.ndarray, AdmissibilityStatus]:
+        """One step of ``step_size`` (default: the adapted ``self.step_size``)."""
+        h = self.step_size if step_size is None else step_size
+        self.step_size, status = self._advance(system, h)
+        return system.state, status
+
+    def run(self, system: System, duration: float) -> List[BoundaryEvent]:
+        """Step until the space clock has advanced by ``duration``; returns the new events."""
+        start = len(self.events)
+        t_end = self.space.current_time + duration
+        while t_end - self.space.current_time > self.tol:
+            h = min(self.step_size, t_end - self.space.current_time)
+            next_h, _ = self._advance(system, h)
+            # A final step shortened to hit t_end keeps the adapted size.
+            if h == self.step_size or next_h < h:
+                self.step_size = next_h
+        return self.events[start:]
+
+    def _advance(self, system: System, h: float) -> Tuple[float, AdmissibilityStatus]:
+        x = system.state
+        direction = self._direction(x)
+        t0 = self.space.current_time
+        proposed_state = x + h * direction
+
+        violated, blocking = self._blocking(proposed_state, system.core, t0 + h)
+        applied = not blocking
+        fraction = 1.0
+        if applied:
+            next_h = min(h * self.grow, self.max_step)
+        else:
+            fraction = self._crossing(x, direction, t0, h, system.core, blocking)
+            if fraction * h >= self.min_step:
+                # Stop on the boundary instead of rejecting the whole step.
+                proposed_state = x + fraction * h * direction
+                violated, _ = self._blocking(proposed_state, system.core, t0 + fraction * h)
+                self.events.append(BoundaryEvent(
+                    time=float(t0 + fraction * h), state=proposed_state.copy(),
+                    constraints=[system.core.constraints[idx].name for idx in blocking],
+                    fraction=float(fraction), step_size=h,
+                ))
+                applied = True
+                next_h = max(h * self.shrink, self.min_step)
+            else:
+                # Already on the boundary: hold the state for the whole step.
+                fraction, next_h = 1.0, min(h * self.grow, self.max_step)
+
+        self.space.step_time(fraction * h)
+        if applied:
             system.state = proposed_state
+        status, reason, violations = self.space._classify(violated, system.core)
+        self.space._log_audit(system.core.sys_id, proposed_state, status, reason, violations,
+                              applied=applied)
+        return next_h, status
+
+@dataclass
+class EnsembleTrajectory:
+    """Result of :meth:`EnsembleDynamics.run` for K trajectories over T steps.
+
+    ``codes[s, k]`` is the status of trajectory k's proposal at step s (index
+    into :data:`STATUS_ORDER`), ``applied`` the mask of accepted proposals.
+    ``states`` is (T + 1, K, d) including the initial states, or just the
+    final (K, d) states when run with ``record_states=False``.
+    """
+    times: np.ndarray
+    codes: np.ndarray
+    applied: np.ndarray
+    states: np.ndarray
+
+    @property
+    def final_states(self) -> np.ndarray:
+        return self.states[-1] if self.states.ndim == 3 else self.states
+
+    def status(self, step: int, k: int) -> AdmissibilityStatus:
+        return STATUS_ORDER[self.codes[step, k]]
+
+    def counts(self) -> Dict[str, int]:
+        totals = np.bincount(self.codes.ravel(), minlength=len(STATUS_ORDER))
+        return {s.value: int(n) for s, n in zip(STATUS_ORDER, totals)}
+
+class EnsembleDynamics:
+    """Advances K systems sharing one core with stacked (K, d) state arrays.
+
+    Each step is :meth:`VoluntadDynamics.step` for all K trajectories at
+    once: one gradient call, one :meth:`CertifiedAdmissibleSpace.evaluate_states`
+    and a masked update that applies only FULLY_ADMISSIBLE proposals.  With
+    ``vectorized=True`` the gradient maps (K, d) -> (K, d); otherwise it is
+    called per row like VoluntadDynamics.
+    """
+    def __init__(self, objective_gradient: Callable[[np.ndarray], np.ndarray],
+                 space: CertifiedAdmissibleSpace, core: InvariantCore, vectorized: bool = True):
+        self.grad_J = objective_gradient
+        self.space = space
+        self.core = core
+        self.vectorized = vectorized
+
+    def _direction(self, X: np.ndarray) -> np.ndarray:
+        if self.vectorized:
+            direction = np.asarray(self.grad_J(X), dtype=float)
+        else:
+            direction = np.array([self.grad_J(x) for x in X], dtype=float).reshape(X.shape[0], -1)
+        if direction.shape != X.shape:
+            raise ValueError(
+                f"objective_gradient must return an array with shape {X.shape}, "
+                f"but got {direction.shape}."
+            )
+        return direction
+
+    def run(self, initial_states: np.ndarray, steps: int, step_size: float = 0.1,
+            dt: float = 0.0, log: bool = False, record_states: bool = True) -> EnsembleTrajectory:
+        """Simulate ``steps`` steps; ``dt`` advances the space clock before each step.
 
-        # Mark whether the proposed state was actually applied
-        if self.space.audit_log:
-            self.space.audit_log[-1]["applied"] = (status == AdmissibilityStatus.FULLY_ADMISSIBLE)
-            return system.state, status
+        With ``log=True`` every proposal is audited (K rows per step, with
+        ``applied``), exactly as K ``VoluntadDynamics.step`` calls would.
+        """
+        X = np.array(initial_states, dtype=float)
+        if X.ndim != 2:
+            raise ValueError(f"initial_states must be a (K, d) matrix, got shape {X.shape}.")
+        K = X.shape[0]
+        codes = np.empty((steps, K), dtype=np.int8)
+        applied = np.empty((steps, K), dtype=bool)
+        times = np.empty(steps)
+        history = np.empty((steps + 1,) + X.shape) if record_states else None
+        if record_states:
+            history[0] = X
+        fully = _CODE[AdmissibilityStatus.FULLY_ADMISSIBLE]
+        for s in range(steps):
+            if dt:
+                self.space.step_time(dt)
+            times[s] = self.space.current_time
+            proposed = X + step_size * self._direction(X)
+            result = self.space.evaluate_states(proposed, self.core, log=False)
+            ok = result.codes == fully
+            X[ok] = proposed[ok]
+            codes[s], applied[s] = result.codes, ok
+            if log:
+                self.space._log_audit_batch(self.core.sys_id, proposed, self.space.current_time,
+                                            result, applied=ok)
+            if record_states:
+                history[s + 1] = X
+        return EnsembleTrajectory(times, codes, applied, history if record_states else X)
 
-        # If the proposed state is not applied, return the status of the actual system state
-        current_status, _ = self.space.evaluate_state(system.state, system.core)
-        return system.state, current_status
 # ==========================================
 # QUICK TEST (MAIN)
 # ==========================================
@@ -25,6 +25,9 @@ Quantum–Classical Boundary (§33):
 Reference: quantum-manifold.yaml (schema_version 1.1.0)
 
 Dependencies (core): none beyond the Python 3.10+ standard library.
+Dependencies (optional): NumPy — when installed, QuantumState keeps its
+amplitudes in a complex128 array and HamiltonianEvolver applies each step as
+one matrix–vector product; without it the pure-stdlib path is used.
 Dependencies (demo): PyYAML — install via ``pip install pyyaml``.
 """
 
@@ -34,7 +37,29 @@ import json
 import math
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from audit_sink import AuditSink
+
+
+BACKENDS = ("numpy", "python")
+
+
+def _resolve_backend(backend: str | None) -> str:
+    """Pick the amplitude backend: NumPy when installed, unless *backend* is given."""
+    if backend is None:
+        return "python" if np is None else "numpy"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}.")
+    if backend == "numpy" and np is None:
+        raise RuntimeError("The numpy backend requires NumPy (pip install numpy).")
+    return backend
 
 
 # ──────────────────────────────────────────────
@@ -60,14 +85,24 @@ class BasisState:
 # ──────────────────────────────────────────────
 
 class QuantumState:
-    """Normalised state vector living in H_adm (dim ≤ 12)."""
+    """Normalised state vector living in H_adm (dim ≤ 12).
+
+    With the ``numpy`` backend (the default when NumPy is installed) the
+    amplitudes are a ``complex128`` array; the ``python`` backend keeps a
+    list of ``complex``.
+    """
 
-    def __init__(self, amplitudes: list[complex], basis: list[BasisState]) -> None:
+    def __init__(
+        self,
+        amplitudes: list[complex],
+        basis: list[BasisState],
+        backend: str | None = None,
+    ) -> None:
         if len(amplitudes) != len(basis):
             raise ValueError("Amplitude count must equal basis size.")
         self._basis = list(basis)
-        self._amplitudes = list(amplitudes)
-        self._normalize()
+        self.backend = _resolve_backend(backend)
+        self.set_amplitudes(amplitudes)
 
     # -- properties ----------------------------------------------------------
 
@@ -77,10 +112,25 @@ class QuantumState:
 
     @property
     def amplitudes(self) -> list[complex]:
+        if self.backend == "numpy":
+            return self._amplitudes.tolist()
         return list(self._amplitudes)
 
+    @property
+    def vector(self) -> Any:
+        """Amplitudes without a list copy: a read-only array view (numpy
+        backend) or a tuple (python backend)."""
+        if self.backend == "numpy":
+            view = self._amplitudes.view()
+            view.flags.writeable = False
+            return view
+        return tuple(self._amplitudes)
+
     @property
     def probabilities(self) -> list[float]:
+        if self.backend == "numpy":
+            a = self._amplitudes
+            return (a.real ** 2 + a.imag ** 2).tolist()
         return [abs(a) ** 2 for a in self._amplitudes]
 
     # -- projection onto H_adm ----------------------------------------------
@@ -93,10 +143,23 @@ class QuantumState:
 
     def set_amplitudes(self, amplitudes: list[complex]) -> None:
         """Replace amplitudes and re-normalise."""
-        self._amplitudes = list(amplitudes)
+        if self.backend == "numpy":
+            self._assign(np.array(amplitudes, dtype=np.complex128))
+        else:
+            self._assign(list(amplitudes))
+
+    def _assign(self, amplitudes: Any) -> None:
+        """Take ownership of *amplitudes* (no copy) and re-normalise."""
+        self._amplitudes = amplitudes
         self._normalize()
 
     def _normalize(self) -> None:
+        if self.backend == "numpy":
+            norm = float(np.linalg.norm(self._amplitudes))
+            if norm == 0:
+                raise ValueError("Zero-norm state is not physical.")
+            self._amplitudes /= norm
+            return
         norm = math.sqrt(sum(abs(a) ** 2 for a in self._amplitudes))
         if norm == 0:
             raise ValueError("Zero-norm state is not physical.")
@@ -125,10 +188,12 @@ class EntanglementMatrix:
         self._matrix: list[list[float]] = [
             [0.0] * dim for _ in range(dim)
         ]
+        self._version = 0
 
     def set_coupling(self, pair: CouplingPair) -> None:
         self._matrix[pair.i][pair.j] = pair.t_ij
         self._matrix[pair.j][pair.i] = pair.t_ij
+        self._version += 1
 
     def get(self, i: int, j: int) -> float:
         return self._matrix[i][j]
@@ -141,6 +206,11 @@ class EntanglementMatrix:
     def matrix(self) -> list[list[float]]:
         return [row[:] for row in self._matrix]
 
+    @property
+    def version(self) -> int:
+        """Incremented on every coupling change (lets evolvers cache H)."""
+        return self._version
+
 
 # ──────────────────────────────────────────────
 # 4. Bell-Bounded Correlation Envelope
@@ -245,6 +315,11 @@ class DeterministicCore:
 # 7. Intentional Hamiltonian Evolution
 # ──────────────────────────────────────────────
 
+# Automatic sparse selection: only for large, mostly-uncoupled bases.
+SPARSE_MIN_DIM = 256
+SPARSE_MAX_DENSITY = 0.05
+
+
 class HamiltonianEvolver:
     """Discrete-time approximate evolution under H = H_0 + H_int + H_intent.
 
@@ -254,8 +329,14 @@ class HamiltonianEvolver:
     12-dimensional admissible subspace at small dt.
 
     Each step:
-      1. Evolve amplitudes via first-order update.
+      1. Evolve amplitudes via first-order update  α ← (I − i·dt·H) α.
       2. Project back onto H_adm (re-normalise).
+
+    The step operator (intent weights on the diagonal, couplings off it) is
+    assembled once per coupling-matrix version for the state's backend: a
+    dense complex128 matrix, or diagonal + sorted off-diagonal triplets when
+    *sparse* (default: large, sparsely coupled bases); the python backend
+    keeps per-row lists of non-zero couplings.
     """
 
     def __init__(
@@ -263,6 +344,7 @@ class HamiltonianEvolver:
         entanglement: EntanglementMatrix,
         intent_weights: list[float] | None = None,
         dt: float = 0.01,
+        sparse: bool | None = None,
     ) -> None:
         dim = entanglement.dim
         self._entanglement = entanglement
@@ -270,26 +352,67 @@ class HamiltonianEvolver:
         if len(self._intent) != dim:
             raise ValueError("Intent weights must match basis dimension.")
         self._dt = dt
+        self._sparse = sparse
+        self._operator: tuple[tuple, Callable[[Any], Any]] | None = None
 
     def evolve(self, state: QuantumState) -> None:
         """One discrete step of Hamiltonian evolution + Π_adm projection."""
-        dim = state.dim
-        amps = state.amplitudes  # cache once (property returns a copy)
-        new_amps: list[complex] = []
-        for k in range(dim):
-            # H_0 contribution (diagonal phase)
-            phase_k = complex(0, -self._dt * self._intent[k])
-            # H_int contribution (off-diagonal tunnelling)
-            coupling_sum = complex(0, 0)
-            for j in range(dim):
-                if j != k:
-                    t_kj = self._entanglement.get(k, j)
-                    coupling_sum += t_kj * amps[j]
-            phase_contribution = phase_k * amps[k]
-            coupling_contribution = complex(0, -self._dt) * coupling_sum
-            new_amp = amps[k] + phase_contribution + coupling_contribution
-            new_amps.append(new_amp)
-        state.set_amplitudes(new_amps)  # Π_adm re-normalisation
+        state._assign(self._step_operator(state)(state._amplitudes))  # Π_adm re-normalisation
+
+    # -- operator assembly ---------------------------------------------------
+
+    def _step_operator(self, state: QuantumState) -> Callable[[Any], Any]:
+        key = (state.backend, state.dim, self._entanglement.version)
+        if self._operator is None or self._operator[0] != key:
+            if state.dim > self._entanglement.dim:
+                raise ValueError("State dimension exceeds the coupling matrix dimension.")
+            if state.backend == "numpy":
+                apply = self._assemble_numpy(state.dim)
+            else:
+                apply = self._assemble_python(state.dim)
+            self._operator = (key, apply)
+        return self._operator[1]
+
+    def _assemble_numpy(self, dim: int) -> Callable[[Any], Any]:
+        h = np.array(self._entanglement.matrix, dtype=np.float64)[:dim, :dim]
+        np.fill_diagonal(h, self._intent[:dim])
+        sparse = self._sparse
+        if sparse is None:
+            off_diagonal = np.count_nonzero(h) - np.count_nonzero(np.diag(h))
+            sparse = dim >= SPARSE_MIN_DIM and off_diagonal <= SPARSE_MAX_DENSITY * dim * dim
+        if not sparse:
+            step = np.eye(dim, dtype=np.complex128) - 1j * self._dt * h
+            return lambda amps: step @ amps
+        diagonal = 1 - 1j * self._dt * np.diag(h)
+        np.fill_diagonal(h, 0.0)
+        rows, cols = np.nonzero(h)  # row-major, so rows are sorted
+        values = -1j * self._dt * h[rows, cols]
+        targets, starts = np.unique(rows, return_index=True)
+
+        def apply(amps: Any) -> Any:
+            out = diagonal * amps
+            if len(values):
+                out[targets] += np.add.reduceat(values * amps[cols], starts)
+            return out
+
+        return apply
+
+    def _assemble_python(self, dim: int) -> Callable[[Any], Any]:
+        matrix = self._entanglement.matrix
+        tunnel = complex(0, -self._dt)
+        diagonal = [1 + complex(0, -self._dt * self._intent[k]) for k in range(dim)]
+        couplings = [
+            [(j, tunnel * matrix[k][j]) for j in range(dim) if j != k and matrix[k][j]]
+            for k in range(dim)
+        ]
+
+        def apply(amps: list[complex]) -> list[complex]:
+            return [
+                diagonal[k] * amps[k] + sum(c * amps[j] for j, c in row)
+                for k, row in enumerate(couplings)
+            ]
+
+        return apply
 
 
 # ──────────────────────────────────────────────
@@ -473,14 +596,19 @@ class HilbertBellManifold:
 
     Plus the quantum-classical boundary:
       CoherenceReductionMap R(ρ) — information-theoretic, not geometric.
+
+    Audit entries are kept in memory and, if *sink* is given (see
+    audit_sink.py), streamed to it as they are recorded.  *backend* selects
+    the QuantumState backend ("numpy" when installed, else "python").
     """
 
-    def __init__(self) -> None:
+    def __init__(self, sink: AuditSink | None = None, backend: str | None = None) -> None:
         # -- Layer 1: spatial discretisation ---------------------------------
         self.domain = SpatialDomain()
         # -- Layer 2: state space (Hilbert) ----------------------------------
         self.basis: list[BasisState] = []
         self.state: QuantumState | None = None
+        self.backend = _resolve_backend(backend)
         # -- Layer 3: physical field (operators) -----------------------------
         self.entanglement = EntanglementMatrix(K_MAX)
         self.evolver: HamiltonianEvolver | None = None
@@ -488,6 +616,7 @@ class HilbertBellManifold:
         self.coherence_map = CoherenceReductionMap()
         # -- audit -----------------------------------------------------------
         self._audit: list[dict] = []
+        self.sink = sink
 
     # -- setup ---------------------------------------------------------------
 
@@ -506,7 +635,7 @@ class HilbertBellManifold:
             # Equal superposition
             n = len(self.basis)
             amplitudes = [complex(1.0 / math.sqrt(n))] * n
-        self.state = QuantumState(amplitudes, self.basis)
+        self.state = QuantumState(amplitudes, self.basis, backend=self.backend)
 
     def set_evolver(self, intent_weights: list[float] | None = None, dt: float = 0.01) -> None:
         self.evolver = HamiltonianEvolver(
@@ -526,7 +655,7 @@ class HilbertBellManifold:
 
     def check_bell_bounds(self, correlators: tuple[float, float, float, float]) -> bool:
         result = check_bell_bound(correlators)
-        self._audit.append({
+        self._record({
             "event": "bell_check",
             "correlators": list(correlators),
             "passed": result,
@@ -538,7 +667,7 @@ class HilbertBellManifold:
 
     def mine(self, pool: list[DataCandidate], **kwargs: float) -> list[DataCandidate]:
         selected = selective_mining(pool, **kwargs)
-        self._audit.append({
+        self._record({
             "event": "data_mining",
             "pool_size": len(pool),
             "selected_count": len(selected),
@@ -569,7 +698,7 @@ class HilbertBellManifold:
             self.state.amplitudes, tau_decoherence, tau_dynamics,
             cell_index=cell_index,
         )
-        self._audit.append({
+        self._record({
             "event": "coherence_reduction",
             "regime": regime,
             "tau_decoherence": tau_decoherence,
@@ -589,10 +718,15 @@ class HilbertBellManifold:
 
     # -- internal ------------------------------------------------------------
 
+    def _record(self, entry: dict) -> None:
+        self._audit.append(entry)
+        if self.sink is not None:
+            self.sink.write(entry)
+
     def _record_snapshot(self) -> None:
         if self.state is None:
             return
-        self._audit.append({
+        self._record({
             "event": "evolution_step",
             "probabilities": self.state.probabilities,
             "timestamp": datetime.now().isoformat(),
@@ -3,38 +3,578 @@
 """
 plot_dynamics.py
 Visualization of state trajectories vs. regulatory constraints.
-Reads audit_log.json generated by certified_dynamics.py and produces 2D plots.
+Reads the audit log generated by certified_dynamics.py (JSON array, JSON Lines
+or columnar .npz) and produces 2D plots.
+
+Trajectory plots stream the log in chunks, keep only the plotted columns as
+NumPy arrays and downsample them (per-bucket min/max plus every status
+transition), so multi-million-entry logs plot with bounded memory.  The
+compliance summary is computed in the same streamed form, in one pass.
+
+render_batch() renders a fleet's charts in a process pool, parsing each log
+once for all the state components plotted from it.  Figures are drawn under
+plt.rc_context(PLOT_STYLE); global rcParams are left alone.
 """
 
+import itertools
 import json
+import multiprocessing
+import os
+import re
 import numpy as np
 import matplotlib
 matplotlib.use("Agg")  # Non-interactive backend for headless environments
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Dict, Optional
+from time import perf_counter
+from typing import Callable, List, Dict, Iterator, Optional, Sequence, Union
+
+from audit_sink import AuditSink
+
+# Professional style configuration (adjustable for technical reports).
+# Applied per figure through plt.rc_context, so importing this module leaves
+# the caller's rcParams untouched.
+def _plot_style() -> Dict:
+    style: Dict = {}
+    # Preferred name for matplotlib 3.6+ where seaborn styles were renamed,
+    # then the older name; if neither is available keep the default style
+    for name in ('seaborn-v0_8-whitegrid', 'seaborn-whitegrid'):
+        if name in plt.style.library:
+            style.update(plt.style.library[name])
+            break
+    style.update({
+        'font.size': 10,
+        'axes.titlesize': 12,
+        'axes.labelsize': 10,
+        'figure.figsize': (10, 6),
+        'figure.dpi': 150,
+        'savefig.bbox': 'tight',
+        'savefig.dpi': 300
+    })
+    return style
+
+PLOT_STYLE = _plot_style()
+
+# ==========================================
+# STREAMING LOADER AND DOWNSAMPLING
+# ==========================================
+
+_JSON_BLOCK = 1 << 20  # characters read per refill when streaming a JSON array
+
+def _iter_json_array(f, block: int = _JSON_BLOCK) -> Iterator[Dict]:
+    """Decode the entries of a top-level JSON array without reading it whole."""
+    decode = json.JSONDecoder().raw_decode
+    buf, pos, opened = "", 0, False
+    while True:
+        # Skip separators, refilling the buffer as needed.
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if pos == len(buf):
+            buf, pos = f.read(block), 0
+            if not buf:
+                raise json.JSONDecodeError("Unterminated JSON array", "", 0)
+            continue
+        if not opened:
+            if buf[pos] != "[":
+                raise json.JSONDecodeError("Expected a JSON array", buf, pos)
+            opened, pos = True, pos + 1
+            continue
+        if buf[pos] == "]":
+            return
+        try:
+            entry, end = decode(buf, pos)
+        except json.JSONDecodeError:
+            more = f.read(block)
+            if not more:
+                raise
+            buf, pos = buf[pos:] + more, 0
+            continue
+        yield entry
+        pos = end
+
+def iter_log_batches(log_path: str, chunk_rows: int = 50_000) -> Iterator[List[Dict]]:
+    """Entries of a JSON array or JSON Lines audit log, ``chunk_rows`` at a time."""
+    path = Path(log_path)
+    with open(path, 'r') as f:
+        if path.suffix == '.jsonl':
+            while True:
+                lines = [line for line in itertools.islice(f, chunk_rows) if not line.isspace()]
+                if not lines:
+                    return
+                # One C-level decode per chunk instead of one call per line.
+                yield json.loads("[" + ",".join(lines) + "]")
+        else:
+            entries = _iter_json_array(f)
+            while True:
+                batch = list(itertools.islice(entries, chunk_rows))
+                if not batch:
+                    return
+                yield batch
+
+class _Codes:
+    """Interns values to dense integer codes in first-seen order."""
+    def __init__(self):
+        self.ids: Dict = {}
+        self.values: List = []
+
+    def code(self, value) -> int:
+        code = self.ids.get(value)
+        if code is None:
+            code = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def encode(self, values, dtype, count: int) -> np.ndarray:
+        return np.fromiter(map(self.code, values), dtype, count)
 
-# Professional style configuration (adjustable for technical reports)
-try:
-    # Preferred style for matplotlib 3.6+ where seaborn styles were renamed
-    plt.style.use('seaborn-v0_8-whitegrid')
-except Exception:
+@dataclass
+class Trace:
+    """Plotted columns of an audit log: one row per (kept) entry.
+
+    ``status`` and ``reason`` are codes into ``status_names`` and
+    ``reasons``; ``index`` is the row's position in the full log.
+    """
+    time: np.ndarray
+    value: np.ndarray
+    status: np.ndarray
+    reason: np.ndarray
+    index: np.ndarray
+    status_names: List[str]
+    reasons: List[str]
+    rows: int = 0  # entries read from the log
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def take(self, idx: np.ndarray) -> "Trace":
+        return Trace(self.time[idx], self.value[idx], self.status[idx], self.reason[idx],
+                     self.index[idx], self.status_names, self.reasons, self.rows)
+
+    @classmethod
+    def concat(cls, parts: List["Trace"], status_names: List[str], reasons: List[str]) -> "Trace":
+        cols = [np.concatenate([getattr(p, name) for p in parts]) if parts else np.empty(0, dt)
+                for name, dt in (("time", float), ("value", float), ("status", np.int16),
+                                 ("reason", np.int32), ("index", np.int64))]
+        return cls(*cols, status_names, reasons, sum(p.rows for p in parts))
+
+def _state_column(batch: List[Dict], state_idx: int, offset: int) -> np.ndarray:
     try:
-        # Fallback for older matplotlib versions
-        plt.style.use('seaborn-whitegrid')
-    except Exception:
-        # If neither seaborn style is available, continue with default style
+        if state_idx >= 0:
+            return np.fromiter((e['state_vector'][state_idx] for e in batch), float, len(batch))
+    except (KeyError, TypeError, IndexError):
         pass
-plt.rcParams.update({
-    'font.size': 10,
-    'axes.titlesize': 12,
-    'axes.labelsize': 10,
-    'figure.figsize': (10, 6),
-    'figure.dpi': 150,
-    'savefig.bbox': 'tight',
-    'savefig.dpi': 300
-})
+    # Slow path only to report which entry is malformed.
+    for i, entry in enumerate(batch, start=offset):
+        if 'state_vector' not in entry:
+            raise ValueError(
+                f"Entry at index {i} is missing 'state_vector'; cannot plot state index {state_idx}."
+            )
+        state_vector = entry['state_vector']
+        try:
+            length = len(state_vector)
+        except TypeError:
+            raise ValueError(
+                f"'state_vector' at entry index {i} is not indexable (type: {type(state_vector).__name__}); "
+                f"cannot plot state index {state_idx}."
+            )
+        if state_idx < 0 or state_idx >= length:
+            sim_time = entry.get('simulation_time', 'unknown')
+            raise ValueError(
+                f"Requested state_idx {state_idx} is out of bounds for entry {i} at simulation_time={sim_time}. "
+                f"'state_vector' length is {length}."
+            )
+    raise ValueError(f"Could not read state index {state_idx} from entries {offset}..{offset + len(batch) - 1}.")
+
+def _iter_npz_traces(log_path: str, state_indices: List[int], chunk_rows: int) -> Iterator[Dict[int, Trace]]:
+    with np.load(log_path) as f:
+        status_names = f["status_values"].tolist()
+        reasons = f["reasons"].tolist()
+        time, status, reason = f["simulation_time"], f["status"], f["reason"]
+        if "state" in f.files:
+            state = f["state"]
+            width = state.shape[1] if state.ndim == 2 else 0
+            length = np.full(len(time), width)
+            values = {i: state[:, i] if 0 <= i < width else None for i in state_indices}
+        else:
+            data, offsets = f["state_data"], f["state_offsets"]
+            length = np.diff(offsets)
+            values = {i: data[offsets[:-1] + i] if ((i >= 0) & (i < length)).all() else None
+                      for i in state_indices}
+    for state_idx, value in values.items():
+        if value is None:
+            bad = int(np.flatnonzero((state_idx < 0) | (state_idx >= length))[0])
+            raise ValueError(
+                f"Requested state_idx {state_idx} is out of bounds for entry {bad} at "
+                f"simulation_time={time[bad]}. 'state_vector' length is {length[bad]}."
+            )
+    for start in range(0, len(time), chunk_rows):
+        sl = slice(start, start + chunk_rows)
+        n = len(time[sl])
+        t, st, rs = time[sl].astype(float), status[sl].astype(np.int16), reason[sl].astype(np.int32)
+        index = np.arange(start, start + n)
+        yield {i: Trace(t, value[sl].astype(float), st, rs, index, status_names, reasons, n)
+               for i, value in values.items()}
+
+def _iter_trace_sets(log_path: str, state_indices: List[int],
+                     chunk_rows: int = 50_000) -> Iterator[Dict[int, Trace]]:
+    """Stream an audit log as chunks of one :class:`Trace` per state index.
+
+    The traces of a chunk share their time, status and reason columns, so
+    several state components cost one read of the log.
+    """
+    state_indices = list(dict.fromkeys(state_indices))
+    if Path(log_path).suffix == '.npz':
+        yield from _iter_npz_traces(log_path, state_indices, chunk_rows)
+        return
+    status, reason = _Codes(), _Codes()
+    offset = 0
+    for batch in iter_log_batches(log_path, chunk_rows):
+        n = len(batch)
+        t = np.fromiter((e['simulation_time'] for e in batch), float, n)
+        st = status.encode((e['status'] for e in batch), np.int16, n)
+        rs = reason.encode((e.get('reason', '') for e in batch), np.int32, n)
+        index = np.arange(offset, offset + n)
+        yield {i: Trace(t, _state_column(batch, i, offset), st, rs, index,
+                        status.values, reason.values, n)
+               for i in state_indices}
+        offset += n
+
+def iter_traces(log_path: str, state_idx: int = 0, chunk_rows: int = 50_000) -> Iterator[Trace]:
+    """Stream an audit log as :class:`Trace` chunks holding one state component.
+
+    Status and reason codes refer to lists shared by all chunks (they grow
+    as new values appear).
+    """
+    for traces in _iter_trace_sets(log_path, [state_idx], chunk_rows):
+        yield traces[state_idx]
+
+def downsample(values: np.ndarray, status: np.ndarray, max_points: int) -> np.ndarray:
+    """Indices of at most ``max_points`` rows that preserve the visual envelope.
+
+    The first and last row are kept, and rows are split into equal buckets
+    whose minimum and maximum are kept (so every peak, e.g. a violation,
+    survives).  Status changes are kept exactly (both rows of every
+    transition) while they fill at most half of ``max_points``, and the
+    buckets share the rest; beyond that, each bucket keeps its extremes
+    plus the first row of each status present in it, so no status run
+    disappears, with the bucket count divided by ``2 + k`` for ``k``
+    distinct statuses.  The bound is exact for ``max_points >= 4 + k``;
+    below that one bucket is used.  Sorted, unique.
+    """
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n)
+    budget = max_points - 2  # first and last row
+    change = np.flatnonzero(status[1:] != status[:-1])
+    exact = 2 * len(change) <= budget // 2
+    if exact:
+        buckets = max(1, (budget - 2 * len(change)) // 2)
+    else:
+        codes = status.astype(np.int64)
+        buckets = max(1, budget // (2 + len(np.unique(codes))))
+    size = -(-n // buckets)
+    buckets = -(-n // size)  # drop buckets left empty by rounding
+    pad = size * buckets - n
+    finite = np.where(np.isnan(values), np.inf, values)
+    lo = np.concatenate([finite, np.full(pad, np.inf)]).reshape(buckets, size).argmin(axis=1)
+    finite = np.where(np.isnan(values), -np.inf, values)
+    hi = np.concatenate([finite, np.full(pad, -np.inf)]).reshape(buckets, size).argmax(axis=1)
+    base = np.arange(buckets) * size
+    if exact:
+        runs = np.concatenate([change, change + 1])
+    else:
+        key = (np.arange(n) // size) * (int(codes.max()) + 1) + codes
+        _, runs = np.unique(key, return_index=True)
+    keep = np.concatenate([[0, n - 1], runs, base + lo, base + hi])
+    return np.unique(keep[keep < n])
+
+def _reduce(parts: List[Trace], names: List[str], reasons: List[str],
+            max_points: Optional[int]) -> Trace:
+    trace = Trace.concat(parts, names, reasons)
+    if max_points is None:
+        return trace
+    return trace.take(downsample(trace.value, trace.status, max_points))
+
+def load_traces(log_path: str, state_indices: List[int], max_points: Optional[int] = None,
+                chunk_rows: int = 50_000) -> Dict[int, Trace]:
+    """Read several state components of an audit log in one pass.
+
+    Each component is reduced as in :func:`load_trace`; the log is parsed
+    once however many components are requested.
+    """
+    parts: Dict[int, List[Trace]] = {i: [] for i in state_indices}
+    names: List[str] = []
+    reasons: List[str] = []
+    for traces in _iter_trace_sets(log_path, list(parts), chunk_rows):
+        for i, trace in traces.items():
+            names, reasons = trace.status_names, trace.reasons
+            if max_points is not None:
+                trace = trace.take(downsample(trace.value, trace.status, max_points))
+            kept = parts[i]
+            kept.append(trace)
+            if max_points is not None and sum(map(len, kept)) > 4 * max_points:
+                kept[:] = [_reduce(kept, names, reasons, max_points)]
+    return {i: _reduce(kept, names, reasons, max_points) for i, kept in parts.items()}
+
+def load_trace(log_path: str, state_idx: int = 0, max_points: Optional[int] = None,
+               chunk_rows: int = 50_000) -> Trace:
+    """Read one state component of an audit log, downsampled to ``max_points``.
+
+    Each chunk is reduced as it is read and the result is reduced again, so
+    memory stays bounded by ``chunk_rows`` plus the kept rows.
+    """
+    return load_traces(log_path, [state_idx], max_points, chunk_rows)[state_idx]
+
+# ==========================================
+# COMPLIANCE AGGREGATION
+# ==========================================
+
+@dataclass
+class LogColumns:
+    """Summary columns of an audit log chunk.
+
+    ``status``, ``reason``, ``system`` and ``violations`` are codes into
+    ``status_names``, ``reasons``, ``systems`` and ``violation_sets`` (tuples
+    of constraint names).
+    """
+    time: np.ndarray
+    status: np.ndarray
+    reason: np.ndarray
+    system: np.ndarray
+    violations: np.ndarray
+    status_names: List[str]
+    reasons: List[str]
+    systems: List[str]
+    violation_sets: List[tuple]
+
+    @classmethod
+    def from_entries(cls, entries: List[Dict], status: _Codes, reason: _Codes,
+                     system: _Codes, vsets: _Codes) -> "LogColumns":
+        n = len(entries)
+        return cls(
+            np.fromiter((e['simulation_time'] for e in entries), float, n),
+            status.encode((e['status'] for e in entries), np.int64, n),
+            reason.encode((e.get('reason', '') for e in entries), np.int64, n),
+            system.encode((e.get('system_id', '') for e in entries), np.int64, n),
+            vsets.encode((tuple(e.get('violations', ())) for e in entries), np.int64, n),
+            status.values, reason.values, system.values, vsets.values,
+        )
+
+def iter_columns(log_path: str, chunk_rows: int = 50_000) -> Iterator[LogColumns]:
+    """Stream the summary columns of a JSON, JSON Lines or .npz audit log."""
+    if Path(log_path).suffix == '.npz':
+        with np.load(log_path) as f:
+            cols = [f[name] for name in ("simulation_time", "status", "reason", "system", "violations")]
+            tables = (f["status_values"].tolist(), f["reasons"].tolist(), f["system_ids"].tolist(),
+                      [tuple(json.loads(v)) for v in f["violation_sets"].tolist()])
+        for start in range(0, len(cols[0]), chunk_rows):
+            time, *codes = (c[start:start + chunk_rows] for c in cols)
+            yield LogColumns(time.astype(float), *(c.astype(np.int64) for c in codes), *tables)
+        return
+    tables = (_Codes(), _Codes(), _Codes(), _Codes())
+    for batch in iter_log_batches(log_path, chunk_rows):
+        yield LogColumns.from_entries(batch, *tables)
+
+_GATE_TOKEN = re.compile(r"GATE-([^:']+): (PASSED|PENDING)")
+_CONDITIONAL_APPROVAL = "Conditional approval granted"
+
+class ComplianceAggregator(AuditSink):
+    """One-pass, incremental compliance summary of an audit log.
+
+    Feed it chunks with :meth:`update_columns` (see :func:`iter_columns`) or
+    entry dicts with :meth:`update`; as an :class:`AuditSink` it can also be
+    attached to ``CertifiedAdmissibleSpace(sink=...)`` to follow a live run.
+    Counts are accumulated with ``np.bincount`` per chunk; per-reason work
+    (gate detection and parsing) is done once per distinct reason string.
+
+    ``window`` is the width, in simulation time, of the windows behind
+    ``windowed_compliance`` (1.0 = one simulated year).  Gate latency runs
+    from the first row reporting ``GATE-<id>: PENDING`` for a system to the
+    first later row reporting it PASSED, or granting conditional approval.
+    """
+    def __init__(self, window: float = 1.0):
+        if window <= 0:
+            raise ValueError("window must be positive.")
+        self.window = window
+        self._status, self._reason, self._system, self._vsets = _Codes(), _Codes(), _Codes(), _Codes()
+        self._reason_info: List[tuple] = []  # per reason code: (mentions GATE, tokens, approval)
+        self._status_counts = np.zeros(0, dtype=np.int64)
+        self._vset_counts = np.zeros(0, dtype=np.int64)
+        self._windows: Dict[int, np.ndarray] = {}
+        self._order: List[int] = []  # status codes in order of first appearance
+        self._pending: Dict[tuple, float] = {}
+        self.latencies: List[Dict] = []
+        self.critical_violations: List[Dict] = []
+        self.evidence_gates_triggered: List[Dict] = []
+        self.total = 0
+        self.start: Optional[float] = None
+        self.end: Optional[float] = None
+
+    # -- input ---------------------------------------------------------------
+
+    def write_many(self, entries) -> None:
+        self.update(entries)
+
+    def update(self, entries) -> None:
+        """Add audit entries (dicts, as written to the log)."""
+        batch = list(entries)
+        if batch:
+            self._consume(LogColumns.from_entries(batch, self._status, self._reason,
+                                                  self._system, self._vsets))
+
+    def update_columns(self, cols: LogColumns) -> None:
+        """Add a chunk whose codes refer to its own tables."""
+        def remap(codes: _Codes, table: List, column: np.ndarray) -> np.ndarray:
+            lookup = np.fromiter(map(codes.code, table), np.int64, len(table))
+            return lookup[column] if len(column) else column.astype(np.int64)
+
+        self._consume(LogColumns(
+            np.asarray(cols.time, dtype=float),
+            remap(self._status, cols.status_names, cols.status),
+            remap(self._reason, cols.reasons, cols.reason),
+            remap(self._system, cols.systems, cols.system),
+            remap(self._vsets, cols.violation_sets, cols.violations),
+            self._status.values, self._reason.values, self._system.values, self._vsets.values,
+        ))
+
+    @staticmethod
+    def _grow(counts: np.ndarray, size: int) -> np.ndarray:
+        return np.concatenate([counts, np.zeros(size - len(counts), np.int64)]) if len(counts) < size else counts
+
+    def _consume(self, cols: LogColumns) -> None:
+        n = len(cols.time)
+        if not n:
+            return
+        if self.start is None:
+            self.start = float(cols.time[0])
+        self.end = float(cols.time[-1])
+        self.total += n
+        n_status = len(self._status.values)
+
+        self._status_counts = self._grow(self._status_counts, n_status)
+        self._status_counts += np.bincount(cols.status, minlength=n_status)
+        if len(self._order) < n_status:
+            seen = set(self._order)
+            new = [c for c in np.flatnonzero(np.bincount(cols.status)).tolist() if c not in seen]
+            self._order += sorted(new, key=lambda c: int(np.argmax(cols.status == c)))
+        self._vset_counts = self._grow(self._vset_counts, len(self._vsets.values))
+        self._vset_counts += np.bincount(cols.violations, minlength=len(self._vsets.values))
+
+        # (window, status) counts with one bincount over a dense key; sparse
+        # time ranges fall back to a sort.
+        windows = np.floor(cols.time / self.window).astype(np.int64)
+        first = int(windows.min())
+        key = (windows - first) * n_status + cols.status
+        span = (int(windows.max()) - first + 1) * n_status
+        if span <= 4 * n:
+            present = np.bincount(key, minlength=span)
+            keys = np.flatnonzero(present)
+            counts = present[keys]
+        else:
+            keys, counts = np.unique(key, return_counts=True)
+        for k, count in zip(keys.tolist(), counts.tolist()):
+            w, code = divmod(k, n_status)
+            w += first
+            row = self._windows[w] = self._grow(self._windows.get(w, np.zeros(0, np.int64)), n_status)
+            row[code] += count
+
+        reasons = self._reason.values
+        for text in reasons[len(self._reason_info):]:
+            self._reason_info.append(
+                ('GATE' in text, _GATE_TOKEN.findall(text), text.startswith(_CONDITIONAL_APPROVAL)))
+        info = self._reason_info
+
+        inadmissible = self._status.ids.get('INADMISSIBLE')
+        if inadmissible is not None:
+            for i in np.flatnonzero(cols.status == inadmissible).tolist():
+                self.critical_violations.append({
+                    "time": float(cols.time[i]),
+                    "reason": reasons[cols.reason[i]],
+                    "violations": list(self._vsets.values[cols.violations[i]]),
+                })
+
+        mentions = np.fromiter((g for g, _, _ in info), bool, len(info))
+        tracked = np.fromiter((bool(t) or a for _, t, a in info), bool, len(info))
+        for i in np.flatnonzero(mentions[cols.reason]).tolist():
+            self.evidence_gates_triggered.append(
+                {"time": float(cols.time[i]), "reason": reasons[cols.reason[i]]})
+        for i in np.flatnonzero(tracked[cols.reason]).tolist():
+            self._track_gates(int(cols.system[i]), float(cols.time[i]), info[cols.reason[i]])
+
+    def _track_gates(self, system: int, t: float, info: tuple) -> None:
+        _, tokens, approval = info
+        for gate, state in tokens:
+            key = (system, gate)
+            if state == "PENDING":
+                self._pending.setdefault(key, t)
+            elif key in self._pending:
+                self._resolve(key, t)
+        if approval:
+            for key in [k for k in self._pending if k[0] == system]:
+                self._resolve(key, t)
+
+    def _resolve(self, key: tuple, t: float) -> None:
+        since = self._pending.pop(key)
+        self.latencies.append({
+            "system_id": self._system.values[key[0]], "gate_id": key[1],
+            "pending_since": since, "fulfilled_at": t, "latency": t - since,
+        })
+
+    # -- output --------------------------------------------------------------
+
+    def _distribution(self, counts: np.ndarray) -> Dict[str, int]:
+        return {self._status.values[code]: int(counts[code])
+                for code in self._order if code < len(counts) and counts[code]}
+
+    def _compliance(self, counts: np.ndarray, total: int) -> float:
+        code = self._status.ids.get('FULLY_ADMISSIBLE')
+        return int(counts[code]) / total if code is not None and code < len(counts) and total else 0.0
+
+    def violation_frequency(self) -> Dict[str, int]:
+        """Rows in which each constraint was violated, most frequent first."""
+        freq: Dict[str, int] = {}
+        for vset, count in zip(self._vsets.values, self._vset_counts.tolist()):
+            for name in vset:
+                freq[name] = freq.get(name, 0) + count
+        return dict(sorted(freq.items(), key=lambda kv: -kv[1]))
+
+    def summary(self) -> Dict:
+        if not self.total:
+            return {}
+        windows = []
+        for w in sorted(self._windows):
+            counts = self._windows[w]
+            total = int(counts.sum())
+            windows.append({
+                "start": w * self.window,
+                "end": (w + 1) * self.window,
+                "evaluations": total,
+                "compliance_rate": self._compliance(counts, total),
+                "status_distribution": self._distribution(counts),
+            })
+        gate_latency = self.latencies + [
+            {"system_id": self._system.values[s], "gate_id": g, "pending_since": since,
+             "fulfilled_at": None, "latency": None}
+            for (s, g), since in self._pending.items()
+        ]
+        return {
+            "report_generated": datetime.now().isoformat(),
+            "total_evaluations": self.total,
+            "time_span": {"start": self.start, "end": self.end},
+            "status_distribution": self._distribution(self._status_counts),
+            "compliance_rate": self._compliance(self._status_counts, self.total),
+            "windowed_compliance": {"window": self.window, "windows": windows},
+            "violation_frequency": self.violation_frequency(),
+            "gate_latency": gate_latency,
+            "critical_violations": self.critical_violations,
+            "evidence_gates_triggered": self.evidence_gates_triggered,
+        }
 
 class DynamicsPlotter:
     """Generates visualizations from CertifiedAdmissibleSpace audit logs."""
@@ -48,18 +588,52 @@ class DynamicsPlotter:
     
     def __init__(self, log_path: str = "audit_log.json"):
         self.log_path = Path(log_path)
-        self.data = self._load_log()
-        
-    def _load_log(self) -> List[Dict]:
         if not self.log_path.exists():
             raise FileNotFoundError(f"Audit log not found: {self.log_path}")
+        self._data: Optional[List[Dict]] = None
+        self._traces: Dict[tuple, Trace] = {}
+
+    @property
+    def data(self) -> List[Dict]:
+        """All entries as dicts, loaded on first use (plots stream instead)."""
+        if self._data is None:
+            self._data = self._load_log()
+        return self._data
+
+    def _load_log(self) -> List[Dict]:
+        if self.log_path.suffix == '.npz':
+            from certified_dynamics import AuditStore
+            return list(AuditStore.load(str(self.log_path)))
+        with self._reading():
+            return [e for batch in iter_log_batches(str(self.log_path)) for e in batch]
+
+    @contextmanager
+    def _reading(self):
+        """Translate read/decode failures into the plotter's error types."""
         try:
-            with open(self.log_path, 'r') as f:
-                return json.load(f)
-        except IOError as e:
-            raise IOError(f"Failed to read audit log from {self.log_path}: {e}") from e
+            yield
         except json.JSONDecodeError as e:
             raise ValueError(f"Audit log at {self.log_path} contains invalid JSON: {e}") from e
+        except OSError as e:
+            raise IOError(f"Failed to read audit log from {self.log_path}: {e}") from e
+
+    def load_traces(self, state_indices: List[int],
+                    max_points: Optional[int] = None) -> Dict[int, Trace]:
+        """Load several state components in one pass and keep them for reuse.
+
+        Components already loaded at the same ``max_points`` are not read
+        again, so plots of one log share a single parse.
+        """
+        missing = [i for i in dict.fromkeys(state_indices) if (i, max_points) not in self._traces]
+        if missing:
+            with self._reading():
+                loaded = load_traces(str(self.log_path), missing, max_points)
+            self._traces.update(((i, max_points), trace) for i, trace in loaded.items())
+        return {i: self._traces[(i, max_points)] for i in state_indices}
+
+    def load_trace(self, state_idx: int = 0, max_points: Optional[int] = None) -> Trace:
+        """Stream one state component of the log (see :func:`load_trace`)."""
+        return self.load_traces([state_idx], max_points)[state_idx]
     
     def plot_state_trajectory(self, 
                              state_idx: int = 0,
@@ -67,7 +641,9 @@ class DynamicsPlotter:
                              constraint_name: Optional[str] = None,
                              threshold_fn: Optional[Callable[[float], float]] = None,
                              title: Optional[str] = None,
-                             output_path: Optional[str] = None):
+                             output_path: Optional[str] = None,
+                             boundary_events: Optional[List[Dict]] = None,
+                             max_points: Optional[int] = 5000):
         """
         Plot the evolution of a state variable vs. its regulatory limit.
         
@@ -78,58 +654,76 @@ class DynamicsPlotter:
             threshold_fn: Function f(t) that calculates the limit at simulation time.
             title: Custom chart title.
             output_path: If provided, saves the chart to this path.
+            boundary_events: Located boundary crossings to mark, as
+                ``BoundaryEvent.as_dict()`` entries ("time", "state_vector").
+            max_points: Downsample to at most this many points (see
+                :func:`downsample`); ``None`` plots every entry.
         """
-        if not self.data:
+        trace = self.load_trace(state_idx, max_points)
+        try:
+            self.render_trace(trace, output_path, state_idx, state_label, constraint_name,
+                              threshold_fn, title, boundary_events)
+        except OSError as e:
+            print(f"[Plot] Failed to save chart to {output_path}: {e}")
+            return
+        if output_path:
+            print(f"[Plot] Chart saved to: {output_path}")
+
+    @classmethod
+    def render_trace(cls,
+                     trace: Trace,
+                     output_path: Optional[str] = None,
+                     state_idx: int = 0,
+                     state_label: str = "State Variable",
+                     constraint_name: Optional[str] = None,
+                     threshold_fn: Optional[Callable[[float], float]] = None,
+                     title: Optional[str] = None,
+                     boundary_events: Optional[List[Dict]] = None):
+        """Draw a loaded trace with :data:`PLOT_STYLE` and save it to ``output_path``.
+
+        Arguments are as for :meth:`plot_state_trajectory`; save failures
+        propagate as ``OSError``.
+        """
+        if not len(trace):
             raise ValueError("No data to plot")
-            
-        # Extract time series
-        sim_times = [entry['simulation_time'] for entry in self.data]
-        state_values = []
-        for i, entry in enumerate(self.data):
-            if 'state_vector' not in entry:
-                raise ValueError(
-                    f"Entry at index {i} is missing 'state_vector'; cannot plot state index {state_idx}."
-                )
-            state_vector = entry['state_vector']
+        with plt.rc_context(PLOT_STYLE):
+            fig, ax = plt.subplots()
             try:
-                length = len(state_vector)
-            except TypeError:
-                raise ValueError(
-                    f"'state_vector' at entry index {i} is not indexable (type: {type(state_vector).__name__}); "
-                    f"cannot plot state index {state_idx}."
-                )
-            if state_idx < 0 or state_idx >= length:
-                sim_time = entry.get('simulation_time', 'unknown')
-                raise ValueError(
-                    f"Requested state_idx {state_idx} is out of bounds for entry {i} at simulation_time={sim_time}. "
-                    f"'state_vector' length is {length}."
-                )
-            state_values.append(state_vector[state_idx])
-        statuses = [entry['status'] for entry in self.data]
+                cls._draw(ax, trace, state_idx, state_label, constraint_name,
+                          threshold_fn, title, boundary_events)
+                fig.tight_layout()
+                if output_path:
+                    fig.savefig(output_path)
+            finally:
+                plt.close(fig)
+
+    @classmethod
+    def _draw(cls, ax, trace: Trace, state_idx: int, state_label: str,
+              constraint_name: Optional[str], threshold_fn: Optional[Callable[[float], float]],
+              title: Optional[str], boundary_events: Optional[List[Dict]]) -> None:
+        sim_times, state_values = trace.time, trace.value
+        names = trace.status_names
+        palette = np.array([cls.STATUS_COLORS.get(name, '#95a5a6') for name in names])
         
         # Calculate regulatory boundary if function is provided
         if threshold_fn:
-            thresholds = [threshold_fn(t) for t in sim_times]
+            thresholds = [threshold_fn(t) for t in sim_times.tolist()]
         else:
             thresholds = None
         
-        # Create figure
-        fig, ax = plt.subplots()
-        
-        # Plot state trajectory with colors by status
-        labeled_statuses = set()
-        for i in range(len(sim_times) - 1):
-            color = self.STATUS_COLORS.get(statuses[i], '#95a5a6')
-            label = statuses[i] if statuses[i] not in labeled_statuses else ""
-            ax.plot([sim_times[i], sim_times[i+1]], 
-                   [state_values[i], state_values[i+1]], 
-                   color=color, linewidth=2.5, label=label)
-            labeled_statuses.add(statuses[i])
+        # Plot state trajectory with colors by status: one collection, each
+        # segment coloured by the status of its first point
+        points = np.column_stack([sim_times, state_values])
+        segments = np.stack([points[:-1], points[1:]], axis=1)
+        ax.add_collection(LineCollection(segments, colors=palette[trace.status[:-1]], linewidths=2.5))
+        ax.autoscale_view()
+        _, first = np.unique(trace.status[:-1], return_index=True)
+        for code in trace.status[np.sort(first)].tolist():
+            ax.add_line(Line2D([], [], color=palette[code], linewidth=2.5, label=names[code]))
         
         # Plot points with distinctive markers
-        for t, val, status in zip(sim_times, state_values, statuses):
-            ax.scatter(t, val, c=self.STATUS_COLORS.get(status, '#95a5a6'), 
-                      s=50, edgecolors='white', linewidth=1.5, zorder=5)
+        ax.scatter(sim_times, state_values, c=palette[trace.status],
+                   s=50 if len(trace) <= 1000 else 10, edgecolors='white', linewidth=1.5, zorder=5)
         
         # Plot regulatory boundary if available
         if thresholds:
@@ -138,15 +732,23 @@ class DynamicsPlotter:
             ax.fill_between(sim_times, thresholds, np.max(state_values)*1.1, 
                            alpha=0.1, color='red', label="Inadmissible Region")
         
-        # Mark evidence events (status transitions from CONDITIONAL_PENDING -> FULLY_ADMISSIBLE)
-        evidence_labeled = False
-        for i in range(1, len(statuses)):
-            if statuses[i-1] == 'CONDITIONAL_PENDING' and statuses[i] == 'FULLY_ADMISSIBLE':
-                label = "Evidence Gate Fulfilled" if not evidence_labeled else ""
-                ax.axvline(x=sim_times[i], color='green', linestyle=':', 
-                          linewidth=1, alpha=0.7, label=label)
-                evidence_labeled = True
-        
+        # Mark evidence events (status transitions from CONDITIONAL_PENDING -> FULLY_ADMISSIBLE);
+        # the downsampler keeps both rows of every transition
+        codes = {name: k for k, name in enumerate(names)}
+        if 'CONDITIONAL_PENDING' in codes and 'FULLY_ADMISSIBLE' in codes:
+            fulfilled = np.flatnonzero((trace.status[:-1] == codes['CONDITIONAL_PENDING'])
+                                       & (trace.status[1:] == codes['FULLY_ADMISSIBLE'])) + 1
+            if len(fulfilled):
+                ax.vlines(sim_times[fulfilled], 0, 1, transform=ax.get_xaxis_transform(),
+                          colors='green', linestyles=':', linewidth=1, alpha=0.7,
+                          label="Evidence Gate Fulfilled")
+
+        # Mark located boundary crossings (AdaptiveVoluntadDynamics events)
+        if boundary_events:
+            ax.scatter([e['time'] for e in boundary_events],
+                       [e['state_vector'][state_idx] for e in boundary_events],
+                       marker='x', s=80, c='black', zorder=6, label="Boundary Crossing")
+
         # Axis configuration and legend
         ax.set_xlabel("Simulation Time (arbitrary units)", fontsize=10)
         ax.set_ylabel(state_label, fontsize=10)
@@ -163,75 +765,31 @@ class DynamicsPlotter:
         
         # Add tooltip-style annotations for key points (limit to avoid clutter)
         MAX_ANNOTATIONS = 30
-        annot_candidates = [
-            entry for entry in self.data
-            if entry.get('status') in ['INADMISSIBLE', 'CONDITIONAL_PENDING']
-        ]
+        flagged = [codes[name] for name in ('INADMISSIBLE', 'CONDITIONAL_PENDING') if name in codes]
+        annot_candidates = np.flatnonzero(np.isin(trace.status, flagged))
         if len(annot_candidates) > MAX_ANNOTATIONS:
             step = max(1, (len(annot_candidates) + MAX_ANNOTATIONS - 1) // MAX_ANNOTATIONS)
             annot_candidates = annot_candidates[::step]
 
-        for entry in annot_candidates:
-            reason = entry.get('reason', '')
+        for i in annot_candidates.tolist():
+            reason = trace.reasons[trace.reason[i]]
             reason_text = reason[:30] + '...' if len(reason) > 30 else reason
             ax.annotate(f"\u26a0 {reason_text}", 
-                       xy=(entry['simulation_time'], entry['state_vector'][state_idx]),
+                       xy=(sim_times[i], state_values[i]),
                        xytext=(0, 30), textcoords='offset points',
                        fontsize=8, bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.3),
                        arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.15'))
-        
-        plt.tight_layout()
-        
-        if output_path:
-            try:
-                plt.savefig(output_path)
-                print(f"[Plot] Chart saved to: {output_path}")
-            except IOError as e:
-                print(f"[Plot] Failed to save chart to {output_path}: {e}")
-        
-        plt.close(fig)
 
-    def generate_summary_report(self, output_path: str = "compliance_summary.json"):
-        """Generate an executive summary in JSON with key metrics."""
-        if not self.data:
+    def generate_summary_report(self, output_path: str = "compliance_summary.json",
+                                window: float = 1.0):
+        """Generate an executive summary in JSON with key metrics (one streamed pass)."""
+        aggregator = ComplianceAggregator(window)
+        with self._reading():
+            for cols in iter_columns(str(self.log_path)):
+                aggregator.update_columns(cols)
+        summary = aggregator.summary()
+        if not summary:
             return {}
-            
-        status_counts = {}
-        for entry in self.data:
-            status = entry['status']
-            status_counts[status] = status_counts.get(status, 0) + 1
-            
-        total_evaluations = len(self.data)
-
-        summary = {
-            "report_generated": datetime.now().isoformat(),
-            "total_evaluations": total_evaluations,
-            "time_span": {
-                "start": self.data[0]['simulation_time'],
-                "end": self.data[-1]['simulation_time']
-            },
-            "status_distribution": status_counts,
-            "compliance_rate": (
-                status_counts.get('FULLY_ADMISSIBLE', 0) / total_evaluations
-                if total_evaluations
-                else 0.0
-            ),
-            "critical_violations": [
-                {
-                    "time": entry['simulation_time'],
-                    "reason": entry['reason'],
-                    "violations": entry['violations']
-                }
-                for entry in self.data if entry['status'] == 'INADMISSIBLE'
-            ],
-            "evidence_gates_triggered": [
-                {
-                    "time": entry['simulation_time'],
-                    "reason": entry['reason']
-                }
-                for entry in self.data if 'GATE' in entry['reason']
-            ]
-        }
         
         try:
             with open(output_path, 'w') as f:
@@ -242,6 +800,139 @@ class DynamicsPlotter:
         return summary
 
 
+# ==========================================
+# BATCH RENDERING
+# ==========================================
+
+@dataclass
+class PlotJob:
+    """One chart of a batch: a state component of a log against its limit.
+
+    The first four fields match the ``(log, state_idx, threshold_fn, output)``
+    tuples accepted by :func:`render_batch`.
+    """
+    log_path: str
+    state_idx: int
+    threshold_fn: Optional[Callable[[float], float]]
+    output_path: str
+    state_label: str = "State Variable"
+    constraint_name: Optional[str] = None
+    title: Optional[str] = None
+    boundary_events: Optional[List[Dict]] = None
+    max_points: Optional[int] = 5000
+
+@dataclass
+class RenderResult:
+    """Outcome and timing of one :class:`PlotJob`.
+
+    ``load_seconds`` is the time spent reading the log for this job; jobs
+    served from data already loaded for the same log report 0.
+    """
+    job: int  # position in the batch
+    output_path: str
+    load_seconds: float
+    render_seconds: float
+    worker: int  # process id
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+def _error(e: Exception) -> str:
+    return f"{type(e).__name__}: {e}"
+
+def _partition(jobs: List[PlotJob], workers: int) -> List[List[int]]:
+    """Group job positions by log; split logs only when there are fewer logs
+    than workers (each split re-reads its log)."""
+    by_log: Dict[str, List[int]] = {}
+    for k, job in enumerate(jobs):
+        by_log.setdefault(str(job.log_path), []).append(k)
+    splits = -(-workers // len(by_log))
+    tasks = []
+    for positions in by_log.values():
+        size = -(-len(positions) // min(splits, len(positions)))
+        tasks.extend(positions[i:i + size] for i in range(0, len(positions), size))
+    return tasks
+
+_batch_jobs: List[PlotJob] = []  # set in each pool worker by _init_worker
+
+def _init_worker(jobs: List[PlotJob]) -> None:
+    global _batch_jobs
+    _batch_jobs = jobs
+
+def _render_group(positions: List[int], jobs: Optional[List[PlotJob]] = None) -> List[RenderResult]:
+    """Render jobs that share one log, loading all their components in one pass."""
+    jobs = _batch_jobs if jobs is None else jobs
+    group = [jobs[k] for k in positions]
+    pid = os.getpid()
+    start = perf_counter()
+    try:
+        plotter = DynamicsPlotter(group[0].log_path)
+    except Exception as e:
+        return [RenderResult(k, job.output_path, perf_counter() - start, 0.0, pid, _error(e))
+                for k, job in zip(positions, group)]
+    for max_points in dict.fromkeys(job.max_points for job in group):
+        try:
+            plotter.load_traces([job.state_idx for job in group if job.max_points == max_points],
+                                max_points)
+        except Exception:
+            pass  # a bad component fails only its own job, when loaded below
+    results = []
+    for k, job in zip(positions, group):
+        load_start = perf_counter()
+        error = None
+        try:
+            trace = plotter.load_trace(job.state_idx, job.max_points)
+            render_start = perf_counter()
+            plotter.render_trace(trace, job.output_path, job.state_idx, job.state_label,
+                                 job.constraint_name, job.threshold_fn, job.title,
+                                 job.boundary_events)
+        except Exception as e:
+            render_start = perf_counter()
+            error = _error(e)
+        end = perf_counter()
+        # The shared load is charged to the first job of the group
+        load_seconds = render_start - load_start + (load_start - start if not results else 0.0)
+        results.append(RenderResult(k, job.output_path, load_seconds, end - render_start, pid, error))
+    return results
+
+def render_batch(jobs: Sequence[Union[PlotJob, tuple]],
+                 workers: Optional[int] = None) -> List[RenderResult]:
+    """Render many trajectory charts in a process pool.
+
+    ``jobs`` are :class:`PlotJob` instances or ``(log, state_idx,
+    threshold_fn, output)`` tuples.  Jobs on the same log run in one task
+    that parses the log once; tasks are spread over ``workers`` processes
+    (default: one per CPU; 1 renders in this process).  Each worker draws
+    with the Agg backend and :data:`PLOT_STYLE`.  Failures are reported per
+    job in :attr:`RenderResult.error` instead of stopping the batch.
+
+    Where ``fork`` is available jobs reach the workers by inheritance, so
+    threshold functions may be lambdas; otherwise they must be picklable.
+
+    Returns one result per job, in job order.
+    """
+    jobs = [job if isinstance(job, PlotJob) else PlotJob(*job) for job in jobs]
+    if not jobs:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    tasks = _partition(jobs, workers)
+    start = perf_counter()
+    if workers == 1:
+        groups = [_render_group(task, jobs) for task in tasks]
+    else:
+        method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context(method),
+                                 initializer=_init_worker, initargs=(jobs,)) as pool:
+            groups = list(pool.map(_render_group, tasks))
+    results = sorted((r for group in groups for r in group), key=lambda r: r.job)
+    failed = sum(not r.ok for r in results)
+    print(f"[Plot] Rendered {len(results) - failed}/{len(results)} charts with {workers} "
+          f"worker(s) in {perf_counter() - start:.2f}s")
+    return results
+
+
 # ==========================================
 # USAGE EXAMPLE WITH THE LOG FROM THE MAIN MODULE
 # ==========================================
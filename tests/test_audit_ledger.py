@@ -0,0 +1,270 @@
+"""
+tests/test_audit_ledger.py — Hash-Chained Audit Ledger Validation
+==================================================================
+
+Validates audit_ledger.py: records chain and checkpoint correctly, a
+resumed ledger continues the chain and recovers from a crash mid-write
+(missing checkpoints, a torn last line, a changed checkpoint interval), the
+streaming verifier and the
+checkpoint range verifier detect modification, insertion, deletion and
+truncation, and Merkle proofs verify for every leaf of every tree size.
+
+Run with:  python -m pytest tests/test_audit_ledger.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from audit_ledger import (
+    HashChainLedger,
+    LedgerError,
+    _after_last_newline,
+    checkpoint_proof,
+    iter_entries,
+    ledger_root,
+    merkle_proof,
+    merkle_root,
+    read_checkpoints,
+    verify_ledger,
+    verify_merkle_proof,
+    verify_range,
+)
+
+_N = 1000
+_EVERY = 64
+
+
+def _entry(i: int) -> dict:
+    return {"i": i, "status": "FULLY_ADMISSIBLE", "state_vector": [float(i), 2.0]}
+
+
+@pytest.fixture()
+def ledger_path(tmp_path) -> Path:
+    path = tmp_path / "audit.ledger"
+    with HashChainLedger(str(path), checkpoint_every=_EVERY) as ledger:
+        ledger.write_many(_entry(i) for i in range(_N))
+    return path
+
+
+def _rewrite(path: Path, fn) -> None:
+    lines = path.read_bytes().splitlines(keepends=True)
+    path.write_bytes(b"".join(fn(lines)))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Merkle trees
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestMerkle:
+    """Inclusion proofs for every leaf of every tree size."""
+
+    def test_proofs(self) -> None:
+        for size in range(1, 40):
+            leaves = [bytes([i]) * 32 for i in range(size)]
+            root = merkle_root(leaves)
+            for i in range(size):
+                proof = merkle_proof(leaves, i)
+                assert len(proof) <= size.bit_length()
+                assert verify_merkle_proof(leaves[i], i, size, proof, root)
+                if size > 1:
+                    assert not verify_merkle_proof(leaves[i], (i + 1) % size, size, proof, root)
+                    assert not verify_merkle_proof(b"\xff" * 32, i, size, proof, root)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Writing and verification
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestLedger:
+    """Writer, resume and both verifiers on an intact ledger."""
+
+    def test_verify(self, ledger_path) -> None:
+        report = verify_ledger(str(ledger_path))
+        assert report.records == _N
+        assert report.bytes == ledger_path.stat().st_size
+        assert report.mb_per_s > 0
+        checkpoints = read_checkpoints(str(ledger_path))
+        assert [cp.index for cp in checkpoints] == list(range(_EVERY, _N + 1, _EVERY))
+        assert report.root == ledger_root(checkpoints)
+
+    def test_lines_are_json(self, ledger_path) -> None:
+        first = json.loads(ledger_path.read_text().splitlines()[0])
+        assert first["e"] == _entry(0)
+        assert list(iter_entries(str(ledger_path))) == [_entry(i) for i in range(_N)]
+
+    def test_resume_continues_chain(self, ledger_path) -> None:
+        with HashChainLedger(str(ledger_path), checkpoint_every=_EVERY) as ledger:
+            assert len(ledger) == _N
+            ledger.write(_entry(_N))
+            count, head = ledger.head()
+        report = verify_ledger(str(ledger_path))
+        assert (report.records, report.head) == (count, head) == (_N + 1, head)
+
+    @pytest.mark.parametrize("start,stop", [(0, 1), (100, 130), (_N - 5, _N), (0, _N)])
+    def test_range(self, ledger_path, start, stop) -> None:
+        report = verify_range(str(ledger_path), start, stop)
+        assert report.records >= stop - start
+        if stop - start < _EVERY and stop <= _N // _EVERY * _EVERY:
+            assert report.records <= 2 * _EVERY
+
+    def test_range_against_anchored_root(self, ledger_path) -> None:
+        checkpoints = read_checkpoints(str(ledger_path))
+        root = ledger_root(checkpoints)
+        verify_range(str(ledger_path), 200, 210, root=root)
+        with pytest.raises(LedgerError):
+            verify_range(str(ledger_path), 200, 210, root="00" * 32)
+        proof = checkpoint_proof(checkpoints, 3)
+        assert verify_merkle_proof(
+            bytes.fromhex(checkpoints[3].block_root), 3, len(checkpoints), proof, bytes.fromhex(root)
+        )
+
+    def test_range_past_end(self, ledger_path) -> None:
+        with pytest.raises(LedgerError):
+            verify_range(str(ledger_path), 0, _N + 1)
+
+    def test_as_audit_sink(self, tmp_path) -> None:
+        from certified_dynamics import CertifiedAdmissibleSpace, InvariantCore, LinearConstraint
+
+        path = tmp_path / "space.ledger"
+        core = InvariantCore("SYS", "EASA", "ledger")
+        core.add_constraint(LinearConstraint("Noise", [1.0], 80.0))
+        with HashChainLedger(str(path), checkpoint_every=8) as ledger:
+            space = CertifiedAdmissibleSpace(sink=ledger)
+            space.evaluate_states(np.linspace(70, 90, 20)[:, np.newaxis], core)
+        assert verify_ledger(str(path)).records == 20
+        assert list(iter_entries(str(path))) == json.loads(json.dumps(list(space.audit_log)))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Crash recovery
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestRecovery:
+    """A ledger interrupted mid-write can be reopened and appended to."""
+
+    def _reopen_and_append(self, path: Path, every: int = _EVERY) -> None:
+        with HashChainLedger(str(path), checkpoint_every=every) as ledger:
+            assert len(ledger) == _N
+            ledger.write_many(_entry(i) for i in range(_N, _N + 100))
+        assert verify_ledger(str(path)).records == _N + 100
+        verify_range(str(path), 0, _N + 100)
+
+    def test_missing_checkpoints_recomputed(self, ledger_path) -> None:
+        ckpt = Path(str(ledger_path) + ".ckpt")
+        intact = ckpt.read_text()
+        ckpt.write_text("".join(intact.splitlines(keepends=True)[:-3]))
+        HashChainLedger(str(ledger_path), checkpoint_every=_EVERY).close()
+        assert ckpt.read_text() == intact
+        self._reopen_and_append(ledger_path)
+
+    def test_torn_record_dropped(self, ledger_path) -> None:
+        with ledger_path.open("ab") as fh:
+            fh.write(b'{"hash": "0123')
+        with pytest.warns(RuntimeWarning, match="incomplete last line"):
+            self._reopen_and_append(ledger_path)
+
+    def test_torn_checkpoint_dropped(self, ledger_path) -> None:
+        ckpt = Path(str(ledger_path) + ".ckpt")
+        ckpt.write_text(ckpt.read_text()[:-20])
+        with pytest.warns(RuntimeWarning, match="incomplete last line"):
+            self._reopen_and_append(ledger_path)
+
+    @pytest.mark.parametrize("data", [b"", b"torn", b"a\n", b"a\nbc" + b"x" * 300])
+    @pytest.mark.parametrize("block", [1, 7, 1 << 16])
+    def test_last_newline_scanned_backwards(self, tmp_path, data, block) -> None:
+        path = tmp_path / "lines"
+        path.write_bytes(data)
+        assert _after_last_newline(str(path), len(data), block) == data.rfind(b"\n") + 1
+
+    def test_torn_line_only_at_end(self, ledger_path) -> None:
+        # A damaged line followed by complete ones is tampering, not a crash.
+        _rewrite(ledger_path, lambda lines: lines[:-2] + [lines[-2][:-1]] + lines[-1:])
+        with pytest.raises(LedgerError, match="record 998"):
+            HashChainLedger(str(ledger_path), checkpoint_every=_EVERY)
+
+    @pytest.mark.parametrize("every", [10, _EVERY * 4])
+    def test_changed_checkpoint_interval(self, ledger_path, every) -> None:
+        self._reopen_and_append(ledger_path, every)
+
+    def test_close_during_write(self, tmp_path) -> None:
+        path = tmp_path / "race.ledger"
+        ledger = HashChainLedger(str(path), checkpoint_every=7)
+
+        def write() -> None:
+            try:
+                ledger.write_many([_entry(i) for i in range(5000)])
+            except ValueError:  # closed first: nothing written
+                pass
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        ledger.close()
+        writer.join()
+        assert verify_ledger(str(path)).records in (0, 5000)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tampering
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestTampering:
+    """Every kind of edit is rejected by both verifiers."""
+
+    def _modify(self, lines):
+        lines[300] = lines[300].replace(b'"FULLY_ADMISSIBLE"', b'"INADMISSIBLE"')
+        return lines
+
+    def _delete(self, lines):
+        return lines[:300] + lines[301:]
+
+    def _insert(self, lines):
+        return lines[:300] + [lines[299]] + lines[300:]
+
+    def _swap(self, lines):
+        lines[300], lines[301] = lines[301], lines[300]
+        return lines
+
+    @pytest.mark.parametrize("edit", ["_modify", "_delete", "_insert", "_swap"])
+    def test_detected(self, ledger_path, edit) -> None:
+        _rewrite(ledger_path, getattr(self, edit))
+        with pytest.raises(LedgerError):
+            verify_ledger(str(ledger_path))
+        with pytest.raises(LedgerError):
+            verify_range(str(ledger_path), 290, 310)
+        # Blocks before the edit still verify on their own.
+        verify_range(str(ledger_path), 0, 256)
+
+    def test_truncation_before_checkpoint(self, ledger_path) -> None:
+        _rewrite(ledger_path, lambda lines: lines[:500])
+        with pytest.raises(LedgerError):
+            verify_ledger(str(ledger_path))
+        with pytest.raises(LedgerError):
+            HashChainLedger(str(ledger_path), checkpoint_every=_EVERY)
+
+    def test_rewritten_chain_caught_by_checkpoint(self, ledger_path, tmp_path) -> None:
+        # A fully re-hashed forgery no longer matches the checkpoint heads.
+        forged = tmp_path / "forged.ledger"
+        with HashChainLedger(str(forged), checkpoint_every=10 ** 9) as ledger:
+            ledger.write_many(_entry(i) if i != 300 else {**_entry(i), "status": "X"}
+                              for i in range(_N))
+        ledger_path.write_bytes(forged.read_bytes())
+        with pytest.raises(LedgerError):
+            verify_ledger(str(ledger_path))
+
+    def test_checkpoint_file_tampering(self, ledger_path) -> None:
+        ckpt = Path(str(ledger_path) + ".ckpt")
+        lines = ckpt.read_text().splitlines(keepends=True)
+        ckpt.write_text("".join(lines[:2] + lines[3:]))
+        with pytest.raises(LedgerError):
+            verify_ledger(str(ledger_path))
+
+    def test_malformed_line(self, ledger_path) -> None:
+        _rewrite(ledger_path, lambda lines: lines[:10] + [b"garbage\n"] + lines[11:])
+        with pytest.raises(LedgerError, match="record 10"):
+            verify_ledger(str(ledger_path))
@@ -0,0 +1,230 @@
+"""
+tests/test_audit_sink.py — Streaming Audit Sink Validation
+===========================================================
+
+Validates audit_sink.py: the JSON Lines sink writes every accepted entry in
+order, rotates by size and age, fsyncs on its batching policy, applies
+backpressure, surfaces writer failures, and can be shared by
+CertifiedAdmissibleSpace and HilbertBellManifold.
+
+Run with:  python -m pytest tests/test_audit_sink.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from audit_sink import JsonlSink, MemorySink, SinkError, SinkFullError
+
+
+def _read(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _read_all(path: Path) -> list[dict]:
+    """Entries across rotated backups, oldest first."""
+    backups = sorted(path.parent.glob(path.name + ".*"), key=lambda p: -int(p.suffix[1:]))
+    return [e for p in backups + [path] for e in _read(p)]
+
+
+class _StalledSink(JsonlSink):
+    """Writer blocks until ``release`` is set, so the queue can fill up."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.release = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _write_lines(self, lines):
+        self.release.wait(5)
+        super()._write_lines(lines)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Writing and rotation
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestJsonlSink:
+    """Ordering, rotation and fsync policy."""
+
+    def test_writes_in_order(self, tmp_path) -> None:
+        path = tmp_path / "audit.jsonl"
+        with JsonlSink(str(path)) as sink:
+            for i in range(100):
+                sink.write({"i": i})
+            sink.write_many({"i": i} for i in range(100, 1000))
+        assert [e["i"] for e in _read(path)] == list(range(1000))
+        assert sink.stats.written == 1000
+
+    def test_flush_makes_entries_visible(self, tmp_path) -> None:
+        path = tmp_path / "audit.jsonl"
+        sink = JsonlSink(str(path))
+        sink.write({"event": "a", "x": np.float64(1.5), "v": np.arange(2)})
+        sink.flush()
+        assert _read(path) == [{"event": "a", "x": 1.5, "v": [0, 1]}]
+        sink.close()
+
+    def test_appends_to_existing_file(self, tmp_path) -> None:
+        path = tmp_path / "audit.jsonl"
+        with JsonlSink(str(path)) as sink:
+            sink.write({"run": 1})
+        with JsonlSink(str(path)) as sink:
+            sink.write({"run": 2})
+        assert _read(path) == [{"run": 1}, {"run": 2}]
+
+    def test_size_rotation_keeps_every_entry(self, tmp_path) -> None:
+        path = tmp_path / "audit.jsonl"
+        with JsonlSink(str(path), max_bytes=2000, backup_count=None) as sink:
+            sink.write_many({"i": i, "pad": "x" * 40} for i in range(500))
+        assert sink.stats.rotations > 1
+        assert [e["i"] for e in _read_all(path)] == list(range(500))
+        for p in tmp_path.iterdir():
+            assert p.stat().st_size <= 2000
+
+    def test_backup_count(self, tmp_path) -> None:
+        path = tmp_path / "audit.jsonl"
+        with JsonlSink(str(path), max_bytes=500, backup_count=2) as sink:
+            sink.write_many({"i": i, "pad": "x" * 40} for i in range(500))
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert names == ["audit.jsonl", "audit.jsonl.1", "audit.jsonl.2"]
+        assert _read_all(path)[-1]["i"] == 499
+
+    def test_age_rotation(self, tmp_path) -> None:
+        path = tmp_path / "audit.jsonl"
+        with JsonlSink(str(path), max_age=0.05) as sink:
+            sink.write({"i": 0})
+            sink.flush()
+            time.sleep(0.1)
+            sink.write({"i": 1})
+        assert _read(Path(f"{path}.1")) == [{"i": 0}]
+        assert _read(path) == [{"i": 1}]
+
+    def test_fsync_batching(self, tmp_path) -> None:
+        path = tmp_path / "audit.jsonl"
+        with JsonlSink(str(path), fsync_every=10) as sink:
+            for i in range(50):
+                sink.write({"i": i})
+                sink.flush()
+            assert 4 <= sink.stats.fsyncs <= 5
+            sink.flush(sync=True)
+
+    def test_fsync_interval_when_idle(self, tmp_path) -> None:
+        with JsonlSink(str(tmp_path / "audit.jsonl"), fsync_interval=0.05) as sink:
+            sink.write({"i": 0})
+            deadline = time.monotonic() + 2
+            while sink.stats.fsyncs == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert sink.stats.fsyncs == 1
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Backpressure and failure
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestBackpressure:
+    """Bounded pending queue."""
+
+    def _fill(self, sink: _StalledSink) -> None:
+        sink.write({"i": 0})                      # taken by the stalled writer
+        deadline = time.monotonic() + 2
+        while sink._queue and time.monotonic() < deadline:
+            time.sleep(0.005)
+        sink.write_many({"i": i} for i in range(1, 4))
+
+    def test_drop(self, tmp_path) -> None:
+        sink = _StalledSink(str(tmp_path / "a.jsonl"), max_pending=4, overflow="drop")
+        self._fill(sink)
+        sink.write({"i": 99})
+        assert sink.stats.dropped == 1
+        sink.release.set()
+        sink.close()
+        assert sink.stats.written == 4
+
+    def test_raise(self, tmp_path) -> None:
+        sink = _StalledSink(str(tmp_path / "a.jsonl"), max_pending=4, overflow="raise")
+        self._fill(sink)
+        with pytest.raises(SinkFullError):
+            sink.write({"i": 99})
+        sink.release.set()
+        sink.close()
+
+    def test_block_with_timeout(self, tmp_path) -> None:
+        sink = _StalledSink(str(tmp_path / "a.jsonl"), max_pending=4, timeout=0.05)
+        self._fill(sink)
+        with pytest.raises(SinkFullError):
+            sink.write({"i": 99})
+        sink.release.set()
+        sink.close()
+
+    def test_block_until_drained(self, tmp_path) -> None:
+        path = tmp_path / "a.jsonl"
+        sink = _StalledSink(str(path), max_pending=4)
+        self._fill(sink)
+        threading.Timer(0.05, sink.release.set).start()
+        sink.write({"i": 4})
+        sink.close()
+        assert [e["i"] for e in _read(path)] == [0, 1, 2, 3, 4]
+
+    def test_writer_failure_surfaces(self, tmp_path) -> None:
+        sink = JsonlSink(str(tmp_path / "a.jsonl"))
+        sink._fh.close()
+        sink.write({"i": 0})
+        with pytest.raises(SinkError):
+            sink.flush()
+        with pytest.raises(SinkError):
+            sink.write({"i": 1})
+
+    def test_write_after_close(self, tmp_path) -> None:
+        sink = JsonlSink(str(tmp_path / "a.jsonl"))
+        sink.close()
+        sink.close()
+        with pytest.raises(SinkError):
+            sink.write({"i": 0})
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Producers
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestProducers:
+    """Both audit producers stream to one sink."""
+
+    def test_shared_sink(self, tmp_path) -> None:
+        from certified_dynamics import (
+            CertifiedAdmissibleSpace, InvariantCore, LinearConstraint, System,
+            VoluntadDynamics,
+        )
+        from hilbert_bell_manifold import HilbertBellManifold
+
+        path = tmp_path / "shared.jsonl"
+        with JsonlSink(str(path)) as sink:
+            core = InvariantCore("SYS", "EASA", "sink")
+            core.add_constraint(LinearConstraint("Noise", [1.0], 80.0))
+            space = CertifiedAdmissibleSpace(sink=sink)
+            system = System(core)
+            system.set_state(np.array([79.0]))
+            dynamics = VoluntadDynamics(lambda x: np.array([1.0]), space)
+            dynamics.step(system, step_size=0.5)
+            dynamics.step(system, step_size=5.0)
+            space.evaluate_states(np.array([[70.0], [90.0]]), core)
+
+            manifold = HilbertBellManifold(sink=sink)
+            manifold.check_bell_bounds((0.5, 0.5, 0.5, -0.4))
+
+        entries = _read(path)
+        assert entries[:4] == json.loads(json.dumps(list(space.audit_log)))
+        assert [e.get("applied") for e in entries[:2]] == [True, False]
+        assert entries[4] == manifold.audit_trail()[0]
+
+    def test_memory_sink(self) -> None:
+        from hilbert_bell_manifold import DataCandidate, HilbertBellManifold
+
+        sink = MemorySink()
+        manifold = HilbertBellManifold(sink=sink)
+        manifold.mine([DataCandidate("d1", relevance=0.9, quality=0.8, compliance=0.95)])
+        assert sink.entries == manifold.audit_trail()
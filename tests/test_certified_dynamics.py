@@ -0,0 +1,749 @@
+"""
+tests/test_certified_dynamics.py — Certified Admissible Space Validation
+=========================================================================
+
+Validates batch admissibility evaluation (certified_dynamics.py): the
+vectorised evaluate_states() agrees row by row — status, reason and audit
+entry — with the scalar evaluate_state(), for lambda, array-capable and
+compiled (fused) constraint forms; and the columnar AuditStore behind the
+audit log (chunk spill, JSON / JSON Lines / .npz export, plotter reads);
+the EnsembleDynamics simulator against per-system VoluntadDynamics;
+boundary event detection in AdaptiveVoluntadDynamics; the evidence gate
+registry (name keys, many-to-many links, masks, change events); and the
+opt-in AdmissibilityCache.
+
+Run with:  python -m pytest tests/test_certified_dynamics.py -v
+"""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from certified_dynamics import (
+    AdaptiveVoluntadDynamics,
+    AdmissibilityCache,
+    AdmissibilityStatus,
+    AuditStore,
+    BoxConstraint,
+    CertifiedAdmissibleSpace,
+    EnsembleDynamics,
+    EvidenceGate,
+    EvidenceGateRegistry,
+    InvariantCore,
+    LinearConstraint,
+    PiecewiseLinearSchedule,
+    QuadraticConstraint,
+    SlowConstraintWarning,
+    System,
+    TimeVaryingConstraint,
+    VoluntadDynamics,
+    fallback_report,
+)
+
+# Row-by-row fallback is exercised on purpose throughout this module.
+pytestmark = pytest.mark.filterwarnings("ignore::certified_dynamics.SlowConstraintWarning")
+
+
+def _core(mode) -> InvariantCore:
+    """Same three constraints as lambdas (False), array lambdas (True) or compiled forms."""
+    core = InvariantCore("TEST-SYS", "EASA", "Batch evaluation")
+    if mode == "compiled":
+        core.add_constraint(LinearConstraint(
+            "Noise", [1.0, 0.0], 80, schedule=lambda t: 1.0 - 0.0125 * t,
+        ))
+        core.add_constraint(LinearConstraint("Mass", [0.0, 1.0], 5.0))
+        core.add_constraint(LinearConstraint("Energy", [0.01, 1.0], 6.0))
+    elif mode:
+        core.add_constraint(TimeVaryingConstraint(
+            "Noise", lambda X: X[:, 0] - 80, lambda t: 1.0 - 0.0125 * t, vectorized=True,
+        ))
+        core.add_constraint(TimeVaryingConstraint(
+            "Mass", lambda X: X[:, 1] - 5.0, vectorized=True,
+        ))
+        core.add_constraint(TimeVaryingConstraint(
+            "Energy", lambda X: X[:, 0] * 0.01 + X[:, 1] - 6.0, vectorized=True,
+        ))
+    else:
+        core.add_constraint(TimeVaryingConstraint(
+            "Noise", lambda x: x[0] - 80, lambda t: 1.0 - 0.0125 * t,
+        ))
+        core.add_constraint(TimeVaryingConstraint("Mass", lambda x: x[1] - 5.0))
+        core.add_constraint(TimeVaryingConstraint(
+            "Energy", lambda x: x[0] * 0.01 + x[1] - 6.0,
+        ))
+    return core
+
+
+def _space(fail_closed: bool, fulfilled: bool) -> CertifiedAdmissibleSpace:
+    space = CertifiedAdmissibleSpace(fail_closed=fail_closed)
+    space.register_gate(0, EvidenceGate("G-NOISE", "Acoustic report", "AMC-20", 6))
+    space.register_gate(2, EvidenceGate("G-ENERGY", "Energy report", "CS-23", 5))
+    if fulfilled:
+        space.fulfill_gate(0, "uri://noise")
+    space.current_time = 2.0
+    return space
+
+
+@pytest.fixture()
+def states() -> np.ndarray:
+    rng = np.random.default_rng(7)
+    return np.column_stack([rng.uniform(70, 90, 400), rng.uniform(3, 7, 400)])
+
+
+def _strip(entry: dict) -> dict:
+    return {k: v for k, v in entry.items() if k != "timestamp"}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Batch vs scalar
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestEvaluateStates:
+    """evaluate_states() is a drop-in batch form of evaluate_state()."""
+
+    @pytest.mark.parametrize("vectorized", [False, True, "compiled"])
+    @pytest.mark.parametrize("fail_closed", [False, True])
+    @pytest.mark.parametrize("fulfilled", [False, True])
+    def test_matches_scalar(self, states, vectorized, fail_closed, fulfilled) -> None:
+        scalar_core, batch_core = _core(False), _core(vectorized)
+        scalar, batch = _space(fail_closed, fulfilled), _space(fail_closed, fulfilled)
+
+        expected = [scalar.evaluate_state(x, scalar_core) for x in states]
+        result = batch.evaluate_states(states, batch_core)
+
+        assert result.statuses == [status for status, _ in expected]
+        assert [result.reason(i) for i in range(len(result))] == [r for _, r in expected]
+        assert [_strip(e) for e in batch.audit_log] == [_strip(e) for e in scalar.audit_log]
+
+    @staticmethod
+    def _wide_core(m: int) -> InvariantCore:
+        core = InvariantCore("WIDE", "EASA", f"{m} constraints")
+        for k in range(m):
+            core.add_constraint(TimeVaryingConstraint(f"C{k}", lambda x, k=k: x[0] - 70 - k))
+        return core
+
+    # 8: bincount grouping; 20: sort (2^m table >> batch); 24: row patterns
+    @pytest.mark.parametrize("m", [8, 20, 24])
+    def test_many_constraints(self, states, m) -> None:
+        core = self._wide_core(m)
+        scalar, batch = CertifiedAdmissibleSpace(), CertifiedAdmissibleSpace()
+        batch.register_gate(3, EvidenceGate("G3", "d", "s", 1))
+        scalar.register_gate(3, EvidenceGate("G3", "d", "s", 1))
+        result = batch.evaluate_states(states, core)
+        assert [result.reason(i) for i in range(len(states))] == [
+            scalar.evaluate_state(x, core)[1] for x in states
+        ]
+
+    @pytest.mark.parametrize("m", [3, 24])
+    def test_empty_batch(self, m) -> None:
+        space = CertifiedAdmissibleSpace()
+        result = space.evaluate_states(np.empty((0, 2)), self._wide_core(m))
+        assert len(result) == 0 and result.statuses == []
+        assert sum(result.counts().values()) == 0
+        assert space.audit_log == []
+
+    @pytest.mark.parametrize("mode", [True, "compiled"])
+    def test_time_vector(self, states, mode) -> None:
+        core = _core(mode)
+        times = np.linspace(0.0, 10.0, len(states))
+        batch = _space(True, False)
+        result = batch.evaluate_states(states, core, times=times)
+
+        scalar = _space(True, False)
+        for i, (x, t) in enumerate(zip(states, times)):
+            scalar.current_time = t
+            status, _ = scalar.evaluate_state(x, _core(False))
+            assert result.status(i) is status
+        assert batch.audit_log[-1]["simulation_time"] == 10.0
+
+    def test_counts_and_mask(self, states) -> None:
+        result = _space(True, False).evaluate_states(states, _core(True), log=False)
+        counts = result.counts()
+        assert sum(counts.values()) == len(states)
+        pending = result.mask(AdmissibilityStatus.CONDITIONAL_PENDING)
+        assert pending.sum() == counts["CONDITIONAL_PENDING"]
+
+    def test_no_log(self, states) -> None:
+        space = _space(True, False)
+        space.evaluate_states(states, _core(True), log=False)
+        assert space.audit_log == []
+
+    def test_shape_checks(self) -> None:
+        space = _space(True, False)
+        with pytest.raises(ValueError):
+            space.evaluate_states(np.zeros((2, 2, 2)), _core(True))
+        with pytest.raises(ValueError):
+            space.evaluate_states(np.zeros((3, 2)), _core(True), times=np.zeros(2))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Compiled constraint forms
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestCompiledConstraints:
+    """Built-in forms agree with their scalar definition and fuse correctly."""
+
+    @pytest.fixture()
+    def cloud(self) -> np.ndarray:
+        return np.random.default_rng(11).normal(size=(300, 3))
+
+    def _check(self, constraint, cloud, t=0.0) -> None:
+        core = InvariantCore("C", "EASA", "compiled")
+        core.add_constraint(constraint)
+        fused = core.compiled().evaluate(cloud, t)[:, 0]
+        ts = np.broadcast_to(t, len(cloud))
+        scalar = [constraint.evaluate(x, ti) for x, ti in zip(cloud, ts)]
+        np.testing.assert_allclose(fused, scalar)
+        np.testing.assert_allclose(constraint.evaluate_batch(cloud, t), scalar)
+
+    def test_linear(self, cloud) -> None:
+        c = LinearConstraint("L", [1.0, -2.0, 0.5], 0.3)
+        self._check(c, cloud)
+        assert c.evaluate(np.array([1.0, 0.0, 0.0]), 0.0) == pytest.approx(0.7)
+
+    def test_box(self, cloud) -> None:
+        c = BoxConstraint("B", [-1.0, None, -0.5], [1.0, 0.2, np.inf])
+        self._check(c, cloud)
+        assert c.evaluate(np.zeros(3), 0.0) == pytest.approx(-0.2)
+        assert c.evaluate(np.array([1.5, 0.0, 0.0]), 0.0) == pytest.approx(0.5)
+
+    def test_quadratic(self, cloud) -> None:
+        c = QuadraticConstraint("Q", np.eye(3), a=[0.0, 1.0, 0.0], c=-1.0)
+        self._check(c, cloud)
+        assert c.evaluate(np.array([1.0, 1.0, 0.0]), 0.0) == pytest.approx(2.0)
+
+    def test_piecewise_schedule(self, cloud) -> None:
+        schedule = PiecewiseLinearSchedule([0.0, 10.0, 20.0], [1.0, 0.5, 0.5])
+        assert schedule(5.0) == pytest.approx(0.75)
+        assert schedule(-3.0) == 1.0 and schedule(99.0) == 0.5
+        c = LinearConstraint("L", [1.0, 0.0, 0.0], 0.1, schedule=schedule)
+        self._check(c, cloud, t=np.linspace(-5, 25, len(cloud)))
+        self._check(c, cloud, t=5.0)
+
+    def test_mixed_core(self, cloud) -> None:
+        schedule = PiecewiseLinearSchedule([0.0, 1.0], [1.0, 2.0])
+        constraints = [
+            BoxConstraint("Box", [-1, -1, -1], [1, 1, 1], schedule=schedule),
+            LinearConstraint("Lin", [0.0, 0.0, 1.0], 0.5, schedule=schedule),
+            TimeVaryingConstraint("Lambda", lambda x: x[0] * x[1]),
+            QuadraticConstraint("Ball", np.eye(3), c=-2.0),
+        ]
+        core = InvariantCore("MIX", "EASA", "fused")
+        for c in constraints:
+            core.add_constraint(c)
+        t = np.linspace(0, 1, len(cloud))
+        values = core.compiled().evaluate(cloud, t)
+        for j, c in enumerate(constraints):
+            np.testing.assert_allclose(
+                values[:, j], [c.evaluate(x, ti) for x, ti in zip(cloud, t)]
+            )
+
+    def test_plan_rebuilt_on_change(self) -> None:
+        core = _core("compiled")
+        plan = core.compiled()
+        assert core.compiled() is plan
+        core.add_constraint(LinearConstraint("Extra", [1.0, 1.0], 0.0))
+        assert core.compiled() is not plan
+        assert core.compiled().m == 4
+
+    def test_dimension_mismatch(self) -> None:
+        with pytest.raises(ValueError):
+            _space(True, False).evaluate_states(np.zeros((4, 3)), _core("compiled"))
+
+    def test_invalid_forms(self) -> None:
+        with pytest.raises(ValueError):
+            BoxConstraint("B", [1.0], [0.0])
+        with pytest.raises(ValueError):
+            BoxConstraint("B", [None], [None])
+        with pytest.raises(ValueError):
+            QuadraticConstraint("Q", np.ones((2, 3)))
+        with pytest.raises(ValueError):
+            PiecewiseLinearSchedule([1.0, 0.0], [1.0, 1.0])
+
+
+class TestFallback:
+    """Scalar lambdas keep working through a counted, warned fallback."""
+
+    def test_warns_once_and_counts(self, states) -> None:
+        core = _core(False)
+        space = _space(True, False)
+        with pytest.warns(SlowConstraintWarning) as record:
+            space.evaluate_states(states, core, log=False)
+            space.evaluate_states(states[:10], core, log=False)
+        assert len(record) == 3
+        assert fallback_report(core) == {"Noise": 410, "Mass": 410, "Energy": 410}
+
+    def test_compiled_core_has_no_fallback(self, states) -> None:
+        core = _core("compiled")
+        _space(True, False).evaluate_states(states, core, log=False)
+        assert fallback_report(core) == {}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Audit store
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestAuditStore:
+    """Columnar audit log: bounded chunks, exports, plotter compatibility."""
+
+    def _filled(self, states, **kwargs) -> CertifiedAdmissibleSpace:
+        space = _space(True, False)
+        space.audit_log = AuditStore(**kwargs)
+        core = _core("compiled")
+        for x in states[:50]:
+            space.evaluate_state(x, core)
+        space.evaluate_states(states[50:], core, times=np.linspace(0, 5, len(states) - 50))
+        return space
+
+    def test_chunks_match_single_buffer(self, states, tmp_path) -> None:
+        reference = list(self._filled(states).audit_log)
+        in_memory = self._filled(states, chunk_rows=64).audit_log
+        spilled = self._filled(states, chunk_rows=64, spill_dir=str(tmp_path)).audit_log
+        assert len(spilled) == len(states)
+        assert len(list(tmp_path.glob("audit-*/*.npz"))) == len(states) // 64
+        for store in (in_memory, spilled):
+            assert [_strip(e) for e in store] == [_strip(e) for e in reference]
+            assert _strip(store[-1]) == _strip(reference[-1])
+            assert _strip(store[70]) == _strip(reference[70])
+        # Only the open buffer is held in memory once chunks are spilled.
+        assert len(spilled._buf["timestamp"]) <= 64
+
+    def test_shared_spill_dir(self, tmp_path) -> None:
+        a = AuditStore(chunk_rows=2, spill_dir=str(tmp_path))
+        b = AuditStore(chunk_rows=2, spill_dir=str(tmp_path))
+        for k in range(5):
+            a.append("A", k, np.array([float(k)]), AdmissibilityStatus.FULLY_ADMISSIBLE, "ok", [])
+            b.append("B", k, np.array([9.0]), AdmissibilityStatus.INADMISSIBLE, "bad", ["X"])
+        assert [(e["system_id"], e["state_vector"]) for e in a] == [("A", [float(k)]) for k in range(5)]
+        assert {e["system_id"] for e in b} == {"B"}
+        b.clear()
+        assert len(b) == 0
+        assert [e["state_vector"] for e in a] == [[float(k)] for k in range(5)]
+        assert len(list(tmp_path.glob("audit-*/*.npz"))) == 2
+        for k in range(3):  # a cleared store is reusable
+            b.append("C", k, np.array([1.0, 2.0]), AdmissibilityStatus.FULLY_ADMISSIBLE, "ok", [])
+        assert [e["system_id"] for e in b] == ["C"] * 3 and b.systems.values == ["C"]
+
+    @pytest.mark.parametrize("suffix", [".json", ".jsonl", ".npz"])
+    def test_export_roundtrip(self, states, tmp_path, suffix) -> None:
+        from plot_dynamics import DynamicsPlotter
+
+        space = self._filled(states, chunk_rows=100)
+        path = tmp_path / f"audit{suffix}"
+        space.export_audit_log(str(path))
+        assert DynamicsPlotter(str(path)).data == list(space.audit_log)
+
+    def test_mixed_dimensions_npz(self, tmp_path) -> None:
+        store = AuditStore()
+        store.append("A", 0.0, np.array([1.0]), AdmissibilityStatus.FULLY_ADMISSIBLE, "ok", [])
+        store.append("B", 1.0, np.array([1.0, 2.0]), AdmissibilityStatus.INADMISSIBLE, "bad", ["C1"])
+        store.append("B", 2.0, np.array([3.0, 4.0]), AdmissibilityStatus.INADMISSIBLE, "bad", ["C1"])
+        path = str(tmp_path / "mixed.npz")
+        store.export(path)
+        loaded = AuditStore.load(path)
+        assert list(loaded) == list(store)
+        assert loaded[1]["state_vector"] == [1.0, 2.0]
+        assert loaded.reasons.values == ["ok", "bad"]
+
+    def test_load_rejects_foreign_npz(self, tmp_path) -> None:
+        path = str(tmp_path / "other.npz")
+        np.savez(path, x=np.zeros(3))
+        with pytest.raises(ValueError):
+            AuditStore.load(path)
+
+    def test_step_marks_applied(self) -> None:
+        core = _core(False)
+        system = System(core)
+        system.set_state(np.array([79.0, 4.0]))
+        space = CertifiedAdmissibleSpace()
+        dynamics = VoluntadDynamics(lambda x: np.array([1.0, 0.0]), space)
+        dynamics.step(system, step_size=0.5)
+        dynamics.step(system, step_size=5.0)
+        assert [e["applied"] for e in space.audit_log] == [True, False]
+        assert len(space.audit_log) == 2
+        json.dumps(space.audit_log[:])
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Ensemble dynamics
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestEnsembleDynamics:
+    """K stacked trajectories == K VoluntadDynamics loops."""
+
+    @staticmethod
+    def _gradient(X: np.ndarray) -> np.ndarray:
+        return np.column_stack([np.ones(len(X)), 0.1 * np.sin(X[:, 0])])
+
+    def _loop(self, initial: np.ndarray, steps: int):
+        space = _space(False, True)
+        core = _core("compiled")
+        systems = []
+        for x in initial:
+            system = System(core)
+            system.set_state(x.copy())
+            systems.append(system)
+        dynamics = VoluntadDynamics(lambda x: self._gradient(x[np.newaxis])[0], space)
+        statuses = []
+        for _ in range(steps):
+            space.step_time(0.5)
+            statuses.append([dynamics.step(s, step_size=0.4)[1] for s in systems])
+        return space, np.array([s.state for s in systems]), statuses
+
+    @pytest.fixture()
+    def initial(self) -> np.ndarray:
+        rng = np.random.default_rng(3)
+        return np.column_stack([rng.uniform(74, 82, 60), rng.uniform(3, 6, 60)])
+
+    def test_matches_loop(self, initial) -> None:
+        loop_space, loop_final, loop_statuses = self._loop(initial, 12)
+
+        space = _space(False, True)
+        ensemble = EnsembleDynamics(self._gradient, space, _core("compiled"))
+        run = ensemble.run(initial, 12, step_size=0.4, dt=0.5, log=True)
+
+        np.testing.assert_array_equal(run.final_states, loop_final)
+        assert [[run.status(s, k) for k in range(len(initial))] for s in range(12)] == loop_statuses
+        assert run.times.tolist() == [2.0 + 0.5 * (s + 1) for s in range(12)]
+        assert [_strip(e) for e in space.audit_log] == [_strip(e) for e in loop_space.audit_log]
+        assert run.applied.sum() == run.counts()["FULLY_ADMISSIBLE"]
+
+    def test_states_history(self, initial) -> None:
+        ensemble = EnsembleDynamics(self._gradient, _space(False, True), _core("compiled"))
+        run = ensemble.run(initial, 5, dt=0.5)
+        assert run.states.shape == (6,) + initial.shape
+        np.testing.assert_array_equal(run.states[0], initial)
+        moved = np.any(run.states[1:] != run.states[:-1], axis=2)
+        np.testing.assert_array_equal(moved, run.applied)
+
+        final_only = EnsembleDynamics(self._gradient, _space(False, True), _core("compiled"))
+        run2 = final_only.run(initial, 5, dt=0.5, record_states=False)
+        np.testing.assert_array_equal(run2.final_states, run.final_states)
+
+    def test_scalar_gradient(self, initial) -> None:
+        vec = EnsembleDynamics(self._gradient, _space(False, True), _core("compiled"))
+        row = EnsembleDynamics(lambda x: self._gradient(x[np.newaxis])[0],
+                               _space(False, True), _core("compiled"), vectorized=False)
+        np.testing.assert_array_equal(
+            vec.run(initial, 4).final_states, row.run(initial, 4).final_states
+        )
+
+    def test_gradient_shape_check(self, initial) -> None:
+        ensemble = EnsembleDynamics(lambda X: X[:, :1], _space(False, True), _core("compiled"))
+        with pytest.raises(ValueError):
+            ensemble.run(initial, 1)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Evidence gate registry
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestGateRegistry:
+    """Gates keyed by name or position, linked many-to-many, with events."""
+
+    @staticmethod
+    def _gate(gate_id: str) -> EvidenceGate:
+        return EvidenceGate(gate_id, "report", "CS-23", 5)
+
+    def test_name_keys_match_positions(self, states) -> None:
+        by_index, by_name = _space(False, True), CertifiedAdmissibleSpace(fail_closed=False)
+        by_name.register_gate("Noise", self._gate("G-NOISE"))
+        by_name.register_gate("Energy", self._gate("G-ENERGY"))
+        by_name.fulfill_gate("Noise", "uri://noise")
+        by_name.current_time = 2.0
+        a = by_index.evaluate_states(states, _core("compiled"))
+        b = by_name.evaluate_states(states, _core("compiled"))
+        np.testing.assert_array_equal(a.codes, b.codes)
+        assert [a.reason(i) for i in range(len(a))] == [b.reason(i) for i in range(len(b))]
+
+    def test_many_to_many(self) -> None:
+        core = _core("compiled")
+        space = CertifiedAdmissibleSpace(fail_closed=False)
+        space.register_gate(["Noise", "Mass"], self._gate("G-SHARED"))
+        space.register_gate("Noise", self._gate("G-NOISE"))
+        masks = space.evidence_gates.masks(core)
+        assert masks.gated.tolist() == [True, True, False]
+        assert [g.gate_id for g in masks.gates[0]] == ["G-SHARED", "G-NOISE"]
+
+        x = np.array([90.0, 5.05])  # violates Noise and Mass, not Energy
+        assert space.evaluate_state(x, core)[0] == AdmissibilityStatus.CONDITIONAL_PENDING
+        space.evidence_gates.fulfill("G-SHARED", "uri://shared")
+        # Mass is cleared; Noise still waits for its second gate.
+        assert space.evidence_gates.masks(core).passed.tolist() == [False, True, False]
+        assert space.evaluate_state(x, core)[0] == AdmissibilityStatus.CONDITIONAL_PENDING
+        space.fulfill_gate("Noise", "uri://noise")
+        assert space.evaluate_state(x, core)[0] == AdmissibilityStatus.FULLY_ADMISSIBLE
+
+    def test_index_and_name_keys_agree(self) -> None:
+        core = _core("compiled")
+        space = CertifiedAdmissibleSpace(fail_closed=False)
+        by_name = space.register_gate("Noise", self._gate("G-NAME"))
+        by_index = space.register_gate(0, self._gate("G-INDEX"))
+        registry = space.evidence_gates
+        assert registry.gates_for(0) == [by_index]  # no core seen yet: literal keys
+        ids = [{g.gate_id for g in registry.gates_for(key, core)} for key in (0, "Noise")]
+        assert ids == [{"G-NAME", "G-INDEX"}] * 2
+        space.fulfill_gate(0, "uri://noise", core=core)
+        assert by_name.is_fulfilled and by_index.is_fulfilled
+        assert registry.masks(core).passed.tolist() == [True, False, False]
+
+        other = CertifiedAdmissibleSpace(fail_closed=False)
+        gate = other.register_gate("Mass", self._gate("G-MASS"))
+        other.evaluate_state(np.array([70.0, 4.0]), core)
+        other.fulfill_gate(1, "uri://mass")  # resolved against the evaluated core
+        assert gate.is_fulfilled
+
+    def test_index_lookup_deprecated(self) -> None:
+        space = _space(False, False)
+        with pytest.warns(DeprecationWarning, match="gates_for"):
+            assert space.evidence_gates[0] == space.evidence_gates.gates_for(0)
+        assert space.evidence_gates["G-NOISE"].gate_id == "G-NOISE"
+
+    def test_events(self) -> None:
+        registry = EvidenceGateRegistry()
+        events = []
+        unsubscribe = registry.subscribe(events.append)
+        gate = registry.register(self._gate("G1"), 0, "Mass")
+        registry.register(self._gate("G1"), "Mass", 2)  # same id: links only the new key
+        gate.fulfill("uri://direct")
+        unsubscribe()
+        registry.fulfill("G1", "uri://again")
+        assert [(e.kind, e.constraints) for e in events] == [
+            ("linked", (0, "Mass")), ("linked", (2,)), ("fulfilled", (0, "Mass", 2)),
+        ]
+        assert [e.version for e in events] == [1, 2, 3] and registry.version == 4
+        assert registry.constraints_for("G1") == [0, "Mass", 2]
+
+    def test_registration_is_not_gate_state(self) -> None:
+        gate, twin = self._gate("G1"), self._gate("G1")
+        EvidenceGateRegistry().register(gate, 0)
+        assert gate == twin and repr(gate) == repr(twin)
+        assert gate.to_dict() == twin.to_dict() == {
+            "gate_id": "G1", "description": "report", "standard_ref": "CS-23",
+            "required_trl": 5, "is_fulfilled": False, "evidence_uri": None, "timestamp": None,
+        }
+
+    def test_masks_cached_until_change(self) -> None:
+        core = _core("compiled")
+        registry = EvidenceGateRegistry()
+        registry.register(self._gate("G1"), "Energy")
+        first = registry.masks(core)
+        assert registry.masks(core) is first
+        registry.fulfill("G1", "uri://energy")
+        assert registry.masks(core) is not first
+        assert registry.masks(core).passed.tolist() == [False, False, True]
+        np.testing.assert_array_equal(
+            registry.masks(core).blocking(np.array([[True, False, True]])), [[True, False, False]]
+        )
+
+    def test_errors_and_export(self, tmp_path) -> None:
+        space = _space(False, True)
+        with pytest.raises(KeyError):
+            space.fulfill_gate("Mass", "uri://mass")
+        with pytest.raises(KeyError):
+            space.evidence_gates.fulfill("G-MISSING", "uri://x")
+        path = tmp_path / "gates.json"
+        space.export_evidence_gates(str(path))
+        exported = json.loads(path.read_text())
+        assert exported["G-NOISE"]["is_fulfilled"] and exported["G-NOISE"]["constraints"] == [0]
+        assert exported["G-ENERGY"]["constraints"] == [2]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Adaptive dynamics
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestAdaptiveDynamics:
+    """Boundary crossings are located, recorded and cheaper than fixed steps."""
+
+    @staticmethod
+    def _setup(*constraints, start=0.0):
+        core = InvariantCore("TEST-SYS", "EASA", "Adaptive")
+        for c in constraints:
+            core.add_constraint(c)
+        space = CertifiedAdmissibleSpace()
+        system = System(core)
+        system.set_state(np.array([start]))
+        return space, system
+
+    def test_locates_static_boundary(self) -> None:
+        space, system = self._setup(LinearConstraint("Noise", [1.0], 10.0))
+        dynamics = AdaptiveVoluntadDynamics(lambda x: np.array([2.0]), space, step_size=0.3)
+        events = dynamics.run(system, 20.0)
+        assert len(events) == 1
+        event = events[0]
+        assert event.constraints == ["Noise"]
+        assert event.time == pytest.approx(5.0, abs=1e-8)
+        assert event.state[0] == pytest.approx(10.0, abs=1e-8)
+        assert event.state[0] <= 10.0
+        assert system.state[0] == event.state[0]
+        assert space.current_time == pytest.approx(20.0)
+        assert all(e["status"] == "FULLY_ADMISSIBLE" for e in space.audit_log if e["applied"])
+
+    def test_plot_marks_events(self, tmp_path) -> None:
+        from plot_dynamics import DynamicsPlotter
+
+        space, system = self._setup(LinearConstraint("Noise", [1.0], 10.0))
+        dynamics = AdaptiveVoluntadDynamics(lambda x: np.array([2.0]), space, step_size=0.3)
+        dynamics.run(system, 20.0)
+        space.export_audit_log(str(tmp_path / "audit.jsonl"))
+        events = json.loads(json.dumps([e.as_dict() for e in dynamics.events]))
+        out = tmp_path / "trajectory.png"
+        DynamicsPlotter(str(tmp_path / "audit.jsonl")).plot_state_trajectory(
+            boundary_events=events, output_path=str(out))
+        assert out.stat().st_size > 0
+
+    def test_moving_boundary_time(self) -> None:
+        # Limit 12 - t closes in on x = t: they meet at t = 6.
+        limit = TimeVaryingConstraint("Shrinking", lambda x: 1.0, lambda t: 0.0)
+        limit.evaluate = lambda x, t: float(x[0] - (12.0 - t))
+        space, system = self._setup(limit)
+        dynamics = AdaptiveVoluntadDynamics(lambda x: np.array([1.0]), space, step_size=0.5)
+        events = dynamics.run(system, 10.0)
+        assert events[0].time == pytest.approx(6.0, abs=1e-8)
+        assert events[0].state[0] == pytest.approx(6.0, abs=1e-8)
+
+    def test_fewer_evaluations_than_fixed_steps(self) -> None:
+        space, system = self._setup(LinearConstraint("Noise", [1.0], 10.0))
+        dynamics = AdaptiveVoluntadDynamics(lambda x: np.array([1.0]), space, step_size=0.01)
+        dynamics.run(system, 100.0)
+
+        fixed_space, fixed_system = self._setup(LinearConstraint("Noise", [1.0], 10.0))
+        fixed = VoluntadDynamics(lambda x: np.array([1.0]), fixed_space)
+        for _ in range(10000):
+            fixed_space.step_time(0.01)
+            fixed.step(fixed_system, step_size=0.01)
+        assert dynamics.evaluations < 100
+        assert abs(system.state[0] - 10.0) < abs(fixed_system.state[0] - 10.0)
+
+    def test_holds_on_boundary(self) -> None:
+        space, system = self._setup(LinearConstraint("Noise", [1.0], 10.0), start=10.0)
+        dynamics = AdaptiveVoluntadDynamics(lambda x: np.array([1.0]), space, step_size=0.5)
+        state, status = dynamics.step(system)
+        assert status == AdmissibilityStatus.INADMISSIBLE
+        assert state[0] == 10.0 and not dynamics.events
+        assert space.audit_log[-1]["applied"] is False
+        assert space.current_time == 0.5
+
+    def test_interior_violation_is_avoided(self) -> None:
+        # The Noise crossing at x = 5 lies inside the forbidden band 4.5 < x < 5.5.
+        band = TimeVaryingConstraint("Band", lambda x: 0.25 - (x[0] - 5.0) ** 2)
+        space, system = self._setup(LinearConstraint("Noise", [1.0], 5.0), band)
+        dynamics = AdaptiveVoluntadDynamics(lambda x: np.array([1.0]), space, step_size=8.0)
+        dynamics.step(system)
+        assert system.state[0] <= 4.5
+        assert space.audit_log[-1]["status"] == "FULLY_ADMISSIBLE"
+
+    def test_passed_gate_does_not_block(self) -> None:
+        space, system = self._setup(LinearConstraint("Noise", [1.0], 10.0))
+        space.register_gate(0, EvidenceGate("G-NOISE", "Acoustic report", "AMC-20", 6))
+        space.fulfill_gate(0, "s3://evidence/noise.pdf")
+        dynamics = AdaptiveVoluntadDynamics(lambda x: np.array([1.0]), space, step_size=4.0)
+        dynamics.run(system, 12.0)
+        assert not dynamics.events and system.state[0] == pytest.approx(12.0)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Admissibility cache
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestAdmissibilityCache:
+    """Memoized evaluate_state() never disagrees with the uncached space."""
+
+    @staticmethod
+    def _counting_core(time_invariant: bool):
+        calls = []
+
+        def noise(x):
+            calls.append(1)
+            return x[0] - 80
+
+        core = InvariantCore("TEST-SYS", "EASA", "Cache")
+        evolution = None if time_invariant else (lambda t: 1.0 - 0.0125 * t)
+        core.add_constraint(TimeVaryingConstraint("Noise", noise, evolution))
+        core.add_constraint(LinearConstraint("Mass", [0.0, 1.0], 5.0))
+        return core, calls
+
+    def test_revisits_match_uncached(self, states) -> None:
+        revisits = states[np.random.default_rng(0).integers(0, 40, 400)]
+        core = _core("compiled")
+        plain = _space(False, False)
+        cached = _space(False, False)
+        cached.cache = AdmissibilityCache()
+        for k, x in enumerate(revisits):
+            if k == 220:
+                plain.fulfill_gate(0, "uri://noise")
+                cached.fulfill_gate(0, "uri://noise")
+            if k % 50 == 0:
+                plain.step_time(1.0)
+                cached.step_time(1.0)
+            assert cached.evaluate_state(x, core) == plain.evaluate_state(x, core)
+        metrics = cached.cache.metrics()
+        assert metrics["hit_rate"] > 0.4 and metrics["reclassified"] > 0
+        assert [_strip(e) for e in cached.audit_log] == [_strip(e) for e in plain.audit_log]
+
+    def test_shared_cache_across_spaces(self, states) -> None:
+        core = _core("compiled")
+        variants = [lambda: _space(True, True), lambda: _space(True, False),
+                    lambda: _space(False, False), lambda: CertifiedAdmissibleSpace(fail_closed=True),
+                    lambda: CertifiedAdmissibleSpace(fail_closed=False)]
+        cache = AdmissibilityCache()
+        pairs = []
+        for make in variants:
+            plain, cached = make(), make()
+            cached.current_time = plain.current_time
+            cached.cache = cache
+            pairs.append((plain, cached))
+        worst = np.array([[100.0, 9.0]])
+        for x in np.concatenate([worst, states[:40], worst]):
+            for plain, cached in pairs:
+                assert cached.evaluate_state(x, core) == plain.evaluate_state(x, core)
+        assert cache.hits > 0
+
+    def test_time_invariant_entries_survive_step_time(self) -> None:
+        core, calls = self._counting_core(time_invariant=True)
+        space = CertifiedAdmissibleSpace(cache=AdmissibilityCache())
+        for _ in range(5):
+            space.evaluate_state(np.array([85.0, 4.0]), core)
+            space.step_time(1.0)
+        assert len(calls) == 1 and space.cache.hits == 4
+
+    def test_time_varying_entries_expire(self) -> None:
+        core, calls = self._counting_core(time_invariant=False)
+        space = CertifiedAdmissibleSpace(cache=AdmissibilityCache())
+        for _ in range(3):
+            space.evaluate_state(np.array([85.0, 4.0]), core)
+            space.evaluate_state(np.array([85.0, 4.0]), core)
+            space.step_time(1.0)
+        assert len(calls) == 3 and space.cache.expired == 3 and len(space.cache) == 0
+
+    def test_time_bucket(self) -> None:
+        core, calls = self._counting_core(time_invariant=False)
+        space = CertifiedAdmissibleSpace(cache=AdmissibilityCache(time_bucket=1.0))
+        for _ in range(8):
+            space.evaluate_state(np.array([85.0, 4.0]), core)
+            space.step_time(0.25)
+        assert len(calls) == 2
+
+    def test_quantization_and_lru(self) -> None:
+        core, calls = self._counting_core(time_invariant=True)
+        space = CertifiedAdmissibleSpace(cache=AdmissibilityCache(maxsize=2, tolerance=1e-3))
+        space.evaluate_state(np.array([85.0, 4.0]), core)
+        space.evaluate_state(np.array([85.0001, 4.0]), core)
+        assert len(calls) == 1
+        space.evaluate_state(np.array([86.0, 4.0]), core)
+        space.evaluate_state(np.array([87.0, 4.0]), core)
+        space.evaluate_state(np.array([85.0, 4.0]), core)
+        assert len(calls) == 4 and space.cache.evictions == 2
+
+    def test_export_metrics(self, tmp_path) -> None:
+        core, _ = self._counting_core(time_invariant=True)
+        space = CertifiedAdmissibleSpace(cache=AdmissibilityCache())
+        space.evaluate_state(np.array([85.0, 4.0]), core)
+        space.evaluate_state(np.array([85.0, 4.0]), core)
+        path = tmp_path / "cache.json"
+        space.export_cache_metrics(str(path))
+        assert json.loads(path.read_text())["hit_rate"] == 0.5
@@ -0,0 +1,130 @@
+"""
+tests/test_hilbert_bell_manifold.py — Quantum State Backend Validation
+=======================================================================
+
+Validates hilbert_bell_manifold.py: the NumPy backend (dense and sparse step
+operators) and the pure-stdlib fallback evolve states exactly like the
+original per-pair Euler loop, pick up coupling changes made after the
+evolver was built, and the fallback is selected when NumPy is absent.
+
+Run with:  python -m pytest tests/test_hilbert_bell_manifold.py -v
+"""
+
+from __future__ import annotations
+
+import cmath
+import random
+
+import numpy as np
+import pytest
+
+import hilbert_bell_manifold as hbm
+from hilbert_bell_manifold import (
+    BasisState,
+    CouplingPair,
+    EntanglementMatrix,
+    HamiltonianEvolver,
+    HilbertBellManifold,
+    QuantumState,
+)
+
+
+def _reference_step(amps: list[complex], matrix: list[list[float]], intent: list[float],
+                    dt: float) -> list[complex]:
+    """The original double loop over EntanglementMatrix.get(), renormalised."""
+    new = []
+    for k in range(len(amps)):
+        coupling = sum(matrix[k][j] * amps[j] for j in range(len(amps)) if j != k)
+        new.append(amps[k] + complex(0, -dt * intent[k]) * amps[k] + complex(0, -dt) * coupling)
+    norm = sum(abs(a) ** 2 for a in new) ** 0.5
+    return [a / norm for a in new]
+
+
+def _system(dim: int, pairs: int, seed: int = 0):
+    rng = random.Random(seed)
+    entanglement = EntanglementMatrix(dim)
+    for _ in range(pairs):
+        i, j = rng.randrange(dim), rng.randrange(dim)
+        entanglement.set_coupling(CouplingPair(i, j, rng.uniform(-1, 1)))
+    intent = [rng.uniform(-2, 2) for _ in range(dim)]
+    amps = [cmath.rect(rng.uniform(0.1, 1), rng.uniform(0, 6.28)) for _ in range(dim)]
+    basis = [BasisState(k, f"S{k + 1}") for k in range(dim)]
+    return entanglement, intent, amps, basis
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Evolution
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestBackends:
+    """All backends reproduce the original evolution."""
+
+    @pytest.mark.parametrize("backend,sparse", [("numpy", False), ("numpy", True), ("python", None)])
+    def test_matches_reference(self, backend, sparse) -> None:
+        entanglement, intent, amps, basis = _system(12, 20)
+        state = QuantumState(amps, basis, backend=backend)
+        evolver = HamiltonianEvolver(entanglement, intent, dt=0.01, sparse=sparse)
+        expected = state.amplitudes
+        for _ in range(50):
+            evolver.evolve(state)
+            expected = _reference_step(expected, entanglement.matrix, intent, 0.01)
+        np.testing.assert_allclose(state.amplitudes, expected, rtol=0, atol=1e-12)
+        assert sum(state.probabilities) == pytest.approx(1.0)
+
+    def test_sparse_large_basis(self) -> None:
+        entanglement, intent, amps, basis = _system(300, 150, seed=3)
+        states = {b: QuantumState(amps, basis, backend=b) for b in ("numpy", "python")}
+        evolver = HamiltonianEvolver(entanglement, intent, dt=0.05)
+        for state in states.values():
+            for _ in range(5):
+                evolver.evolve(state)
+        np.testing.assert_allclose(states["numpy"].vector, states["python"].vector, atol=1e-12)
+
+    def test_sub_basis_and_coupling_updates(self) -> None:
+        entanglement, intent, amps, basis = _system(12, 10)
+        state = QuantumState(amps[:5], basis[:5])
+        evolver = HamiltonianEvolver(entanglement, intent, dt=0.02)
+        expected = state.amplitudes
+        evolver.evolve(state)
+        expected = _reference_step(expected, entanglement.matrix, intent, 0.02)
+        entanglement.set_coupling(CouplingPair(0, 4, 3.0))
+        evolver.evolve(state)
+        expected = _reference_step(expected, entanglement.matrix, intent, 0.02)
+        np.testing.assert_allclose(state.amplitudes, expected, rtol=0, atol=1e-12)
+        with pytest.raises(ValueError, match="exceeds"):
+            HamiltonianEvolver(EntanglementMatrix(3)).evolve(state)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# State and backend selection
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestQuantumState:
+    """Amplitude storage and the stdlib fallback."""
+
+    def test_numpy_storage(self) -> None:
+        state = QuantumState([3, 4j], [BasisState(0, "a"), BasisState(1, "b")])
+        assert state.backend == "numpy"
+        assert state.vector.dtype == np.complex128
+        assert not state.vector.flags.writeable
+        np.testing.assert_allclose(state.amplitudes, [0.6, 0.8j])
+        assert state.probabilities == pytest.approx([0.36, 0.64])
+        with pytest.raises(ValueError, match="Zero-norm"):
+            state.set_amplitudes([0, 0])
+        with pytest.raises(ValueError, match="Unknown backend"):
+            QuantumState([1], [BasisState(0, "a")], backend="torch")
+
+    def test_fallback_without_numpy(self, monkeypatch) -> None:
+        monkeypatch.setattr(hbm, "np", None)
+        manifold = HilbertBellManifold()
+        for k in range(3):
+            manifold.add_basis_state(k, f"S{k + 1}")
+        manifold.set_coupling(CouplingPair(0, 1, 0.5))
+        manifold.initialise_state()
+        manifold.set_evolver([1.0] + [0.0] * 11, dt=0.1)
+        manifold.evolve(steps=3)
+        assert manifold.state.backend == "python"
+        assert isinstance(manifold.state.vector, tuple)
+        assert sum(manifold.state.probabilities) == pytest.approx(1.0)
+        with pytest.raises(RuntimeError, match="requires NumPy"):
+            QuantumState([1], [BasisState(0, "a")], backend="numpy")
@@ -0,0 +1,142 @@
+"""
+tests/test_nameset.py — Interned Name Bitset Validation
+========================================================
+
+Validates ampel360.nameset: NameSet behaves like a read-only frozenset of
+names and its operators never intern caller input; resolve_profile() returns
+mutable sets while shared (cached) profiles carry bitsets.
+
+Run with:  python -m pytest tests/test_nameset.py -v
+"""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from ampel360.nameset import RULESET_NAMES, TEMPLATE_NAMES, NameSet, NameTable
+from ampel360.resolver import (
+    FunctionalMission,
+    OperationalEnvironment,
+    PayloadClassification,
+    _merge_constraint,
+    resolve_profile,
+    resolve_profile_cached,
+)
+
+
+@pytest.fixture()
+def table() -> NameTable:
+    return NameTable("test")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# NameSet semantics
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestNameSet:
+    """NameSet matches frozenset semantics."""
+
+    def test_membership_and_len(self, table: NameTable) -> None:
+        s = table.set(["A", "B", "A"])
+        assert "A" in s and "C" not in s and 42 not in s
+        assert len(s) == 2
+        assert sorted(s) == ["A", "B"]
+
+    def test_operators_match_frozenset(self, table: NameTable) -> None:
+        a, b = {"A", "B", "C"}, {"B", "C", "D"}
+        na, nb = table.set(a), table.set(b)
+        assert na | nb == frozenset(a | b)
+        assert na & nb == frozenset(a & b)
+        assert na - nb == frozenset(a - b)
+        assert na ^ nb == frozenset(a ^ b)
+        assert na | {"E"} == frozenset(a | {"E"})
+        assert {"E"} | na == frozenset(a | {"E"})
+        assert {"A", "X"} - na == {"X"}
+
+    def test_comparisons(self, table: NameTable) -> None:
+        small, big = table.set("A"), table.set(["A", "B"])
+        assert small <= big and big >= small and small < big
+        assert not big <= small
+        assert table.set(["A", "B"]) == {"A", "B"}
+        assert {"A", "B"} == table.set(["B", "A"])
+        assert hash(table.set(["A", "B"])) == hash(frozenset({"A", "B"}))
+        assert big.isdisjoint(table.set(["C"]))
+
+    def test_operators_do_not_intern(self, table: NameTable) -> None:
+        s = table.set(["A", "B"])
+        assert s & {"A", "X"} == {"A"} and isinstance(s & {"X"}, NameSet)
+        assert s - {"A", "X"} == {"B"}
+        union = s | {"X"}
+        assert union == {"A", "B", "X"} and type(union) is frozenset
+        assert s ^ {"A", "Y"} == {"B", "Y"}
+        assert {"Z", "A"} - s == {"Z"}
+        assert s | {"A"} == s and isinstance(s | {"A"}, NameSet)
+        assert len(table) == 2
+
+    def test_immutable(self, table: NameTable) -> None:
+        s = table.set(["A"])
+        with pytest.raises(AttributeError):
+            s.add("B")  # type: ignore[attr-defined]
+
+    def test_pickle_reinterns(self) -> None:
+        s = TEMPLATE_NAMES.set(["H_PIPELINE_GATE_CHECK", "NEW_TEMPLATE_FOR_PICKLE"])
+        clone = pickle.loads(pickle.dumps(s))
+        assert clone == s and clone.table is TEMPLATE_NAMES
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Resolver integration
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestResolvedBitsets:
+    """Resolved profiles use bitsets and table-driven merges."""
+
+    def test_profile_sets(self) -> None:
+        axes = (
+            OperationalEnvironment.AIR,
+            FunctionalMission.PAX_TRANSPORT,
+            PayloadClassification.CIVIL_PUBLIC,
+            "EASA-Q100",
+        )
+        p = resolve_profile(*axes)
+        assert type(p.templates) is set and type(p.rulesets) is set
+        p.templates.add("LOCAL_TEMPLATE")
+        shared = resolve_profile_cached(*axes)
+        assert isinstance(shared.templates, NameSet) and shared.templates.table is TEMPLATE_NAMES
+        assert isinstance(shared.rulesets, NameSet) and shared.rulesets.table is RULESET_NAMES
+        assert shared.templates == p.templates - {"LOCAL_TEMPLATE"}
+        assert "LOCAL_TEMPLATE" not in TEMPLATE_NAMES._ids
+
+    def test_profile_diff(self) -> None:
+        air = resolve_profile(
+            OperationalEnvironment.AIR,
+            FunctionalMission.CARGO_ONLY,
+            PayloadClassification.CIVIL_PUBLIC,
+            "NONE",
+        )
+        space = resolve_profile(
+            OperationalEnvironment.SPACE,
+            FunctionalMission.CARGO_ONLY,
+            PayloadClassification.CIVIL_PUBLIC,
+            "NONE",
+        )
+        assert space.templates - air.templates == {
+            "CONJUNCTION_EVIDENCE_LOOP",
+            "ORBIT_REGIME_APPLICABILITY",
+            "REENTRY_SAFETY_CONSTRAINT",
+        }
+        assert air.rulesets ^ space.rulesets == (
+            (set(air.rulesets) | set(space.rulesets))
+            - (set(air.rulesets) & set(space.rulesets))
+        )
+
+    def test_merge_table(self) -> None:
+        assert _merge_constraint("risk_threshold", 1e-7, 1e-9) == 1e-9
+        assert _merge_constraint("dal_level", "C", "B") == "B"
+        assert _merge_constraint("dal_level", "?", "?") == "E"
+        assert _merge_constraint("require_authority", False, True) is True
+        assert _merge_constraint("query_relaxation", True, False) is False
+        assert _merge_constraint("disclosure_mode", "REDACTED", "FULL") == "REDACTED"
+        assert _merge_constraint("custom_key", 1, 2) == 2
@@ -0,0 +1,221 @@
+"""
+tests/test_pack_registry.py — Axis Pack Registry Validation
+============================================================
+
+Validates the data-driven pack registry (ampel360.packs): YAML and builtin
+pack documents are identical, overlays are matched by token (with a bounded
+memo), and reloads swap in new packs atomically.
+
+Run with:  python -m pytest tests/test_pack_registry.py -v
+"""
+
+from __future__ import annotations
+
+import itertools
+import shutil
+import time
+
+import pytest
+
+from ampel360 import packs as _packs
+from ampel360.packs import (
+    BUILTIN_PACK_DOCUMENTS,
+    DEFAULT_PROFILES_DIR,
+    OVERLAY_MEMO_SIZE,
+    PACK_KEYS,
+    PackError,
+    PackRegistry,
+    PackSet,
+    builtin_packs,
+    compile_pack,
+)
+from ampel360.resolver import (
+    FunctionalMission,
+    OperationalContext,
+    OperationalEnvironment,
+    PayloadClassification,
+    resolve_profile,
+)
+
+requires_yaml = pytest.mark.skipif(_packs.yaml is None, reason="PyYAML not installed")
+
+
+def _snapshot(profile) -> tuple:
+    return (
+        profile.profile_id,
+        frozenset(profile.templates),
+        frozenset(profile.rulesets),
+        tuple(sorted(profile.constraints.items())),
+        profile.disclosure_mode,
+    )
+
+
+@pytest.fixture()
+def pack_dir(tmp_path):
+    root = tmp_path / "profiles"
+    shutil.copytree(DEFAULT_PROFILES_DIR / "axis_packs", root / "axis_packs")
+    shutil.copytree(DEFAULT_PROFILES_DIR / "overlays", root / "overlays")
+    return root
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Pack compilation
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestCompilePack:
+    """Pack documents compile into typed, immutable packs."""
+
+    def test_constraints_are_typed(self) -> None:
+        pack = compile_pack({
+            "axis": "function",
+            "value": "PAX_TRANSPORT",
+            "constraints": {"human_override": "true", "dal_level": "a",
+                            "risk_threshold": "1e-9"},
+        })
+        assert dict(pack.constraints) == {
+            "human_override": True, "dal_level": "A", "risk_threshold": 1e-9,
+        }
+
+    def test_overlay_defaults_to_own_id(self) -> None:
+        pack = compile_pack({"overlay_id": "faa-part25"})
+        assert pack.axis == "overlay"
+        assert pack.match == ("FAA-PART25",)
+
+    def test_unknown_axis_rejected(self) -> None:
+        with pytest.raises(PackError):
+            compile_pack({"axis": "colour", "value": "RED"})
+
+    def test_incomplete_pack_set_rejected(self) -> None:
+        packs = [p for p in builtin_packs() if p.pack_id != "environment:SPACE"]
+        with pytest.raises(PackError, match="SPACE"):
+            PackSet(packs)
+
+    def test_duplicate_pack_rejected(self) -> None:
+        packs = builtin_packs()
+        with pytest.raises(PackError, match="Duplicate"):
+            PackSet(packs + packs[:1])
+
+    def test_overlay_memo_is_bounded(self) -> None:
+        pack_set = PackSet(builtin_packs())
+        easa = pack_set.overlay("EASA")
+        for i in range(3 * OVERLAY_MEMO_SIZE):
+            assert pack_set.overlay(f"EASA-{i}") == easa
+            pack_set.overlay("EASA")  # kept as most recently used
+        assert len(pack_set._overlay_memo) == OVERLAY_MEMO_SIZE
+        assert "EASA" in pack_set._overlay_memo
+        assert pack_set.overlay("free text") == ()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# YAML vs builtin packs
+# ──────────────────────────────────────────────────────────────────────────────
+
+@requires_yaml
+class TestPackSources:
+    """profiles/*.yaml and the builtin documents describe the same packs."""
+
+    def test_same_documents(self) -> None:
+        docs = {}
+        for path in _packs._pack_files(DEFAULT_PROFILES_DIR):
+            doc = _packs.yaml.safe_load(path.read_text(encoding="utf-8"))
+            docs[f"{path.parent.name}/{path.name}"] = {k: doc[k] for k in PACK_KEYS if k in doc}
+        assert docs == BUILTIN_PACK_DOCUMENTS
+
+    def test_same_packs(self) -> None:
+        def key(packs):
+            return {
+                p.pack_id: (p.templates, p.rulesets, p.constraints, p.match)
+                for p in packs
+            }
+        assert key(PackRegistry(DEFAULT_PROFILES_DIR).packs.packs) == key(builtin_packs())
+
+    def test_same_resolution_over_lattice(self) -> None:
+        from_yaml = PackRegistry(DEFAULT_PROFILES_DIR)
+        builtin = PackRegistry()
+        overlays = ("EASA-Q100", "SPACE-Q10", "EASA-Q100(+DO-178C-DAL-A)", "DEF-X", "")
+        for env, func, payload, overlay, ctx in itertools.product(
+            OperationalEnvironment, FunctionalMission, PayloadClassification,
+            overlays, OperationalContext,
+        ):
+            a = resolve_profile(env, func, payload, overlay, ctx, registry=from_yaml)
+            b = resolve_profile(env, func, payload, overlay, ctx, registry=builtin)
+            assert _snapshot(a) == _snapshot(b)
+
+    def test_defense_extension_applied_once(self) -> None:
+        profile = resolve_profile(
+            OperationalEnvironment.AIR,
+            FunctionalMission.CARGO_ONLY,
+            PayloadClassification.DEFENSE_CLASSIFIED,
+            "DEF-Q100",
+            OperationalContext.DEFENSE,
+        )
+        assert "ROE_ENGAGEMENT_CONSTRAINTS" in profile.templates
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Reload
+# ──────────────────────────────────────────────────────────────────────────────
+
+_NEW_OVERLAY = """\
+overlay_id: FAA-P25
+match: [FAA]
+additional_templates:
+  - FAA_PART25_COMPLIANCE_TEMPLATE
+constraints:
+  dal_level: B
+"""
+
+
+@requires_yaml
+class TestReload:
+    """New overlay files take effect without code changes."""
+
+    def _resolve(self, registry):
+        return resolve_profile(
+            OperationalEnvironment.AIR,
+            FunctionalMission.CARGO_ONLY,
+            PayloadClassification.CIVIL_PUBLIC,
+            "FAA-P25",
+            registry=registry,
+        )
+
+    def test_reload_picks_up_new_overlay(self, pack_dir) -> None:
+        registry = PackRegistry(pack_dir)
+        assert "FAA_PART25_COMPLIANCE_TEMPLATE" not in self._resolve(registry).templates
+
+        (pack_dir / "overlays" / "faa_p25.yaml").write_text(_NEW_OVERLAY)
+        old = registry.packs
+        assert registry.reload_if_changed()
+        assert registry.generation == old.generation + 1
+        profile = self._resolve(registry)
+        assert "FAA_PART25_COMPLIANCE_TEMPLATE" in profile.templates
+        assert profile.constraints["dal_level"] == "B"
+        # The previous generation is untouched.
+        assert not old.overlay("FAA-P25")
+
+    def test_broken_file_keeps_current_packs(self, pack_dir) -> None:
+        registry = PackRegistry(pack_dir)
+        current = registry.packs
+        (pack_dir / "overlays" / "broken.yaml").write_text("axis: colour\nvalue: RED\n")
+        assert not registry.reload_if_changed()
+        assert registry.packs is current
+        assert isinstance(registry.last_error, PackError)
+        with pytest.raises(PackError):
+            registry.reload()
+
+    def test_unchanged_files_do_not_reload(self, pack_dir) -> None:
+        registry = PackRegistry(pack_dir)
+        assert not registry.reload_if_changed()
+        assert registry.generation == 0
+
+    def test_watch(self, pack_dir) -> None:
+        registry = PackRegistry(pack_dir)
+        registry.watch(interval=0.01)
+        try:
+            (pack_dir / "overlays" / "faa_p25.yaml").write_text(_NEW_OVERLAY)
+            deadline = time.monotonic() + 5.0
+            while registry.generation == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            registry.stop_watching()
+        assert "FAA_PART25_COMPLIANCE_TEMPLATE" in self._resolve(registry).templates
@@ -0,0 +1,373 @@
+"""
+tests/test_plot_dynamics.py — Streaming Audit Log Plotter Validation
+=====================================================================
+
+Validates plot_dynamics.py: the chunked JSON / JSON Lines / .npz loaders
+agree with each other and with a whole-file json.load, the downsampler
+keeps endpoints, per-bucket extremes and every status transition, and
+plot_state_trajectory() renders large logs and reports malformed entries;
+and the one-pass ComplianceAggregator reproduces the original three-pass
+summary and adds windowed rates, violation frequencies and gate latencies;
+render_batch() parses each log once per task, renders in a process pool and
+reports per-job timings and errors without touching global rcParams.
+
+Run with:  python -m pytest tests/test_plot_dynamics.py -v
+"""
+
+from __future__ import annotations
+
+import io
+import json
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from certified_dynamics import (
+    CertifiedAdmissibleSpace,
+    EvidenceGate,
+    InvariantCore,
+    LinearConstraint,
+)
+from plot_dynamics import (
+    ComplianceAggregator,
+    DynamicsPlotter,
+    PlotJob,
+    _iter_json_array,
+    _partition,
+    downsample,
+    iter_columns,
+    iter_log_batches,
+    load_trace,
+    load_traces,
+    render_batch,
+)
+
+
+def _space(n: int) -> CertifiedAdmissibleSpace:
+    core = InvariantCore("TEST-SYS", "EASA", "Plotting")
+    core.add_constraint(LinearConstraint("Noise", [1.0, 0.0], 80.0))
+    core.add_constraint(LinearConstraint("Mass", [0.0, 1.0], 5.0))
+    space = CertifiedAdmissibleSpace(fail_closed=False)
+    rng = np.random.default_rng(1)
+    t = np.linspace(0, 50, n)
+    X = np.column_stack([78 + 3 * np.sin(t) + rng.normal(0, 0.3, n), rng.uniform(3, 4.9, n)])
+    space.evaluate_states(X, core, times=t)
+    return space
+
+
+@pytest.fixture(scope="module")
+def logs(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp("logs")
+    space = _space(5000)
+    paths = {}
+    for ext in ("json", "jsonl", "npz"):
+        paths[ext] = str(tmp / f"audit.{ext}")
+        space.audit_log.export(paths[ext])
+    return space, paths
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Streaming loaders
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestLoaders:
+    """Chunked readers return exactly what json.load would."""
+
+    def test_json_array_small_blocks(self) -> None:
+        entries = [{"i": i, "s": "x" * (i % 7), "v": [i, -i]} for i in range(200)]
+        text = " [\n" + ",\n ".join(json.dumps(e) for e in entries) + "\n] \n"
+        assert list(_iter_json_array(io.StringIO(text), block=5)) == entries
+        assert list(_iter_json_array(io.StringIO("[]"))) == []
+        with pytest.raises(json.JSONDecodeError):
+            list(_iter_json_array(io.StringIO('[{"i": 1}, {"i": ')))
+
+    @pytest.mark.parametrize("ext", ["json", "jsonl"])
+    def test_batches(self, logs, ext) -> None:
+        space, paths = logs
+        batches = list(iter_log_batches(paths[ext], chunk_rows=700))
+        assert [len(b) for b in batches[:-1]] == [700] * (len(batches) - 1)
+        assert [e for b in batches for e in b] == json.loads(json.dumps(list(space.audit_log)))
+
+    def test_formats_agree(self, logs) -> None:
+        _, paths = logs
+        traces = {ext: load_trace(path, 0, chunk_rows=999) for ext, path in paths.items()}
+        ref = traces["json"]
+        for trace in traces.values():
+            np.testing.assert_array_equal(trace.time, ref.time)
+            np.testing.assert_array_equal(trace.value, ref.value)
+            names = [trace.status_names[c] for c in trace.status.tolist()]
+            assert names == [ref.status_names[c] for c in ref.status.tolist()]
+            assert [trace.reasons[c] for c in trace.reason.tolist()] == \
+                   [ref.reasons[c] for c in ref.reason.tolist()]
+        assert ref.rows == len(ref) == 5000
+
+    @pytest.mark.parametrize("ext", ["json", "npz"])
+    def test_load_traces_one_pass(self, logs, ext) -> None:
+        _, paths = logs
+        traces = load_traces(paths[ext], [1, 0, 1], max_points=400, chunk_rows=700)
+        assert list(traces) == [1, 0]
+        for i, trace in traces.items():
+            single = load_trace(paths[ext], i, max_points=400, chunk_rows=700)
+            np.testing.assert_array_equal(trace.index, single.index)
+            np.testing.assert_array_equal(trace.value, single.value)
+
+    def test_plotter_data_is_lazy(self, logs) -> None:
+        space, paths = logs
+        plotter = DynamicsPlotter(paths["jsonl"])
+        assert plotter._data is None
+        assert plotter.data == json.loads(json.dumps(list(space.audit_log)))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Downsampling
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestDownsample:
+    """Bounded output that keeps extremes and status transitions."""
+
+    def test_keeps_extremes_and_transitions(self) -> None:
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=100_000)
+        status = np.zeros(100_000, dtype=np.int16)
+        status[40_000:40_010] = 2          # short violation run
+        status[77_777] = 1
+        idx = downsample(values, status, 1000)
+        assert len(idx) <= 1000
+        assert np.all(np.diff(idx) > 0)
+        assert {0, 99_999, values.argmin(), values.argmax()} <= set(idx.tolist())
+        assert {39_999, 40_000, 40_009, 40_010, 77_776, 77_777, 77_778} <= set(idx.tolist())
+
+    def test_dense_transitions_bounded(self) -> None:
+        # Status flips on every row: each bucket keeps one row per status.
+        status = np.arange(100_000, dtype=np.int16) % 2
+        idx = downsample(np.zeros(100_000), status, 1000)
+        assert len(idx) <= 1000
+        size = -(-100_000 // ((1000 - 2) // 4))
+        buckets = idx // size
+        for b in range(-(-100_000 // size)):
+            assert set(status[idx[buckets == b]].tolist()) == {0, 1}
+
+    @pytest.mark.parametrize("max_points", [8, 100, 1000])
+    def test_random_statuses_bounded(self, max_points) -> None:
+        rng = np.random.default_rng(1)
+        values, status = rng.normal(size=3000), rng.integers(0, 4, 3000).astype(np.int16)
+        idx = downsample(values, status, max_points)
+        assert len(idx) <= max_points
+        assert {values.argmin(), values.argmax()} <= set(idx.tolist())
+        assert set(status[idx].tolist()) == {0, 1, 2, 3}
+
+    def test_short_input_untouched(self) -> None:
+        np.testing.assert_array_equal(downsample(np.arange(5.0), np.zeros(5), 10), np.arange(5))
+
+    def test_streamed_reduction(self, logs) -> None:
+        _, paths = logs
+        full = load_trace(paths["jsonl"], 0)
+        # 1200 points leave room for every transition (about 250 here) exactly.
+        small = load_trace(paths["jsonl"], 0, max_points=1200, chunk_rows=300)
+        changes = np.flatnonzero(full.status[1:] != full.status[:-1]) + 1
+        assert small.rows == 5000 and len(small) <= 1200 < len(full)
+        assert small.value.max() == full.value.max() and small.value.min() == full.value.min()
+        assert set(changes.tolist()) <= set(small.index.tolist())
+        np.testing.assert_array_equal(small.value, full.value[small.index])
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Rendering
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestPlot:
+    """plot_state_trajectory() on large and malformed logs."""
+
+    def test_large_log(self, tmp_path) -> None:
+        path = tmp_path / "big.npz"
+        _space(200_000).audit_log.export(str(path))
+        out = tmp_path / "big.png"
+        DynamicsPlotter(str(path)).plot_state_trajectory(
+            threshold_fn=lambda t: 80.0, output_path=str(out), max_points=2000)
+        assert out.stat().st_size > 0
+
+    @pytest.mark.parametrize("ext", ["json", "npz"])
+    def test_state_idx_out_of_bounds(self, logs, ext) -> None:
+        _, paths = logs
+        with pytest.raises(ValueError, match="out of bounds for entry 0"):
+            DynamicsPlotter(paths[ext]).plot_state_trajectory(state_idx=2)
+
+    def test_missing_state_vector(self, tmp_path) -> None:
+        path = tmp_path / "bad.jsonl"
+        path.write_text('{"simulation_time": 0, "status": "FULLY_ADMISSIBLE", "state_vector": [1]}\n'
+                        '{"simulation_time": 1, "status": "FULLY_ADMISSIBLE"}\n')
+        with pytest.raises(ValueError, match="Entry at index 1 is missing 'state_vector'"):
+            DynamicsPlotter(str(path)).plot_state_trajectory()
+
+    def test_invalid_json(self, tmp_path) -> None:
+        path = tmp_path / "bad.json"
+        path.write_text('[{"simulation_time": 0,')
+        with pytest.raises(ValueError, match="invalid JSON"):
+            DynamicsPlotter(str(path)).plot_state_trajectory()
+        with pytest.raises(FileNotFoundError):
+            DynamicsPlotter(str(tmp_path / "missing.json"))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Compliance summary
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _gated_run(sink=None) -> CertifiedAdmissibleSpace:
+    """Two systems over 6 years; the noise gate is fulfilled at t = 3.5."""
+    space = CertifiedAdmissibleSpace(fail_closed=True, sink=sink)
+    space.register_gate(0, EvidenceGate("G-NOISE", "Acoustic report", "AMC-20", 6))
+    cores = []
+    for sys_id in ("SYS-A", "SYS-B"):
+        core = InvariantCore(sys_id, "EASA", "Summary")
+        core.add_constraint(LinearConstraint("Noise", [1.0, 0.0], 80.0))
+        core.add_constraint(LinearConstraint("Mass", [0.0, 1.0], 5.0))
+        cores.append(core)
+    rng = np.random.default_rng(4)
+    for step in range(24):
+        if step == 14:
+            space.fulfill_gate(0, "uri://noise")
+        for core in cores:
+            X = np.column_stack([rng.uniform(78, 82, 50), rng.uniform(4, 5.5, 50)])
+            space.evaluate_states(X, core)
+        space.step_time(0.25)
+    return space
+
+
+def _legacy_summary(data: list) -> dict:
+    """The original three-pass generate_summary_report() body."""
+    status_counts = {}
+    for entry in data:
+        status_counts[entry['status']] = status_counts.get(entry['status'], 0) + 1
+    return {
+        "total_evaluations": len(data),
+        "time_span": {"start": data[0]['simulation_time'], "end": data[-1]['simulation_time']},
+        "status_distribution": status_counts,
+        "compliance_rate": status_counts.get('FULLY_ADMISSIBLE', 0) / len(data),
+        "critical_violations": [
+            {"time": e['simulation_time'], "reason": e['reason'], "violations": e['violations']}
+            for e in data if e['status'] == 'INADMISSIBLE'
+        ],
+        "evidence_gates_triggered": [
+            {"time": e['simulation_time'], "reason": e['reason']}
+            for e in data if 'GATE' in e['reason']
+        ],
+    }
+
+
+@pytest.fixture(scope="module")
+def run(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp("summary")
+    space = _gated_run()
+    paths = {ext: str(tmp / f"audit.{ext}") for ext in ("json", "jsonl", "npz")}
+    for path in paths.values():
+        space.audit_log.export(path)
+    return space, paths
+
+
+class TestComplianceAggregator:
+    """One pass over columns == the original report, plus new metrics."""
+
+    @pytest.mark.parametrize("ext", ["json", "jsonl", "npz"])
+    def test_matches_legacy_report(self, run, ext, tmp_path) -> None:
+        space, paths = run
+        summary = DynamicsPlotter(paths[ext]).generate_summary_report(str(tmp_path / "s.json"))
+        legacy = _legacy_summary(json.loads(json.dumps(list(space.audit_log))))
+        assert {k: summary[k] for k in legacy} == legacy
+        assert list(summary["status_distribution"]) == list(legacy["status_distribution"])
+        assert json.loads((tmp_path / "s.json").read_text())["total_evaluations"] == 2400
+
+    def test_windows_and_frequency(self, run, tmp_path) -> None:
+        space, paths = run
+        data = list(space.audit_log)
+        summary = DynamicsPlotter(paths["npz"]).generate_summary_report(
+            str(tmp_path / "s.json"), window=2.0)
+        windows = summary["windowed_compliance"]["windows"]
+        assert [w["start"] for w in windows] == [0.0, 2.0, 4.0]
+        for w in windows:
+            rows = [e for e in data if w["start"] <= e["simulation_time"] < w["end"]]
+            assert w["evaluations"] == len(rows)
+            ok = sum(e["status"] == "FULLY_ADMISSIBLE" for e in rows)
+            assert w["compliance_rate"] == pytest.approx(ok / len(rows))
+        frequency = summary["violation_frequency"]
+        assert frequency == {name: sum(name in e["violations"] for e in data) for name in ("Noise", "Mass")}
+        assert list(frequency.values()) == sorted(frequency.values(), reverse=True)
+
+    def test_gate_latency(self, run) -> None:
+        _, paths = run
+        aggregator = ComplianceAggregator()
+        for cols in iter_columns(paths["jsonl"], chunk_rows=333):
+            aggregator.update_columns(cols)
+        latencies = {e["system_id"]: e for e in aggregator.summary()["gate_latency"]}
+        assert set(latencies) == {"SYS-A", "SYS-B"}
+        for entry in latencies.values():
+            assert entry["gate_id"] == "G-NOISE"
+            assert entry["fulfilled_at"] == 3.5
+            assert entry["latency"] == 3.5 - entry["pending_since"]
+
+    def test_incremental_sink_matches_file(self, run) -> None:
+        _, paths = run
+        live = ComplianceAggregator()
+        _gated_run(sink=live)
+        offline = ComplianceAggregator()
+        for cols in iter_columns(paths["npz"], chunk_rows=500):
+            offline.update_columns(cols)
+        a, b = live.summary(), offline.summary()
+        for summary in (a, b):
+            del summary["report_generated"]
+        assert json.loads(json.dumps(a)) == json.loads(json.dumps(b))
+
+    def test_empty(self, tmp_path) -> None:
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        assert DynamicsPlotter(str(path)).generate_summary_report(str(tmp_path / "s.json")) == {}
+        assert not (tmp_path / "s.json").exists()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Batch rendering
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestBatchRender:
+    """render_batch() over several logs and state components."""
+
+    def test_partition(self) -> None:
+        jobs = [PlotJob(f"log{k % 2}", 0, None, f"{k}.png") for k in range(6)]
+        assert _partition(jobs, 1) == [[0, 2, 4], [1, 3, 5]]
+        assert _partition(jobs, 4) == [[0, 2], [4], [1, 3], [5]]
+        assert _partition(jobs[:1], 8) == [[0]]
+
+    def test_plotter_shares_loaded_traces(self, logs) -> None:
+        _, paths = logs
+        plotter = DynamicsPlotter(paths["jsonl"])
+        traces = plotter.load_traces([0, 1], max_points=500)
+        assert plotter.load_trace(1, max_points=500) is traces[1]
+        assert plotter.load_trace(1) is not traces[1]
+
+    def test_in_process(self, logs, tmp_path) -> None:
+        _, paths = logs
+        dpi = plt.rcParams["savefig.dpi"]
+        jobs = [(paths["jsonl"], 0, lambda t: 80.0, str(tmp_path / "noise.png")),
+                PlotJob(paths["jsonl"], 1, None, str(tmp_path / "mass.png"), max_points=200),
+                (paths["npz"], 2, None, str(tmp_path / "bad.png")),
+                (str(tmp_path / "missing.json"), 0, None, str(tmp_path / "missing.png"))]
+        results = render_batch(jobs, workers=1)
+        assert [r.job for r in results] == [0, 1, 2, 3]
+        assert [r.ok for r in results] == [True, True, False, False]
+        assert "out of bounds" in results[2].error
+        assert results[3].error.startswith("FileNotFoundError")
+        assert (tmp_path / "noise.png").stat().st_size > 0
+        assert (tmp_path / "mass.png").stat().st_size > 0
+        assert not (tmp_path / "bad.png").exists()
+        assert all(r.load_seconds >= 0 and r.render_seconds >= 0 for r in results)
+        assert plt.rcParams["savefig.dpi"] == dpi
+
+    def test_process_pool(self, logs, tmp_path) -> None:
+        _, paths = logs
+        jobs = [(paths[ext], i, lambda t: 80.0, str(tmp_path / f"{ext}{i}.png"))
+                for ext in ("jsonl", "npz") for i in (0, 1)]
+        results = render_batch([PlotJob(*job, max_points=300) for job in jobs], workers=2)
+        assert all(r.ok for r in results), [r.error for r in results]
+        assert [r.output_path for r in results] == [job[3] for job in jobs]
+        assert len({r.worker for r in results}) <= 2
+        assert all((tmp_path / f"{ext}{i}.png").exists() for ext in ("jsonl", "npz") for i in (0, 1))
@@ -0,0 +1,131 @@
+"""
+tests/test_profile_lattice.py — Precomputed Profile Lattice Validation
+=======================================================================
+
+Validates the lattice lookup table (ampel360.lattice): every entry matches
+resolve_profile(), tables round-trip through JSON, and diffs between table
+versions report exactly what changed.
+
+Run with:  python -m pytest tests/test_profile_lattice.py -v
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+
+import pytest
+
+from ampel360.lattice import (
+    LatticeTable,
+    build_lattice,
+    diff_lattices,
+    format_diff,
+    main,
+    read_lattice,
+    write_lattice,
+)
+from ampel360.packs import PackRegistry, PackSet, builtin_packs
+from ampel360.resolver import (
+    FunctionalMission,
+    OperationalContext,
+    OperationalEnvironment,
+    PayloadClassification,
+    resolve_profile,
+)
+
+
+@pytest.fixture(scope="module")
+def table() -> dict:
+    return build_lattice(registry=PackRegistry())
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Build & lookup
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestLatticeBuild:
+    """The table holds every axis combination for every overlay."""
+
+    def test_size(self, table: dict) -> None:
+        assert table["overlays"] == ["DO-178C", "EASA-Q100", "SPACE-Q10"]
+        assert len(table["profiles"]) == 3 * 2 * 2 * 4 * 2
+
+    def test_entries_match_resolver(self, table: dict) -> None:
+        lookup = LatticeTable(table)
+        for env in OperationalEnvironment:
+            for func in FunctionalMission:
+                for payload in PayloadClassification:
+                    for ctx in OperationalContext:
+                        ref = resolve_profile(env, func, payload, "SPACE-Q10", ctx)
+                        rec = lookup.get(env.value, func.value, payload.value,
+                                         "SPACE-Q10", ctx.value)
+                        assert rec.templates == ref.templates
+                        assert rec.rulesets == ref.rulesets
+                        assert dict(rec.constraints) == ref.constraints
+                        assert rec.human_presence == ref.human_presence.value
+                        assert rec.disclosure_mode == ref.disclosure_mode
+
+    def test_deterministic(self, table: dict) -> None:
+        assert build_lattice(registry=PackRegistry())["digest"] == table["digest"]
+
+    def test_json_round_trip(self, table: dict, tmp_path) -> None:
+        path = tmp_path / "lattice.json"
+        write_lattice(table, str(path))
+        loaded = read_lattice(str(path))
+        assert loaded == json.loads(json.dumps(table))
+        assert not diff_lattices(table, loaded)
+
+    def test_rejects_foreign_file(self, tmp_path) -> None:
+        path = tmp_path / "other.json"
+        path.write_text('{"format": "something-else"}')
+        with pytest.raises(ValueError):
+            read_lattice(str(path))
+
+    def test_unknown_key(self, table: dict) -> None:
+        with pytest.raises(KeyError):
+            LatticeTable(table).get("AIR", "PAX_TRANSPORT", "CIVIL_PUBLIC", "NOPE")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Diff
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestLatticeDiff:
+    """Diff reports between table versions."""
+
+    def test_overlay_set_change(self, table: dict) -> None:
+        smaller = build_lattice(["EASA-Q100", "SPACE-Q10"], registry=PackRegistry())
+        diff = diff_lattices(table, smaller)
+        assert len(diff.removed) == 32 and not diff.added and not diff.changed
+        assert all(".DO-178C@" in key for key in diff.removed)
+
+    def test_pack_change(self, table: dict) -> None:
+        registry = PackRegistry()
+        packs = [
+            replace(p, rulesets=frozenset({"DO_330_TOOL_QUAL_RULESET"}))
+            if p.pack_id == "DO-178C" else p
+            for p in builtin_packs()
+        ]
+        registry.packs = PackSet(packs, generation=1)
+        diff = diff_lattices(table, build_lattice(registry=registry))
+        assert len(diff.changed) == 32
+        change = diff.changed["AIR.PAX_TRANSPORT.CIVIL_PUBLIC.DO-178C@CIVIL"]
+        assert change == {
+            "rulesets": {
+                "added": ["DO_330_TOOL_QUAL_RULESET"],
+                "removed": ["DO_178C_ARTEFACT_RULESET"],
+            }
+        }
+        report = format_diff(diff)
+        assert "rulesets: + DO_330_TOOL_QUAL_RULESET" in report
+
+    def test_cli(self, tmp_path, capsys) -> None:
+        a, b = tmp_path / "a.json", tmp_path / "b.json"
+        assert main(["build", "-o", str(a)]) == 0
+        assert main(["build", "-o", str(b), "--overlay", "EASA-Q100"]) == 0
+        capsys.readouterr()
+        assert main(["diff", str(a), str(a)]) == 0
+        assert "No differences." in capsys.readouterr().out
+        assert main(["diff", str(a), str(b), "--json"]) == 1
+        assert len(json.loads(capsys.readouterr().out)["removed"]) == 64
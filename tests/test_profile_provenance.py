@@ -0,0 +1,174 @@
+"""
+tests/test_profile_provenance.py — Incremental Re-resolution Validation
+========================================================================
+
+Validates ampel360.provenance: traces reproduce resolve_profile(), explain
+where every merged constraint came from, and incremental axis changes
+yield the same profiles as a full re-resolution plus an exact diff.
+
+Run with:  python -m pytest tests/test_profile_provenance.py -v
+"""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from ampel360.packs import PackRegistry
+from ampel360.provenance import FleetResolver, trace_profile
+from ampel360.resolver import (
+    FunctionalMission,
+    HumanPresence,
+    OperationalContext,
+    OperationalEnvironment,
+    PayloadClassification,
+    resolve_profile,
+)
+
+_OVERLAYS = ("EASA-Q100", "SPACE-Q10", "EASA-Q100(+DO-178C)", "DEF-X", "")
+
+
+@pytest.fixture()
+def q100():
+    return trace_profile(
+        OperationalEnvironment.AIR,
+        FunctionalMission.PAX_TRANSPORT,
+        PayloadClassification.CIVIL_PUBLIC,
+        "EASA-Q100",
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Provenance
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestTrace:
+    """Traces match the resolver and explain their constraints."""
+
+    def test_matches_resolver_over_lattice(self) -> None:
+        for env, func, payload, overlay, ctx in itertools.product(
+            OperationalEnvironment, FunctionalMission, PayloadClassification,
+            _OVERLAYS, OperationalContext,
+        ):
+            trace = trace_profile(env, func, payload, overlay, ctx)
+            assert trace.profile == resolve_profile(env, func, payload, overlay, ctx)
+
+    def test_explain_constraint(self, q100) -> None:
+        risk = q100.explain("risk_threshold")
+        assert risk.value == 1e-9
+        assert risk.source == "environment:AIR"
+        assert risk.history[0] == ("kernel", 1e-7)
+        assert ("EASA-Q100", 1e-9) in risk.history
+
+    def test_sources_of(self, q100) -> None:
+        assert q100.sources_of("H_PIPELINE_GATE_CHECK") == ["kernel"]
+        assert q100.sources_of("EASA_CS25_COMPLIANCE_TEMPLATE") == ["EASA-Q100"]
+        assert q100.sources_of("NOT_A_TEMPLATE") == []
+
+    def test_defense_extension_counted_once(self) -> None:
+        trace = trace_profile(
+            "SPACE", "CARGO_ONLY", "DEFENSE_CLASSIFIED", "DEF-Q10", "DEFENSE"
+        )
+        assert trace.sources_of("ROE_ENGAGEMENT_CONSTRAINTS") == [
+            "operational_context:DEFENSE"
+        ]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Incremental changes
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestWithAxes:
+    """Incremental re-resolution equals full resolution."""
+
+    def test_every_single_axis_change(self, q100) -> None:
+        changes = (
+            [{"env": e} for e in OperationalEnvironment]
+            + [{"func": f} for f in FunctionalMission]
+            + [{"payload": p} for p in PayloadClassification]
+            + [{"context": c} for c in OperationalContext]
+            + [{"overlay": o} for o in _OVERLAYS]
+        )
+        for change in changes:
+            new, _ = q100.with_axes(**change)
+            axes = {**q100.axes, **change}
+            assert new.profile == resolve_profile(
+                axes["env"], axes["func"], axes["payload"], axes["overlay"],
+                axes["context"],
+            )
+
+    def test_unchanged_slots_are_reused(self, q100) -> None:
+        new, _ = q100.with_axes(overlay="SPACE-Q10")
+        for slot in ("kernel", "environment", "function", "payload", "context"):
+            assert new.slots[slot] is q100.slots[slot]
+
+    def test_diff(self, q100) -> None:
+        _, diff = q100.with_axes(func="CARGO_ONLY")
+        assert diff.axes == {
+            "func": (FunctionalMission.PAX_TRANSPORT, FunctionalMission.CARGO_ONLY)
+        }
+        assert "THIRD_PARTY_HARM_ENVELOPE" in diff.templates_added
+        assert "CABIN_SAFETY_TEMPLATE" in diff.templates_removed
+        change = diff.constraints["human_override"]
+        assert (change.before, change.after) == (True, False)
+        assert change.before_source == "function:PAX_TRANSPORT"
+        assert diff.fields["human_presence"] == (HumanPresence.HOB, HumanPresence.NHOB)
+        assert diff.as_dict()["fields"]["human_presence"] == [
+            "HUMAN_ON_BOARD", "NO_HUMAN_ON_BOARD",
+        ]
+
+    def test_no_op_change(self, q100) -> None:
+        _, diff = q100.with_axes(overlay="EASA-Q100")
+        assert not diff and not diff.axes
+
+    def test_unknown_axis(self, q100) -> None:
+        with pytest.raises(TypeError):
+            q100.with_axes(colour="RED")
+
+    def test_registry_reload_reselects(self, q100) -> None:
+        registry = PackRegistry()
+        trace = trace_profile(*q100.key, registry=registry)
+        registry.reload()
+        new, diff = trace.with_axes(registry=registry)
+        assert new.packs is registry.packs
+        assert new.slots["environment"] is not trace.slots["environment"]
+        assert not diff
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Fleet
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestFleetResolver:
+    """Fleet-wide incremental re-profiling."""
+
+    @pytest.fixture()
+    def fleet(self) -> FleetResolver:
+        fleet = FleetResolver()
+        for i, (env, func) in enumerate(
+            itertools.product(OperationalEnvironment, FunctionalMission)
+        ):
+            for n in range(25):
+                fleet.assign(f"T{i}-{n}", env, func, "CIVIL_PUBLIC", "EASA-Q100")
+        return fleet
+
+    def test_overlay_change(self, fleet: FleetResolver) -> None:
+        diffs = fleet.change(overlay="EASA-Q100(+DO-178C)")
+        assert len(diffs) == len(fleet) == 100
+        assert all(d.rulesets_added == {"DO_178C_ARTEFACT_RULESET"} for d in diffs.values())
+        profile = fleet.profile("T0-0")
+        assert profile == resolve_profile(
+            profile.environment, profile.function, profile.payload_class,
+            "EASA-Q100(+DO-178C)",
+        )
+
+    def test_subset_change(self, fleet: FleetResolver) -> None:
+        diffs = fleet.change(["T0-0", "T0-1"], payload="DEFENSE_CLASSIFIED")
+        assert set(diffs) == {"T0-0", "T0-1"}
+        assert fleet.profile("T0-0").disclosure_mode == "ATTESTATION_ONLY"
+        assert fleet.profile("T0-2").disclosure_mode == "FULL"
+
+    def test_traces_shared_per_axis_tuple(self, fleet: FleetResolver) -> None:
+        assert fleet.trace("T0-0") is fleet.trace("T0-24")
+        assert fleet.profile("T0-0") is fleet.profile("T0-24")
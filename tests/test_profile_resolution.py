@@ -10,15 +10,21 @@ Run with:  python -m pytest tests/test_profile_resolution.py -v
 
 from __future__ import annotations
 
+import pickle
+from dataclasses import FrozenInstanceError
+
 import pytest
 
+from ampel360.packs import PackRegistry
 from ampel360.resolver import (
     AMPEL360Profile,
+    FrozenAMPEL360Profile,
     FunctionalMission,
     HumanPresence,
     OperationalContext,
     OperationalEnvironment,
     PayloadClassification,
+    ResolutionCache,
     resolve_profile,
     _max_dal,
     _most_restrictive_disclosure,
@@ -241,3 +247,84 @@ class TestAxisInvariants:
                 for payload in PayloadClassification:
                     p = resolve_profile(env, func, payload, "TEST")
                     assert p.constraints["require_authority"] is True
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Resolution cache
+# ──────────────────────────────────────────────────────────────────────────────
+
+_Q100_AXES = (
+    OperationalEnvironment.AIR,
+    FunctionalMission.PAX_TRANSPORT,
+    PayloadClassification.CIVIL_PUBLIC,
+    "EASA-Q100",
+)
+
+
+class TestResolutionCache:
+    """Memoised resolution returns shared, read-only profiles."""
+
+    @pytest.fixture()
+    def cache(self) -> ResolutionCache:
+        return ResolutionCache(max_overlays=2, registry=PackRegistry())
+
+    def test_matches_resolver(self, cache: ResolutionCache) -> None:
+        assert cache.resolve(*_Q100_AXES) == resolve_profile(*_Q100_AXES)
+
+    def test_shared_instance(self, cache: ResolutionCache) -> None:
+        first = cache.resolve(*_Q100_AXES)
+        assert cache.resolve(*_Q100_AXES) is first
+        assert cache.resolve("AIR", "PAX_TRANSPORT", "CIVIL_PUBLIC", "EASA-Q100") is first
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+
+    def test_profile_is_read_only(self, cache: ResolutionCache) -> None:
+        profile = cache.resolve(*_Q100_AXES)
+        with pytest.raises(FrozenInstanceError):
+            profile.disclosure_mode = "REDACTED"
+        with pytest.raises(AttributeError):
+            profile.templates.add("X")
+        with pytest.raises(TypeError):
+            profile.constraints["dal_level"] = "E"
+
+    def test_thaw_is_private_copy(self, cache: ResolutionCache) -> None:
+        profile = cache.resolve(*_Q100_AXES)
+        copy = profile.thaw()
+        copy.templates.add("X")
+        assert type(copy) is AMPEL360Profile
+        assert "X" not in profile.templates
+
+    def test_pickle(self, cache: ResolutionCache) -> None:
+        profile = cache.resolve(*_Q100_AXES)
+        clone = pickle.loads(pickle.dumps(profile))
+        assert isinstance(clone, FrozenAMPEL360Profile)
+        assert clone == profile
+
+    def test_lru_evicts_overlays(self, cache: ResolutionCache) -> None:
+        axes = _Q100_AXES[:3]
+        cache.resolve(*axes, "A")
+        cache.resolve(*axes, "B")
+        cache.resolve(*axes, "A")
+        cache.resolve(*axes, "C")          # evicts "B"
+        stats = cache.stats()
+        assert stats.overlays == 2 and stats.evictions == 1
+        cache.reset_stats()
+        cache.resolve(*axes, "A")
+        assert cache.stats().hits == 1
+
+    def test_precompute(self) -> None:
+        cache = ResolutionCache(registry=PackRegistry())
+        assert cache.precompute(["EASA-Q100", "SPACE-Q10"]) == 64
+        assert cache.stats().entries == 64
+        cache.resolve(*_Q100_AXES)
+        assert cache.stats().hits == 1
+
+    def test_reload_clears_cache(self, cache: ResolutionCache) -> None:
+        first = cache.resolve(*_Q100_AXES)
+        cache.registry.reload()
+        assert cache.resolve(*_Q100_AXES) is not first
+        assert cache.stats().misses == 2
+
+    def test_unknown_axis_value(self, cache: ResolutionCache) -> None:
+        with pytest.raises(ValueError):
+            cache.resolve("WATER", "PAX_TRANSPORT", "CIVIL_PUBLIC", "EASA-Q100")
@@ -0,0 +1,386 @@
+"""
+tests/test_profile_selector.py — Regulatory Profile Selector Validation
+========================================================================
+
+Validates the runtime profile selector in AMPEL.py (ESSA-DOC-AMPEL-001).
+
+Run with:  python -m pytest tests/test_profile_selector.py -v
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from AMPEL import (
+    GateType,
+    ProfileCache,
+    ProfileSelector,
+    RegulatoryProfile,
+    Severity,
+    ValidationJob,
+    ValidationService,
+    canonical_profile_bytes,
+    profile_to_json,
+    validate_state,
+    write_profile_json,
+)
+
+
+@pytest.fixture()
+def cache() -> ProfileCache:
+    return ProfileCache()
+
+
+@pytest.fixture()
+def selector(cache: ProfileCache) -> ProfileSelector:
+    return ProfileSelector(cache=cache)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Profile cache
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestProfileCache:
+    """Profiles are built once and shared read-only between activations."""
+
+    def test_built_once(self, selector: ProfileSelector, cache: ProfileCache) -> None:
+        first = selector.select(RegulatoryProfile.EASA_Q100)
+        second = selector.select(RegulatoryProfile.EASA_Q100)
+        assert first.templates is second.templates
+        stats = cache.stats()
+        assert (stats.misses, stats.hits, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_activation_views_are_distinct(self, selector: ProfileSelector) -> None:
+        first = selector.select(RegulatoryProfile.DO_178C)
+        second = first.activate("2026-01-01T00:00:00+00:00")
+        assert first.activated_at is not None
+        assert second.activated_at == "2026-01-01T00:00:00+00:00"
+        assert first.activated_at != second.activated_at
+        assert second.validation_rules is first.validation_rules
+
+    def test_profiles_are_read_only(self, selector: ProfileSelector) -> None:
+        config = selector.select(RegulatoryProfile.SPACE_Q10)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.activated_at = "now"  # type: ignore[misc]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.templates[0].gate = GateType.PUBLISH  # type: ignore[misc]
+        assert isinstance(config.templates, tuple)
+        assert all(isinstance(r.dal_scope, tuple) for r in config.validation_rules)
+
+    def test_invalidate_rebuilds(self, selector: ProfileSelector, cache: ProfileCache) -> None:
+        first = selector.select(RegulatoryProfile.EASA_Q100)
+        cache.invalidate(RegulatoryProfile.EASA_Q100)
+        second = selector.select(RegulatoryProfile.EASA_Q100)
+        assert first.templates is not second.templates
+        assert cache.stats().misses == 2
+
+    def test_register_builder_replaces_definition(self) -> None:
+        cache = ProfileCache(builders={})
+        base = ProfileCache().get(RegulatoryProfile.EASA_Q100)
+        cache.register_builder(
+            RegulatoryProfile.EASA_Q100,
+            lambda: dataclasses.replace(base, title="Patched"),
+        )
+        config = ProfileSelector(cache=cache).select(RegulatoryProfile.EASA_Q100)
+        assert config.title == "Patched"
+
+    def test_register_builder_is_per_cache(self) -> None:
+        patched, other = ProfileCache(), ProfileCache()
+        space = patched.get(RegulatoryProfile.SPACE_Q10)
+        patched.register_builder(RegulatoryProfile.EASA_Q100, lambda: space)
+        assert patched.get(RegulatoryProfile.EASA_Q100) is space
+        config = ProfileSelector(cache=other).select(RegulatoryProfile.EASA_Q100)
+        assert config.profile == RegulatoryProfile.EASA_Q100
+        assert ProfileCache().get(RegulatoryProfile.EASA_Q100).profile == RegulatoryProfile.EASA_Q100
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Precompiled list_* indexes
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestProfileIndex:
+    """Indexed queries agree with a linear scan over the active profile."""
+
+    @pytest.mark.parametrize("profile", list(RegulatoryProfile))
+    def test_rules_match_linear_scan(self, selector: ProfileSelector, profile: RegulatoryProfile) -> None:
+        config = selector.select(profile)
+        for severity in (None, *Severity):
+            for gate in (None, *GateType):
+                for dal in (None, "A", "B", "C", "D", "E", "Z"):
+                    expected = tuple(
+                        r for r in config.validation_rules
+                        if (severity is None or r.severity == severity)
+                        and (gate is None or r.gate == gate)
+                        and (dal is None or not r.dal_scope or dal in r.dal_scope)
+                    )
+                    assert selector.list_rules(severity, dal, gate) == expected
+
+    @pytest.mark.parametrize("profile", list(RegulatoryProfile))
+    def test_templates_match_linear_scan(self, selector: ProfileSelector, profile: RegulatoryProfile) -> None:
+        config = selector.select(profile)
+        for gate in (None, *GateType):
+            for dal in (None, "A", "D", "Z"):
+                expected = tuple(
+                    t for t in config.templates
+                    if (gate is None or t.gate == gate)
+                    and (dal is None or not t.dal_scope or dal in t.dal_scope)
+                )
+                assert selector.list_templates(gate, dal=dal) == expected
+
+    def test_constraints_by_waivability(self, selector: ProfileSelector) -> None:
+        config = selector.select(RegulatoryProfile.SPACE_Q10)
+        waivable = selector.list_constraints(waivable=True)
+        hard = selector.list_constraints(waivable=False)
+        assert {c.constraint_id for c in waivable} == {"Q10-CON-01", "Q10-CON-04"}
+        assert len(waivable) + len(hard) == len(config.constraints)
+        assert selector.list_constraints() == config.constraints
+
+    def test_queries_return_shared_tuples(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.DO_178C)
+        assert selector.list_rules(dal="B") is selector.list_rules(dal="B")
+
+    def test_requires_selection(self) -> None:
+        with pytest.raises(RuntimeError):
+            ProfileSelector().list_rules()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Compiled validation plans
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _results(report: list) -> dict:
+    return {entry["rule_id"]: entry["result"] for entry in report}
+
+
+class TestValidation:
+    """Typed threshold evaluation in ProfileSelector.validate()."""
+
+    def test_numeric_comparison(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.EASA_Q100)
+        passed, report = selector.validate({"Q100-RULE-01": 12, "Q100-RULE-05": 2})
+        assert not passed
+        assert _results(report)["Q100-RULE-01"] == "FAIL"
+        assert _results(report)["Q100-RULE-05"] == "PASS"
+
+    def test_warn_band(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.EASA_Q100)
+        passed, report = selector.validate({"Q100-RULE-01": 9, "Q100-RULE-03": "55"})
+        assert passed
+        assert _results(report)["Q100-RULE-01"] == "WARN"
+        assert _results(report)["Q100-RULE-03"] == "WARN"
+
+    def test_sentinel_and_verbatim_threshold(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.EASA_Q100)
+        passed, report = selector.validate({
+            "Q100-RULE-01": "> 10",
+            "Q100-RULE-02": "false",
+            "Q100-RULE-06": "PSAC_absent",
+        })
+        assert not passed
+        results = _results(report)
+        assert (results["Q100-RULE-01"], results["Q100-RULE-02"], results["Q100-RULE-06"]) == (
+            "FAIL", "PASS", "FAIL",
+        )
+        assert results["Q100-RULE-04"] == "SKIP"
+
+    def test_check_key_preferred_over_rule_id(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.EASA_Q100)
+        key = "cc_per_function_must_not_exceed_threshold"
+        _, report = selector.validate({key: 3, "Q100-RULE-01": 20})
+        assert _results(report)["Q100-RULE-01"] == "PASS"
+
+    def test_dal_qualified_threshold(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.DO_178C)
+        state = {"PR-VAL-CC-01": 12, "PR-VAL-CC-03": 70}
+        assert _results(selector.validate(state)[1])["PR-VAL-CC-03"] == "FAIL"
+        assert _results(selector.validate(state, dal="B")[1])["PR-VAL-CC-01"] == "FAIL"
+        assert _results(selector.validate({"PR-VAL-CC-01": 9}, dal="B")[1])["PR-VAL-CC-01"] == "WARN"
+        assert _results(selector.validate(state, dal="C")[1])["PR-VAL-CC-03"] == "PASS"
+        assert _results(selector.validate({"PR-VAL-CC-03": 81}, dal="C")[1])["PR-VAL-CC-03"] == "FAIL"
+
+    def test_rules_outside_dal_scope_not_run(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.DO_178C)
+        state = {"PR-VAL-CC-01": 50, "PR-VAL-CC-02": "recursion_present"}
+        passed, report = selector.validate(state, dal="C")
+        assert passed
+        assert "PR-VAL-CC-01" not in _results(report) and "PR-VAL-CC-02" not in _results(report)
+        rules = selector.active_profile.validation_rules
+        in_scope = {r.rule_id for r in rules if not r.dal_scope or "C" in r.dal_scope}
+        assert set(_results(report)) == in_scope
+        assert selector.validate_batch([state], dal="C").rule_ids == tuple(_results(report))
+        assert not selector.validate(state)[0]
+
+    def test_warn_severity_does_not_block(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.SPACE_Q10)
+        passed, report = selector.validate({"Q10-RULE-05": "Pc > H_ENVELOPE.Pc_threshold"})
+        assert passed
+        assert _results(report)["Q10-RULE-05"] == "WARN"
+
+    def test_subject_comparison(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.SPACE_Q10)
+        _, report = selector.validate({"Q10-RULE-01": 30, "Q10-RULE-02": 1e-5})
+        assert _results(report)["Q10-RULE-01"] == "FAIL"
+        assert _results(report)["Q10-RULE-02"] == "PASS"
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Batch validation
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestBatchValidation:
+    """validate_batch() agrees with validate() unit by unit."""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self) -> None:
+        pytest.importorskip("numpy")
+
+    def test_list_of_states_matches_single(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.DO_178C)
+        states = [
+            {"PR-VAL-CC-01": i % 20, "PR-VAL-CC-02": "recursion_present" if i % 3 else "none",
+             "PR-VAL-CC-04": str(i % 10), "PR-VAL-ART-00": None}
+            for i in range(60)
+        ]
+        # A check key present with None skips the rule despite a rule_id value.
+        key = "cyclomatic_complexity_check_per_function_unit"
+        for i in range(0, 60, 4):
+            states[i][key] = None
+        for i in range(2, 60, 4):
+            states[i][key] = 3
+        batch = selector.validate_batch(states, dal="C")
+        assert len(batch) == len(states)
+        for i, state in enumerate(states):
+            passed, report = selector.validate(state, dal="C")
+            assert bool(batch.passed[i]) == passed
+            assert batch.report(i) == report
+
+    def test_columnar_numpy_input(self, selector: ProfileSelector) -> None:
+        import numpy as np
+
+        selector.select(RegulatoryProfile.EASA_Q100)
+        batch = selector.validate_batch({
+            "Q100-RULE-01": np.array([3, 9, 12]),
+            "Q100-RULE-06": ["PSAC_present", None, "PSAC_absent"],
+        })
+        assert batch.codes.shape == (3, 6)
+        assert batch.passed.tolist() == [True, True, False]
+        assert batch.results(1)["Q100-RULE-01"] == "WARN"
+        assert batch.results(1)["Q100-RULE-06"] == "SKIP"
+        assert batch.report(2)[0]["check_value"] == 12
+
+    def test_check_key_column_preferred(self, selector: ProfileSelector) -> None:
+        import numpy as np
+
+        selector.select(RegulatoryProfile.EASA_Q100)
+        batch = selector.validate_batch({
+            "cc_per_function_must_not_exceed_threshold": np.array([1.0, np.nan]),
+            "Q100-RULE-01": np.array([20.0, 20.0]),
+        })
+        assert [batch.results(i)["Q100-RULE-01"] for i in range(2)] == ["PASS", "FAIL"]
+        batch = selector.validate_batch({
+            "cc_per_function_must_not_exceed_threshold": [1.0, None],
+            "Q100-RULE-01": np.array([20.0, 20.0]),
+        })
+        assert [batch.results(i)["Q100-RULE-01"] for i in range(2)] == ["PASS", "SKIP"]
+
+    def test_ragged_columns_rejected(self, selector: ProfileSelector) -> None:
+        selector.select(RegulatoryProfile.EASA_Q100)
+        with pytest.raises(ValueError):
+            selector.validate_batch({"Q100-RULE-01": [1, 2], "Q100-RULE-06": ["x"]})
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Concurrent validation service
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestValidationService:
+    """Stateless multi-profile validation over worker pools."""
+
+    STATE = {"Q100-RULE-01": 12, "PR-VAL-CC-01": 9, "Q10-RULE-03": "launch_licence_absent"}
+
+    def test_validate_state_matches_selector(self, selector: ProfileSelector) -> None:
+        for profile in RegulatoryProfile:
+            selector.select(profile)
+            assert validate_state(profile, self.STATE) == selector.validate(self.STATE)
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_run_streams_every_job(self, executor: str) -> None:
+        jobs = [ValidationJob(p, {**self.STATE, "n": i}) for i, p in enumerate(list(RegulatoryProfile) * 7)]
+        with ValidationService(max_workers=2, executor=executor, chunk_size=4) as service:
+            outcomes = service.run_ordered(jobs)
+        assert [o.index for o in outcomes] == list(range(len(jobs)))
+        for job, outcome in zip(jobs, outcomes):
+            assert outcome.profile is job.profile
+            assert (outcome.passed, outcome.report) == validate_state(job.profile, job.state)
+
+    def test_validate_all_profiles(self) -> None:
+        with ValidationService(max_workers=2, include_reports=False) as service:
+            verdicts = service.validate_all(self.STATE)
+        assert {p: v[0] for p, v in verdicts.items()} == {
+            RegulatoryProfile.EASA_Q100: False,
+            RegulatoryProfile.SPACE_Q10: False,
+            RegulatoryProfile.DO_178C: True,
+        }
+        assert all(report is None for _, report in verdicts.values())
+
+    def test_rejects_unknown_executor(self) -> None:
+        with pytest.raises(ValueError):
+            ValidationService(executor="fiber")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# JSON export
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _legacy_export(config) -> str:
+    """The asdict()-based serialisation export_config() used to perform."""
+    data = dataclasses.asdict(config)
+    data["profile"] = config.profile.value
+    for tmpl in data["templates"]:
+        tmpl["gate"] = tmpl["gate"].value
+    for rule in data["validation_rules"]:
+        rule["severity"] = rule["severity"].value
+        rule["gate"] = rule["gate"].value
+    return json.dumps(data, indent=2)
+
+
+class TestExport:
+    """Single-pass profile serialisation."""
+
+    @pytest.mark.parametrize("profile", list(RegulatoryProfile))
+    def test_matches_legacy_layout(self, selector: ProfileSelector, profile: RegulatoryProfile) -> None:
+        config = selector.select(profile)
+        assert profile_to_json(config) == _legacy_export(config)
+
+    def test_export_config_modes(self, selector: ProfileSelector, tmp_path: Path) -> None:
+        config = selector.select(RegulatoryProfile.DO_178C)
+        pretty, compact = tmp_path / "pretty.json", tmp_path / "compact.json"
+        selector.export_config(str(pretty))
+        selector.export_config(str(compact), compact=True)
+        assert pretty.read_text(encoding="utf-8") == _legacy_export(config)
+        assert "\n" not in compact.read_text(encoding="utf-8")
+        assert json.loads(compact.read_text(encoding="utf-8")) == json.loads(pretty.read_text(encoding="utf-8"))
+
+    def test_streaming_writer(self, selector: ProfileSelector) -> None:
+        config = selector.select(RegulatoryProfile.SPACE_Q10)
+        buffer = io.StringIO()
+        write_profile_json(config, buffer, indent=None)
+        assert buffer.getvalue() == profile_to_json(config, indent=None)
+
+    def test_canonical_bytes_stable_across_activations(self, selector: ProfileSelector) -> None:
+        first = selector.select(RegulatoryProfile.EASA_Q100)
+        second = first.activate("1970-01-01T00:00:00+00:00")
+        assert canonical_profile_bytes(first) == canonical_profile_bytes(second)
+        assert b"activated_at" not in canonical_profile_bytes(first)
+        digest = hashlib.sha256(canonical_profile_bytes(first)).hexdigest()
+        assert digest == hashlib.sha256(canonical_profile_bytes(second)).hexdigest()
+        text = canonical_profile_bytes(first).decode("utf-8")
+        assert json.loads(text) == json.loads(profile_to_json(first, include_activation=False))
+        assert "—" in text  # literal UTF-8, not \u escapes
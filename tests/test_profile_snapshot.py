@@ -0,0 +1,140 @@
+"""
+tests/test_profile_snapshot.py — Binary Profile Snapshot Validation
+====================================================================
+
+Round-trips resolved profiles (ampel360.resolver) and regulatory selector
+profiles (AMPEL.py) through the binary snapshot format.
+
+Run with:  python -m pytest tests/test_profile_snapshot.py -v
+"""
+
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+
+import pytest
+
+from AMPEL import ProfileSelector, RegulatoryProfile
+from ampel360.resolver import (
+    AMPEL360Profile,
+    FunctionalMission,
+    OperationalContext,
+    OperationalEnvironment,
+    PayloadClassification,
+    resolve_profile,
+)
+from ampel360.snapshot import (
+    KIND_AMPEL360_PROFILE,
+    KIND_PROFILE_CONFIG,
+    SnapshotError,
+    SnapshotReader,
+    dump_snapshot,
+    load_snapshot,
+    save_snapshot,
+)
+
+
+@pytest.fixture()
+def resolved() -> list:
+    return [
+        resolve_profile(env, func, payload, overlay, context)
+        for env in OperationalEnvironment
+        for func in FunctionalMission
+        for payload in PayloadClassification
+        for overlay in ("EASA-Q100", "SPACE-Q10-DEF")
+        for context in OperationalContext
+    ]
+
+
+class TestSnapshotRoundTrip:
+    """save_snapshot() / load_snapshot() preserve every field."""
+
+    def test_resolved_profiles(self, resolved: list, tmp_path: Path) -> None:
+        path = tmp_path / "lattice.amps"
+        save_snapshot(resolved, str(path))
+        assert load_snapshot(str(path)) == resolved
+
+    def test_single_profile(self, resolved: list, tmp_path: Path) -> None:
+        path = tmp_path / "one.amps"
+        save_snapshot(resolved[0], str(path))
+        assert load_snapshot(str(path)) == [resolved[0]]
+
+    def test_profile_configs(self, resolved: list) -> None:
+        configs = [ProfileSelector().select(p) for p in RegulatoryProfile]
+        records = configs + resolved[:3]
+        assert load_snapshot(dump_snapshot(records)) == records
+
+    def test_constraint_value_types(self) -> None:
+        profile = AMPEL360Profile(
+            profile_id="X",
+            constraints={"f": 1e-9, "i": 3, "b": False, "s": "A", "n": None},
+        )
+        (back,) = load_snapshot(dump_snapshot([profile]))
+        assert back.constraints == profile.constraints
+        assert type(back.constraints["i"]) is int
+        assert type(back.constraints["b"]) is bool
+        assert back.environment is None
+
+    def test_strings_interned_once(self, resolved: list) -> None:
+        blob = dump_snapshot(resolved)
+        assert blob.count(b"H_PIPELINE_GATE_CHECK") == 1
+
+
+class TestSnapshotReader:
+    """Lazy, memory-mapped access."""
+
+    def test_random_access(self, resolved: list, tmp_path: Path) -> None:
+        path = tmp_path / "lattice.amps"
+        configs = [ProfileSelector().select(RegulatoryProfile.DO_178C)]
+        save_snapshot(resolved + configs, str(path))
+        with SnapshotReader(str(path)) as reader:
+            assert len(reader) == len(resolved) + 1
+            assert reader.kind(0) == KIND_AMPEL360_PROFILE
+            assert reader.kind(len(resolved)) == KIND_PROFILE_CONFIG
+            assert reader[5] == resolved[5]
+            assert reader[len(resolved)] == configs[0]
+
+    def test_rejects_foreign_data(self) -> None:
+        with pytest.raises(SnapshotError):
+            SnapshotReader(b"not a snapshot at all, clearly")
+
+    @pytest.mark.parametrize("size", [0, 3])
+    def test_rejects_short_file(self, tmp_path: Path, size: int) -> None:
+        path = tmp_path / "short.amps"
+        path.write_bytes(b"\0" * size)
+        with pytest.raises(SnapshotError, match="truncated"):
+            SnapshotReader(str(path))
+
+    def test_rejects_truncated_body(self, resolved: list, tmp_path: Path) -> None:
+        blob = dump_snapshot(resolved[:1])
+        path = tmp_path / "cut.amps"
+        for cut in (60, len(blob) // 2, len(blob) - 3):
+            path.write_bytes(blob[:cut])
+            for source in (blob[:cut], str(path)):
+                with pytest.raises(SnapshotError, match="truncated"):
+                    SnapshotReader(source)[0]
+
+    def test_failed_open_closes_map(self, tmp_path: Path, monkeypatch) -> None:
+        maps, real_mmap = [], mmap.mmap
+
+        def tracking_mmap(*args, **kwargs):
+            maps.append(real_mmap(*args, **kwargs))
+            return maps[-1]
+
+        monkeypatch.setattr("ampel360.snapshot.mmap.mmap", tracking_mmap)
+        path = tmp_path / "foreign.amps"
+        path.write_bytes(b"not a snapshot at all, clearly")
+        with pytest.raises(SnapshotError, match="Not an AMPEL"):
+            SnapshotReader(str(path))
+        assert len(maps) == 1 and maps[0].closed
+
+    def test_rejects_future_version(self, resolved: list) -> None:
+        blob = bytearray(dump_snapshot(resolved[:1]))
+        blob[4] = 99
+        with pytest.raises(SnapshotError):
+            SnapshotReader(bytes(blob))
+
+    def test_rejects_unsupported_objects(self) -> None:
+        with pytest.raises(TypeError):
+            dump_snapshot([object()])